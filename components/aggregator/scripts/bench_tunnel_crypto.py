@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""Benchmark aggregator-side tunnel crypto with and without session keys.
+
+Measures requests/sec on a single core for the work the aggregator does per
+tunnel request: encrypt the request payload and decrypt the space's response.
+The space's side of the exchange is precomputed outside the timed loop.
+
+Modes:
+    per-request   fresh ephemeral keypair + ECDH + HKDF for every request and
+                  an ECDH to decrypt every response (the classic protocol)
+    session       one TunnelSession reused across requests, answered by a
+                  session-aware space (no ECDH per request)
+    session-compat
+                  session requests answered by a space without session support
+                  (request ECDH saved, response ECDH still paid)
+
+Usage:
+    python scripts/bench_tunnel_crypto.py [--seconds S] [--payload-bytes N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+# Add the src directory to the path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from cryptography.hazmat.primitives.asymmetric.x25519 import X25519PrivateKey
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+
+from aggregator import crypto
+
+
+def _classic_response(
+    request_eph_pub_b64: str, payload: str, correlation_id: str
+) -> tuple[dict[str, str], str]:
+    """Encrypt a response the way a space without session support does."""
+    resp_priv, resp_pub = crypto.generate_keypair()
+    key = crypto.derive_key(
+        resp_priv, crypto._b64url_decode(request_eph_pub_b64), crypto.HKDF_RESPONSE_INFO
+    )
+    nonce, ciphertext = crypto.encrypt_payload(payload.encode(), key, correlation_id.encode())
+    info = {
+        "algorithm": crypto.ALGORITHM_ID,
+        "ephemeral_public_key": crypto._b64url_encode(resp_pub),
+        "nonce": crypto._b64url_encode(nonce),
+    }
+    return info, crypto._b64url_encode(ciphertext)
+
+
+def _session_response(
+    space_priv: X25519PrivateKey,
+    session_pub_b64: str,
+    payload: str,
+    correlation_id: str,
+) -> tuple[dict[str, str], str]:
+    """Encrypt a response the way a session-aware space does."""
+    _, response_key = crypto.derive_session_keys(space_priv, crypto._b64url_decode(session_pub_b64))
+    nonce = b"\x01" * crypto.NONCE_SIZE
+    ciphertext = AESGCM(response_key).encrypt(nonce, payload.encode(), correlation_id.encode())
+    info = {
+        "algorithm": crypto.SESSION_ALGORITHM_ID,
+        "ephemeral_public_key": session_pub_b64,
+        "nonce": crypto._b64url_encode(nonce),
+    }
+    return info, crypto._b64url_encode(ciphertext)
+
+
+def bench(mode: str, seconds: float, payload: str) -> float:
+    """Run one mode for ``seconds`` and return requests/sec."""
+    space_priv, space_pub = crypto.generate_keypair()
+    space_pub_b64 = crypto._b64url_encode(space_pub)
+    correlation_id = "bench"
+
+    session = crypto.TunnelSession(space_pub_b64, ttl_seconds=3600, max_messages=2**40)
+    if mode == "session":
+        response = _session_response(
+            space_priv, session.ephemeral_public_key_b64, payload, correlation_id
+        )
+    elif mode == "session-compat":
+        response = _classic_response(session.ephemeral_public_key_b64, payload, correlation_id)
+
+    count = 0
+    deadline = time.perf_counter() + seconds
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        if mode == "per-request":
+            info, eph_priv = crypto.encrypt_tunnel_request(payload, space_pub_b64, correlation_id)
+            # The response ECDH depends on this request's ephemeral key, so
+            # the space's side cannot be precomputed here; exclude it.
+            pause = time.perf_counter()
+            resp_info, resp_ct = _classic_response(
+                info["ephemeral_public_key"], payload, correlation_id
+            )
+            deadline += time.perf_counter() - pause
+            start += time.perf_counter() - pause
+            crypto.decrypt_tunnel_response(resp_ct, resp_info, eph_priv, correlation_id)
+        else:
+            session.encrypt_request(payload, correlation_id)
+            resp_info, resp_ct = response
+            session.decrypt_response(resp_ct, resp_info, correlation_id)
+        count += 1
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--seconds", type=float, default=2.0, help="Duration per mode")
+    parser.add_argument(
+        "--payload-bytes", type=int, default=512, help="Approximate request payload size"
+    )
+    args = parser.parse_args()
+
+    payload = json.dumps({"messages": "x" * args.payload_bytes, "limit": 5})
+    baseline = None
+    for mode in ("per-request", "session-compat", "session"):
+        rate = bench(mode, args.seconds, payload)
+        baseline = baseline or rate
+        print(f"{mode:>15}: {rate:10.0f} req/s per core  ({rate / baseline:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
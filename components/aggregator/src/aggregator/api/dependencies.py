@@ -6,14 +6,20 @@ from typing import Annotated
 from fastapi import Depends, Header
 
 from aggregator.clients import DataSourceClient, ErrorReporter, ModelClient
+from aggregator.clients.hedging import RequestHedger
 from aggregator.clients.nats_transport import NATSTransport
 from aggregator.core.config import get_settings
 from aggregator.services import (
     GenerationService,
     Orchestrator,
     PromptBuilder,
+    RerankerPool,
     RetrievalService,
 )
+from aggregator.services.circuit_breaker import CircuitBreakerRegistry
+from aggregator.services.embedding_cache import EmbeddingCache, build_shared_store
+from aggregator.services.prompt_cache import SemanticPromptCache
+from aggregator.services.retrieval_cache import RetrievalCache, build_shared_retrieval_store
 
 
 @lru_cache
@@ -23,6 +29,19 @@ def get_error_reporter() -> ErrorReporter:
     return ErrorReporter(backend_url=settings.syfthub_url)
 
 
+def _build_hedger(name: str) -> RequestHedger | None:
+    """Create a request hedger for a client (None if hedging is disabled)."""
+    settings = get_settings()
+    if not settings.hedging_enabled:
+        return None
+    return RequestHedger(
+        name,
+        min_samples=settings.hedging_min_samples,
+        min_delay=settings.hedging_min_delay_ms / 1000,
+        max_ratio=settings.hedging_max_ratio,
+    )
+
+
 @lru_cache
 def get_data_source_client() -> DataSourceClient:
     """Get the data source client singleton."""
@@ -30,6 +49,7 @@ def get_data_source_client() -> DataSourceClient:
     return DataSourceClient(
         timeout=settings.retrieval_timeout,
         error_reporter=get_error_reporter(),
+        hedger=_build_hedger("data_source"),
     )
 
 
@@ -40,6 +60,7 @@ def get_model_client() -> ModelClient:
     return ModelClient(
         timeout=settings.generation_timeout,
         error_reporter=get_error_reporter(),
+        hedger=_build_hedger("model"),
     )
 
 
@@ -56,6 +77,78 @@ def get_nats_transport() -> NATSTransport | None:
     )
 
 
+@lru_cache
+def get_reranker_pool() -> RerankerPool | None:
+    """Get the process-wide reranker pool (None if reranking via the pool is disabled).
+
+    The model itself is loaded during application startup (see main.lifespan).
+    """
+    settings = get_settings()
+    if not settings.reranker_enabled:
+        return None
+
+    cache: EmbeddingCache | None = None
+    if settings.reranker_cache_max_bytes > 0:
+        cache = EmbeddingCache(
+            model_name=settings.reranker_model_name,
+            max_bytes=settings.reranker_cache_max_bytes,
+            shared=build_shared_store(
+                settings.reranker_cache_url,
+                ttl_seconds=settings.reranker_cache_ttl,
+                disk_max_bytes=settings.reranker_cache_disk_max_bytes,
+            ),
+        )
+    return RerankerPool(
+        model_name=settings.reranker_model_name,
+        max_workers=settings.reranker_workers,
+        max_pending=settings.reranker_max_pending,
+        threads=settings.reranker_threads,
+        batch_max_size=settings.reranker_batch_max_size,
+        batch_max_wait_ms=settings.reranker_batch_max_wait_ms,
+        cache=cache,
+    )
+
+
+@lru_cache
+def get_circuit_breakers() -> CircuitBreakerRegistry | None:
+    """Get the process-wide data source circuit breakers (None if disabled)."""
+    settings = get_settings()
+    if not settings.circuit_breaker_enabled:
+        return None
+    return CircuitBreakerRegistry(
+        failure_rate_threshold=settings.circuit_breaker_failure_rate,
+        min_requests=settings.circuit_breaker_min_requests,
+        window_seconds=settings.circuit_breaker_window_seconds,
+        open_seconds=settings.circuit_breaker_open_seconds,
+    )
+
+
+@lru_cache
+def get_retrieval_cache() -> RetrievalCache | None:
+    """Get the process-wide retrieval result cache (None if disabled)."""
+    settings = get_settings()
+    if not settings.retrieval_cache_enabled:
+        return None
+    return RetrievalCache(
+        max_entries=settings.retrieval_cache_max_entries,
+        max_ttl=settings.retrieval_cache_max_ttl,
+        shared=build_shared_retrieval_store(settings.retrieval_cache_url),
+    )
+
+
+@lru_cache
+def get_prompt_cache() -> SemanticPromptCache | None:
+    """Get the process-wide semantic prompt cache (None if disabled)."""
+    settings = get_settings()
+    if not settings.prompt_cache_enabled or not settings.reranker_enabled:
+        return None
+    return SemanticPromptCache(
+        similarity_threshold=settings.prompt_cache_similarity_threshold,
+        max_ttl=settings.prompt_cache_max_ttl,
+        max_entries=settings.prompt_cache_max_entries,
+    )
+
+
 def get_prompt_builder() -> PromptBuilder:
     """Get a prompt builder instance."""
     return PromptBuilder()
@@ -64,9 +157,20 @@ def get_prompt_builder() -> PromptBuilder:
 def get_retrieval_service(
     data_source_client: Annotated[DataSourceClient, Depends(get_data_source_client)],
     nats_transport: Annotated[NATSTransport | None, Depends(get_nats_transport)],
+    circuit_breakers: Annotated[CircuitBreakerRegistry | None, Depends(get_circuit_breakers)],
+    retrieval_cache: Annotated[RetrievalCache | None, Depends(get_retrieval_cache)],
 ) -> RetrievalService:
     """Get the retrieval service."""
-    return RetrievalService(data_source_client, nats_transport=nats_transport)
+    settings = get_settings()
+    return RetrievalService(
+        data_source_client,
+        nats_transport=nats_transport,
+        circuit_breakers=circuit_breakers,
+        deadline=settings.retrieval_deadline or None,
+        quorum_sources=settings.retrieval_quorum_sources,
+        quorum_documents=settings.retrieval_quorum_documents,
+        retrieval_cache=retrieval_cache,
+    )
 
 
 def get_generation_service(
@@ -81,12 +185,16 @@ def get_orchestrator(
     retrieval_service: Annotated[RetrievalService, Depends(get_retrieval_service)],
     generation_service: Annotated[GenerationService, Depends(get_generation_service)],
     prompt_builder: Annotated[PromptBuilder, Depends(get_prompt_builder)],
+    reranker: Annotated[RerankerPool | None, Depends(get_reranker_pool)],
+    prompt_cache: Annotated[SemanticPromptCache | None, Depends(get_prompt_cache)],
 ) -> Orchestrator:
     """Get the orchestrator service."""
     return Orchestrator(
         retrieval_service=retrieval_service,
         generation_service=generation_service,
         prompt_builder=prompt_builder,
+        reranker=reranker,
+        prompt_cache=prompt_cache,
     )
 
 
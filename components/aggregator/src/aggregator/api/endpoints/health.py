@@ -3,6 +3,9 @@
 from typing import Any
 
 from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from aggregator.observability.metrics import metrics
 
 router = APIRouter(tags=["health"])
 
@@ -25,3 +28,14 @@ async def ready() -> dict[str, Any]:
         "status": "ready",
         "checks": {},
     }
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+async def metrics_endpoint() -> PlainTextResponse:
+    """Process metrics in the Prometheus text exposition format.
+
+    Unauthenticated, like /health and /ready, so scrapers need no credentials.
+    It is meant for the internal network only: the public nginx config denies
+    /aggregator/metrics, and scrapers reach the service directly.
+    """
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
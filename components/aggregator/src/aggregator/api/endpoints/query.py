@@ -93,10 +93,15 @@ async def _resolve_endpoint(
     # Extract first enabled connection with a URL
     url = None
     tenant_name = None
+    cache_ttl = None
     for conn in data.get("connect", []):
         if conn.get("enabled", True) and conn.get("config", {}).get("url"):
             url = str(conn["config"]["url"])
             tenant_name = conn["config"].get("tenant_name")
+            # Owner opt-in to retrieval caching; ignore malformed values
+            ttl = conn["config"].get("retrieval_cache_ttl")
+            if isinstance(ttl, int) and not isinstance(ttl, bool) and ttl > 0:
+                cache_ttl = ttl
             break
 
     if not url:
@@ -108,42 +113,54 @@ async def _resolve_endpoint(
         name=data.get("name", ""),
         owner_username=data.get("owner_username"),
         tenant_name=tenant_name,
+        cache_ttl_seconds=cache_ttl,
     )
 
 
-async def _get_guest_satellite_token(
-    client: httpx.AsyncClient, audience: str, base_url: str
-) -> str | None:
-    """Fetch a guest satellite token from the backend."""
+async def _get_guest_satellite_tokens(
+    client: httpx.AsyncClient, audiences: list[str], base_url: str
+) -> dict[str, str]:
+    """Fetch guest satellite tokens for several audiences in one backend call."""
     try:
-        resp = await client.get(f"{base_url}/api/v1/token/guest", params={"aud": audience})
+        resp = await client.post(
+            f"{base_url}/api/v1/token/guest/batch", json={"audiences": audiences}
+        )
         resp.raise_for_status()
-        token: str | None = resp.json().get("target_token")
-        return token
+        return _batch_tokens(resp.json())
     except httpx.HTTPError:
-        logger.warning("Failed to get guest satellite token for audience '%s'", audience)
-        return None
+        logger.warning("Failed to get guest satellite tokens for audiences %s", audiences)
+        return {}
 
 
-async def _get_satellite_token(
-    client: httpx.AsyncClient, audience: str, user_token: str, base_url: str
-) -> str | None:
-    """Fetch an authenticated satellite token from the backend."""
+async def _get_satellite_tokens(
+    client: httpx.AsyncClient, audiences: list[str], user_token: str, base_url: str
+) -> dict[str, str]:
+    """Fetch authenticated satellite tokens for several audiences in one backend call."""
     try:
-        resp = await client.get(
-            f"{base_url}/api/v1/token",
-            params={"aud": audience},
+        resp = await client.post(
+            f"{base_url}/api/v1/token/batch",
+            json={"audiences": audiences},
             headers={"Authorization": f"Bearer {user_token}"},
         )
         resp.raise_for_status()
-        token: str | None = resp.json().get("target_token")
-        return token
+        return _batch_tokens(resp.json())
     except httpx.HTTPError:
         logger.warning(
-            "Failed to get satellite token for audience '%s', falling back to guest",
-            audience,
+            "Failed to get satellite tokens for audiences %s, falling back to guest",
+            audiences,
         )
-        return await _get_guest_satellite_token(client, audience, base_url)
+        return await _get_guest_satellite_tokens(client, audiences, base_url)
+
+
+def _batch_tokens(data: dict[str, Any]) -> dict[str, str]:
+    """Extract ``{audience: token}`` from a batch token response."""
+    for audience, error in data.get("errors", {}).items():
+        logger.warning("No satellite token for audience '%s': %s", audience, error.get("message"))
+    return {
+        audience: entry["target_token"]
+        for audience, entry in data.get("tokens", {}).items()
+        if entry.get("target_token")
+    }
 
 
 def _error_result(query: str, model: str, data_sources: list[str], error: str) -> dict[str, Any]:
@@ -260,23 +277,22 @@ async def query_render(
                         tenant_name=url_fetcher_ref.tenant_name,
                         owner_username=url_fetcher_ref.owner_username,
                         query_override=url,
+                        cache_ttl_seconds=url_fetcher_ref.cache_ttl_seconds,
                     )
                 )
 
-        # --- Acquire satellite tokens in parallel ---
-        unique_owners: list[str] = list(
+        # --- Acquire satellite tokens in one batch call ---
+        unique_owners: list[str] = sorted(
             {ref.owner_username for ref in resolved if ref.owner_username}
         )
-        is_guest = user_token is None
-
-        async def _fetch_token(owner: str) -> tuple[str, str | None]:
-            if is_guest:
-                return (owner, await _get_guest_satellite_token(client, owner, base_url))
-            assert user_token is not None  # narrowing for type checker
-            return (owner, await _get_satellite_token(client, owner, user_token, base_url))
-
-        token_results = await asyncio.gather(*[_fetch_token(owner) for owner in unique_owners])
-        endpoint_tokens = {owner: token for owner, token in token_results if token}
+        endpoint_tokens: dict[str, str] = {}
+        if unique_owners:
+            if user_token is None:
+                endpoint_tokens = await _get_guest_satellite_tokens(client, unique_owners, base_url)
+            else:
+                endpoint_tokens = await _get_satellite_tokens(
+                    client, unique_owners, user_token, base_url
+                )
 
     # --- Build ChatRequest and run pipeline ---
     model_path = (
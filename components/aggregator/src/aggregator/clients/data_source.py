@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import time
+from collections.abc import Awaitable
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -20,6 +21,7 @@ from aggregator.schemas.responses import Document
 
 if TYPE_CHECKING:
     from aggregator.clients.error_reporter import ErrorReporter
+    from aggregator.clients.hedging import RequestHedger
 
 logger = get_logger(__name__)
 
@@ -46,10 +48,12 @@ class DataSourceClient:
         timeout: float = 30.0,
         error_reporter: ErrorReporter | None = None,
         http_client: httpx.AsyncClient | None = None,
+        hedger: RequestHedger | None = None,
     ):
         self.timeout = httpx.Timeout(timeout)
         self.error_reporter = error_reporter
         self.http_client = http_client
+        self.hedger = hedger
 
     async def query(
         self,
@@ -84,6 +88,49 @@ class DataSourceClient:
         Returns:
             RetrievalResult with documents and status
         """
+
+        def attempt() -> Awaitable[RetrievalResult]:
+            return self._query(
+                url,
+                slug,
+                endpoint_path,
+                query,
+                top_k=top_k,
+                similarity_threshold=similarity_threshold,
+                tenant_name=tenant_name,
+                authorization_token=authorization_token,
+                user_token=user_token,
+                syfthub_url=syfthub_url,
+            )
+
+        if self.hedger is None:
+            return await attempt()
+        # Credentials may be billed without a 402, so only anonymous requests
+        # are hedged (see hedging.py)
+        if authorization_token or user_token:
+            result = await attempt()
+        else:
+            result = await self.hedger.run(
+                endpoint_path, attempt, accept=lambda r: r.status == "success"
+            )
+        if result.policy_metadata:
+            self.hedger.mark_billed(endpoint_path)
+        return result
+
+    async def _query(
+        self,
+        url: str,
+        slug: str,
+        endpoint_path: str,
+        query: str,
+        top_k: int = 5,
+        similarity_threshold: float = 0.5,
+        tenant_name: str | None = None,
+        authorization_token: str | None = None,
+        user_token: str | None = None,
+        syfthub_url: str | None = None,
+    ) -> RetrievalResult:
+        """Send one query (with retries and MPP payment) to a SyftAI-Space endpoint."""
         start_time = time.perf_counter()
 
         # Build SyftAI-Space endpoint URL
@@ -132,6 +179,8 @@ class DataSourceClient:
                     )
 
                     # Handle MPP 402 Payment Required
+                    if response.status_code == 402 and self.hedger is not None:
+                        self.hedger.mark_billed(endpoint_path)
                     if response.status_code == 402 and user_token and syfthub_url:
                         try:
                             x_payment = await handle_mpp_payment(
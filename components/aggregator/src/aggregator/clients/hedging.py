@@ -0,0 +1,162 @@
+"""Request hedging for endpoints with heavy tail latency.
+
+Some spaces answer most requests quickly but occasionally stall. When a
+request has been outstanding for longer than the endpoint's recent p95
+latency, the hedger sends a duplicate and uses whichever answers first; the
+other is cancelled.
+
+Paid endpoints must never be charged twice, so only endpoints known to be
+free are hedged:
+
+- requests carrying credentials (a satellite token or a Hub token for MPP
+  payment) are never hedged: an endpoint may bill by identity without ever
+  answering 402, and the duplicate would be charged too. Clients call
+  :meth:`RequestHedger.run` only for anonymous requests;
+- an endpoint that asked for MPP payment (HTTP 402) or returned
+  ``policy_metadata`` on any response, successful or not, is remembered as
+  billed and never hedged again.
+
+At most ``max_ratio`` of requests are hedged, which bounds the extra load a
+slow endpoint can attract.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from typing import TypeVar
+
+from aggregator.observability import get_logger
+from aggregator.observability.metrics import metrics
+
+T = TypeVar("T")
+
+logger = get_logger(__name__)
+
+HEDGED_REQUESTS = metrics.counter(
+    "aggregator_hedged_requests_total",
+    "Requests for which a duplicate was sent, by client and which request answered",
+    ("client", "winner"),
+)
+
+
+class RequestHedger:
+    """Learns per-endpoint latency and hedges requests that run past its p95.
+
+    Args:
+        name: Client name used in metrics (``data_source`` or ``model``).
+        min_samples: Latencies an endpoint needs before it is hedged.
+        window: Recent latencies kept per endpoint.
+        percentile: Latency percentile after which a duplicate is sent.
+        min_delay: Lower bound on the hedge delay (seconds).
+        max_ratio: Maximum share of requests that may be hedged.
+        max_endpoints: Endpoints tracked; the least recently used are forgotten.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        min_samples: int = 20,
+        window: int = 200,
+        percentile: float = 0.95,
+        min_delay: float = 0.05,
+        max_ratio: float = 0.1,
+        max_endpoints: int = 10_000,
+    ):
+        self.name = name
+        self.min_samples = min_samples
+        self.window = window
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_ratio = max_ratio
+        self.max_endpoints = max_endpoints
+        self._latencies: OrderedDict[str, deque[float]] = OrderedDict()
+        self._billed: set[str] = set()
+        self._requests = 0
+        self._hedges = 0
+
+    def observe(self, key: str, seconds: float) -> None:
+        """Record how long a successful request to an endpoint took."""
+        samples = self._latencies.get(key)
+        if samples is None:
+            samples = self._latencies[key] = deque(maxlen=self.window)
+            while len(self._latencies) > self.max_endpoints:
+                self._latencies.popitem(last=False)
+        else:
+            self._latencies.move_to_end(key)
+        samples.append(seconds)
+
+    def mark_billed(self, key: str) -> None:
+        """Never hedge an endpoint that asked for payment or reported a policy."""
+        if key not in self._billed:
+            logger.info("hedging.endpoint_billed", client=self.name, endpoint=key)
+            self._billed.add(key)
+
+    def hedge_delay(self, key: str) -> float | None:
+        """Seconds to wait before hedging a request, or None to never hedge it."""
+        if key in self._billed:
+            return None
+        samples = self._latencies.get(key)
+        if samples is None or len(samples) < self.min_samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(self.percentile * len(ordered)))
+        return max(self.min_delay, ordered[index])
+
+    async def run(
+        self,
+        key: str,
+        call: Callable[[], Awaitable[T]],
+        accept: Callable[[T], bool] = lambda _: True,
+    ) -> T:
+        """Run ``call()``, hedging it with a second ``call()`` if it runs long.
+
+        Args:
+            key: Endpoint identity used for latency tracking.
+            call: Starts a request. It must not carry credentials, since the
+                duplicate is an identical request.
+            accept: Whether a result may be used. The first accepted result
+                wins; if none is accepted the original's outcome is returned.
+                Raising counts as not accepted.
+
+        Returns:
+            The winning result (or the original's result or exception).
+        """
+        self._requests += 1
+        start = time.perf_counter()
+        delay = self.hedge_delay(key)
+        primary = asyncio.ensure_future(call())
+        hedge: asyncio.Future[T] | None = None
+        try:
+            if delay is not None:
+                await asyncio.wait({primary}, timeout=delay)
+                if not primary.done() and self._hedges < self.max_ratio * self._requests:
+                    self._hedges += 1
+                    hedge = asyncio.ensure_future(call())
+
+            winner: asyncio.Future[T] = primary
+            if hedge is not None:
+                racers: set[asyncio.Future[T]] = {primary, hedge}
+                chosen: asyncio.Future[T] | None = None
+                while racers and chosen is None:
+                    done, racers = await asyncio.wait(racers, return_when=asyncio.FIRST_COMPLETED)
+                    # Prefer the original when both finish together
+                    for task in sorted(done, key=lambda t: t is not primary):
+                        if task.exception() is None and accept(task.result()):
+                            chosen = task
+                            break
+                winner = chosen or primary
+                HEDGED_REQUESTS.inc(
+                    client=self.name, winner="hedge" if winner is hedge else "primary"
+                )
+
+            result = await winner
+            if accept(result):
+                self.observe(key, time.perf_counter() - start)
+            return result
+        finally:
+            for request in (primary, hedge):
+                if request is not None and not request.done():
+                    request.cancel()
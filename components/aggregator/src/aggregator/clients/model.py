@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, Awaitable
 from typing import TYPE_CHECKING, Any
 
 import httpx
@@ -19,6 +19,7 @@ from aggregator.schemas.requests import Message
 
 if TYPE_CHECKING:
     from aggregator.clients.error_reporter import ErrorReporter
+    from aggregator.clients.hedging import RequestHedger
 
 logger = get_logger(__name__)
 
@@ -57,10 +58,12 @@ class ModelClient:
         timeout: float = 120.0,
         error_reporter: ErrorReporter | None = None,
         http_client: httpx.AsyncClient | None = None,
+        hedger: RequestHedger | None = None,
     ):
         self.timeout = httpx.Timeout(timeout)
         self.error_reporter = error_reporter
         self.http_client = http_client
+        self.hedger = hedger
 
     async def chat(
         self,
@@ -96,6 +99,55 @@ class ModelClient:
         Raises:
             ModelClientError: If the request fails
         """
+
+        def attempt() -> Awaitable[GenerationResult]:
+            return self._chat(
+                url,
+                slug,
+                messages,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                tenant_name=tenant_name,
+                authorization_token=authorization_token,
+                user_token=user_token,
+                syfthub_url=syfthub_url,
+            )
+
+        if self.hedger is None:
+            return await attempt()
+        key = self._hedge_key(url, slug)
+        try:
+            # Credentials may be billed without a 402, so only anonymous
+            # requests are hedged (see hedging.py)
+            if authorization_token or user_token:
+                result = await attempt()
+            else:
+                result = await self.hedger.run(key, attempt)
+        except ModelClientError as e:
+            if e.policy_metadata:
+                self.hedger.mark_billed(key)
+            raise
+        if result.policy_metadata:
+            self.hedger.mark_billed(key)
+        return result
+
+    @staticmethod
+    def _hedge_key(url: str, slug: str) -> str:
+        return f"{url.rstrip('/')}/{slug}"
+
+    async def _chat(
+        self,
+        url: str,
+        slug: str,
+        messages: list[Message],
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        tenant_name: str | None = None,
+        authorization_token: str | None = None,
+        user_token: str | None = None,
+        syfthub_url: str | None = None,
+    ) -> GenerationResult:
+        """Send one chat request (with retries and MPP payment) to a model endpoint."""
         start_time = time.perf_counter()
 
         # Build SyftAI-Space endpoint URL
@@ -148,6 +200,8 @@ class ModelClient:
                     )
 
                     # Handle MPP 402 Payment Required
+                    if response.status_code == 402 and self.hedger is not None:
+                        self.hedger.mark_billed(self._hedge_key(url, slug))
                     if response.status_code == 402 and user_token and syfthub_url:
                         try:
                             x_payment = await handle_mpp_payment(
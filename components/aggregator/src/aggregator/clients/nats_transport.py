@@ -8,17 +8,31 @@ Subject namespace:
 - `syfthub.spaces.{username}` — space listens here for incoming requests
 - `syfthub.peer.{peer_channel}` — aggregator subscribes here for replies
 
+Replies are multiplexed: the transport keeps one subscription per peer channel
+for as long as requests are in flight on it (plus a short idle grace period),
+and routes each reply to its waiting request by `correlation_id`. A chat that
+fans out to many tunneling data sources therefore costs one SUB/UNSUB pair
+rather than one per source.
+
 Message format: syfthub-tunnel/v1 protocol with mandatory E2E encryption.
 All payloads are encrypted using X25519 ECDH + AES-256-GCM (see aggregator/crypto.py).
+With AGGREGATOR_NATS_SESSION_KEYS_ENABLED, requests reuse a per-space
+TunnelSession instead of running a fresh ECDH for every request.
+
+Serialization and crypto for payloads above AGGREGATOR_TUNNEL_OFFLOAD_THRESHOLD_BYTES
+run on a PayloadExecutor thread pool so large retrieval results do not block
+the event loop (see aggregator/core/offload.py).
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
 import logging
 import time
 import uuid
+from dataclasses import dataclass, field
 from typing import Any
 
 import httpx
@@ -28,6 +42,7 @@ from nats.aio.client import Client as NATSClient
 
 from aggregator import crypto
 from aggregator.core.config import get_settings
+from aggregator.core.offload import PayloadExecutor
 from aggregator.schemas.internal import GenerationResult, RetrievalResult
 from aggregator.schemas.responses import Document
 
@@ -39,6 +54,27 @@ TUNNELING_PREFIX = "tunneling:"
 # Key cache TTL in seconds — refresh the cached public key after this interval
 _KEY_CACHE_TTL = 300.0
 
+# Seconds a peer-channel reply subscription stays open after its last request
+# completes, so back-to-back chats on the same channel reuse it.
+_REPLY_SUB_IDLE_TTL = 60.0
+
+
+def _approx_payload_size(value: Any, depth: int = 4) -> int:
+    """Cheap lower-bound estimate of a payload's JSON size in bytes.
+
+    Sums string lengths a few levels deep (chat messages, document lists)
+    without serializing, so the offload decision costs almost nothing.
+    """
+    if isinstance(value, str):
+        return len(value)
+    if depth <= 0:
+        return 0
+    if isinstance(value, dict):
+        return sum(len(k) + _approx_payload_size(v, depth - 1) for k, v in value.items())
+    if isinstance(value, list | tuple):
+        return sum(_approx_payload_size(v, depth - 1) for v in value)
+    return 8
+
 
 def is_tunneling_url(url: str) -> bool:
     """Check if a URL is a tunneling URL."""
@@ -64,6 +100,40 @@ class NATSTransportError(Exception):
         self.policy_metadata = policy_metadata
 
 
+@dataclass
+class _ReplyRoute:
+    """A shared subscription on one peer channel, routing replies by correlation_id."""
+
+    nc: NATSClient
+    ready: asyncio.Future[None]
+    executor: PayloadExecutor
+    pending: dict[str, asyncio.Future[dict[str, Any]]] = field(default_factory=dict)
+    subscription: Any = None
+    idle_timer: asyncio.TimerHandle | None = None
+
+    def expect(self, correlation_id: str) -> asyncio.Future[dict[str, Any]]:
+        """Register a waiter for the reply carrying ``correlation_id``."""
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self.pending[correlation_id] = future
+        if self.idle_timer is not None:
+            self.idle_timer.cancel()
+            self.idle_timer = None
+        return future
+
+    async def dispatch(self, msg: Any) -> None:
+        """NATS callback: hand a reply to the request waiting on its correlation_id."""
+        try:
+            data = await self.executor.run("decode_reply", len(msg.data), json.loads, msg.data)
+        except Exception:
+            logger.warning(f"Dropping undecodable reply on {msg.subject!r}")
+            return
+        if not isinstance(data, dict):
+            return
+        future = self.pending.get(data.get("correlation_id", ""))
+        if future is not None and not future.done():
+            future.set_result(data)
+
+
 class NATSTransport:
     """Transport for sending requests to tunneling spaces via NATS.
 
@@ -78,6 +148,7 @@ class NATSTransport:
         backend_url: str | None = None,
         default_timeout: float = 30.0,
         http_client: httpx.AsyncClient | None = None,
+        payload_executor: PayloadExecutor | None = None,
     ):
         settings = get_settings()
         self._nats_url = nats_url or settings.nats_url
@@ -89,6 +160,21 @@ class NATSTransport:
         self._lock = asyncio.Lock()
         # Key cache: username -> (public_key_b64, fetched_at_timestamp)
         self._key_cache: dict[str, tuple[str, float]] = {}
+        # Shared reply subscriptions: peer_channel -> route
+        self._reply_routes: dict[str, _ReplyRoute] = {}
+        self._expiring_routes: set[asyncio.Task[None]] = set()
+        # Tunnel sessions (opt-in): space public key -> reusable session keys
+        self._session_keys_enabled = settings.nats_session_keys_enabled
+        self._session_key_ttl = settings.nats_session_key_ttl
+        self._session_key_max_messages = settings.nats_session_key_max_messages
+        self._sessions: dict[str, crypto.TunnelSession] = {}
+        # Large payload serialization/crypto runs off the event loop
+        self._payload_executor = payload_executor or PayloadExecutor(
+            threshold_bytes=(
+                settings.tunnel_offload_threshold_bytes if settings.tunnel_offload_enabled else None
+            ),
+            max_workers=settings.tunnel_offload_workers or None,
+        )
 
     async def _ensure_connected(self) -> NATSClient:
         """Ensure we have an active NATS connection."""
@@ -110,10 +196,91 @@ class NATSTransport:
 
     async def close(self) -> None:
         """Close the NATS connection."""
+        routes, self._reply_routes = self._reply_routes, {}
+        for route in routes.values():
+            if route.idle_timer is not None:
+                route.idle_timer.cancel()
+        self._sessions.clear()
+        self._payload_executor.shutdown()
         if self._nc is not None and self._nc.is_connected:
             await self._nc.close()
             self._nc = None
 
+    async def _expect_reply(
+        self, nc: NATSClient, peer_channel: str, correlation_id: str
+    ) -> asyncio.Future[dict[str, Any]]:
+        """Register for a reply on the peer channel's shared subscription.
+
+        Creates the subscription on first use (or after a reconnect replaced the
+        client). The waiter is registered before subscribing, so a reply that
+        arrives while the SUB is in flight is still routed. Returns only once
+        the subscription is active on the server, so it is safe to publish.
+        """
+        route = self._reply_routes.get(peer_channel)
+        if route is not None and route.nc is nc:
+            future = route.expect(correlation_id)
+            try:
+                await asyncio.shield(route.ready)
+            except BaseException:
+                route.pending.pop(correlation_id, None)
+                raise
+            return future
+
+        route = _ReplyRoute(
+            nc=nc,
+            ready=asyncio.get_running_loop().create_future(),
+            executor=self._payload_executor,
+        )
+        self._reply_routes[peer_channel] = route
+        future = route.expect(correlation_id)
+        try:
+            route.subscription = await nc.subscribe(
+                f"syfthub.peer.{peer_channel}", cb=route.dispatch
+            )
+            # Make sure the server has processed the SUB before anyone publishes
+            await nc.flush()
+        except BaseException as exc:
+            if self._reply_routes.get(peer_channel) is route:
+                del self._reply_routes[peer_channel]
+            # Fail any requests that joined while the SUB was in flight
+            if isinstance(exc, Exception):
+                route.ready.set_exception(exc)
+                route.ready.exception()  # mark retrieved; joiners re-raise via shield
+            else:
+                route.ready.cancel()
+            raise
+        route.ready.set_result(None)
+        return future
+
+    def _release_reply(self, peer_channel: str, correlation_id: str) -> None:
+        """Drop a waiter; schedule unsubscribe once the channel goes idle."""
+        route = self._reply_routes.get(peer_channel)
+        if route is None:
+            return
+        route.pending.pop(correlation_id, None)
+        if route.pending or route.idle_timer is not None:
+            return
+
+        def _expire() -> None:
+            task = asyncio.get_running_loop().create_task(
+                self._expire_reply_route(peer_channel, route)
+            )
+            self._expiring_routes.add(task)
+            task.add_done_callback(self._expiring_routes.discard)
+
+        route.idle_timer = asyncio.get_running_loop().call_later(_REPLY_SUB_IDLE_TTL, _expire)
+
+    async def _expire_reply_route(self, peer_channel: str, route: _ReplyRoute) -> None:
+        """Unsubscribe an idle peer channel (unless it was reused meanwhile)."""
+        route.idle_timer = None
+        if route.pending or self._reply_routes.get(peer_channel) is not route:
+            return
+        del self._reply_routes[peer_channel]
+        try:
+            await route.subscription.unsubscribe()
+        except Exception:
+            logger.debug(f"Unsubscribe from idle peer channel {peer_channel} failed", exc_info=True)
+
     async def _get_space_public_key(self, username: str) -> str:
         """Fetch and cache the X25519 public key for a tunneling space.
 
@@ -177,7 +344,23 @@ class NATSTransport:
 
     def _evict_key_cache(self, username: str) -> None:
         """Evict a cached key (called after decryption failure to force re-fetch)."""
-        self._key_cache.pop(username, None)
+        cached = self._key_cache.pop(username, None)
+        if cached is not None:
+            self._sessions.pop(cached[0], None)
+
+    def _get_session(self, space_public_key: str) -> crypto.TunnelSession | None:
+        """Return a live tunnel session for a space key, or None if sessions are disabled."""
+        if not self._session_keys_enabled:
+            return None
+        session = self._sessions.get(space_public_key)
+        if session is None or session.expired:
+            session = crypto.TunnelSession(
+                space_public_key,
+                ttl_seconds=self._session_key_ttl,
+                max_messages=self._session_key_max_messages,
+            )
+            self._sessions[space_public_key] = session
+        return session
 
     def _build_tunnel_request(
         self,
@@ -188,12 +371,13 @@ class NATSTransport:
         space_public_key: str,
         timeout_ms: int = 30000,
         satellite_token: str | None = None,
+        session: crypto.TunnelSession | None = None,
     ) -> tuple[str, dict[str, Any], X25519PrivateKey]:
         """Build a syfthub-tunnel/v1 encrypted request message.
 
-        Generates a fresh ephemeral X25519 keypair, encrypts the payload,
-        and returns the request dict alongside the ephemeral private key
-        (needed to decrypt the response).
+        Generates a fresh ephemeral X25519 keypair (or reuses the session's),
+        encrypts the payload, and returns the request dict alongside the
+        ephemeral private key (needed to decrypt the response).
 
         Args:
             slug: Endpoint slug.
@@ -203,6 +387,7 @@ class NATSTransport:
             space_public_key: Base64url-encoded X25519 public key of the target space.
             timeout_ms: Request timeout in milliseconds.
             satellite_token: Optional RS256 satellite token for authentication.
+            session: Optional tunnel session to encrypt with (session mode).
 
         Returns:
             Tuple of (correlation_id, message_dict, ephemeral_private_key).
@@ -211,11 +396,15 @@ class NATSTransport:
         correlation_id = str(uuid.uuid4())
         payload_json = json.dumps(payload)
 
-        encryption_info, ephemeral_priv = crypto.encrypt_tunnel_request(
-            payload_json=payload_json,
-            space_public_key_b64=space_public_key,
-            correlation_id=correlation_id,
-        )
+        if session is not None:
+            encryption_info = session.encrypt_request(payload_json, correlation_id)
+            ephemeral_priv = session.private_key
+        else:
+            encryption_info, ephemeral_priv = crypto.encrypt_tunnel_request(
+                payload_json=payload_json,
+                space_public_key_b64=space_public_key,
+                correlation_id=correlation_id,
+            )
 
         message: dict[str, Any] = {
             "protocol": TUNNEL_PROTOCOL_VERSION,
@@ -240,6 +429,43 @@ class NATSTransport:
 
         return correlation_id, message, ephemeral_priv
 
+    def _encode_tunnel_request(self, **request_kwargs: Any) -> tuple[str, bytes, X25519PrivateKey]:
+        """Build and serialize a tunnel request (may run on a worker thread).
+
+        Returns:
+            Tuple of (correlation_id, wire_bytes, ephemeral_private_key).
+        """
+        correlation_id, message, ephemeral_priv = self._build_tunnel_request(**request_kwargs)
+        return correlation_id, json.dumps(message).encode(), ephemeral_priv
+
+    @staticmethod
+    def _decrypt_response_payload(
+        encrypted_payload_b64: str,
+        enc_info: dict[str, str],
+        correlation_id: str,
+        ephemeral_priv: X25519PrivateKey,
+        session: crypto.TunnelSession | None,
+    ) -> Any:
+        """Decrypt and parse a response payload (may run on a worker thread).
+
+        Raises:
+            InvalidTag: If decryption fails.
+        """
+        if session is not None:
+            decrypted_json = session.decrypt_response(
+                encrypted_payload_b64=encrypted_payload_b64,
+                encryption_info=enc_info,
+                correlation_id=correlation_id,
+            )
+        else:
+            decrypted_json = crypto.decrypt_tunnel_response(
+                encrypted_payload_b64=encrypted_payload_b64,
+                encryption_info=enc_info,
+                ephemeral_private_key=ephemeral_priv,
+                correlation_id=correlation_id,
+            )
+        return json.loads(decrypted_json)
+
     async def _send_and_receive(
         self,
         target_username: str,
@@ -281,37 +507,32 @@ class NATSTransport:
         space_public_key = await self._get_space_public_key(target_username)
 
         nc = await self._ensure_connected()
+        session = self._get_session(space_public_key)
 
         # Build the encrypted request message; retain ephemeral_priv for response decryption
-        correlation_id, request_msg, ephemeral_priv = self._build_tunnel_request(
-            slug=slug,
-            endpoint_type=endpoint_type,
-            payload=payload,
-            peer_channel=peer_channel,
-            space_public_key=space_public_key,
-            timeout_ms=timeout_ms,
-            satellite_token=satellite_token,
+        correlation_id, request_data, ephemeral_priv = await self._payload_executor.run(
+            "encode_request",
+            _approx_payload_size(payload),
+            functools.partial(
+                self._encode_tunnel_request,
+                slug=slug,
+                endpoint_type=endpoint_type,
+                payload=payload,
+                peer_channel=peer_channel,
+                space_public_key=space_public_key,
+                timeout_ms=timeout_ms,
+                satellite_token=satellite_token,
+                session=session,
+            ),
         )
 
-        # Subscribe to reply channel BEFORE publishing (prevents race condition)
-        reply_subject = f"syfthub.peer.{peer_channel}"
-        response_future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
-
-        async def message_handler(msg: Any) -> None:
-            try:
-                data = json.loads(msg.data.decode())
-                if data.get("correlation_id") == correlation_id and not response_future.done():
-                    response_future.set_result(data)
-            except Exception as exc:
-                if not response_future.done():
-                    response_future.set_exception(exc)
-
-        sub = await nc.subscribe(reply_subject, cb=message_handler)
+        # Register on the peer channel's shared reply subscription BEFORE
+        # publishing (prevents the reply racing the subscription)
+        response_future = await self._expect_reply(nc, peer_channel, correlation_id)
 
         try:
             publish_subject = f"syfthub.spaces.{target_username}"
-            await nc.publish(publish_subject, json.dumps(request_msg).encode())
-            await nc.flush()
+            await nc.publish(publish_subject, request_data)
 
             logger.info(
                 f"Published encrypted tunnel request to {publish_subject} "
@@ -327,7 +548,7 @@ class NATSTransport:
                 code="TIMEOUT",
             )
         finally:
-            await sub.unsubscribe()
+            self._release_reply(peer_channel, correlation_id)
 
         # Decrypt the response payload
         enc_info = raw_response.get("encryption_info")
@@ -340,12 +561,22 @@ class NATSTransport:
                 code="DECRYPTION_FAILED",
             )
 
+        if session is None and enc_info.get("algorithm") == crypto.SESSION_ALGORITHM_ID:
+            raise NATSTransportError(
+                f"Response from {target_username}/{slug} uses session keys that were not offered.",
+                code="DECRYPTION_FAILED",
+            )
+
         try:
-            decrypted_json = crypto.decrypt_tunnel_response(
-                encrypted_payload_b64=encrypted_payload_b64,
-                encryption_info=enc_info,
-                ephemeral_private_key=ephemeral_priv,
-                correlation_id=correlation_id,
+            decrypted_payload = await self._payload_executor.run(
+                "decrypt_response",
+                len(encrypted_payload_b64),
+                self._decrypt_response_payload,
+                encrypted_payload_b64,
+                enc_info,
+                correlation_id,
+                ephemeral_priv,
+                session,
             )
         except crypto.InvalidTag as exc:
             # GCM tag failure could indicate key rotation; evict the cached key so the
@@ -359,7 +590,7 @@ class NATSTransport:
 
         # Replace encrypted fields with decrypted payload in the response dict
         raw_response = dict(raw_response)
-        raw_response["payload"] = json.loads(decrypted_json)
+        raw_response["payload"] = decrypted_payload
 
         # If the space reported DECRYPTION_FAILED, it couldn't decrypt our request —
         # most likely because the space restarted and registered a new X25519 keypair
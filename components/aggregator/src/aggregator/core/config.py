@@ -39,6 +39,77 @@ class Settings(BaseSettings):
     default_top_k: int = 5
     max_top_k: int = 20
     max_data_sources: int = 10
+    # Request-level retrieval cap: retrieval returns after retrieval_deadline
+    # seconds (0 waits for every source), or earlier once retrieval_quorum_sources
+    # sources have succeeded or retrieval_quorum_documents documents at or above the
+    # similarity threshold are in (0 disables each). Sources not back by then are
+    # reported as "timeout" and their queries finish in the background.
+    retrieval_deadline: float = 30.0
+    retrieval_quorum_sources: int = 0
+    retrieval_quorum_documents: int = 0
+    # Retrieval result cache for data sources whose owners opted in with a
+    # "retrieval_cache_ttl" (seconds) in their connection config, capped at
+    # retrieval_cache_max_ttl. In-process LRU of retrieval_cache_max_entries results
+    # plus an optional shared tier at retrieval_cache_url ("redis://..."; requires
+    # the "cache" extra). Results with policy metadata (e.g. paid) are cached per caller.
+    retrieval_cache_enabled: bool = True
+    retrieval_cache_max_entries: int = 10_000
+    retrieval_cache_max_ttl: int = 3600
+    retrieval_cache_url: str = ""
+
+    # Per-data-source circuit breakers: once failure_rate of the outcomes in the
+    # last window_seconds have failed (with at least min_requests outcomes), a
+    # source is skipped for open_seconds before a single probe request is let
+    # through. Payment and access refusals do not count as failures.
+    circuit_breaker_enabled: bool = True
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_min_requests: int = 5
+    circuit_breaker_window_seconds: float = 60.0
+    circuit_breaker_open_seconds: float = 30.0
+
+    # Request hedging (opt-in): a data source query or model call still running
+    # after the endpoint's recent p95 latency (learned from hedging_min_samples
+    # successes) gets a duplicate request and whichever answers first is used.
+    # Duplicates never carry payment credentials and endpoints that asked for
+    # MPP payment are never hedged. At most hedging_max_ratio of requests are hedged.
+    hedging_enabled: bool = False
+    hedging_min_samples: int = 20
+    hedging_min_delay_ms: float = 50.0
+    hedging_max_ratio: float = 0.1
+
+    # Reranker configuration (CENTRAL_REEMBEDDING)
+    # The embedding model is loaded once at startup and shared by all requests;
+    # reranker_workers bounds concurrent encodes, reranker_max_pending bounds the
+    # queue (requests beyond it fall back to raw-score ordering).
+    reranker_enabled: bool = True
+    reranker_model_name: str = "BAAI/bge-base-en-v1.5"
+    reranker_workers: int = 2
+    reranker_max_pending: int = 32
+    reranker_threads: int | None = None  # ONNX intra-op threads per encode (None = runtime default)
+    # Cross-request micro-batching: texts from concurrent requests are merged into
+    # one forward pass, flushed at batch_max_size texts or after batch_max_wait_ms.
+    reranker_batch_max_size: int = 64
+    reranker_batch_max_wait_ms: float = 5.0  # 0 disables batching (flush immediately)
+    # Embedding cache keyed by (model, SHA-256 of content): an in-process LRU bounded
+    # by reranker_cache_max_bytes (0 disables caching) plus an optional shared tier
+    # at reranker_cache_url ("redis://..." or a directory path; requires the
+    # "cache" extra for Redis).
+    reranker_cache_max_bytes: int = 64 * 1024 * 1024
+    reranker_cache_url: str = ""
+    reranker_cache_ttl: int = 86400  # seconds (Redis tier only)
+    # Byte budget of a directory shared tier; least recently used files are
+    # evicted beyond it (0 = unbounded)
+    reranker_cache_disk_max_bytes: int = 1024 * 1024 * 1024
+    # Semantic prompt cache (opt-in per request with ChatRequest.semantic_cache):
+    # answers are reused for prompts whose reranker embedding has cosine similarity
+    # >= prompt_cache_similarity_threshold within the same model, data sources,
+    # system prompt and top_k. Only answers from sources that all opted in to
+    # retrieval caching, with no billing, are kept (at most prompt_cache_max_ttl
+    # seconds). Requires the reranker.
+    prompt_cache_enabled: bool = False
+    prompt_cache_similarity_threshold: float = 0.95
+    prompt_cache_max_ttl: int = 3600
+    prompt_cache_max_entries: int = 10_000
 
     # Model streaming configuration
     # TODO: Set to True when SyftAI-Space implements model streaming.
@@ -51,6 +122,20 @@ class Settings(BaseSettings):
     nats_url: str = "nats://nats:4222"
     nats_auth_token: str = ""
     nats_tunnel_timeout: float = 30.0
+    # Tunnel session keys: reuse one ephemeral keypair (and the derived AES keys)
+    # per target space instead of a fresh ECDH per request. Spaces that do not
+    # support it keep working; sessions rotate after the TTL or message budget.
+    nats_session_keys_enabled: bool = False
+    nats_session_key_ttl: float = 300.0  # seconds
+    nats_session_key_max_messages: int = 100_000
+    # Payload serialization/crypto above this size runs on a thread pool
+    # (tunnel_offload_workers threads; 0 = one per CPU core) instead of the loop
+    tunnel_offload_enabled: bool = True
+    tunnel_offload_threshold_bytes: int = 64 * 1024
+    tunnel_offload_workers: int = 0
+
+    # Event-loop lag sampling interval in seconds for GET /metrics (0 disables)
+    loop_lag_monitor_interval: float = 0.25
 
     # Default model for /q endpoint (owner/slug format)
     default_query_model: str = "testuser/llm-proxy"
@@ -0,0 +1,92 @@
+"""Off-loop execution for CPU-heavy payload work.
+
+Serializing, encrypting and decrypting whole retrieval payloads is CPU-bound.
+Done inline it holds the event loop, stalling every other in-flight chat for
+the duration. PayloadExecutor runs such work inline when the payload is small
+(a thread hop costs more than the work) and on a thread pool sized to the
+cores once it crosses a size threshold.
+
+AES-GCM and base64 in ``cryptography``/``binascii`` run in native code; JSON
+encoding does not release the GIL, but the interpreter still switches threads
+every few milliseconds, so the loop keeps serving other requests instead of
+waiting for one large payload to finish.
+
+Every call is timed into ``aggregator_payload_work_seconds``; the ``inline``
+series is time the event loop was blocked.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TypeVar
+
+from aggregator.observability.metrics import metrics
+
+T = TypeVar("T")
+
+PAYLOAD_WORK_SECONDS = metrics.histogram(
+    "aggregator_payload_work_seconds",
+    "Time spent on payload serialization/crypto; mode=inline is event-loop blocking time",
+    ("op", "mode"),
+)
+PAYLOAD_WORK_BYTES = metrics.counter(
+    "aggregator_payload_work_bytes_total",
+    "Payload bytes processed by serialization/crypto work",
+    ("op", "mode"),
+)
+
+
+class PayloadExecutor:
+    """Runs payload work inline below ``threshold_bytes`` and on a thread pool above it.
+
+    Args:
+        threshold_bytes: Payload size at which work moves off the loop.
+            None keeps all work inline (still measured).
+        max_workers: Thread pool size; defaults to the number of CPU cores.
+    """
+
+    def __init__(
+        self,
+        threshold_bytes: int | None = 64 * 1024,
+        max_workers: int | None = None,
+    ):
+        self.threshold_bytes = threshold_bytes
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self._executor: ThreadPoolExecutor | None = None
+
+    def should_offload(self, size: int) -> bool:
+        """Whether work on a payload of ``size`` bytes runs on the pool."""
+        return self.threshold_bytes is not None and size >= self.threshold_bytes
+
+    async def run(self, op: str, size: int, fn: Callable[..., T], *args: object) -> T:
+        """Run ``fn(*args)`` for a payload of ``size`` bytes, off the loop if large.
+
+        Args:
+            op: Short operation name used as a metrics label.
+            size: Payload size in bytes (an estimate is fine).
+            fn: The CPU-bound callable.
+        """
+        mode = "offloaded" if self.should_offload(size) else "inline"
+        start = time.perf_counter()
+        try:
+            if mode == "inline":
+                return fn(*args)
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="payload",
+                )
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            PAYLOAD_WORK_SECONDS.observe(time.perf_counter() - start, op=op, mode=mode)
+            PAYLOAD_WORK_BYTES.inc(size, op=op, mode=mode)
+
+    def shutdown(self) -> None:
+        """Stop the thread pool (pending work is cancelled)."""
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
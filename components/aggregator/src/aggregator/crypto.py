@@ -20,12 +20,29 @@ Protocol:
     3. plaintext = AES-256-GCM-Decrypt(aes_key, nonce, ciphertext, aad=correlation_id.encode())
 
 Response uses HKDF_RESPONSE_INFO so request/response keys are always distinct.
+
+Session mode (opt-in, negotiated):
+  The per-request keypair + ECDH + HKDF above dominates CPU cost for small
+  payloads. A TunnelSession instead keeps one ephemeral keypair per target space
+  for a bounded lifetime (time and message count), derives the request and
+  response keys once, and encrypts each request with a counter nonce, so a nonce
+  never repeats under a session key. Requests are sent with SESSION_ALGORITHM_ID.
+
+  Negotiation is implicit and backward compatible: the request key is derived
+  exactly as above, so spaces that predate session mode decrypt it unchanged and
+  answer with a classic per-response ECDH (ALGORITHM_ID), which the session
+  still decrypts with its private key. Spaces that support session mode cache
+  the keys for the session's ephemeral public key and answer with
+  SESSION_ALGORITHM_ID, encrypting under the session response key with their
+  own prefix+counter nonces.
 """
 
 from __future__ import annotations
 
 import base64
 import os
+import threading
+import time
 
 from cryptography.exceptions import InvalidTag
 from cryptography.hazmat.primitives.asymmetric.x25519 import (
@@ -47,6 +64,12 @@ HKDF_RESPONSE_INFO: bytes = b"syfthub-tunnel-response-v1"
 NONCE_SIZE: int = 12  # 96-bit nonce for AES-256-GCM
 
 ALGORITHM_ID: str = "X25519-ECDH-AES-256-GCM"
+SESSION_ALGORITHM_ID: str = "X25519-ECDH-AES-256-GCM-SESSION"
+
+# Session mode request nonces are a fixed 4-byte prefix + 8-byte big-endian
+# counter. Responses from the space use their own random prefix under a
+# distinct key, so the two directions never collide.
+_SESSION_NONCE_PREFIX: bytes = b"\x00" * 4
 
 
 def _b64url_encode(data: bytes) -> str:
@@ -90,6 +113,11 @@ def derive_key(
     """
     peer_pub = X25519PublicKey.from_public_bytes(peer_public_key_bytes)
     shared_secret = private_key.exchange(peer_pub)
+    return _hkdf(shared_secret, info)
+
+
+def _hkdf(shared_secret: bytes, info: bytes) -> bytes:
+    """Derive a 32-byte AES key from an ECDH shared secret."""
     return HKDF(
         algorithm=SHA256(),
         length=32,
@@ -98,6 +126,20 @@ def derive_key(
     ).derive(shared_secret)
 
 
+def derive_session_keys(
+    private_key: X25519PrivateKey,
+    peer_public_key_bytes: bytes,
+) -> tuple[bytes, bytes]:
+    """Perform one X25519 ECDH and derive both the request and response AES keys.
+
+    Returns:
+        Tuple of (request_key, response_key).
+    """
+    peer_pub = X25519PublicKey.from_public_bytes(peer_public_key_bytes)
+    shared_secret = private_key.exchange(peer_pub)
+    return _hkdf(shared_secret, HKDF_REQUEST_INFO), _hkdf(shared_secret, HKDF_RESPONSE_INFO)
+
+
 def encrypt_payload(
     plaintext: bytes,
     aes_key: bytes,
@@ -218,14 +260,116 @@ def decrypt_tunnel_response(
     return plaintext.decode()
 
 
+class TunnelSession:
+    """Reusable tunnel keys for one (aggregator, space) pair.
+
+    Holds one ephemeral X25519 keypair and the request/response AES keys derived
+    from it against the space's long-term public key. Request nonces come from a
+    counter, so they are unique for the lifetime of the session. A session must
+    be replaced once ``expired`` is true (age or message budget exhausted).
+    """
+
+    def __init__(
+        self,
+        space_public_key_b64: str,
+        ttl_seconds: float = 300.0,
+        max_messages: int = 100_000,
+    ):
+        self.space_public_key_b64 = space_public_key_b64
+        self._private_key, public_key_bytes = generate_keypair()
+        self.ephemeral_public_key_b64 = _b64url_encode(public_key_bytes)
+        request_key, response_key = derive_session_keys(
+            self._private_key, _b64url_decode(space_public_key_b64)
+        )
+        self._request_aead = AESGCM(request_key)
+        self._response_aead = AESGCM(response_key)
+        self._ttl = ttl_seconds
+        # Rotation threshold; requests already holding the session may finish
+        # past it, so the hard stop is the 64-bit counter space itself.
+        self._max_messages = min(max_messages, 2**63)
+        self._created_at = time.monotonic()
+        self._counter = 0
+        # Encryption may run on executor threads; the counter must not be shared
+        # between two messages.
+        self._lock = threading.Lock()
+
+    @property
+    def private_key(self) -> X25519PrivateKey:
+        """The session's ephemeral private key (decrypts classic responses)."""
+        return self._private_key
+
+    @property
+    def expired(self) -> bool:
+        """Whether the session has outlived its TTL or message budget."""
+        return (
+            self._counter >= self._max_messages or time.monotonic() - self._created_at >= self._ttl
+        )
+
+    def _next_nonce(self) -> bytes:
+        with self._lock:
+            if self._counter >= 2**64 - 1:
+                raise RuntimeError("Tunnel session nonce space exhausted")
+            self._counter += 1
+            counter = self._counter
+        return _SESSION_NONCE_PREFIX + counter.to_bytes(8, "big")
+
+    def encrypt_request(self, payload_json: str, correlation_id: str) -> dict[str, str]:
+        """Encrypt a tunnel request payload under the session request key.
+
+        Returns:
+            encryption_info dict: {algorithm, ephemeral_public_key, nonce, encrypted_payload}
+        """
+        nonce = self._next_nonce()
+        ciphertext = self._request_aead.encrypt(
+            nonce, payload_json.encode(), correlation_id.encode()
+        )
+        return {
+            "algorithm": SESSION_ALGORITHM_ID,
+            "ephemeral_public_key": self.ephemeral_public_key_b64,
+            "nonce": _b64url_encode(nonce),
+            "encrypted_payload": _b64url_encode(ciphertext),
+        }
+
+    def decrypt_response(
+        self,
+        encrypted_payload_b64: str,
+        encryption_info: dict[str, str],
+        correlation_id: str,
+    ) -> str:
+        """Decrypt a response to a request sent on this session.
+
+        Session-mode responses use the cached response key; classic responses
+        (from spaces without session support) are decrypted via ECDH as usual.
+
+        Raises:
+            InvalidTag: If decryption fails.
+            KeyError: If encryption_info is missing required fields.
+        """
+        if encryption_info.get("algorithm") != SESSION_ALGORITHM_ID:
+            return decrypt_tunnel_response(
+                encrypted_payload_b64=encrypted_payload_b64,
+                encryption_info=encryption_info,
+                ephemeral_private_key=self._private_key,
+                correlation_id=correlation_id,
+            )
+
+        nonce = _b64url_decode(encryption_info["nonce"])
+        ciphertext = _b64url_decode(encrypted_payload_b64)
+        plaintext = self._response_aead.decrypt(nonce, ciphertext, correlation_id.encode())
+        return plaintext.decode()
+
+
 __all__ = [
     "ALGORITHM_ID",
+    "SESSION_ALGORITHM_ID",
     "HKDF_REQUEST_INFO",
     "HKDF_RESPONSE_INFO",
     "NONCE_SIZE",
     "InvalidTag",
+    "TunnelSession",
     "generate_keypair",
     "derive_key",
+    "derive_session_keys",
     "encrypt_payload",
     "decrypt_payload",
     "encrypt_tunnel_request",
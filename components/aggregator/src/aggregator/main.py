@@ -15,6 +15,7 @@ from aggregator.observability import (
     configure_logging,
     get_logger,
 )
+from aggregator.observability.loop_monitor import EventLoopLagMonitor
 
 # Get settings for logging configuration
 _settings = get_settings()
@@ -48,6 +49,8 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         get_error_reporter,
         get_model_client,
         get_nats_transport,
+        get_reranker_pool,
+        get_retrieval_cache,
     )
 
     shared = _app.state.http_client
@@ -58,8 +61,30 @@ async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
     if nats is not None:
         nats._http_client = shared
 
+    # Load the reranker model once so chat requests never pay the cold start.
+    # A failed load is not fatal: reranking falls back to the per-request path.
+    reranker = get_reranker_pool()
+    if reranker is not None:
+        try:
+            await reranker.start()
+        except Exception:
+            logger.exception("Failed to load reranker model; using per-request reranking")
+
+    # Sample event-loop lag so blocking work shows up on GET /metrics
+    loop_monitor = None
+    if settings.loop_lag_monitor_interval > 0:
+        loop_monitor = EventLoopLagMonitor(interval=settings.loop_lag_monitor_interval)
+        loop_monitor.start()
+
     yield
 
+    if loop_monitor is not None:
+        await loop_monitor.stop()
+    if reranker is not None:
+        await reranker.close()
+    retrieval_cache = get_retrieval_cache()
+    if retrieval_cache is not None:
+        await retrieval_cache.close()
     await _app.state.http_client.aclose()
     logger.info(f"Shutting down {settings.service_name}")
 
@@ -123,7 +148,7 @@ responses using model endpoints registered in SyftHub.
     app.add_middleware(CorrelationIDMiddleware)
 
     # Include routers
-    app.include_router(health_router)  # /health, /ready
+    app.include_router(health_router)  # /health, /ready, /metrics
     app.include_router(api_router)  # /api/v1/chat, /api/v1/chat/stream
 
     return app
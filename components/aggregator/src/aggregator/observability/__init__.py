@@ -16,6 +16,7 @@ from aggregator.observability.context import (
     set_correlation_id,
 )
 from aggregator.observability.logger import configure_logging, get_logger
+from aggregator.observability.metrics import metrics
 from aggregator.observability.middleware import (
     CorrelationIDMiddleware,
     RequestLoggingMiddleware,
@@ -30,6 +31,8 @@ __all__ = [
     # Logger
     "configure_logging",
     "get_logger",
+    # Metrics
+    "metrics",
     # Middleware
     "CorrelationIDMiddleware",
     "RequestLoggingMiddleware",
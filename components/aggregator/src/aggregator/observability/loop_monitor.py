@@ -0,0 +1,47 @@
+"""Event-loop lag monitor.
+
+A background task sleeps for a fixed interval and records how late it wakes up.
+Any lag means some callback held the loop (CPU-bound work, blocking I/O) while
+other requests were waiting, so the ``aggregator_event_loop_lag_seconds``
+histogram is the end-to-end measure of loop blocking.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import time
+
+from aggregator.observability.metrics import metrics
+
+EVENT_LOOP_LAG_SECONDS = metrics.histogram(
+    "aggregator_event_loop_lag_seconds",
+    "How late the event loop ran a timer scheduled for a fixed interval",
+)
+
+
+class EventLoopLagMonitor:
+    """Samples event-loop scheduling lag every ``interval`` seconds."""
+
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self._task: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start sampling on the running loop (no-op if already started)."""
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop sampling."""
+        task, self._task = self._task, None
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _run(self) -> None:
+        while True:
+            expected = time.perf_counter() + self.interval
+            await asyncio.sleep(self.interval)
+            EVENT_LOOP_LAG_SECONDS.observe(max(0.0, time.perf_counter() - expected))
@@ -37,6 +37,10 @@ class ResolvedEndpoint(BaseModel):
         default=None,
         description="If set, use this as the retrieval query instead of the request prompt.",
     )
+    cache_ttl_seconds: int | None = Field(
+        default=None,
+        description="Seconds retrieval results may be cached (None disables caching)",
+    )
 
 
 class RetrievalResult(BaseModel):
@@ -38,6 +38,11 @@ class EndpointRef(BaseModel):
         default=None,
         description="If set, use this as the retrieval query instead of the request prompt (e.g. a URL for url_fetcher).",
     )
+    cache_ttl_seconds: int | None = Field(
+        default=None,
+        description="Seconds the aggregator may cache this data source's retrieval results "
+        "(the owner's 'retrieval_cache_ttl' connection setting; unset disables caching)",
+    )
 
 
 class ChatRequest(BaseModel):
@@ -128,6 +133,11 @@ class ChatRequest(BaseModel):
         default=False,
         description="When True, skip reranking and LLM generation; return only raw retrieved documents.",
     )
+    semantic_cache: bool = Field(
+        default=False,
+        description="Serve the answer to a near-duplicate earlier prompt when one is cached. "
+        "Only applies when every data source opted in to caching and there is no history.",
+    )
 
 
 class Message(BaseModel):
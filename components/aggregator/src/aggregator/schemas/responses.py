@@ -46,6 +46,18 @@ class ResponseMetadata(BaseModel):
     retrieval_time_ms: int = Field(..., description="Time spent retrieving documents")
     generation_time_ms: int = Field(..., description="Time spent generating response")
     total_time_ms: int = Field(..., description="Total request time")
+    cache_hit: bool = Field(
+        default=False,
+        description="Whether the answer was served from the semantic prompt cache",
+    )
+    cache_similarity: float | None = Field(
+        default=None,
+        description="Cosine similarity between this prompt and the cached one (hits only)",
+    )
+    cache_age_seconds: float | None = Field(
+        default=None,
+        description="Seconds since the cached answer was generated (hits only)",
+    )
 
 
 class TokenUsage(BaseModel):
@@ -3,10 +3,13 @@
 from aggregator.services.generation import GenerationError, GenerationService
 from aggregator.services.orchestrator import Orchestrator, OrchestratorError
 from aggregator.services.prompt_builder import PromptBuilder
+from aggregator.services.reranker import RerankerPool, RerankerUnavailableError
 from aggregator.services.retrieval import RetrievalService
 
 __all__ = [
     "PromptBuilder",
+    "RerankerPool",
+    "RerankerUnavailableError",
     "RetrievalService",
     "GenerationService",
     "GenerationError",
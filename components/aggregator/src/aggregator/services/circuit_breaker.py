@@ -0,0 +1,222 @@
+"""Per-data-source circuit breakers.
+
+DataSourceClient retries each query on transient failures, but every chat
+starts from scratch: a space that has been down for minutes still costs each
+request the full retrieval timeout plus its retries. The registry remembers
+recent outcomes per endpoint path and stops sending requests to sources that
+keep failing:
+
+- closed: requests flow; outcomes in the last ``window_seconds`` are kept.
+  Once at least ``min_requests`` are recorded and the failure rate reaches
+  ``failure_rate_threshold`` the circuit opens.
+- open: requests fail fast without touching the source, for ``open_seconds``.
+- half-open: one probe request is let through. Success closes the circuit,
+  failure opens it again.
+
+Each breaker also keeps an EWMA of the source's latency. Breaker state,
+fast-failed requests and latency are exported on ``GET /metrics``.
+
+Breakers are per process and are only touched from the event loop, so they
+need no locking.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable
+from enum import StrEnum
+
+from aggregator.observability.metrics import metrics
+
+CIRCUIT_STATE = metrics.gauge(
+    "aggregator_data_source_circuit_state",
+    "Circuit breaker state per data source (0=closed, 1=half-open, 2=open)",
+    ("source",),
+)
+CIRCUIT_REJECTIONS = metrics.counter(
+    "aggregator_data_source_circuit_rejections_total",
+    "Data source requests failed fast because the circuit was open",
+    ("source",),
+)
+SOURCE_LATENCY_EWMA = metrics.gauge(
+    "aggregator_data_source_latency_ewma_seconds",
+    "Exponentially weighted moving average of data source latency",
+    ("source",),
+)
+
+
+class CircuitState(StrEnum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"
+    HALF_OPEN = "half_open"
+    OPEN = "open"
+
+
+_STATE_VALUES = {CircuitState.CLOSED: 0, CircuitState.HALF_OPEN: 1, CircuitState.OPEN: 2}
+
+
+class CircuitBreaker:
+    """Rolling failure rate, state and EWMA latency of a single data source."""
+
+    def __init__(
+        self,
+        source: str,
+        failure_rate_threshold: float,
+        min_requests: int,
+        window_seconds: float,
+        open_seconds: float,
+        ewma_alpha: float,
+        clock: Callable[[], float],
+    ):
+        self.source = source
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_requests = min_requests
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.ewma_alpha = ewma_alpha
+        self._clock = clock
+        self.state = CircuitState.CLOSED
+        self.latency_ewma_ms: float | None = None
+        # (timestamp, succeeded) of recent outcomes while closed
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._opened_at = 0.0
+        # When the half-open probe was sent (None when no probe is in flight)
+        self._probe_started_at: float | None = None
+
+    def allow_request(self) -> bool:
+        """Return whether a request may be sent to the source now."""
+        if self.state is CircuitState.OPEN:
+            if self._clock() - self._opened_at < self.open_seconds:
+                return False
+            self._set_state(CircuitState.HALF_OPEN)
+        if self.state is CircuitState.HALF_OPEN:
+            now = self._clock()
+            # A probe that never reported back (e.g. cancelled) is replaced
+            if (
+                self._probe_started_at is not None
+                and now - self._probe_started_at < self.open_seconds
+            ):
+                return False
+            self._probe_started_at = now
+        return True
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through (0 if not open)."""
+        if self.state is not CircuitState.OPEN:
+            return 0.0
+        return max(0.0, self.open_seconds - (self._clock() - self._opened_at))
+
+    def record(self, success: bool, latency_ms: float) -> None:
+        """Record the outcome of a request that was allowed through."""
+        if self.latency_ewma_ms is None:
+            self.latency_ewma_ms = latency_ms
+        else:
+            self.latency_ewma_ms += self.ewma_alpha * (latency_ms - self.latency_ewma_ms)
+        SOURCE_LATENCY_EWMA.set(self.latency_ewma_ms / 1000, source=self.source)
+
+        if self.state is CircuitState.HALF_OPEN:
+            self._probe_started_at = None
+            if success:
+                self._outcomes.clear()
+                self._set_state(CircuitState.CLOSED)
+            else:
+                self._open()
+            return
+
+        if self.state is CircuitState.OPEN:
+            # A request started before the circuit opened; it says nothing new.
+            return
+
+        now = self._clock()
+        self._outcomes.append((now, success))
+        while self._outcomes and now - self._outcomes[0][0] > self.window_seconds:
+            self._outcomes.popleft()
+        if len(self._outcomes) >= self.min_requests:
+            failures = sum(1 for _, ok in self._outcomes if not ok)
+            if failures / len(self._outcomes) >= self.failure_rate_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self._set_state(CircuitState.OPEN)
+
+    def _set_state(self, state: CircuitState) -> None:
+        self.state = state
+        CIRCUIT_STATE.set(_STATE_VALUES[state], source=self.source)
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers keyed by data source endpoint path.
+
+    Args:
+        failure_rate_threshold: Failure ratio (0-1) in the window that opens a circuit.
+        min_requests: Outcomes needed in the window before the rate is acted on.
+        window_seconds: How far back outcomes count towards the failure rate.
+        open_seconds: How long an open circuit fails fast before probing.
+        ewma_alpha: Weight of the newest latency sample in the EWMA.
+        max_sources: Breakers kept; the least recently used are forgotten.
+        clock: Monotonic time source (seconds).
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float = 0.5,
+        min_requests: int = 5,
+        window_seconds: float = 60.0,
+        open_seconds: float = 30.0,
+        ewma_alpha: float = 0.2,
+        max_sources: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_requests = min_requests
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.ewma_alpha = ewma_alpha
+        self.max_sources = max_sources
+        self._clock = clock
+        self._breakers: OrderedDict[str, CircuitBreaker] = OrderedDict()
+
+    def get(self, source: str) -> CircuitBreaker:
+        """Return the breaker for a source, creating a closed one if needed."""
+        breaker = self._breakers.get(source)
+        if breaker is not None:
+            self._breakers.move_to_end(source)
+            return breaker
+
+        breaker = CircuitBreaker(
+            source,
+            failure_rate_threshold=self.failure_rate_threshold,
+            min_requests=self.min_requests,
+            window_seconds=self.window_seconds,
+            open_seconds=self.open_seconds,
+            ewma_alpha=self.ewma_alpha,
+            clock=self._clock,
+        )
+        self._breakers[source] = breaker
+        while len(self._breakers) > self.max_sources:
+            evicted, _ = self._breakers.popitem(last=False)
+            CIRCUIT_STATE.remove(source=evicted)
+            SOURCE_LATENCY_EWMA.remove(source=evicted)
+        return breaker
+
+    def allow_request(self, source: str) -> bool:
+        """Return whether a request may be sent to a source, counting rejections."""
+        allowed = self.get(source).allow_request()
+        if not allowed:
+            CIRCUIT_REJECTIONS.inc(source=source)
+        return allowed
+
+    def record(self, source: str, success: bool, latency_ms: float) -> None:
+        """Record the outcome of a request to a source."""
+        self.get(source).record(success, latency_ms)
+
+    def snapshot(self) -> dict[str, dict[str, float | str | None]]:
+        """State and EWMA latency (ms) of every tracked source."""
+        return {
+            source: {"state": breaker.state.value, "latency_ewma_ms": breaker.latency_ewma_ms}
+            for source, breaker in self._breakers.items()
+        }
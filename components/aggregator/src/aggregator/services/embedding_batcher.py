@@ -0,0 +1,92 @@
+"""Cross-request micro-batching for embedding forward passes.
+
+Concurrent chat requests each need their query and retrieved documents
+re-embedded for reranking. Encoding them one request at a time leaves most of
+a CPU forward pass idle on small inputs, so the batcher merges texts queued by
+concurrent callers into a single encode call. A batch is flushed as soon as it
+reaches ``max_batch_size`` texts or ``max_wait_ms`` after its first submission,
+whichever comes first, and each caller receives the rows for its own texts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EncodeFn = Callable[[list[str]], Awaitable[np.ndarray]]
+
+
+class EmbeddingBatcher:
+    """Merge embedding requests from concurrent callers into shared batches."""
+
+    def __init__(
+        self,
+        encode: EncodeFn,
+        max_batch_size: int = 64,
+        max_wait_ms: float = 5.0,
+    ):
+        self._encode = encode
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max(0.0, max_wait_ms) / 1000
+        self._queue: list[tuple[list[str], asyncio.Future[np.ndarray]]] = []
+        self._queued_texts = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._inflight: set[asyncio.Task[None]] = set()
+
+    async def submit(self, texts: list[str]) -> np.ndarray:
+        """Queue texts for the next batch and wait for their embeddings.
+
+        Returns:
+            One row per input text, in input order.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[np.ndarray] = loop.create_future()
+        self._queue.append((texts, future))
+        self._queued_texts += len(texts)
+
+        if self._queued_texts >= self.max_batch_size or self.max_wait == 0:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Hand the queued requests to a background encode task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._queue:
+            return
+
+        batch, self._queue = self._queue, []
+        self._queued_texts = 0
+        task = asyncio.get_running_loop().create_task(self._run(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _run(self, batch: list[tuple[list[str], asyncio.Future[np.ndarray]]]) -> None:
+        """Encode one merged batch and scatter the rows back to each caller."""
+        texts = [text for request_texts, _ in batch for text in request_texts]
+        try:
+            vectors = await self._encode(texts)
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        if len(batch) > 1:
+            logger.debug(f"Embedded {len(texts)} texts for {len(batch)} requests in one batch")
+
+        offset = 0
+        for request_texts, future in batch:
+            end = offset + len(request_texts)
+            if not future.done():
+                future.set_result(vectors[offset:end])
+            offset = end
@@ -0,0 +1,267 @@
+"""Content-addressed cache for reranker embeddings.
+
+Popular data sources return the same chunks across many chat requests, so the
+reranker keeps the vectors it has already computed. Entries are keyed by
+(model name, SHA-256 of the text): changing the reranker model never serves
+stale vectors, and identical content from different sources shares one entry.
+
+Two tiers:
+- an in-process LRU bounded by a byte budget, consulted first;
+- an optional shared tier (Redis, or a local directory) so replicas and
+  restarts reuse each other's work. Shared-tier failures are logged and
+  treated as misses; they never fail a rerank. Redis entries expire after a
+  TTL; the directory is kept under a byte budget by evicting the least
+  recently used files.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Protocol
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_VECTOR_DTYPE = np.float32
+
+# Once over budget, the disk tier evicts down to this fraction of it, so a full
+# directory is not rescanned on every write.
+_DISK_LOW_WATERMARK = 0.9
+
+
+class SharedEmbeddingStore(Protocol):
+    """A cache tier shared between processes, storing raw vector bytes."""
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]: ...
+
+    async def set_many(self, items: dict[str, bytes]) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class RedisEmbeddingStore:
+    """Shared tier backed by Redis (requires the optional ``redis`` package)."""
+
+    def __init__(self, url: str, ttl_seconds: int = 86400):
+        from redis.asyncio import Redis  # noqa: PLC0415
+
+        self._client: Any = Redis.from_url(
+            url,
+            # Short timeouts so a hung Redis degrades to a cache miss instead
+            # of stalling the rerank step.
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+        self._ttl = ttl_seconds
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        values: list[bytes | None] = await self._client.mget(keys)
+        return values
+
+    async def set_many(self, items: dict[str, bytes]) -> None:
+        async with self._client.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(key, value, ex=self._ttl)
+            await pipe.execute()
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class DiskEmbeddingStore:
+    """Shared tier backed by a local directory (one file per vector).
+
+    Reads refresh a file's mtime. When the files exceed ``max_bytes`` (0 means
+    unbounded), the least recently used are deleted until the directory is
+    back under ``_DISK_LOW_WATERMARK`` of the budget. The running total is
+    per process and re-measured on every eviction, so processes sharing the
+    directory correct each other's estimates.
+    """
+
+    def __init__(self, directory: str | Path, max_bytes: int = 1024 * 1024 * 1024):
+        self._dir = Path(directory)
+        self._dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        # Guards _bytes and eviction; reads and writes run on worker threads
+        self._lock = threading.Lock()
+        self._bytes = sum(size for _, size, _ in self._scan())
+
+    def _path(self, key: str) -> Path:
+        # Keys contain the model name ("BAAI/bge-..."); hash them into flat filenames.
+        return self._dir / f"{hashlib.sha256(key.encode()).hexdigest()}.f32"
+
+    def _scan(self) -> list[tuple[float, int, Path]]:
+        """(mtime, size, path) of every stored vector."""
+        files: list[tuple[float, int, Path]] = []
+        for path in self._dir.glob("*.f32"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue  # evicted by another process
+            files.append((stat.st_mtime, stat.st_size, path))
+        return files
+
+    def _read(self, keys: list[str]) -> list[bytes | None]:
+        values: list[bytes | None] = []
+        for key in keys:
+            path = self._path(key)
+            try:
+                values.append(path.read_bytes())
+            except FileNotFoundError:
+                values.append(None)
+                continue
+            with contextlib.suppress(OSError):
+                os.utime(path)  # mark as recently used
+        return values
+
+    def _write(self, items: dict[str, bytes]) -> None:
+        added = 0
+        for key, value in items.items():
+            path = self._path(key)
+            with contextlib.suppress(FileNotFoundError):
+                added -= path.stat().st_size
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(value)
+            tmp.replace(path)  # atomic, so readers never see a partial vector
+            added += len(value)
+        with self._lock:
+            self._bytes += added
+            if self.max_bytes > 0 and self._bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used files down to the low watermark."""
+        files = sorted(self._scan())
+        total = sum(size for _, size, _ in files)
+        target = self.max_bytes * _DISK_LOW_WATERMARK
+        for _, size, path in files:
+            if total <= target:
+                break
+            with contextlib.suppress(FileNotFoundError):
+                path.unlink()
+            total -= size
+        self._bytes = total
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        return await asyncio.to_thread(self._read, keys)
+
+    async def set_many(self, items: dict[str, bytes]) -> None:
+        await asyncio.to_thread(self._write, items)
+
+    async def close(self) -> None:
+        return None
+
+
+def build_shared_store(
+    url: str, ttl_seconds: int = 86400, disk_max_bytes: int = 1024 * 1024 * 1024
+) -> SharedEmbeddingStore | None:
+    """Create the shared tier from a URL (``redis://...``, ``rediss://...`` or a directory path).
+
+    ``ttl_seconds`` applies to Redis and ``disk_max_bytes`` to a directory.
+    Returns None when no URL is configured.
+    """
+    if not url:
+        return None
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisEmbeddingStore(url, ttl_seconds=ttl_seconds)
+    return DiskEmbeddingStore(url.removeprefix("file://"), max_bytes=disk_max_bytes)
+
+
+class EmbeddingCache:
+    """In-process LRU of embeddings with an optional shared tier behind it."""
+
+    def __init__(
+        self,
+        model_name: str,
+        max_bytes: int = 64 * 1024 * 1024,
+        shared: SharedEmbeddingStore | None = None,
+    ):
+        self.model_name = model_name
+        self.max_bytes = max_bytes
+        self.shared = shared
+        self._entries: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._bytes = 0
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+
+    @property
+    def size_bytes(self) -> int:
+        """Bytes currently held by the in-process tier."""
+        return self._bytes
+
+    def key(self, text: str) -> str:
+        """Cache key for a text under this cache's model."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"emb:{self.model_name}:{digest}"
+
+    def _get_local(self, key: str) -> np.ndarray | None:
+        vector = self._entries.get(key)
+        if vector is not None:
+            self._entries.move_to_end(key)
+        return vector
+
+    def _put_local(self, key: str, vector: np.ndarray) -> None:
+        if vector.nbytes > self.max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._bytes -= previous.nbytes
+        self._entries[key] = vector
+        self._bytes += vector.nbytes
+        while self._bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= evicted.nbytes
+
+    async def get_many(self, texts: list[str]) -> list[np.ndarray | None]:
+        """Look up vectors for texts; None marks a miss in both tiers."""
+        keys = [self.key(t) for t in texts]
+        found: list[np.ndarray | None] = [self._get_local(k) for k in keys]
+        local_hits = sum(v is not None for v in found)
+        self.hits += local_hits
+
+        missing = [i for i, v in enumerate(found) if v is None]
+        if missing and self.shared is not None:
+            try:
+                raw = await self.shared.get_many([keys[i] for i in missing])
+            except Exception:
+                logger.warning("Shared embedding cache lookup failed", exc_info=True)
+                raw = [None] * len(missing)
+            for i, value in zip(missing, raw, strict=True):
+                if value is None:
+                    continue
+                vector = np.frombuffer(value, dtype=_VECTOR_DTYPE)
+                found[i] = vector
+                self._put_local(keys[i], vector)
+                self.shared_hits += 1
+
+        self.misses += sum(v is None for v in found)
+        return found
+
+    async def put_many(self, texts: list[str], vectors: np.ndarray) -> None:
+        """Store freshly computed vectors in both tiers."""
+        shared_items: dict[str, bytes] = {}
+        for text, vector in zip(texts, vectors, strict=True):
+            key = self.key(text)
+            stored = np.ascontiguousarray(vector, dtype=_VECTOR_DTYPE)
+            self._put_local(key, stored)
+            shared_items[key] = stored.tobytes()
+
+        if shared_items and self.shared is not None:
+            try:
+                await self.shared.set_many(shared_items)
+            except Exception:
+                logger.warning("Shared embedding cache write failed", exc_info=True)
+
+    async def close(self) -> None:
+        """Release the shared tier's resources."""
+        if self.shared is not None:
+            await self.shared.close()
@@ -9,6 +9,7 @@ import uuid
 from collections.abc import AsyncGenerator
 from typing import Any
 
+import numpy as np
 from federated_aggregation.aggregator import Aggregate
 
 from aggregator.clients.nats_transport import is_tunneling_url
@@ -26,6 +27,13 @@ from aggregator.schemas.internal import AggregatedContext, ResolvedEndpoint, Ret
 from aggregator.schemas.responses import Billing, Document
 from aggregator.services.generation import GenerationError, GenerationService
 from aggregator.services.prompt_builder import PromptBuilder
+from aggregator.services.prompt_cache import (
+    CachedChat,
+    PromptCacheHit,
+    PromptCacheLookup,
+    SemanticPromptCache,
+)
+from aggregator.services.reranker import RerankerPool, RerankerUnavailableError
 from aggregator.services.retrieval import RetrievalService
 
 logger = logging.getLogger(__name__)
@@ -68,10 +76,14 @@ class Orchestrator:
         retrieval_service: RetrievalService,
         generation_service: GenerationService,
         prompt_builder: PromptBuilder,
+        reranker: RerankerPool | None = None,
+        prompt_cache: SemanticPromptCache | None = None,
     ):
         self.retrieval_service = retrieval_service
         self.generation_service = generation_service
         self.prompt_builder = prompt_builder
+        self.reranker = reranker
+        self.prompt_cache = prompt_cache
 
     @staticmethod
     def _resolve_fallback_peer_channel(
@@ -107,6 +119,7 @@ class Orchestrator:
             tenant_name=ref.tenant_name,
             owner_username=ref.owner_username,
             query_override=ref.query_override,
+            cache_ttl_seconds=ref.cache_ttl_seconds,
         )
 
     def _build_document_sources(self, context: AggregatedContext) -> dict[str, DocumentSource]:
@@ -191,7 +204,9 @@ class Orchestrator:
         """Rerank documents using CENTRAL_REEMBEDDING.
 
         Re-embeds all retrieved documents into a uniform embedding space so
-        cross-source scores are directly comparable.
+        cross-source scores are directly comparable. Uses the process-wide
+        reranker pool when it is loaded; otherwise falls back to a one-off
+        federated_aggregation run (which loads the model on the request path).
 
         Returns:
             Tuple of (reranked_documents, context_dict, source_index_map)
@@ -203,16 +218,21 @@ class Orchestrator:
 
         rerank_start = time.perf_counter()
         try:
-            aggregator = Aggregate()
-            results = await asyncio.to_thread(
-                aggregator.perform_aggregation,
-                query=query,
-                retrieved_nodes=retrieved_nodes,
-                method=Aggregate.CENTRAL_REEMBEDDING,
-                top_k=top_k,
-                model_name="BAAI/bge-base-en-v1.5",
-                device="cpu",
-            )
+            if self.reranker is not None and self.reranker.ready:
+                ranked = await self.reranker.rerank(
+                    query=query,
+                    candidates=[
+                        (path, source["document"]["content"])
+                        for path, node in retrieved_nodes.items()
+                        for source in node["sources"]
+                    ],
+                    top_k=top_k,
+                )
+            else:
+                ranked = await self._rerank_with_aggregate(query, retrieved_nodes, top_k)
+        except RerankerUnavailableError as e:
+            logger.warning(f"Reranker unavailable ({e}), falling back to raw score sort")
+            return None
         except Exception:
             logger.error("Reranking failed, falling back to raw score sort", exc_info=True)
             return None
@@ -220,23 +240,48 @@ class Orchestrator:
         rerank_ms = int((time.perf_counter() - rerank_start) * 1000)
         logger.info(f"Reranking (CENTRAL_REEMBEDDING) completed in {rerank_ms}ms")
 
-        reranked_nodes = results["central_re_embedding"]["reranked_nodes"]
-
         reranked_docs: list[Document] = []
         context_dict: dict[int, str] = {}
         source_index_map: dict[int, str] = {}
 
-        for i, node in enumerate(reranked_nodes, start=1):
-            content = node["document"]["content"]
-            score = node.get("score", 0.0)
-            source = node.get("person", f"source_{i}")
-
+        for i, (source, content, score) in enumerate(ranked, start=1):
             reranked_docs.append(Document(content=content, score=score))
             context_dict[i] = content
             source_index_map[i] = source
 
         return reranked_docs, context_dict, source_index_map
 
+    @staticmethod
+    async def _rerank_with_aggregate(
+        query: str,
+        retrieved_nodes: dict[str, dict[str, Any]],
+        top_k: int,
+    ) -> list[tuple[str, str, float]]:
+        """Run CENTRAL_REEMBEDDING through a fresh federated_aggregation instance.
+
+        Returns:
+            (source_path, content, score) triples in reranked order.
+        """
+        aggregator = Aggregate()
+        results = await asyncio.to_thread(
+            aggregator.perform_aggregation,
+            query=query,
+            retrieved_nodes=retrieved_nodes,
+            method=Aggregate.CENTRAL_REEMBEDDING,
+            top_k=top_k,
+            model_name=get_settings().reranker_model_name,
+            device="cpu",
+        )
+        reranked_nodes = results["central_re_embedding"]["reranked_nodes"]
+        return [
+            (
+                node.get("person", f"source_{i}"),
+                node["document"]["content"],
+                node.get("score", 0.0),
+            )
+            for i, node in enumerate(reranked_nodes, start=1)
+        ]
+
     @staticmethod
     def _compute_attribution(
         response: str,
@@ -325,6 +370,80 @@ class Orchestrator:
 
         return Billing(total_cost=total_cost, currency=currency, entries=entries)
 
+    async def _lookup_prompt_cache(
+        self,
+        request: ChatRequest,
+        model_endpoint: ResolvedEndpoint,
+        data_sources: list[ResolvedEndpoint],
+        user_token: str | None,
+    ) -> PromptCacheLookup | None:
+        """Look the prompt up in the semantic cache if the request may use it.
+
+        Returns None when the request did not opt in, cannot be cached (history,
+        retrieval-only, sources that did not opt in) or the prompt cannot be
+        embedded; otherwise the lookup, whose scope and vector are reused to
+        store the answer on a miss.
+        """
+        prompt_cache = self.prompt_cache
+        if (
+            prompt_cache is None
+            or not request.semantic_cache
+            or request.retrieval_only
+            or request.messages
+        ):
+            return None
+        credentials = [
+            request.endpoint_tokens.get(endpoint.owner_username or "") or user_token
+            for endpoint in [model_endpoint, *data_sources]
+        ]
+        scope = prompt_cache.scope(
+            model_endpoint,
+            data_sources,
+            request.custom_system_prompt,
+            request.top_k,
+            credentials,
+        )
+        if scope is None or self.reranker is None or not self.reranker.ready:
+            return None
+        try:
+            vector: np.ndarray = (await self.reranker.embed([request.prompt]))[0]
+        except RerankerUnavailableError as e:
+            logger.info(f"Skipping prompt cache, reranker unavailable: {e}")
+            return None
+        hit = prompt_cache.lookup(scope, vector)
+        if hit is not None:
+            logger.info(f"Prompt cache hit (similarity {hit.similarity:.3f})")
+        return PromptCacheLookup(scope=scope, vector=vector, hit=hit)
+
+    def _store_prompt_cache(
+        self,
+        lookup: PromptCacheLookup | None,
+        retrieval_results: list[RetrievalResult],
+        model_policy_metadata: dict[str, Any] | None,
+        billing: Billing | None,
+        chat: CachedChat,
+    ) -> None:
+        """Cache an answer unless a source failed or any policy metadata was reported."""
+        if lookup is None or self.prompt_cache is None or billing is not None:
+            return
+        if model_policy_metadata:
+            return
+        if any(r.status != "success" or r.policy_metadata for r in retrieval_results):
+            return
+        self.prompt_cache.store(lookup.scope, lookup.vector, chat)
+
+    @staticmethod
+    def _cached_metadata(hit: PromptCacheHit, total_start: float) -> ResponseMetadata:
+        """Response metadata for an answer served from the prompt cache."""
+        return ResponseMetadata(
+            retrieval_time_ms=0,
+            generation_time_ms=0,
+            total_time_ms=int((time.perf_counter() - total_start) * 1000),
+            cache_hit=True,
+            cache_similarity=hit.similarity,
+            cache_age_seconds=hit.age_seconds,
+        )
+
     async def process_chat(
         self,
         request: ChatRequest,
@@ -379,6 +498,22 @@ class Orchestrator:
             model_endpoint, data_sources, peer_channel
         )
 
+        # Answer a near-duplicate of an earlier prompt from the semantic cache
+        cache_lookup = await self._lookup_prompt_cache(
+            request, model_endpoint, data_sources, effective_user_token
+        )
+        if cache_lookup is not None and cache_lookup.hit is not None:
+            cached = cache_lookup.hit.chat
+            return ChatResponse(
+                response=cached.annotated_response or cached.response,
+                sources=dict(cached.sources),
+                retrieval_info=list(cached.retrieval_info),
+                metadata=self._cached_metadata(cache_lookup.hit, total_start),
+                usage=None,
+                profit_share=cached.profit_share,
+                billing=None,
+            )
+
         # 3. Retrieve context from SyftAI-Space data sources
         retrieval_start = time.perf_counter()
         context = await self.retrieval_service.retrieve(
@@ -517,6 +652,19 @@ class Orchestrator:
             [(r.endpoint_path, r.policy_metadata) for r in context.retrieval_results]
             + [(model_endpoint.path, result.policy_metadata)]
         )
+        self._store_prompt_cache(
+            cache_lookup,
+            context.retrieval_results,
+            result.policy_metadata,
+            billing,
+            CachedChat(
+                response=result.response,
+                sources=document_sources,
+                retrieval_info=retrieval_info,
+                profit_share=profit_share,
+                annotated_response=display_response if source_index_map else None,
+            ),
+        )
 
         return ChatResponse(
             response=display_response,
@@ -577,6 +725,15 @@ class Orchestrator:
             model_endpoint, data_sources, peer_channel
         )
 
+        # Answer a near-duplicate of an earlier prompt from the semantic cache
+        cache_lookup = await self._lookup_prompt_cache(
+            request, model_endpoint, data_sources, effective_user_token
+        )
+        if cache_lookup is not None and cache_lookup.hit is not None:
+            for event in self._cached_chat_events(cache_lookup.hit, len(data_sources), total_start):
+                yield event
+            return
+
         # 3. Retrieval phase with progress events
         yield self._sse_event(
             "retrieval_start",
@@ -782,6 +939,7 @@ class Orchestrator:
                 "path": r.endpoint_path,
                 "documents_retrieved": len(r.documents),
                 "status": r.status,
+                "error_message": r.error_message,
             }
             for r in retrieval_results
         ]
@@ -821,8 +979,62 @@ class Orchestrator:
         if billing is not None:
             done_data["billing"] = billing.model_dump()
 
+        self._store_prompt_cache(
+            cache_lookup,
+            retrieval_results,
+            model_policy_metadata,
+            billing,
+            CachedChat(
+                response="".join(full_response),
+                sources=self._build_document_sources(context),
+                retrieval_info=[SourceInfo(**info) for info in retrieval_info],
+                profit_share=profit_share,
+                annotated_response=annotated_response,
+            ),
+        )
+
         yield self._sse_event("done", done_data)
 
+    def _cached_chat_events(
+        self, hit: PromptCacheHit, source_count: int, total_start: float
+    ) -> list[str]:
+        """SSE events replaying a cached answer in the shape of a live stream."""
+        cached = hit.chat
+        events = [self._sse_event("retrieval_start", {"sources": source_count})]
+        for info in cached.retrieval_info:
+            events.append(
+                self._sse_event(
+                    "source_complete",
+                    {
+                        "path": info.path,
+                        "status": info.status,
+                        "documents": info.documents_retrieved,
+                    },
+                )
+            )
+        events.append(
+            self._sse_event(
+                "retrieval_complete", {"total_documents": len(cached.sources), "time_ms": 0}
+            )
+        )
+        events.append(self._sse_event("generation_start", {}))
+        events.append(self._sse_event("token", {"content": cached.response}))
+
+        done_data: dict[str, Any] = {
+            "sources": {
+                title: {"slug": doc_source.slug, "content": doc_source.content}
+                for title, doc_source in cached.sources.items()
+            },
+            "retrieval_info": [info.model_dump() for info in cached.retrieval_info],
+            "metadata": self._cached_metadata(hit, total_start).model_dump(),
+        }
+        if cached.profit_share is not None:
+            done_data["profit_share"] = cached.profit_share
+        if cached.annotated_response is not None:
+            done_data["response"] = cached.annotated_response
+        events.append(self._sse_event("done", done_data))
+        return events
+
     @staticmethod
     def _annotate_cite_positions(text: str) -> str:
         """Enrich [cite:N] end-of-sentence markers with character span information.
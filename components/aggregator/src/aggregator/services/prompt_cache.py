@@ -0,0 +1,236 @@
+"""Semantic cache of full chat responses.
+
+Popular collectives get the same question in many phrasings. When a request
+opts in (``ChatRequest.semantic_cache``), the orchestrator embeds the prompt
+with the reranker's model and looks for an earlier answer to a near-duplicate
+prompt within the same scope: (model, sorted data sources, system prompt
+hash, top_k, credentials). A hit needs cosine similarity of at least
+``similarity_threshold`` and returns the stored answer without retrieval or
+generation.
+
+Only answers that are safe to hand to another caller are stored:
+
+- the request has at least one data source and every one of them opted in to
+  caching through its owner's ``retrieval_cache_ttl`` setting (models have
+  no opt-in, so model-only chats are never cached), and the entry expires
+  after the smallest of those TTLs (capped by ``max_ttl``). The TTLs arrive
+  with the request, so a hit must also be younger than the TTL of the
+  *reading* request's scope;
+- every source answered successfully, and no source or model reported policy
+  metadata: billed or policy-governed answers are never served for free;
+- the request carried no conversation history.
+
+As for the retrieval cache, what the sources return can depend on the
+credentials presented for them, so answers are only shared between requests
+that presented the same credentials (hashed into the scope); requests
+without any share one scope.
+
+The index is in process and searched by brute force per scope, which is
+cheap at the sizes a scope reaches. An answer replaces any stored answer it
+would itself have matched, and beyond ``max_entries`` the least recently used
+scopes lose their oldest answers first.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from aggregator.observability.metrics import metrics
+from aggregator.schemas.internal import ResolvedEndpoint
+from aggregator.schemas.responses import DocumentSource, SourceInfo
+
+PROMPT_CACHE_LOOKUPS = metrics.counter(
+    "aggregator_prompt_cache_lookups_total",
+    "Semantic prompt cache lookups, by result (hit, miss)",
+    ("result",),
+)
+
+
+@dataclass(frozen=True)
+class PromptCacheScope:
+    """Where a request's answer may be looked up and for how long it may be kept."""
+
+    key: str
+    ttl_seconds: int
+
+
+@dataclass
+class CachedChat:
+    """A chat answer as returned to the caller that first asked it."""
+
+    response: str
+    sources: dict[str, DocumentSource] = field(default_factory=dict)
+    retrieval_info: list[SourceInfo] = field(default_factory=list)
+    profit_share: dict[str, float] | None = None
+    # Response with position-annotated citations, when attribution ran
+    annotated_response: str | None = None
+
+
+@dataclass
+class PromptCacheHit:
+    """A cached answer and how closely its prompt matched."""
+
+    chat: CachedChat
+    similarity: float
+    age_seconds: float
+
+
+@dataclass
+class PromptCacheLookup:
+    """A request's cache scope and prompt embedding, plus the hit if there was one."""
+
+    scope: PromptCacheScope
+    vector: np.ndarray
+    hit: PromptCacheHit | None
+
+
+@dataclass
+class _Entry:
+    vector: np.ndarray
+    chat: CachedChat
+    created_at: float
+    expires_at: float
+
+
+class SemanticPromptCache:
+    """In-process vector index of chat answers, partitioned by scope.
+
+    Args:
+        similarity_threshold: Minimum cosine similarity for a hit.
+        max_ttl: Upper bound (seconds) on how long an answer is kept.
+        max_entries: Answers kept across all scopes; the least recently used
+            are evicted.
+        clock: Monotonic time source (seconds).
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: float = 0.95,
+        max_ttl: int = 3600,
+        max_entries: int = 10_000,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.similarity_threshold = similarity_threshold
+        self.max_ttl = max_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._scopes: OrderedDict[str, list[_Entry]] = OrderedDict()
+        self._size = 0
+
+    def scope(
+        self,
+        model: ResolvedEndpoint,
+        data_sources: list[ResolvedEndpoint],
+        system_prompt: str | None,
+        top_k: int,
+        credentials: Sequence[str | None] = (),
+    ) -> PromptCacheScope | None:
+        """Scope of a request, or None if it has no sources or they did not all opt in.
+
+        ``credentials`` are the tokens the request presents to its endpoints.
+        """
+        if not data_sources:
+            return None
+        ttl = self.max_ttl
+        for ds in data_sources:
+            if not ds.cache_ttl_seconds or ds.cache_ttl_seconds <= 0:
+                return None
+            ttl = min(ttl, ds.cache_ttl_seconds)
+        if ttl <= 0:
+            return None
+
+        sources = sorted(_endpoint_id(ds) for ds in data_sources)
+        system_hash = hashlib.sha256((system_prompt or "").encode("utf-8")).hexdigest()
+        credential_hashes = sorted(
+            {hashlib.sha256(c.encode("utf-8")).hexdigest() for c in credentials if c}
+        )
+        parts = [
+            _endpoint_id(model),
+            *sources,
+            system_hash,
+            str(top_k),
+            *credential_hashes,
+        ]
+        digest = hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+        return PromptCacheScope(key=digest, ttl_seconds=ttl)
+
+    def lookup(self, scope: PromptCacheScope, vector: np.ndarray) -> PromptCacheHit | None:
+        """Return the closest live answer in the scope if it clears the threshold."""
+        now = self._clock()
+        entries = [
+            e for e in self._live_entries(scope.key) if now - e.created_at < scope.ttl_seconds
+        ]
+        if not entries:
+            PROMPT_CACHE_LOOKUPS.inc(result="miss")
+            return None
+
+        similarities = np.vstack([e.vector for e in entries]) @ vector
+        best = int(np.argmax(similarities))
+        similarity = float(similarities[best])
+        if similarity < self.similarity_threshold:
+            PROMPT_CACHE_LOOKUPS.inc(result="miss")
+            return None
+
+        self._scopes.move_to_end(scope.key)
+        entry = entries[best]
+        PROMPT_CACHE_LOOKUPS.inc(result="hit")
+        return PromptCacheHit(
+            chat=entry.chat,
+            similarity=similarity,
+            age_seconds=now - entry.created_at,
+        )
+
+    def store(self, scope: PromptCacheScope, vector: np.ndarray, chat: CachedChat) -> None:
+        """Keep an answer for the scope's TTL."""
+        if self.max_entries <= 0:
+            return
+        now = self._clock()
+        entries = self._live_entries(scope.key)
+        if entries:
+            # Replace answers to the same question instead of piling them up
+            similarities = np.vstack([e.vector for e in entries]) @ vector
+            kept = [
+                e
+                for e, s in zip(entries, similarities, strict=True)
+                if s < self.similarity_threshold
+            ]
+            self._size -= len(entries) - len(kept)
+            entries = kept
+        entries.append(_Entry(vector, chat, created_at=now, expires_at=now + scope.ttl_seconds))
+        self._scopes[scope.key] = entries
+        self._scopes.move_to_end(scope.key)
+        self._size += 1
+
+        while self._size > self.max_entries:
+            oldest_key, oldest = next(iter(self._scopes.items()))
+            oldest.pop(0)
+            self._size -= 1
+            if not oldest:
+                del self._scopes[oldest_key]
+
+    def _live_entries(self, key: str) -> list[_Entry]:
+        """Entries of a scope with expired ones dropped."""
+        entries = self._scopes.get(key)
+        if entries is None:
+            return []
+        now = self._clock()
+        live = [e for e in entries if e.expires_at > now]
+        self._size -= len(entries) - len(live)
+        if live:
+            self._scopes[key] = live
+        else:
+            del self._scopes[key]
+        return live
+
+
+def _endpoint_id(endpoint: ResolvedEndpoint) -> str:
+    """Identity of an endpoint within a scope key."""
+    return "\x1f".join(
+        [endpoint.path, endpoint.url.rstrip("/"), endpoint.slug, endpoint.tenant_name or ""]
+    )
@@ -0,0 +1,197 @@
+"""Process-wide reranker pool for CENTRAL_REEMBEDDING.
+
+The embedding model is loaded once during application startup and shared by
+every chat request. Encoding runs on a small, bounded thread pool so several
+requests can rerank concurrently without each one holding its own copy of the
+model weights in memory. A cap on pending jobs keeps a burst of traffic from
+queueing indefinitely behind the model: once the pool is saturated, callers get
+a RerankerUnavailableError and fall back to raw-score ordering.
+
+Texts from concurrent requests are merged into shared forward passes by an
+EmbeddingBatcher (see embedding_batcher.py) before they reach the workers.
+With an EmbeddingCache attached (see embedding_cache.py), only texts whose
+vectors are not already cached are encoded at all.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import numpy as np
+
+from aggregator.services.embedding_batcher import EmbeddingBatcher
+from aggregator.services.embedding_cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_RERANKER_MODEL = "BAAI/bge-base-en-v1.5"
+
+
+class RerankerUnavailableError(Exception):
+    """The reranker cannot accept work (model not loaded or pool saturated)."""
+
+
+class RerankerPool:
+    """Long-lived embedding model plus a bounded worker pool for reranking.
+
+    Usage:
+        pool = RerankerPool(model_name="BAAI/bge-base-en-v1.5", max_workers=2)
+        await pool.start()          # at lifespan startup
+        ranked = await pool.rerank(query, [(source, content), ...], top_k=5)
+        await pool.close()          # at lifespan shutdown
+    """
+
+    def __init__(
+        self,
+        model_name: str = DEFAULT_RERANKER_MODEL,
+        max_workers: int = 2,
+        max_pending: int = 32,
+        threads: int | None = None,
+        batch_max_size: int = 64,
+        batch_max_wait_ms: float = 5.0,
+        cache: EmbeddingCache | None = None,
+    ):
+        self.model_name = model_name
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(self.max_workers, max_pending)
+        self._threads = threads
+        self._model: Any = None
+        self._executor: ThreadPoolExecutor | None = None
+        self._batcher = EmbeddingBatcher(
+            self._encode_on_pool,
+            max_batch_size=batch_max_size,
+            max_wait_ms=batch_max_wait_ms,
+        )
+        self.cache = cache
+        self._pending = 0
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def ready(self) -> bool:
+        """Whether the model is loaded and the pool accepts work."""
+        return self._model is not None and self._executor is not None
+
+    @property
+    def pending(self) -> int:
+        """Number of rerank jobs currently queued or running."""
+        return self._pending
+
+    async def start(self) -> None:
+        """Load the embedding model once and start the worker pool.
+
+        Safe to call more than once; subsequent calls are no-ops.
+        """
+        async with self._start_lock:
+            if self.ready:
+                return
+
+            executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="reranker",
+            )
+            load_start = time.perf_counter()
+            try:
+                model = await asyncio.get_running_loop().run_in_executor(executor, self._load_model)
+            except Exception:
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+
+            self._model = model
+            self._executor = executor
+            load_ms = int((time.perf_counter() - load_start) * 1000)
+            logger.info(
+                f"Reranker model {self.model_name} loaded in {load_ms}ms "
+                f"(workers={self.max_workers}, max_pending={self.max_pending})"
+            )
+
+    def _load_model(self) -> Any:
+        """Construct the embedding model (runs on a worker thread)."""
+        from fastembed import TextEmbedding  # noqa: PLC0415
+
+        return TextEmbedding(model_name=self.model_name, threads=self._threads)
+
+    async def close(self) -> None:
+        """Shut down the worker pool and release the model."""
+        executor, self._executor = self._executor, None
+        self._model = None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+        if self.cache is not None:
+            await self.cache.close()
+
+    def _encode(self, texts: list[str]) -> np.ndarray:
+        """Encode texts into L2-normalised row vectors (runs on a worker thread)."""
+        vectors = np.asarray(list(self._model.embed(texts)), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        normalised: np.ndarray = vectors / norms
+        return normalised
+
+    async def _encode_on_pool(self, texts: list[str]) -> np.ndarray:
+        """Run one (possibly merged) encode on a worker thread."""
+        if self._executor is None:
+            raise RerankerUnavailableError("Reranker model is not loaded")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, self._encode, texts)
+
+    async def embed(self, texts: list[str]) -> np.ndarray:
+        """Encode texts, serving cached vectors and batching the rest on the pool.
+
+        Raises:
+            RerankerUnavailableError: If the model is not loaded or the pool
+                already has ``max_pending`` jobs queued.
+        """
+        if not self.ready:
+            raise RerankerUnavailableError("Reranker model is not loaded")
+        if self.cache is None:
+            return await self._embed_uncached(texts)
+
+        vectors = await self.cache.get_many(texts)
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            missing_texts = [texts[i] for i in missing]
+            fresh = await self._embed_uncached(missing_texts)
+            await self.cache.put_many(missing_texts, fresh)
+            for row, i in enumerate(missing):
+                vectors[i] = fresh[row]
+        return np.vstack([v for v in vectors if v is not None])
+
+    async def _embed_uncached(self, texts: list[str]) -> np.ndarray:
+        """Submit texts to the batcher, enforcing the pending-job cap."""
+        if self._pending >= self.max_pending:
+            raise RerankerUnavailableError(
+                f"Reranker queue is full ({self._pending}/{self.max_pending} pending)"
+            )
+
+        self._pending += 1
+        try:
+            return await self._batcher.submit(texts)
+        finally:
+            self._pending -= 1
+
+    async def rerank(
+        self,
+        query: str,
+        candidates: list[tuple[str, str]],
+        top_k: int,
+    ) -> list[tuple[str, str, float]]:
+        """Re-embed the query and candidate documents and rank by cosine similarity.
+
+        Args:
+            query: The user query.
+            candidates: (source_path, content) pairs from all successful sources.
+            top_k: Maximum number of documents to return.
+
+        Returns:
+            (source_path, content, score) triples, best match first.
+        """
+        if not candidates:
+            return []
+
+        vectors = await self.embed([query] + [content for _, content in candidates])
+        scores = vectors[1:] @ vectors[0]
+        order = np.argsort(-scores, kind="stable")[: max(top_k, 0)]
+        return [(candidates[i][0], candidates[i][1], float(scores[i])) for i in order]
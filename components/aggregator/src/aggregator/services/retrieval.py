@@ -14,9 +14,27 @@ from aggregator.schemas.internal import AggregatedContext, ResolvedEndpoint, Ret
 
 if TYPE_CHECKING:
     from aggregator.clients.nats_transport import NATSTransport
+    from aggregator.services.circuit_breaker import CircuitBreakerRegistry
+    from aggregator.services.retrieval_cache import RetrievalCache
 
 logger = logging.getLogger(__name__)
 
+# Queries still running when retrieval returned (deadline or quorum). Held here
+# so they are not garbage collected before they finish.
+_detached_queries: set[asyncio.Task[RetrievalResult]] = set()
+
+
+def _detach(task: asyncio.Task[RetrievalResult]) -> None:
+    """Let a query nobody is waiting for finish in the background."""
+    _detached_queries.add(task)
+    task.add_done_callback(_finish_detached)
+
+
+def _finish_detached(task: asyncio.Task[RetrievalResult]) -> None:
+    _detached_queries.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(f"Detached data source query failed: {task.exception()}")
+
 
 class RetrievalService:
     """Service for retrieving context from multiple SyftAI-Space data sources."""
@@ -25,9 +43,31 @@ class RetrievalService:
         self,
         data_source_client: DataSourceClient,
         nats_transport: NATSTransport | None = None,
+        circuit_breakers: CircuitBreakerRegistry | None = None,
+        deadline: float | None = None,
+        quorum_sources: int = 0,
+        quorum_documents: int = 0,
+        retrieval_cache: RetrievalCache | None = None,
     ):
+        """
+        Args:
+            data_source_client: HTTP client for SyftAI-Space data sources
+            nats_transport: Transport for tunneling spaces (None disables NATS routing)
+            circuit_breakers: Per-source breakers consulted before each query
+            deadline: Seconds after which retrieval returns whatever is in
+                (None waits for every source)
+            quorum_sources: Return early once this many sources succeeded (0 disables)
+            quorum_documents: Return early once this many documents at or above the
+                similarity threshold are in (0 disables)
+            retrieval_cache: Cache of results from sources whose owners opted in
+        """
         self.data_source_client = data_source_client
         self.nats_transport = nats_transport
+        self.circuit_breakers = circuit_breakers
+        self.deadline = deadline
+        self.quorum_sources = quorum_sources
+        self.quorum_documents = quorum_documents
+        self.retrieval_cache = retrieval_cache
 
     def _get_token_for_endpoint(
         self, endpoint: ResolvedEndpoint, token_mapping: dict[str, str]
@@ -37,6 +77,85 @@ class RetrievalService:
             return token_mapping[endpoint.owner_username]
         return None
 
+    async def _query_source(
+        self,
+        ds: ResolvedEndpoint,
+        query: str,
+        top_k: int,
+        similarity_threshold: float,
+        endpoint_tokens: dict[str, str],
+        transaction_tokens: dict[str, str],
+        peer_channel: str | None,
+        user_token: str | None,
+        syfthub_url: str | None,
+    ) -> RetrievalResult:
+        """Query one data source over HTTP or NATS, honouring its cache and circuit breaker."""
+        effective_query = ds.query_override or query
+        # Paid results are cached per caller, scoped by the credential they present
+        credential = self._get_token_for_endpoint(ds, endpoint_tokens) or user_token
+        cache = self.retrieval_cache
+        if cache is not None:
+            cached = await cache.get(ds, effective_query, top_k, similarity_threshold, credential)
+            if cached is not None:
+                logger.debug(f"Retrieval cache hit for {ds.path}")
+                return cached
+
+        breakers = self.circuit_breakers
+        if breakers is not None and not breakers.allow_request(ds.path):
+            retry_after = breakers.get(ds.path).retry_after()
+            logger.info(f"Circuit open for {ds.path}, skipping (retry in {retry_after:.0f}s)")
+            return RetrievalResult(
+                endpoint_path=ds.path,
+                status="error",
+                error_message=(
+                    f"Circuit open: {ds.path} has been failing; skipped without querying "
+                    f"(retrying in {retry_after:.0f}s)"
+                ),
+                latency_ms=0,
+            )
+
+        start = time.perf_counter()
+        try:
+            if is_tunneling_url(ds.url) and self.nats_transport and peer_channel:
+                # Route through NATS for tunneling spaces
+                result = await self.nats_transport.query_data_source(
+                    target_username=extract_tunnel_username(ds.url),
+                    slug=ds.slug,
+                    endpoint_path=ds.path,
+                    query=effective_query,
+                    peer_channel=peer_channel,
+                    top_k=top_k,
+                    similarity_threshold=similarity_threshold,
+                    transaction_token=self._get_token_for_endpoint(ds, transaction_tokens),
+                    satellite_token=self._get_token_for_endpoint(ds, endpoint_tokens),
+                )
+            else:
+                # Standard HTTP request
+                result = await self.data_source_client.query(
+                    url=ds.url,
+                    slug=ds.slug,
+                    endpoint_path=ds.path,
+                    query=effective_query,
+                    top_k=top_k,
+                    similarity_threshold=similarity_threshold,
+                    tenant_name=ds.tenant_name,
+                    authorization_token=self._get_token_for_endpoint(ds, endpoint_tokens),
+                    user_token=user_token,
+                    syfthub_url=syfthub_url,
+                )
+        except Exception:
+            if breakers is not None:
+                breakers.record(ds.path, False, (time.perf_counter() - start) * 1000)
+            raise
+
+        if breakers is not None:
+            # Payment and access refusals come from a healthy source
+            healthy = result.status not in ("error", "timeout")
+            breakers.record(ds.path, healthy, (time.perf_counter() - start) * 1000)
+        if cache is not None:
+            await cache.put(ds, effective_query, top_k, similarity_threshold, credential, result)
+        return result
+
     async def retrieve(
         self,
         data_sources: list[ResolvedEndpoint],
@@ -52,7 +171,9 @@ class RetrievalService:
         """
         Retrieve relevant documents from multiple SyftAI-Space data sources in parallel.
 
-        User identity is derived from satellite tokens by SyftAI-Space.
+        User identity is derived from satellite tokens by SyftAI-Space. Returns at the
+        service's deadline or once its quorum is met; sources not back by then are
+        reported with status ``timeout``.
 
         Args:
             data_sources: List of resolved data source endpoints
@@ -80,42 +201,28 @@ class RetrievalService:
         start_time = time.perf_counter()
 
         # Query all data sources in parallel (HTTP or NATS)
-        tasks = []
-        for ds in data_sources:
-            if is_tunneling_url(ds.url) and self.nats_transport and peer_channel:
-                # Route through NATS for tunneling spaces
-                target_username = extract_tunnel_username(ds.url)
-                tasks.append(
-                    self.nats_transport.query_data_source(
-                        target_username=target_username,
-                        slug=ds.slug,
-                        endpoint_path=ds.path,
-                        query=ds.query_override or query,
-                        peer_channel=peer_channel,
-                        top_k=top_k,
-                        similarity_threshold=similarity_threshold,
-                        transaction_token=self._get_token_for_endpoint(ds, transaction_tokens),
-                        satellite_token=self._get_token_for_endpoint(ds, endpoint_tokens),
-                    )
-                )
-            else:
-                # Standard HTTP request
-                tasks.append(
-                    self.data_source_client.query(
-                        url=ds.url,
-                        slug=ds.slug,
-                        endpoint_path=ds.path,
-                        query=ds.query_override or query,
-                        top_k=top_k,
-                        similarity_threshold=similarity_threshold,
-                        tenant_name=ds.tenant_name,
-                        authorization_token=self._get_token_for_endpoint(ds, endpoint_tokens),
-                        user_token=user_token,
-                        syfthub_url=syfthub_url,
-                    )
+        tasks = [
+            asyncio.create_task(
+                self._query_source(
+                    ds,
+                    query=query,
+                    top_k=top_k,
+                    similarity_threshold=similarity_threshold,
+                    endpoint_tokens=endpoint_tokens,
+                    transaction_tokens=transaction_tokens,
+                    peer_channel=peer_channel,
+                    user_token=user_token,
+                    syfthub_url=syfthub_url,
                 )
+            )
+            for ds in data_sources
+        ]
 
-        results: list[RetrievalResult] = await asyncio.gather(*tasks, return_exceptions=False)
+        # Keep results in data source order
+        by_index: dict[int, RetrievalResult] = {}
+        async for index, result in self._collect(tasks, data_sources, similarity_threshold):
+            by_index[index] = result
+        results = [by_index[i] for i in range(len(data_sources))]
 
         total_latency_ms = int((time.perf_counter() - start_time) * 1000)
 
@@ -158,7 +265,8 @@ class RetrievalService:
         Retrieve from SyftAI-Space data sources and yield results as they complete.
 
         This is useful for streaming UX where you want to show progress.
-        User identity is derived from satellite tokens by SyftAI-Space.
+        User identity is derived from satellite tokens by SyftAI-Space. Sources not
+        back by the service's deadline or quorum are yielded last, as ``timeout``.
 
         Args:
             data_sources: List of resolved data source endpoints
@@ -181,48 +289,94 @@ class RetrievalService:
         transaction_tokens = transaction_tokens or {}
 
         # Create tasks (HTTP or NATS based on URL)
-        tasks = {}
-        for ds in data_sources:
-            if is_tunneling_url(ds.url) and self.nats_transport and peer_channel:
-                target_username = extract_tunnel_username(ds.url)
-                task = asyncio.create_task(
-                    self.nats_transport.query_data_source(
-                        target_username=target_username,
-                        slug=ds.slug,
-                        endpoint_path=ds.path,
-                        query=ds.query_override or query,
-                        peer_channel=peer_channel,
-                        top_k=top_k,
-                        similarity_threshold=similarity_threshold,
-                        transaction_token=self._get_token_for_endpoint(ds, transaction_tokens),
-                        satellite_token=self._get_token_for_endpoint(ds, endpoint_tokens),
-                    )
+        tasks = [
+            asyncio.create_task(
+                self._query_source(
+                    ds,
+                    query=query,
+                    top_k=top_k,
+                    similarity_threshold=similarity_threshold,
+                    endpoint_tokens=endpoint_tokens,
+                    transaction_tokens=transaction_tokens,
+                    peer_channel=peer_channel,
+                    user_token=user_token,
+                    syfthub_url=syfthub_url,
                 )
-            else:
-                task = asyncio.create_task(
-                    self.data_source_client.query(
-                        url=ds.url,
-                        slug=ds.slug,
-                        endpoint_path=ds.path,
-                        query=ds.query_override or query,
-                        top_k=top_k,
-                        similarity_threshold=similarity_threshold,
-                        tenant_name=ds.tenant_name,
-                        authorization_token=self._get_token_for_endpoint(ds, endpoint_tokens),
-                        user_token=user_token,
-                        syfthub_url=syfthub_url,
-                    )
-                )
-            tasks[task] = ds
+            )
+            for ds in data_sources
+        ]
 
         # Yield results as they complete
-        pending = set(tasks.keys())
-        while pending:
-            done, pending = await asyncio.wait(
-                pending,
-                return_when=asyncio.FIRST_COMPLETED,
-            )
+        async for _, result in self._collect(tasks, data_sources, similarity_threshold):
+            yield result
+
+    async def _collect(
+        self,
+        tasks: list[asyncio.Task[RetrievalResult]],
+        data_sources: list[ResolvedEndpoint],
+        similarity_threshold: float,
+    ) -> AsyncIterator[tuple[int, RetrievalResult]]:
+        """Yield (index, result) as queries complete, until the deadline or quorum.
+
+        Sources still pending at that point are reported as ``timeout`` and
+        their queries are left to finish in the background, so circuit
+        breakers still learn their outcome and paid queries are not cut off
+        mid-payment.
+        """
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        index_of = {task: i for i, task in enumerate(tasks)}
+        pending = set(tasks)
+        succeeded = 0
+        relevant_documents = 0
+        reason = ""
+        try:
+            while pending:
+                timeout = None
+                if self.deadline is not None:
+                    timeout = start + self.deadline - loop.time()
+                    if timeout <= 0:
+                        reason = f"no response within the {self.deadline:g}s retrieval deadline"
+                        break
+
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    result = task.result()
+                    if result.status == "success":
+                        succeeded += 1
+                        relevant_documents += sum(
+                            1 for d in result.documents if d.score >= similarity_threshold
+                        )
+                    yield index_of[task], result
+
+                if pending and self._quorum_reached(succeeded, relevant_documents):
+                    reason = "enough results arrived from other sources"
+                    break
+
+            if pending:
+                logger.info(
+                    f"Retrieval returning without {len(pending)}/{len(tasks)} sources: {reason}"
+                )
+            latency_ms = int((loop.time() - start) * 1000)
+            for task in sorted(pending, key=index_of.__getitem__):
+                index = index_of[task]
+                yield (
+                    index,
+                    RetrievalResult(
+                        endpoint_path=data_sources[index].path,
+                        status="timeout",
+                        error_message=f"Not waited for: {reason}",
+                        latency_ms=latency_ms,
+                    ),
+                )
+        finally:
+            for task in pending:
+                _detach(task)
 
-            for task in done:
-                result = await task
-                yield result
+    def _quorum_reached(self, succeeded: int, relevant_documents: int) -> bool:
+        """Whether enough has arrived to stop waiting for the remaining sources."""
+        if self.quorum_sources and succeeded >= self.quorum_sources:
+            return True
+        return bool(self.quorum_documents and relevant_documents >= self.quorum_documents)
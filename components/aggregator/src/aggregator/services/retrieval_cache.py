@@ -0,0 +1,283 @@
+"""Cache of data source retrieval results.
+
+The same prompt against the same sources arrives again and again: shared
+``/q?q=owner/slug!prompt`` links, retries, the frontend re-asking. Endpoint
+owners can opt a source in by setting ``retrieval_cache_ttl`` (seconds) in its
+connection config; the value reaches the aggregator as
+``EndpointRef.cache_ttl_seconds`` and is capped by ``max_ttl``. Sources that do
+not opt in are never cached.
+
+Entries are keyed by (endpoint, effective query, top_k, similarity threshold)
+and only successful results are stored. ``cache_ttl_seconds`` arrives with
+the request, so each entry records when it was fetched and a hit must also be
+younger than the TTL of the endpoint the *reading* caller sent: a caller that
+claims a longer TTL than the owner set only ever keeps results longer for
+itself.
+
+Whether a source answers depends on the credential presented for it, so
+results are only shared between callers that presented none. A result
+fetched with a credential is stored under a hash of that credential (the
+aggregator does not verify tokens, so this is the only identity it can scope
+by). Results carrying ``policy_metadata`` (billing, rate limits, access rules)
+are never stored without a credential. A hit returns the documents with
+``policy_metadata`` cleared, so a cached paid result is never billed twice.
+
+Two tiers, as for the reranker embedding cache:
+- an in-process LRU, consulted first;
+- an optional Redis tier so replicas share entries. Redis failures are logged
+  and treated as misses; they never fail a retrieval.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any, Protocol
+
+from aggregator.observability.metrics import metrics
+from aggregator.schemas.internal import ResolvedEndpoint, RetrievalResult
+
+logger = logging.getLogger(__name__)
+
+RETRIEVAL_CACHE_LOOKUPS = metrics.counter(
+    "aggregator_retrieval_cache_lookups_total",
+    "Retrieval cache lookups for opted-in data sources, by result (hit, shared_hit, miss)",
+    ("result",),
+)
+
+_SHARED_SCOPE = "shared"
+
+
+class SharedRetrievalStore(Protocol):
+    """A cache tier shared between processes, storing serialized results."""
+
+    async def get(self, key: str) -> bytes | None: ...
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None: ...
+
+    async def close(self) -> None: ...
+
+
+class RedisRetrievalStore:
+    """Shared tier backed by Redis (requires the optional ``redis`` package)."""
+
+    def __init__(self, url: str):
+        from redis.asyncio import Redis  # noqa: PLC0415
+
+        self._client: Any = Redis.from_url(
+            url,
+            # Short timeouts so a hung Redis degrades to a cache miss instead
+            # of stalling retrieval.
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        value: bytes | None = await self._client.get(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        await self._client.set(key, value, ex=ttl_seconds)
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+
+class RetrievalCache:
+    """In-process LRU of retrieval results with an optional Redis tier behind it.
+
+    Args:
+        max_entries: Results kept in process; the least recently used are evicted.
+        max_ttl: Upper bound (seconds) on the TTL an endpoint owner may ask for.
+        shared: Optional tier shared between replicas.
+        clock: Wall-clock time source (seconds); shared entries carry their
+            expiry so every replica honours the same TTL.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        max_ttl: int = 3600,
+        shared: SharedRetrievalStore | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.max_entries = max_entries
+        self.max_ttl = max_ttl
+        self.shared = shared
+        self._clock = clock
+        # key -> (created_at, expires_at, result)
+        self._entries: OrderedDict[str, tuple[float, float, RetrievalResult]] = OrderedDict()
+
+    def ttl_for(self, endpoint: ResolvedEndpoint) -> int:
+        """Seconds results of an endpoint may be cached (0 if it did not opt in)."""
+        if not endpoint.cache_ttl_seconds or endpoint.cache_ttl_seconds <= 0:
+            return 0
+        return min(endpoint.cache_ttl_seconds, self.max_ttl)
+
+    @staticmethod
+    def key(
+        endpoint: ResolvedEndpoint,
+        query: str,
+        top_k: int,
+        similarity_threshold: float,
+        scope: str,
+    ) -> str:
+        """Cache key for a retrieval from an endpoint within a scope."""
+        parts = [
+            endpoint.path,
+            endpoint.url.rstrip("/"),
+            endpoint.slug,
+            endpoint.tenant_name or "",
+            query,
+            str(top_k),
+            repr(similarity_threshold),
+            scope,
+        ]
+        digest = hashlib.sha256("\x00".join(parts).encode("utf-8")).hexdigest()
+        return f"retrieval:{digest}"
+
+    @staticmethod
+    def _scope(credential: str | None) -> str:
+        if not credential:
+            return _SHARED_SCOPE
+        return "user:" + hashlib.sha256(credential.encode("utf-8")).hexdigest()
+
+    async def get(
+        self,
+        endpoint: ResolvedEndpoint,
+        query: str,
+        top_k: int,
+        similarity_threshold: float,
+        credential: str | None,
+    ) -> RetrievalResult | None:
+        """Return a cached result for the retrieval, or None on a miss.
+
+        ``credential`` is the token the caller presented for the endpoint;
+        only results fetched with the same credential (or, without one, with
+        none) are returned.
+        """
+        ttl = self.ttl_for(endpoint)
+        if not ttl:
+            return None
+
+        key = self.key(endpoint, query, top_k, similarity_threshold, self._scope(credential))
+        result = self._get_local(key, ttl)
+        if result is not None:
+            RETRIEVAL_CACHE_LOOKUPS.inc(result="hit")
+            return self._serve(result)
+
+        if self.shared is not None:
+            result = await self._get_shared(self.shared, key, ttl)
+            if result is not None:
+                RETRIEVAL_CACHE_LOOKUPS.inc(result="shared_hit")
+                return self._serve(result)
+
+        RETRIEVAL_CACHE_LOOKUPS.inc(result="miss")
+        return None
+
+    async def put(
+        self,
+        endpoint: ResolvedEndpoint,
+        query: str,
+        top_k: int,
+        similarity_threshold: float,
+        credential: str | None,
+        result: RetrievalResult,
+    ) -> None:
+        """Store a successful result if the endpoint opted in to caching."""
+        ttl = self.ttl_for(endpoint)
+        if not ttl or result.status != "success":
+            return
+        if result.policy_metadata and not credential:
+            return
+
+        key = self.key(endpoint, query, top_k, similarity_threshold, self._scope(credential))
+        created_at = self._clock()
+        expires_at = created_at + ttl
+        self._put_local(key, created_at, expires_at, result)
+
+        if self.shared is not None:
+            payload = json.dumps(
+                {
+                    "created_at": created_at,
+                    "expires_at": expires_at,
+                    "result": result.model_dump(mode="json"),
+                }
+            ).encode("utf-8")
+            try:
+                await self.shared.set(key, payload, ttl)
+            except Exception:
+                logger.warning("Shared retrieval cache write failed", exc_info=True)
+
+    def _is_fresh(self, created_at: float, expires_at: float, ttl: int) -> bool:
+        """Whether an entry is live and within the reading caller's TTL."""
+        now = self._clock()
+        return expires_at > now and now - created_at < ttl
+
+    def _get_local(self, key: str, ttl: int) -> RetrievalResult | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        created_at, expires_at, result = entry
+        if expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        if not self._is_fresh(created_at, expires_at, ttl):
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def _put_local(
+        self, key: str, created_at: float, expires_at: float, result: RetrievalResult
+    ) -> None:
+        if self.max_entries <= 0:
+            return
+        self._entries[key] = (created_at, expires_at, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def _get_shared(
+        self, shared: SharedRetrievalStore, key: str, ttl: int
+    ) -> RetrievalResult | None:
+        try:
+            raw = await shared.get(key)
+        except Exception:
+            logger.warning("Shared retrieval cache lookup failed", exc_info=True)
+            return None
+        if raw is None:
+            return None
+        try:
+            payload = json.loads(raw)
+            created_at = float(payload["created_at"])
+            expires_at = float(payload["expires_at"])
+            result = RetrievalResult.model_validate(payload["result"])
+        except Exception:
+            logger.warning("Ignoring malformed shared retrieval cache entry", exc_info=True)
+            return None
+        if not self._is_fresh(created_at, expires_at, ttl):
+            return None
+        self._put_local(key, created_at, expires_at, result)
+        return result
+
+    @staticmethod
+    def _serve(result: RetrievalResult) -> RetrievalResult:
+        # Copies so callers cannot mutate the cached entry; no policy metadata
+        # so a cached result is never reported (or billed) as a fresh charge.
+        return result.model_copy(deep=True, update={"policy_metadata": None, "latency_ms": 0})
+
+    async def close(self) -> None:
+        """Release the shared tier's resources."""
+        if self.shared is not None:
+            await self.shared.close()
+
+
+def build_shared_retrieval_store(url: str) -> SharedRetrievalStore | None:
+    """Create the shared tier from a Redis URL (None when no URL is configured)."""
+    if not url:
+        return None
+    return RedisRetrievalStore(url)
@@ -0,0 +1,170 @@
+"""Tests for per-data-source circuit breakers and their use in RetrievalService."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aggregator.observability.metrics import metrics
+from aggregator.schemas.internal import ResolvedEndpoint, RetrievalResult
+from aggregator.services.circuit_breaker import CircuitBreakerRegistry, CircuitState
+from aggregator.services.retrieval import RetrievalService
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def registry(clock: FakeClock) -> CircuitBreakerRegistry:
+    return CircuitBreakerRegistry(
+        failure_rate_threshold=0.5,
+        min_requests=4,
+        window_seconds=60.0,
+        open_seconds=30.0,
+        clock=clock,
+    )
+
+
+def _fail(registry: CircuitBreakerRegistry, source: str, times: int) -> None:
+    for _ in range(times):
+        assert registry.allow_request(source)
+        registry.record(source, False, 100.0)
+
+
+def test_opens_after_failure_rate_reached(registry: CircuitBreakerRegistry) -> None:
+    registry.record("alice/docs", True, 100.0)
+    _fail(registry, "alice/docs", 1)
+    assert registry.get("alice/docs").state is CircuitState.CLOSED  # below min_requests
+
+    _fail(registry, "alice/docs", 2)
+
+    assert registry.get("alice/docs").state is CircuitState.OPEN
+    assert not registry.allow_request("alice/docs")
+    assert 'aggregator_data_source_circuit_state{source="alice/docs"} 2' in metrics.render()
+
+
+def test_old_outcomes_leave_the_window(registry: CircuitBreakerRegistry, clock: FakeClock) -> None:
+    _fail(registry, "alice/docs", 3)
+    clock.now += 61
+    registry.record("alice/docs", True, 100.0)
+    _fail(registry, "alice/docs", 1)
+
+    assert registry.get("alice/docs").state is CircuitState.CLOSED
+
+
+def test_half_open_probe_closes_on_success(
+    registry: CircuitBreakerRegistry, clock: FakeClock
+) -> None:
+    _fail(registry, "alice/docs", 4)
+    clock.now += 30
+
+    assert registry.allow_request("alice/docs")
+    assert registry.get("alice/docs").state is CircuitState.HALF_OPEN
+    assert not registry.allow_request("alice/docs")  # one probe at a time
+
+    registry.record("alice/docs", True, 100.0)
+
+    assert registry.get("alice/docs").state is CircuitState.CLOSED
+    assert registry.allow_request("alice/docs")
+
+
+def test_half_open_probe_reopens_on_failure(
+    registry: CircuitBreakerRegistry, clock: FakeClock
+) -> None:
+    _fail(registry, "alice/docs", 4)
+    clock.now += 30
+    _fail(registry, "alice/docs", 1)
+
+    breaker = registry.get("alice/docs")
+    assert breaker.state is CircuitState.OPEN
+    assert breaker.retry_after() == pytest.approx(30.0)
+
+
+def test_latency_ewma(registry: CircuitBreakerRegistry) -> None:
+    registry.record("alice/docs", True, 100.0)
+    registry.record("alice/docs", True, 200.0)
+
+    assert registry.snapshot()["alice/docs"] == {
+        "state": "closed",
+        "latency_ewma_ms": pytest.approx(120.0),
+    }
+
+
+def test_least_recently_used_sources_are_forgotten(clock: FakeClock) -> None:
+    registry = CircuitBreakerRegistry(max_sources=2, clock=clock)
+    for source in ("a/one", "b/two", "c/three"):
+        registry.record(source, True, 10.0)
+
+    assert set(registry.snapshot()) == {"b/two", "c/three"}
+
+
+# ---------------------------------------------------------------------------
+# RetrievalService integration
+# ---------------------------------------------------------------------------
+
+DS = ResolvedEndpoint(
+    path="alice/docs",
+    url="http://space.example",
+    slug="docs",
+    endpoint_type="data_source",
+    name="Docs",
+)
+
+
+def _service(status: str, registry: CircuitBreakerRegistry) -> tuple[RetrievalService, MagicMock]:
+    client = MagicMock()
+    client.query = AsyncMock(
+        return_value=RetrievalResult(endpoint_path=DS.path, status=status, latency_ms=5)
+    )
+    return RetrievalService(client, circuit_breakers=registry), client
+
+
+@pytest.mark.asyncio
+async def test_open_circuit_fails_fast(registry: CircuitBreakerRegistry) -> None:
+    service, client = _service("timeout", registry)
+
+    for _ in range(4):
+        await service.retrieve([DS], "query")
+    context = await service.retrieve([DS], "query")
+
+    assert client.query.await_count == 4
+    [result] = context.retrieval_results
+    assert result.status == "error"
+    assert result.error_message is not None
+    assert result.error_message.startswith("Circuit open")
+
+
+@pytest.mark.asyncio
+async def test_access_refusals_do_not_open_the_circuit(
+    registry: CircuitBreakerRegistry,
+) -> None:
+    service, client = _service("access_denied", registry)
+
+    for _ in range(6):
+        await service.retrieve([DS], "query")
+
+    assert client.query.await_count == 6
+    assert registry.get(DS.path).state is CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+async def test_streaming_retrieval_uses_the_breaker(registry: CircuitBreakerRegistry) -> None:
+    service, client = _service("error", registry)
+    _fail(registry, DS.path, 4)
+
+    results = [r async for r in service.retrieve_streaming([DS], "query")]
+
+    client.query.assert_not_awaited()
+    assert results[0].error_message is not None
+    assert results[0].error_message.startswith("Circuit open")
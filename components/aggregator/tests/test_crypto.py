@@ -8,6 +8,7 @@ Tests cover:
 - Wrong AAD (correlation_id) authentication failures
 - Domain separation between request and response keys
 - Base64url helpers
+- TunnelSession (session-key mode) with classic and session-aware spaces
 """
 
 from __future__ import annotations
@@ -17,6 +18,7 @@ import uuid
 
 import pytest
 from cryptography.exceptions import InvalidTag
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
 from aggregator import crypto
 
@@ -291,3 +293,96 @@ def test_encrypt_decrypt_payload_wrong_aad_raises():
 
 def test_nonce_size_is_12():
     assert crypto.NONCE_SIZE == 12
+
+
+# ---------------------------------------------------------------------------
+# TunnelSession (session-key mode)
+# ---------------------------------------------------------------------------
+
+
+def simulate_go_session_encrypt_response(
+    payload_json: str,
+    request_enc_info: dict,
+    space_priv,
+    correlation_id: str,
+    nonce: bytes,
+) -> tuple[dict, str]:
+    """Simulate a session-aware Go space answering under the session response key."""
+    session_pub_bytes = crypto._b64url_decode(request_enc_info["ephemeral_public_key"])
+    _, response_key = crypto.derive_session_keys(space_priv, session_pub_bytes)
+    ciphertext = AESGCM(response_key).encrypt(nonce, payload_json.encode(), correlation_id.encode())
+    enc_info = {
+        "algorithm": crypto.SESSION_ALGORITHM_ID,
+        "ephemeral_public_key": request_enc_info["ephemeral_public_key"],
+        "nonce": crypto._b64url_encode(nonce),
+    }
+    return enc_info, crypto._b64url_encode(ciphertext)
+
+
+def test_session_request_decryptable_by_classic_space():
+    """A space without session support decrypts session requests unchanged."""
+    space_priv, space_pub_b64 = make_space_keypair()
+    session = crypto.TunnelSession(space_pub_b64)
+
+    for i in range(3):
+        corr_id = str(uuid.uuid4())
+        enc_info = session.encrypt_request(json.dumps({"n": i}), corr_id)
+        assert enc_info["algorithm"] == crypto.SESSION_ALGORITHM_ID
+        assert json.loads(manual_space_decrypt_request(enc_info, space_priv, corr_id)) == {"n": i}
+
+
+def test_session_reuses_ephemeral_key_with_unique_nonces():
+    _, space_pub_b64 = make_space_keypair()
+    session = crypto.TunnelSession(space_pub_b64)
+
+    infos = [session.encrypt_request("{}", str(uuid.uuid4())) for _ in range(100)]
+
+    assert {info["ephemeral_public_key"] for info in infos} == {session.ephemeral_public_key_b64}
+    assert len({info["nonce"] for info in infos}) == 100
+
+
+def test_session_decrypts_classic_response():
+    """Responses from spaces that ignore session mode still decrypt."""
+    _, space_pub_b64 = make_space_keypair()
+    session = crypto.TunnelSession(space_pub_b64)
+    corr_id = str(uuid.uuid4())
+    session.encrypt_request("{}", corr_id)
+
+    resp_enc_info, resp_ct = manual_simulate_go_encrypt_response(
+        '{"ok": true}', session.private_key, corr_id
+    )
+
+    assert session.decrypt_response(resp_ct, resp_enc_info, corr_id) == '{"ok": true}'
+
+
+def test_session_decrypts_session_response():
+    space_priv, space_pub_b64 = make_space_keypair()
+    session = crypto.TunnelSession(space_pub_b64)
+    corr_id = str(uuid.uuid4())
+    enc_info = session.encrypt_request("{}", corr_id)
+
+    resp_enc_info, resp_ct = simulate_go_session_encrypt_response(
+        '{"ok": true}', enc_info, space_priv, corr_id, nonce=b"\x01" * 12
+    )
+
+    assert session.decrypt_response(resp_ct, resp_enc_info, corr_id) == '{"ok": true}'
+    with pytest.raises(InvalidTag):
+        session.decrypt_response(resp_ct, resp_enc_info, "other-correlation-id")
+
+
+def test_session_expires_after_message_budget():
+    _, space_pub_b64 = make_space_keypair()
+    session = crypto.TunnelSession(space_pub_b64, max_messages=2)
+
+    session.encrypt_request("{}", "a")
+    assert not session.expired
+    session.encrypt_request("{}", "b")
+    assert session.expired
+    # In-flight requests that already hold the session may still finish
+    assert session.encrypt_request("{}", "c")["nonce"]
+
+
+def test_session_expires_after_ttl():
+    _, space_pub_b64 = make_space_keypair()
+    assert crypto.TunnelSession(space_pub_b64, ttl_seconds=0).expired
+    assert not crypto.TunnelSession(space_pub_b64, ttl_seconds=60).expired
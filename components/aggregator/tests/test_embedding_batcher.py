@@ -0,0 +1,110 @@
+"""Tests for cross-request embedding micro-batching."""
+
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from aggregator.services.embedding_batcher import EmbeddingBatcher
+
+
+class _RecordingEncoder:
+    """Encode each text as a 1-d vector holding its length; record batch sizes."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def __call__(self, texts: list[str]) -> np.ndarray:
+        self.batches.append(list(texts))
+        return np.array([[float(len(t))] for t in texts], dtype=np.float32)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_batch() -> None:
+    """Requests submitted within the wait window are encoded together."""
+    encoder = _RecordingEncoder()
+    batcher = EmbeddingBatcher(encoder, max_batch_size=100, max_wait_ms=20)
+
+    first, second = await asyncio.gather(
+        batcher.submit(["a", "bb"]),
+        batcher.submit(["ccc"]),
+    )
+
+    assert encoder.batches == [["a", "bb", "ccc"]]
+    # Each caller gets back only the rows for its own texts, in order
+    assert first.tolist() == [[1.0], [2.0]]
+    assert second.tolist() == [[3.0]]
+
+
+@pytest.mark.asyncio
+async def test_size_limit_flushes_without_waiting() -> None:
+    """Reaching max_batch_size flushes immediately instead of waiting for the deadline."""
+    encoder = _RecordingEncoder()
+    batcher = EmbeddingBatcher(encoder, max_batch_size=3, max_wait_ms=10_000)
+
+    result = await asyncio.wait_for(
+        asyncio.gather(batcher.submit(["a", "b"]), batcher.submit(["c"])),
+        timeout=1.0,
+    )
+
+    assert encoder.batches == [["a", "b", "c"]]
+    assert [r.shape[0] for r in result] == [2, 1]
+
+
+@pytest.mark.asyncio
+async def test_deadline_flushes_partial_batch() -> None:
+    """A lone request is flushed once max_wait_ms elapses."""
+    encoder = _RecordingEncoder()
+    batcher = EmbeddingBatcher(encoder, max_batch_size=100, max_wait_ms=1)
+
+    result = await asyncio.wait_for(batcher.submit(["only"]), timeout=1.0)
+
+    assert encoder.batches == [["only"]]
+    assert result.tolist() == [[4.0]]
+
+
+@pytest.mark.asyncio
+async def test_zero_wait_disables_batching() -> None:
+    """max_wait_ms=0 encodes each request on its own."""
+    encoder = _RecordingEncoder()
+    batcher = EmbeddingBatcher(encoder, max_batch_size=100, max_wait_ms=0)
+
+    await asyncio.gather(batcher.submit(["a"]), batcher.submit(["b"]))
+
+    assert encoder.batches == [["a"], ["b"]]
+
+
+@pytest.mark.asyncio
+async def test_encode_failure_propagates_to_every_caller() -> None:
+    """An encode error is raised in each request that shared the batch."""
+
+    async def _failing(_texts: list[str]) -> np.ndarray:
+        raise RuntimeError("onnx session crashed")
+
+    batcher = EmbeddingBatcher(_failing, max_batch_size=100, max_wait_ms=5)
+
+    results = await asyncio.gather(
+        batcher.submit(["a"]),
+        batcher.submit(["b"]),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_break_batch() -> None:
+    """Cancelling one waiting request leaves the others' results intact."""
+    encoder = _RecordingEncoder()
+    batcher = EmbeddingBatcher(encoder, max_batch_size=100, max_wait_ms=10)
+
+    cancelled = asyncio.create_task(batcher.submit(["gone"]))
+    kept = asyncio.create_task(batcher.submit(["kept"]))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert (await kept).tolist() == [[4.0]]
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
@@ -0,0 +1,183 @@
+"""Tests for the reranker embedding cache."""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterable
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from aggregator.services.embedding_cache import (
+    DiskEmbeddingStore,
+    EmbeddingCache,
+    build_shared_store,
+)
+from aggregator.services.reranker import RerankerPool
+
+
+def _vec(*values: float) -> np.ndarray:
+    return np.array(values, dtype=np.float32)
+
+
+class _DictStore:
+    """In-memory SharedEmbeddingStore for exercising the shared tier."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.data: dict[str, bytes] = {}
+        self.fail = fail
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        if self.fail:
+            raise ConnectionError("redis down")
+        return [self.data.get(k) for k in keys]
+
+    async def set_many(self, items: dict[str, bytes]) -> None:
+        if self.fail:
+            raise ConnectionError("redis down")
+        self.data.update(items)
+
+    async def close(self) -> None:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# EmbeddingCache
+# ---------------------------------------------------------------------------
+
+
+def test_key_depends_on_model_and_content() -> None:
+    """Same content under a different model must not share an entry."""
+    base = EmbeddingCache(model_name="BAAI/bge-base-en-v1.5")
+    other = EmbeddingCache(model_name="BAAI/bge-small-en-v1.5")
+
+    assert base.key("hello") == base.key("hello")
+    assert base.key("hello") != base.key("hello!")
+    assert base.key("hello") != other.key("hello")
+
+
+@pytest.mark.asyncio
+async def test_round_trip_and_hit_counters() -> None:
+    """Stored vectors are returned on lookup; misses are reported as None."""
+    cache = EmbeddingCache(model_name="m")
+    await cache.put_many(["a"], np.stack([_vec(1.0, 0.0)]))
+
+    found = await cache.get_many(["a", "b"])
+
+    assert found[0] is not None
+    assert found[0].tolist() == [1.0, 0.0]
+    assert found[1] is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_lru_evicts_least_recently_used_within_byte_budget() -> None:
+    """The in-process tier never exceeds its byte budget and evicts LRU first."""
+    vector_bytes = _vec(0.0, 0.0).nbytes
+    cache = EmbeddingCache(model_name="m", max_bytes=2 * vector_bytes)
+
+    await cache.put_many(["a", "b"], np.stack([_vec(1, 0), _vec(0, 1)]))
+    await cache.get_many(["a"])  # "a" becomes most recently used
+    await cache.put_many(["c"], np.stack([_vec(1, 1)]))
+
+    found = await cache.get_many(["a", "b", "c"])
+    assert [v is not None for v in found] == [True, False, True]
+    assert cache.size_bytes <= cache.max_bytes
+
+
+@pytest.mark.asyncio
+async def test_shared_tier_fills_local_misses() -> None:
+    """A vector written by another replica is served from the shared tier."""
+    store = _DictStore()
+    writer = EmbeddingCache(model_name="m", shared=store)
+    reader = EmbeddingCache(model_name="m", shared=store)
+
+    await writer.put_many(["doc"], np.stack([_vec(0.6, 0.8)]))
+    found = await reader.get_many(["doc"])
+
+    assert found[0] is not None
+    assert found[0].tolist() == pytest.approx([0.6, 0.8])
+    assert reader.shared_hits == 1
+    # Promoted into the local tier: the next lookup does not touch the store
+    store.data.clear()
+    assert (await reader.get_many(["doc"]))[0] is not None
+
+
+@pytest.mark.asyncio
+async def test_shared_tier_failure_is_a_miss() -> None:
+    """Shared-tier errors degrade to cache misses instead of raising."""
+    cache = EmbeddingCache(model_name="m", shared=_DictStore(fail=True))
+
+    await cache.put_many(["doc"], np.stack([_vec(1.0)]))
+    assert (await cache.get_many(["other"])) == [None]
+
+
+@pytest.mark.asyncio
+async def test_disk_store_round_trip(tmp_path: Path) -> None:
+    """The directory-backed shared tier persists vectors across instances."""
+    store = build_shared_store(str(tmp_path))
+    assert isinstance(store, DiskEmbeddingStore)
+
+    await EmbeddingCache(model_name="BAAI/bge", shared=store).put_many(
+        ["doc"], np.stack([_vec(0.5, 0.5)])
+    )
+    found = await EmbeddingCache(model_name="BAAI/bge", shared=store).get_many(["doc"])
+
+    assert found[0] is not None
+    assert found[0].tolist() == [0.5, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_disk_store_evicts_least_recently_used_beyond_budget(tmp_path: Path) -> None:
+    """The directory stays within its byte budget; reads keep a vector alive."""
+    vector_bytes = _vec(0.0, 0.0).nbytes
+    store = DiskEmbeddingStore(tmp_path, max_bytes=3 * vector_bytes)
+    await store.set_many({k: _vec(1, 0).tobytes() for k in ("a", "b", "c")})
+    for age, key in enumerate(("c", "b", "a")):
+        mtime = 1_000_000 - age
+        os.utime(store._path(key), (mtime, mtime))
+
+    assert (await store.get_many(["a"]))[0] is not None  # "a" becomes most recently used
+    await store.set_many({"d": _vec(0, 1).tobytes()})
+
+    found = await store.get_many(["a", "b", "c", "d"])
+    assert [v is not None for v in found] == [True, False, False, True]
+    assert sum(p.stat().st_size for p in tmp_path.glob("*.f32")) <= store.max_bytes
+    # A new instance measures what is already on disk
+    assert DiskEmbeddingStore(tmp_path)._bytes == 2 * vector_bytes
+
+
+def test_build_shared_store_disabled_without_url() -> None:
+    assert build_shared_store("") is None
+
+
+# ---------------------------------------------------------------------------
+# RerankerPool integration
+# ---------------------------------------------------------------------------
+
+
+class _CountingModel:
+    def __init__(self) -> None:
+        self.encoded: list[str] = []
+
+    def embed(self, texts: Iterable[str]) -> Iterable[np.ndarray]:
+        for text in texts:
+            self.encoded.append(text)
+            yield _vec(float(len(text)), 1.0)
+
+
+@pytest.mark.asyncio
+async def test_reranker_only_encodes_cache_misses() -> None:
+    """Repeated documents are served from the cache; only new text hits the model."""
+    model = _CountingModel()
+    pool = RerankerPool(cache=EmbeddingCache(model_name="m"))
+    pool._load_model = lambda: model  # type: ignore[method-assign]
+    await pool.start()
+
+    await pool.rerank("query", [("a/b", "doc one"), ("a/b", "doc two")], top_k=2)
+    ranked = await pool.rerank("query", [("a/b", "doc one"), ("c/d", "doc three")], top_k=3)
+
+    assert model.encoded == ["query", "doc one", "doc two", "doc three"]
+    assert {content for _, content, _ in ranked} == {"doc one", "doc three"}
+    await pool.close()
@@ -25,3 +25,12 @@ def test_ready_endpoint_returns_status(client: TestClient) -> None:
     assert "checks" in data
     # Aggregator is stateless - no external dependencies to check
     assert data["checks"] == {}
+
+
+def test_metrics_endpoint_serves_prometheus_text(client: TestClient) -> None:
+    """GET /metrics exposes payload-work and event-loop lag metrics."""
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE aggregator_event_loop_lag_seconds histogram" in response.text
+    assert "# TYPE aggregator_payload_work_seconds histogram" in response.text
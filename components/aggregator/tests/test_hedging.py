@@ -0,0 +1,216 @@
+"""Tests for request hedging of slow data sources and models."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+
+from aggregator.clients.data_source import DataSourceClient
+from aggregator.clients.hedging import RequestHedger
+from aggregator.clients.model import ModelClient
+from aggregator.schemas.requests import Message
+
+
+def _trained_hedger(key: str, latency: float = 0.01) -> RequestHedger:
+    hedger = RequestHedger("test", min_samples=5, min_delay=0.01, max_ratio=1.0)
+    for _ in range(5):
+        hedger.observe(key, latency)
+    return hedger
+
+
+def test_no_hedge_delay_until_enough_samples() -> None:
+    hedger = RequestHedger("test", min_samples=3, min_delay=0.0)
+    hedger.observe("a/docs", 0.1)
+    hedger.observe("a/docs", 0.2)
+    assert hedger.hedge_delay("a/docs") is None
+
+    hedger.observe("a/docs", 0.3)
+    assert hedger.hedge_delay("a/docs") == pytest.approx(0.3)
+
+
+def test_billed_endpoints_are_never_hedged() -> None:
+    hedger = _trained_hedger("a/docs")
+    hedger.mark_billed("a/docs")
+
+    assert hedger.hedge_delay("a/docs") is None
+
+
+@pytest.mark.asyncio
+async def test_slow_primary_is_hedged() -> None:
+    hedger = _trained_hedger("a/docs")
+    calls: list[int] = []
+
+    async def call() -> str:
+        calls.append(len(calls))
+        if len(calls) == 1:
+            await asyncio.sleep(1.0)
+            return "primary"
+        return "hedge"
+
+    assert await hedger.run("a/docs", call) == "hedge"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_fast_primary_is_not_hedged() -> None:
+    hedger = _trained_hedger("a/docs", latency=0.5)
+    calls: list[int] = []
+
+    async def call() -> str:
+        calls.append(len(calls))
+        return "primary"
+
+    assert await hedger.run("a/docs", call) == "primary"
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_unaccepted_hedge_does_not_win() -> None:
+    hedger = _trained_hedger("a/docs")
+    calls: list[int] = []
+
+    async def call() -> str:
+        calls.append(len(calls))
+        if len(calls) > 1:
+            return "unavailable"
+        await asyncio.sleep(0.05)
+        return "ok"
+
+    assert await hedger.run("a/docs", call, accept=lambda r: r == "ok") == "ok"
+
+
+@pytest.mark.asyncio
+async def test_hedge_ratio_is_bounded() -> None:
+    hedger = _trained_hedger("a/docs")
+    hedger.max_ratio = 0.0
+    calls: list[int] = []
+
+    async def call() -> str:
+        calls.append(len(calls))
+        await asyncio.sleep(0.03)
+        return "primary"
+
+    await hedger.run("a/docs", call)
+    assert len(calls) == 1
+
+
+# ---------------------------------------------------------------------------
+# Client integration
+# ---------------------------------------------------------------------------
+
+SUCCESS_BODY = {
+    "summary": None,
+    "references": {"documents": [{"content": "doc", "similarity_score": 0.9}]},
+}
+
+
+def _slow_data_source(requests: list[httpx.Request], body: dict[str, object]) -> DataSourceClient:
+    """Client whose first request to the source stalls past the hedge delay."""
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 1:
+            await asyncio.sleep(0.1)
+        return httpx.Response(200, json=body)
+
+    return DataSourceClient(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        hedger=_trained_hedger("alice/docs"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_data_source_requests_with_credentials_are_not_hedged() -> None:
+    """A satellite token may be billed without a 402, so it is never sent twice."""
+    requests: list[httpx.Request] = []
+    client = _slow_data_source(requests, SUCCESS_BODY)
+
+    result = await client.query(
+        url="http://space.example",
+        slug="docs",
+        endpoint_path="alice/docs",
+        query="q",
+        authorization_token="satellite-token",
+    )
+
+    assert result.status == "success"
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_data_source_reporting_policy_metadata_is_never_hedged() -> None:
+    """A successful answer carrying policy metadata marks the source billed."""
+    requests: list[httpx.Request] = []
+    body = {**SUCCESS_BODY, "policy_metadata": {"policies": ["prepaid"], "entries": []}}
+    client = _slow_data_source(requests, body)
+    assert client.hedger is not None
+
+    await client.query(
+        url="http://space.example",
+        slug="docs",
+        endpoint_path="alice/docs",
+        query="q",
+        authorization_token="satellite-token",
+    )
+    assert client.hedger.hedge_delay("alice/docs") is None
+
+    requests.clear()
+    await client.query(
+        url="http://space.example", slug="docs", endpoint_path="alice/docs", query="q"
+    )
+    assert len(requests) == 1
+
+
+@pytest.mark.asyncio
+async def test_data_source_402_marks_source_billed() -> None:
+    """An anonymous hedge answered with 402 is not taken, and the source is remembered."""
+    requests: list[httpx.Request] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        if len(requests) == 1:
+            await asyncio.sleep(0.1)
+            return httpx.Response(200, json=SUCCESS_BODY)
+        return httpx.Response(402, headers={"www-authenticate": "Payment x"})
+
+    hedger = _trained_hedger("alice/docs")
+    client = DataSourceClient(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        hedger=hedger,
+    )
+
+    result = await client.query(
+        url="http://space.example", slug="docs", endpoint_path="alice/docs", query="q"
+    )
+
+    assert result.status == "success"
+    assert len(requests) == 2
+    assert hedger.hedge_delay("alice/docs") is None
+
+
+@pytest.mark.asyncio
+async def test_model_chat_uses_faster_duplicate() -> None:
+    calls = {"count": 0}
+
+    async def handler(_request: httpx.Request) -> httpx.Response:
+        calls["count"] += 1
+        if calls["count"] == 1:
+            await asyncio.sleep(1.0)
+            return httpx.Response(200, json={"summary": {"message": {"content": "slow"}}})
+        return httpx.Response(200, json={"summary": {"message": {"content": "fast"}}})
+
+    client = ModelClient(
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        hedger=_trained_hedger("http://space.example/llm"),
+    )
+
+    result = await client.chat(
+        url="http://space.example",
+        slug="llm",
+        messages=[Message(role="user", content="hi")],
+    )
+
+    assert result.response == "fast"
+    assert calls["count"] == 2
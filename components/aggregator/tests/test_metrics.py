@@ -0,0 +1,85 @@
+"""Tests for the in-process metrics registry and event-loop lag monitor."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from aggregator.observability.loop_monitor import EVENT_LOOP_LAG_SECONDS, EventLoopLagMonitor
+from aggregator.observability.metrics import MetricsRegistry
+
+
+def test_counter_renders_prometheus_text() -> None:
+    registry = MetricsRegistry()
+    hits = registry.counter("cache_hits_total", "Cache hits", ("tier",))
+
+    hits.inc(tier="local")
+    hits.inc(2, tier="local")
+    hits.inc(tier="shared")
+
+    text = registry.render()
+    assert "# TYPE cache_hits_total counter" in text
+    assert 'cache_hits_total{tier="local"} 3' in text
+    assert 'cache_hits_total{tier="shared"} 1' in text
+
+
+def test_removed_series_is_not_rendered() -> None:
+    registry = MetricsRegistry()
+    state = registry.gauge("circuit_state", "Circuit state", ("source",))
+
+    state.set(2, source="a")
+    state.set(0, source="b")
+    state.remove(source="a")
+
+    text = registry.render()
+    assert 'circuit_state{source="a"}' not in text
+    assert 'circuit_state{source="b"} 0' in text
+
+
+def test_histogram_buckets_are_cumulative() -> None:
+    registry = MetricsRegistry()
+    latency = registry.histogram("work_seconds", "Work time", buckets=(0.01, 0.1))
+
+    for value in (0.005, 0.05, 0.5):
+        latency.observe(value)
+
+    text = registry.render()
+    assert 'work_seconds_bucket{le="0.01"} 1' in text
+    assert 'work_seconds_bucket{le="0.1"} 2' in text
+    assert 'work_seconds_bucket{le="+Inf"} 3' in text
+    assert "work_seconds_count 3" in text
+    assert latency.sum() == pytest.approx(0.555)
+
+
+def test_registering_twice_returns_same_metric() -> None:
+    registry = MetricsRegistry()
+    first = registry.counter("requests_total", "Requests")
+
+    assert registry.counter("requests_total", "Requests") is first
+    with pytest.raises(ValueError):
+        registry.histogram("requests_total", "Requests")
+
+
+def test_wrong_labels_rejected() -> None:
+    registry = MetricsRegistry()
+    hits = registry.counter("hits_total", "Hits", ("tier",))
+
+    with pytest.raises(ValueError):
+        hits.inc(other="x")
+
+
+@pytest.mark.asyncio
+async def test_loop_monitor_records_blocking() -> None:
+    """A synchronous stall on the loop shows up as lag."""
+    before = EVENT_LOOP_LAG_SECONDS.sum()
+    monitor = EventLoopLagMonitor(interval=0.01)
+    monitor.start()
+
+    await asyncio.sleep(0.02)
+    time.sleep(0.05)  # block the loop
+    await asyncio.sleep(0.02)
+    await monitor.stop()
+
+    assert EVENT_LOOP_LAG_SECONDS.sum() - before >= 0.03
@@ -0,0 +1,342 @@
+"""Tests for multiplexed peer-channel reply routing in NATSTransport.
+
+Replies for every in-flight request on a peer channel share one long-lived
+subscription and are routed to the waiting request by correlation_id.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+import uuid
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+
+from aggregator import crypto
+from aggregator.clients import nats_transport as nats_transport_module
+from aggregator.clients.nats_transport import NATSTransport, NATSTransportError
+from aggregator.core.offload import PAYLOAD_WORK_SECONDS, PayloadExecutor
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+def _encrypted_echo_reply(space_priv: Any, request: dict[str, Any]) -> dict[str, Any]:
+    """Play the Go space: decrypt the request and encrypt an echo of its payload."""
+    correlation_id = request["correlation_id"]
+    enc = request["encryption_info"]
+    request_eph_pub = crypto._b64url_decode(enc["ephemeral_public_key"])
+    req_key = crypto.derive_key(space_priv, request_eph_pub, crypto.HKDF_REQUEST_INFO)
+    plaintext = crypto.decrypt_payload(
+        crypto._b64url_decode(request["encrypted_payload"]),
+        req_key,
+        crypto._b64url_decode(enc["nonce"]),
+        correlation_id.encode(),
+    )
+
+    resp_priv, resp_pub = crypto.generate_keypair()
+    resp_key = crypto.derive_key(resp_priv, request_eph_pub, crypto.HKDF_RESPONSE_INFO)
+    nonce, ciphertext = crypto.encrypt_payload(
+        json.dumps({"echo": json.loads(plaintext)}).encode(),
+        resp_key,
+        correlation_id.encode(),
+    )
+    return {
+        "protocol": "syfthub-tunnel/v1",
+        "type": "endpoint_response",
+        "correlation_id": correlation_id,
+        "status": "success",
+        "encryption_info": {
+            "algorithm": crypto.ALGORITHM_ID,
+            "ephemeral_public_key": crypto._b64url_encode(resp_pub),
+            "nonce": crypto._b64url_encode(nonce),
+        },
+        "encrypted_payload": crypto._b64url_encode(ciphertext),
+    }
+
+
+class _FakeNATS:
+    """Minimal NATS client: collects published requests, replies on demand."""
+
+    def __init__(self, space_priv: Any) -> None:
+        self.is_connected = True
+        self.space_priv = space_priv
+        self.subscribed: list[str] = []
+        self.unsubscribed: list[str] = []
+        self.published: list[dict[str, Any]] = []
+        self._callbacks: dict[str, Any] = {}
+        self.flush = AsyncMock()
+
+    async def subscribe(self, subject: str, cb: Any = None) -> Any:
+        self.subscribed.append(subject)
+        self._callbacks[subject] = cb
+        sub = MagicMock()
+
+        async def _unsubscribe() -> None:
+            self.unsubscribed.append(subject)
+
+        sub.unsubscribe = _unsubscribe
+        return sub
+
+    async def publish(self, _subject: str, data: bytes) -> None:
+        self.published.append(json.loads(data))
+
+    async def reply(self, request: dict[str, Any], reply: dict[str, Any] | None = None) -> None:
+        subject = f"syfthub.peer.{request['reply_to']}"
+        msg = MagicMock()
+        msg.subject = subject
+        msg.data = json.dumps(reply or _encrypted_echo_reply(self.space_priv, request)).encode()
+        await self._callbacks[subject](msg)
+
+
+def _make_transport(
+    nc: _FakeNATS,
+    space_pub_b64: str,
+    *usernames: str,
+    payload_executor: PayloadExecutor | None = None,
+) -> NATSTransport:
+    transport = NATSTransport(
+        nats_url="nats://localhost:4222",
+        nats_auth_token="tok",
+        backend_url="http://localhost:8000",
+        payload_executor=payload_executor,
+    )
+    for username in usernames:
+        transport._key_cache[username] = (space_pub_b64, time.monotonic())
+
+    async def _connected() -> Any:
+        return nc
+
+    transport._ensure_connected = _connected  # type: ignore[method-assign]
+    return transport
+
+
+async def _wait_for_published(nc: _FakeNATS, count: int) -> None:
+    while len(nc.published) < count:
+        await asyncio.sleep(0)
+
+
+@pytest.fixture
+def space_keys() -> tuple[Any, str]:
+    priv, pub = crypto.generate_keypair()
+    return priv, crypto._b64url_encode(pub)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_subscription(space_keys: tuple[Any, str]) -> None:
+    """Fan-out to several spaces subscribes once and routes replies by correlation_id."""
+    space_priv, space_pub = space_keys
+    nc = _FakeNATS(space_priv)
+    transport = _make_transport(nc, space_pub, "alice", "bob", "carol")
+    peer_channel = str(uuid.uuid4())
+
+    tasks = [
+        asyncio.create_task(
+            transport._send_and_receive(
+                target_username=user,
+                peer_channel=peer_channel,
+                slug="docs",
+                endpoint_type="data_source",
+                payload={"messages": f"question for {user}"},
+            )
+        )
+        for user in ("alice", "bob", "carol")
+    ]
+    await _wait_for_published(nc, 3)
+
+    # Reply out of order; each request must still get its own answer
+    for request in reversed(nc.published):
+        await nc.reply(request)
+    results = await asyncio.gather(*tasks)
+
+    assert nc.subscribed == [f"syfthub.peer.{peer_channel}"]
+    assert [r["payload"]["echo"]["messages"] for r in results] == [
+        "question for alice",
+        "question for bob",
+        "question for carol",
+    ]
+    assert nc.unsubscribed == []
+
+
+@pytest.mark.asyncio
+async def test_unknown_and_malformed_replies_are_ignored(space_keys: tuple[Any, str]) -> None:
+    """Stray replies on the channel do not resolve (or break) the waiting request."""
+    space_priv, space_pub = space_keys
+    nc = _FakeNATS(space_priv)
+    transport = _make_transport(nc, space_pub, "alice")
+    peer_channel = str(uuid.uuid4())
+
+    task = asyncio.create_task(
+        transport._send_and_receive(
+            target_username="alice",
+            peer_channel=peer_channel,
+            slug="docs",
+            endpoint_type="data_source",
+            payload={"messages": "q"},
+        )
+    )
+    await _wait_for_published(nc, 1)
+    request = nc.published[0]
+
+    await nc.reply(request, reply={"correlation_id": "someone-else", "status": "success"})
+    malformed = MagicMock()
+    malformed.subject = f"syfthub.peer.{peer_channel}"
+    malformed.data = b"not json"
+    await nc._callbacks[malformed.subject](malformed)
+    assert not task.done()
+
+    await nc.reply(request)
+    result = await task
+    assert result["payload"] == {"echo": {"messages": "q"}}
+
+
+@pytest.mark.asyncio
+async def test_idle_subscription_is_reused_then_expires(
+    space_keys: tuple[Any, str], monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Back-to-back requests reuse the subscription; it is dropped once idle."""
+    monkeypatch.setattr(nats_transport_module, "_REPLY_SUB_IDLE_TTL", 0.01)
+    space_priv, space_pub = space_keys
+    nc = _FakeNATS(space_priv)
+    transport = _make_transport(nc, space_pub, "alice")
+    peer_channel = str(uuid.uuid4())
+
+    for i in range(2):
+        task = asyncio.create_task(
+            transport._send_and_receive(
+                target_username="alice",
+                peer_channel=peer_channel,
+                slug="docs",
+                endpoint_type="data_source",
+                payload={"messages": f"q{i}"},
+            )
+        )
+        await _wait_for_published(nc, i + 1)
+        await nc.reply(nc.published[i])
+        await task
+
+    assert nc.subscribed == [f"syfthub.peer.{peer_channel}"]
+
+    await asyncio.sleep(0.05)
+    assert nc.unsubscribed == [f"syfthub.peer.{peer_channel}"]
+    assert peer_channel not in transport._reply_routes
+
+
+@pytest.mark.asyncio
+async def test_timeout_releases_waiter(space_keys: tuple[Any, str]) -> None:
+    """A timed-out request is removed from the routing table."""
+    space_priv, space_pub = space_keys
+    nc = _FakeNATS(space_priv)
+    transport = _make_transport(nc, space_pub, "alice")
+    peer_channel = str(uuid.uuid4())
+
+    with pytest.raises(NATSTransportError) as exc_info:
+        await transport._send_and_receive(
+            target_username="alice",
+            peer_channel=peer_channel,
+            slug="docs",
+            endpoint_type="data_source",
+            payload={"messages": "q"},
+            timeout=0.01,
+        )
+
+    assert exc_info.value.code == "TIMEOUT"
+    assert transport._reply_routes[peer_channel].pending == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_subscribe_is_not_cached(space_keys: tuple[Any, str]) -> None:
+    """If subscribing fails, the next request tries to subscribe again."""
+    space_priv, space_pub = space_keys
+    nc = _FakeNATS(space_priv)
+    transport = _make_transport(nc, space_pub, "alice")
+    peer_channel = str(uuid.uuid4())
+    nc.flush.side_effect = [ConnectionError("nats down"), None]
+
+    with pytest.raises(ConnectionError):
+        await transport._send_and_receive(
+            target_username="alice",
+            peer_channel=peer_channel,
+            slug="docs",
+            endpoint_type="data_source",
+            payload={"messages": "q"},
+        )
+    assert peer_channel not in transport._reply_routes
+
+    task = asyncio.create_task(
+        transport._send_and_receive(
+            target_username="alice",
+            peer_channel=peer_channel,
+            slug="docs",
+            endpoint_type="data_source",
+            payload={"messages": "q"},
+        )
+    )
+    await _wait_for_published(nc, 1)
+    await nc.reply(nc.published[0])
+    await task
+    assert len(nc.subscribed) == 2
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_are_processed_off_the_loop(space_keys: tuple[Any, str]) -> None:
+    """Above the threshold, encode, reply parsing and decryption all use the pool."""
+    space_priv, space_pub = space_keys
+    nc = _FakeNATS(space_priv)
+    executor = PayloadExecutor(threshold_bytes=1024, max_workers=2)
+    transport = _make_transport(nc, space_pub, "alice", payload_executor=executor)
+    ops = ("encode_request", "decode_reply", "decrypt_response")
+    before = {op: PAYLOAD_WORK_SECONDS.count(op=op, mode="offloaded") for op in ops}
+    big = "x" * 10_000
+
+    task = asyncio.create_task(
+        transport._send_and_receive(
+            target_username="alice",
+            peer_channel=str(uuid.uuid4()),
+            slug="docs",
+            endpoint_type="data_source",
+            payload={"messages": big},
+        )
+    )
+    await _wait_for_published(nc, 1)
+    await nc.reply(nc.published[0])
+    result = await task
+
+    assert result["payload"] == {"echo": {"messages": big}}
+    for op in ops:
+        assert PAYLOAD_WORK_SECONDS.count(op=op, mode="offloaded") == before[op] + 1
+    await transport.close()
+
+
+def test_request_ephemeral_key_round_trip_helper(space_keys: tuple[Any, str]) -> None:
+    """Sanity-check the fake space helper against a real request."""
+    space_priv, space_pub = space_keys
+    transport = NATSTransport(nats_url="nats://x", nats_auth_token="t", backend_url="http://b")
+    correlation_id, request, eph_priv = transport._build_tunnel_request(
+        slug="docs",
+        endpoint_type="data_source",
+        payload={"messages": "hi"},
+        peer_channel="chan",
+        space_public_key=space_pub,
+    )
+    reply = _encrypted_echo_reply(space_priv, request)
+    decrypted = crypto.decrypt_tunnel_response(
+        encrypted_payload_b64=reply["encrypted_payload"],
+        encryption_info=reply["encryption_info"],
+        ephemeral_private_key=eph_priv,
+        correlation_id=correlation_id,
+    )
+    assert json.loads(decrypted) == {"echo": {"messages": "hi"}}
+    assert eph_priv.public_key().public_bytes(
+        encoding=Encoding.Raw, format=PublicFormat.Raw
+    ) == crypto._b64url_decode(request["encryption_info"]["ephemeral_public_key"])
@@ -6,6 +6,7 @@ These tests focus on the encryption-related behavior of NATSTransport:
 - Missing key raises NATSTransportError with ENCRYPTION_KEY_MISSING code
 - Decryption failures evict the key cache
 - decrypt_tunnel_response is called correctly on valid responses
+- Opt-in session-key mode reuses one TunnelSession per space key
 """
 
 from __future__ import annotations
@@ -259,6 +260,91 @@ def test_evict_key_cache_noop_for_unknown_user():
     transport._evict_key_cache("nonexistent")  # should not raise
 
 
+# ---------------------------------------------------------------------------
+# Session-key mode
+# ---------------------------------------------------------------------------
+
+
+def _session_transport() -> NATSTransport:
+    transport = NATSTransport(
+        nats_url="nats://localhost:4222",
+        nats_auth_token="tok",
+        backend_url="http://localhost:8000",
+    )
+    transport._session_keys_enabled = True
+    return transport
+
+
+def test_get_session_disabled_by_default():
+    transport = NATSTransport(
+        nats_url="nats://localhost:4222",
+        nats_auth_token="tok",
+        backend_url="http://localhost:8000",
+    )
+    _, space_pub_b64 = make_space_keypair_b64()
+
+    assert transport._get_session(space_pub_b64) is None
+
+
+def test_get_session_reused_until_expired():
+    transport = _session_transport()
+    _, space_pub_b64 = make_space_keypair_b64()
+
+    session = transport._get_session(space_pub_b64)
+    assert session is not None
+    assert transport._get_session(space_pub_b64) is session
+
+    transport._session_key_ttl = 0
+    transport._sessions.clear()
+    expired = transport._get_session(space_pub_b64)
+    assert transport._get_session(space_pub_b64) is not expired
+
+
+def test_build_tunnel_request_with_session_is_decryptable_by_space():
+    """Session requests use the session's ephemeral key and stay decryptable."""
+    transport = _session_transport()
+    space_priv, space_pub_b64 = make_space_keypair_b64()
+    session = transport._get_session(space_pub_b64)
+
+    correlation_id, message, ephemeral_priv = transport._build_tunnel_request(
+        slug="docs",
+        endpoint_type="data_source",
+        payload={"messages": "hi"},
+        peer_channel=str(uuid.uuid4()),
+        space_public_key=space_pub_b64,
+        session=session,
+    )
+
+    enc_info = message["encryption_info"]
+    assert ephemeral_priv is session.private_key
+    assert enc_info["algorithm"] == crypto.SESSION_ALGORITHM_ID
+    assert enc_info["ephemeral_public_key"] == session.ephemeral_public_key_b64
+    aes_key = crypto.derive_key(
+        space_priv,
+        crypto._b64url_decode(enc_info["ephemeral_public_key"]),
+        crypto.HKDF_REQUEST_INFO,
+    )
+    plaintext = crypto.decrypt_payload(
+        crypto._b64url_decode(message["encrypted_payload"]),
+        aes_key,
+        crypto._b64url_decode(enc_info["nonce"]),
+        correlation_id.encode(),
+    )
+    assert json.loads(plaintext) == {"messages": "hi"}
+
+
+def test_evict_key_cache_drops_session():
+    """A key rotation must also discard the session derived from the old key."""
+    transport = _session_transport()
+    _, space_pub_b64 = make_space_keypair_b64()
+    transport._key_cache["dave"] = (space_pub_b64, time.monotonic())
+    transport._get_session(space_pub_b64)
+
+    transport._evict_key_cache("dave")
+
+    assert space_pub_b64 not in transport._sessions
+
+
 # ---------------------------------------------------------------------------
 # Encrypted response decryption in _send_and_receive
 # ---------------------------------------------------------------------------
@@ -210,6 +210,64 @@ async def test_rerank_documents_empty_input_returns_none() -> None:
     mock_instance.perform_aggregation.assert_not_called()
 
 
+@pytest.mark.asyncio
+async def test_rerank_documents_uses_loaded_reranker_pool() -> None:
+    """Verify a ready RerankerPool is used instead of building a fresh Aggregate."""
+    orchestrator = _make_orchestrator()
+    reranker = MagicMock()
+    reranker.ready = True
+    reranker.rerank = AsyncMock(
+        return_value=[
+            ("bob/data", "Bob doc 1.", 0.95),
+            ("alice/docs", "Alice doc 2.", 0.7),
+        ]
+    )
+    orchestrator.reranker = reranker
+
+    with patch(AGGREGATE_PATH) as mock_cls:
+        result = await orchestrator._rerank_documents(
+            query="test query",
+            retrieval_results=_make_retrieval_results(),
+            top_k=2,
+        )
+
+    mock_cls.assert_not_called()
+    reranker.rerank.assert_awaited_once_with(
+        query="test query",
+        candidates=[
+            ("alice/docs", "Alice doc 1."),
+            ("alice/docs", "Alice doc 2."),
+            ("bob/data", "Bob doc 1."),
+        ],
+        top_k=2,
+    )
+    assert result is not None
+    reranked_docs, context_dict, source_index_map = result
+    assert [d.content for d in reranked_docs] == ["Bob doc 1.", "Alice doc 2."]
+    assert context_dict == {1: "Bob doc 1.", 2: "Alice doc 2."}
+    assert source_index_map == {1: "bob/data", 2: "alice/docs"}
+
+
+@pytest.mark.asyncio
+async def test_rerank_documents_saturated_pool_returns_none() -> None:
+    """Verify a saturated RerankerPool falls back to raw score order."""
+    from aggregator.services.reranker import RerankerUnavailableError
+
+    orchestrator = _make_orchestrator()
+    reranker = MagicMock()
+    reranker.ready = True
+    reranker.rerank = AsyncMock(side_effect=RerankerUnavailableError("queue full"))
+    orchestrator.reranker = reranker
+
+    result = await orchestrator._rerank_documents(
+        query="test query",
+        retrieval_results=_make_retrieval_results(),
+        top_k=3,
+    )
+
+    assert result is None
+
+
 # ---------------------------------------------------------------------------
 # _compute_attribution
 # ---------------------------------------------------------------------------
@@ -0,0 +1,63 @@
+"""Tests for the size-gated PayloadExecutor."""
+
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from aggregator.clients.nats_transport import _approx_payload_size
+from aggregator.core.offload import PAYLOAD_WORK_SECONDS, PayloadExecutor
+
+
+def _thread_name() -> str:
+    return threading.current_thread().name
+
+
+@pytest.mark.asyncio
+async def test_small_payloads_run_inline() -> None:
+    executor = PayloadExecutor(threshold_bytes=1024)
+
+    name = await executor.run("test_small", 10, _thread_name)
+
+    assert name == threading.current_thread().name
+    assert PAYLOAD_WORK_SECONDS.count(op="test_small", mode="inline") == 1
+
+
+@pytest.mark.asyncio
+async def test_large_payloads_run_on_pool() -> None:
+    executor = PayloadExecutor(threshold_bytes=1024, max_workers=2)
+
+    name = await executor.run("test_large", 4096, _thread_name)
+
+    assert name.startswith("payload")
+    assert PAYLOAD_WORK_SECONDS.count(op="test_large", mode="offloaded") == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_disabled_threshold_keeps_everything_inline() -> None:
+    executor = PayloadExecutor(threshold_bytes=None)
+
+    assert not executor.should_offload(10**9)
+    assert await executor.run("test_disabled", 10**9, _thread_name) == (
+        threading.current_thread().name
+    )
+
+
+@pytest.mark.asyncio
+async def test_offloaded_errors_propagate() -> None:
+    executor = PayloadExecutor(threshold_bytes=0)
+
+    def _fail() -> None:
+        raise ValueError("bad payload")
+
+    with pytest.raises(ValueError, match="bad payload"):
+        await executor.run("test_error", 1, _fail)
+    executor.shutdown()
+
+
+def test_approx_payload_size_counts_nested_strings() -> None:
+    payload = {"messages": [{"role": "user", "content": "x" * 1000}], "limit": 5}
+
+    assert 1000 <= _approx_payload_size(payload) < 1100
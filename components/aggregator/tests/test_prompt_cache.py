@@ -0,0 +1,333 @@
+"""Tests for the semantic prompt cache and its use in the orchestrator."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock
+
+import numpy as np
+import pytest
+
+from aggregator.schemas import EndpointRef
+from aggregator.schemas.internal import (
+    AggregatedContext,
+    GenerationResult,
+    ResolvedEndpoint,
+    RetrievalResult,
+)
+from aggregator.schemas.requests import ChatRequest, Message
+from aggregator.schemas.responses import Document
+from aggregator.services.orchestrator import Orchestrator
+from aggregator.services.prompt_builder import PromptBuilder
+from aggregator.services.prompt_cache import CachedChat, SemanticPromptCache
+from aggregator.services.reranker import RerankerUnavailableError
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _unit(*values: float) -> np.ndarray:
+    vector = np.asarray(values, dtype=np.float32)
+    normalised: np.ndarray = vector / np.linalg.norm(vector)
+    return normalised
+
+
+MODEL = ResolvedEndpoint(
+    path="openmined/llm", url="http://space.example", slug="llm", endpoint_type="model", name="LLM"
+)
+
+
+def _source(slug: str, ttl: int | None = 600) -> ResolvedEndpoint:
+    return ResolvedEndpoint(
+        path=f"alice/{slug}",
+        url="http://space.example",
+        slug=slug,
+        endpoint_type="data_source",
+        name=slug,
+        cache_ttl_seconds=ttl,
+    )
+
+
+def test_scope_ignores_source_order_and_takes_smallest_ttl() -> None:
+    cache = SemanticPromptCache(max_ttl=3600)
+    one, two = _source("one", ttl=600), _source("two", ttl=60)
+
+    scope = cache.scope(MODEL, [one, two], None, 5)
+    assert scope is not None
+    assert scope == cache.scope(MODEL, [two, one], None, 5)
+    assert scope.ttl_seconds == 60
+    assert scope != cache.scope(MODEL, [one, two], "Answer in French", 5)
+
+
+def test_scope_covers_endpoint_identity_and_credentials() -> None:
+    cache = SemanticPromptCache()
+    base = cache.scope(MODEL, [_source("one")], None, 5)
+
+    other_tenant = _source("one").model_copy(update={"tenant_name": "acme"})
+    other_slug = MODEL.model_copy(update={"slug": "llm-2"})
+    assert base != cache.scope(MODEL, [other_tenant], None, 5)
+    assert base != cache.scope(other_slug, [_source("one")], None, 5)
+    assert base != cache.scope(MODEL, [_source("one")], None, 5, ["alice-token"])
+    assert base == cache.scope(MODEL, [_source("one")], None, 5, [None])
+
+
+def test_hits_honour_the_reading_scopes_ttl() -> None:
+    """A request claiming a longer TTL does not extend it for other requests."""
+    clock = FakeClock()
+    cache = SemanticPromptCache(clock=clock)
+    long = cache.scope(MODEL, [_source("one", ttl=3600)], None, 5)
+    short = cache.scope(MODEL, [_source("one", ttl=30)], None, 5)
+    assert long is not None and short is not None
+    assert long.key == short.key
+    cache.store(long, _unit(1.0, 0.0), CachedChat(response="cached"))
+
+    clock.now += 31
+
+    assert cache.lookup(short, _unit(1.0, 0.0)) is None
+    assert cache.lookup(long, _unit(1.0, 0.0)) is not None
+
+
+def test_no_scope_unless_every_source_opted_in() -> None:
+    cache = SemanticPromptCache()
+
+    assert cache.scope(MODEL, [_source("one"), _source("two", ttl=None)], None, 5) is None
+    assert cache.scope(MODEL, [], None, 5) is None
+
+
+def test_lookup_matches_near_duplicates_only() -> None:
+    cache = SemanticPromptCache(similarity_threshold=0.95)
+    scope = cache.scope(MODEL, [_source("one")], None, 5)
+    assert scope is not None
+    cache.store(scope, _unit(1.0, 0.0), CachedChat(response="cached"))
+
+    hit = cache.lookup(scope, _unit(1.0, 0.1))
+    assert hit is not None
+    assert hit.chat.response == "cached"
+    assert hit.similarity == pytest.approx(0.995, abs=1e-3)
+
+    assert cache.lookup(scope, _unit(1.0, 1.0)) is None
+
+
+def test_entries_expire() -> None:
+    clock = FakeClock()
+    cache = SemanticPromptCache(clock=clock)
+    scope = cache.scope(MODEL, [_source("one", ttl=60)], None, 5)
+    assert scope is not None
+    cache.store(scope, _unit(1.0, 0.0), CachedChat(response="cached"))
+
+    clock.now += 61
+
+    assert cache.lookup(scope, _unit(1.0, 0.0)) is None
+
+
+def test_same_question_replaces_earlier_answer() -> None:
+    cache = SemanticPromptCache()
+    scope = cache.scope(MODEL, [_source("one")], None, 5)
+    assert scope is not None
+    cache.store(scope, _unit(1.0, 0.0), CachedChat(response="old"))
+    cache.store(scope, _unit(1.0, 0.01), CachedChat(response="new"))
+
+    hit = cache.lookup(scope, _unit(1.0, 0.0))
+    assert hit is not None
+    assert hit.chat.response == "new"
+    assert cache._size == 1
+
+
+def test_least_recently_used_scopes_are_evicted() -> None:
+    cache = SemanticPromptCache(max_entries=1)
+    first = cache.scope(MODEL, [_source("one")], None, 5)
+    second = cache.scope(MODEL, [_source("two")], None, 5)
+    assert first is not None and second is not None
+    cache.store(first, _unit(1.0, 0.0), CachedChat(response="first"))
+    cache.store(second, _unit(1.0, 0.0), CachedChat(response="second"))
+
+    assert cache.lookup(first, _unit(1.0, 0.0)) is None
+    assert cache.lookup(second, _unit(1.0, 0.0)) is not None
+
+
+# ---------------------------------------------------------------------------
+# Orchestrator integration
+# ---------------------------------------------------------------------------
+
+EMBEDDINGS = {
+    "What is PySyft?": _unit(1.0, 0.0),
+    "what is pysyft": _unit(1.0, 0.05),
+    "Who maintains PySyft?": _unit(0.0, 1.0),
+}
+
+MODEL_REF = EndpointRef(url="http://space.example", slug="llm", owner_username="openmined")
+
+
+def _ds_ref(ttl: int | None = 600) -> EndpointRef:
+    return EndpointRef(
+        url="http://space.example", slug="docs", owner_username="alice", cache_ttl_seconds=ttl
+    )
+
+
+def _make_orchestrator(
+    policy_metadata: dict[str, object] | None = None,
+    model_policy_metadata: dict[str, object] | None = None,
+) -> tuple[Orchestrator, MagicMock]:
+    reranker = MagicMock()
+    reranker.ready = True
+    reranker.embed = AsyncMock(side_effect=lambda texts: np.vstack([EMBEDDINGS[texts[0]]]))
+    reranker.rerank = AsyncMock(side_effect=RerankerUnavailableError("busy"))
+
+    retrieval_service = MagicMock()
+    retrieval_result = RetrievalResult(
+        endpoint_path="alice/docs",
+        documents=[Document(content="PySyft is a library.", score=0.9)],
+        status="success",
+        latency_ms=50,
+        policy_metadata=policy_metadata,
+    )
+    retrieval_service.retrieve = AsyncMock(
+        return_value=AggregatedContext(
+            documents=retrieval_result.documents,
+            retrieval_results=[retrieval_result],
+            total_latency_ms=50,
+        )
+    )
+
+    generation_service = MagicMock()
+    generation_service.generate = AsyncMock(
+        return_value=GenerationResult(
+            response="A privacy library.",
+            latency_ms=20,
+            usage=None,
+            policy_metadata=model_policy_metadata,
+        )
+    )
+
+    orchestrator = Orchestrator(
+        retrieval_service=retrieval_service,
+        generation_service=generation_service,
+        prompt_builder=PromptBuilder(),
+        reranker=reranker,
+        prompt_cache=SemanticPromptCache(similarity_threshold=0.95),
+    )
+    return orchestrator, generation_service
+
+
+def _request(prompt: str, **kwargs: object) -> ChatRequest:
+    fields: dict[str, object] = {
+        "prompt": prompt,
+        "model": MODEL_REF,
+        "data_sources": [_ds_ref()],
+        "semantic_cache": True,
+    }
+    fields.update(kwargs)
+    return ChatRequest(**fields)  # type: ignore[arg-type]
+
+
+@pytest.mark.asyncio
+async def test_near_duplicate_prompt_is_served_from_cache() -> None:
+    orchestrator, generation = _make_orchestrator()
+
+    first = await orchestrator.process_chat(_request("What is PySyft?"))
+    second = await orchestrator.process_chat(_request("what is pysyft"))
+
+    assert generation.generate.await_count == 1
+    assert second.response == first.response
+    assert not first.metadata.cache_hit
+    assert second.metadata.cache_hit
+    assert second.metadata.cache_similarity is not None
+    assert second.metadata.cache_similarity > 0.95
+    assert second.retrieval_info == first.retrieval_info
+
+    await orchestrator.process_chat(_request("Who maintains PySyft?"))
+    assert generation.generate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_is_opt_in_per_request() -> None:
+    orchestrator, generation = _make_orchestrator()
+
+    await orchestrator.process_chat(_request("What is PySyft?", semantic_cache=False))
+    await orchestrator.process_chat(_request("What is PySyft?", semantic_cache=False))
+
+    assert generation.generate.await_count == 2
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"data_sources": [_ds_ref(ttl=None)]},
+        {"data_sources": []},
+        {"messages": [Message(role="user", content="Hi"), Message(role="assistant", content="Hi")]},
+    ],
+    ids=["source-not-opted-in", "model-only", "history"],
+)
+@pytest.mark.asyncio
+async def test_uncacheable_requests_always_generate(kwargs: dict[str, object]) -> None:
+    orchestrator, generation = _make_orchestrator()
+
+    await orchestrator.process_chat(_request("What is PySyft?", **kwargs))
+    await orchestrator.process_chat(_request("What is PySyft?", **kwargs))
+
+    assert generation.generate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_billed_answers_are_not_cached() -> None:
+    paid = {"entries": [{"status": "charged", "amount": "0.01", "currency": "USD"}]}
+    orchestrator, generation = _make_orchestrator(policy_metadata=paid)
+
+    await orchestrator.process_chat(_request("What is PySyft?"))
+    second = await orchestrator.process_chat(_request("What is PySyft?"))
+
+    assert generation.generate.await_count == 2
+    assert second.billing is not None
+
+
+@pytest.mark.asyncio
+async def test_answers_with_model_policy_metadata_are_not_cached() -> None:
+    orchestrator, generation = _make_orchestrator(
+        model_policy_metadata={"entries": [], "policies": ["access_group"]}
+    )
+
+    await orchestrator.process_chat(_request("What is PySyft?"))
+    await orchestrator.process_chat(_request("What is PySyft?"))
+
+    assert generation.generate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_answers_are_not_shared_across_credentials() -> None:
+    orchestrator, generation = _make_orchestrator()
+
+    await orchestrator.process_chat(
+        _request("What is PySyft?", endpoint_tokens={"alice": "alice-satellite-token"})
+    )
+    await orchestrator.process_chat(_request("What is PySyft?"))
+
+    assert generation.generate.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_stream_replays_cached_answer() -> None:
+    orchestrator, generation = _make_orchestrator()
+
+    await orchestrator.process_chat(_request("What is PySyft?"))
+    raw_events = [e async for e in orchestrator.process_chat_stream(_request("what is pysyft"))]
+
+    events = [
+        (e.split("\n")[0].removeprefix("event: "), json.loads(e.split("\n")[1][6:]))
+        for e in raw_events
+    ]
+    assert [name for name, _ in events] == [
+        "retrieval_start",
+        "source_complete",
+        "retrieval_complete",
+        "generation_start",
+        "token",
+        "done",
+    ]
+    assert events[4][1]["content"] == "A privacy library."
+    assert events[-1][1]["metadata"]["cache_hit"] is True
+    assert generation.generate.await_count == 1
@@ -0,0 +1,168 @@
+"""Tests for the process-wide RerankerPool."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from collections.abc import Iterable
+
+import numpy as np
+import pytest
+
+from aggregator.services.reranker import RerankerPool, RerankerUnavailableError
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+# Tiny deterministic "embedding space": each keyword maps to one axis.
+_AXES = {"python": 0, "rust": 1, "cooking": 2}
+
+
+class _FakeModel:
+    """Stand-in for fastembed.TextEmbedding that embeds by keyword counts."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def embed(self, texts: Iterable[str]) -> Iterable[np.ndarray]:
+        texts = list(texts)
+        self.calls.append(texts)
+        for text in texts:
+            vec = np.zeros(len(_AXES), dtype=np.float32)
+            for word in text.lower().split():
+                if word.strip(".") in _AXES:
+                    vec[_AXES[word.strip(".")]] += 1.0
+            yield vec
+
+
+async def _started_pool(model: object, **kwargs: int) -> RerankerPool:
+    pool = RerankerPool(**kwargs)
+    pool._load_model = lambda: model  # type: ignore[method-assign]
+    await pool.start()
+    return pool
+
+
+# ---------------------------------------------------------------------------
+# Lifecycle
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_start_loads_model_once() -> None:
+    """Repeated start() calls reuse the already-loaded model."""
+    loads = {"count": 0}
+
+    def _load() -> _FakeModel:
+        loads["count"] += 1
+        return _FakeModel()
+
+    pool = RerankerPool()
+    pool._load_model = _load  # type: ignore[method-assign]
+    assert not pool.ready
+
+    await asyncio.gather(pool.start(), pool.start())
+    await pool.start()
+
+    assert pool.ready
+    assert loads["count"] == 1
+    await pool.close()
+    assert not pool.ready
+
+
+@pytest.mark.asyncio
+async def test_start_failure_leaves_pool_unready() -> None:
+    """A model load failure propagates and leaves the pool unusable."""
+
+    def _load() -> _FakeModel:
+        raise RuntimeError("download failed")
+
+    pool = RerankerPool()
+    pool._load_model = _load  # type: ignore[method-assign]
+
+    with pytest.raises(RuntimeError):
+        await pool.start()
+    assert not pool.ready
+
+
+@pytest.mark.asyncio
+async def test_rerank_before_start_raises() -> None:
+    """Calling rerank on an unloaded pool raises RerankerUnavailableError."""
+    pool = RerankerPool()
+    with pytest.raises(RerankerUnavailableError):
+        await pool.rerank("python", [("a/b", "python")], top_k=1)
+
+
+# ---------------------------------------------------------------------------
+# Ranking
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_rerank_orders_by_similarity_and_keeps_source() -> None:
+    """Documents are ranked by cosine similarity to the query, top_k applied."""
+    model = _FakeModel()
+    pool = await _started_pool(model)
+
+    ranked = await pool.rerank(
+        "python",
+        [
+            ("alice/docs", "Cooking pasta."),
+            ("bob/data", "Python and rust."),
+            ("alice/docs", "Python tips."),
+        ],
+        top_k=2,
+    )
+
+    assert [(source, content) for source, content, _ in ranked] == [
+        ("alice/docs", "Python tips."),
+        ("bob/data", "Python and rust."),
+    ]
+    assert ranked[0][2] == pytest.approx(1.0)
+    assert ranked[1][2] == pytest.approx(1 / np.sqrt(2))
+    # Query and documents are encoded in one forward pass on the shared model
+    assert model.calls == [["python", "Cooking pasta.", "Python and rust.", "Python tips."]]
+    await pool.close()
+
+
+@pytest.mark.asyncio
+async def test_rerank_empty_candidates_skips_model() -> None:
+    """No candidates means no encode call."""
+    model = _FakeModel()
+    pool = await _started_pool(model)
+
+    assert await pool.rerank("python", [], top_k=5) == []
+    assert model.calls == []
+    await pool.close()
+
+
+# ---------------------------------------------------------------------------
+# Backpressure
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_saturated_pool_rejects_new_work() -> None:
+    """Once max_pending jobs are queued/running, further calls fail fast."""
+    release = threading.Event()
+
+    class _BlockingModel(_FakeModel):
+        def embed(self, texts: Iterable[str]) -> Iterable[np.ndarray]:
+            release.wait(timeout=5)
+            return super().embed(texts)
+
+    pool = await _started_pool(_BlockingModel(), max_workers=1, max_pending=2)
+
+    first = asyncio.create_task(pool.rerank("python", [("a/b", "python")], top_k=1))
+    second = asyncio.create_task(pool.rerank("python", [("a/b", "python")], top_k=1))
+    await asyncio.sleep(0)
+    assert pool.pending == 2
+
+    with pytest.raises(RerankerUnavailableError):
+        await pool.rerank("python", [("a/b", "python")], top_k=1)
+
+    release.set()
+    assert len(await first) == 1
+    assert len(await second) == 1
+    assert pool.pending == 0
+    await pool.close()
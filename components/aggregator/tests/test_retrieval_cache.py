@@ -0,0 +1,227 @@
+"""Tests for the retrieval result cache and its use in RetrievalService."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from aggregator.schemas.internal import ResolvedEndpoint, RetrievalResult
+from aggregator.schemas.responses import Document
+from aggregator.services.retrieval import RetrievalService
+from aggregator.services.retrieval_cache import RetrievalCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class MemoryStore:
+    """Shared tier double that records what was written."""
+
+    def __init__(self) -> None:
+        self.items: dict[str, bytes] = {}
+        self.ttls: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.items.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: int) -> None:
+        self.items[key] = value
+        self.ttls[key] = ttl_seconds
+
+    async def close(self) -> None:
+        return None
+
+
+def _source(ttl: int | None = 60) -> ResolvedEndpoint:
+    return ResolvedEndpoint(
+        path="alice/docs",
+        url="http://space.example",
+        slug="docs",
+        endpoint_type="data_source",
+        name="Docs",
+        owner_username="alice",
+        cache_ttl_seconds=ttl,
+    )
+
+
+def _result(policy_metadata: dict[str, object] | None = None) -> RetrievalResult:
+    return RetrievalResult(
+        endpoint_path="alice/docs",
+        documents=[Document(content="doc", score=0.9)],
+        status="success",
+        latency_ms=120,
+        policy_metadata=policy_metadata,
+    )
+
+
+PAID = {"entries": [{"status": "charged", "amount": "0.01"}]}
+
+
+@pytest.mark.asyncio
+async def test_hit_until_ttl_expires() -> None:
+    clock = FakeClock()
+    cache = RetrievalCache(clock=clock)
+    ds = _source(ttl=60)
+
+    await cache.put(ds, "q", 5, 0.5, None, _result())
+    hit = await cache.get(ds, "q", 5, 0.5, None)
+    assert hit is not None
+    assert hit.documents[0].content == "doc"
+    assert hit.latency_ms == 0
+
+    clock.now += 61
+    assert await cache.get(ds, "q", 5, 0.5, None) is None
+
+
+@pytest.mark.asyncio
+async def test_sources_that_did_not_opt_in_are_not_cached() -> None:
+    cache = RetrievalCache()
+    ds = _source(ttl=None)
+
+    await cache.put(ds, "q", 5, 0.5, None, _result())
+
+    assert await cache.get(ds, "q", 5, 0.5, None) is None
+
+
+@pytest.mark.asyncio
+async def test_key_covers_query_top_k_and_threshold() -> None:
+    cache = RetrievalCache()
+    ds = _source()
+    await cache.put(ds, "q", 5, 0.5, None, _result())
+
+    assert await cache.get(ds, "other", 5, 0.5, None) is None
+    assert await cache.get(ds, "q", 10, 0.5, None) is None
+    assert await cache.get(ds, "q", 5, 0.7, None) is None
+
+
+@pytest.mark.asyncio
+async def test_owner_ttl_is_capped() -> None:
+    clock = FakeClock()
+    store = MemoryStore()
+    cache = RetrievalCache(max_ttl=30, shared=store, clock=clock)
+    ds = _source(ttl=86400)
+
+    await cache.put(ds, "q", 5, 0.5, None, _result())
+    assert list(store.ttls.values()) == [30]
+
+    clock.now += 31
+    assert await cache.get(ds, "q", 5, 0.5, None) is None
+
+
+@pytest.mark.asyncio
+async def test_hits_honour_the_reading_callers_ttl() -> None:
+    """A writer claiming a longer TTL does not extend it for other callers."""
+    clock = FakeClock()
+    store = MemoryStore()
+    cache = RetrievalCache(shared=store, clock=clock)
+    await cache.put(_source(ttl=3600), "q", 5, 0.5, None, _result())
+
+    clock.now += 31
+    assert await cache.get(_source(ttl=30), "q", 5, 0.5, None) is None
+    assert (
+        await RetrievalCache(shared=store, clock=clock).get(_source(ttl=30), "q", 5, 0.5, None)
+        is None
+    )
+    assert await cache.get(_source(ttl=3600), "q", 5, 0.5, None) is not None
+
+
+@pytest.mark.asyncio
+async def test_results_fetched_with_a_credential_are_not_shared() -> None:
+    cache = RetrievalCache()
+    ds = _source()
+
+    await cache.put(ds, "q", 5, 0.5, "alice-token", _result())
+
+    assert await cache.get(ds, "q", 5, 0.5, None) is None
+    assert await cache.get(ds, "q", 5, 0.5, "bob-token") is None
+    assert await cache.get(ds, "q", 5, 0.5, "alice-token") is not None
+
+
+@pytest.mark.asyncio
+async def test_paid_results_are_scoped_to_the_caller() -> None:
+    cache = RetrievalCache()
+    ds = _source()
+
+    await cache.put(ds, "q", 5, 0.5, "alice-token", _result(PAID))
+
+    assert await cache.get(ds, "q", 5, 0.5, "bob-token") is None
+    assert await cache.get(ds, "q", 5, 0.5, None) is None
+    hit = await cache.get(ds, "q", 5, 0.5, "alice-token")
+    assert hit is not None
+    assert hit.policy_metadata is None  # never billed twice
+
+
+@pytest.mark.asyncio
+async def test_paid_results_without_credential_are_not_cached() -> None:
+    cache = RetrievalCache()
+    ds = _source()
+
+    await cache.put(ds, "q", 5, 0.5, None, _result(PAID))
+
+    assert not cache._entries
+
+
+@pytest.mark.asyncio
+async def test_shared_tier_serves_other_replicas() -> None:
+    store = MemoryStore()
+    ds = _source()
+    await RetrievalCache(shared=store).put(ds, "q", 5, 0.5, None, _result())
+
+    replica = RetrievalCache(shared=store)
+    hit = await replica.get(ds, "q", 5, 0.5, None)
+
+    assert hit is not None
+    assert hit.documents[0].content == "doc"
+    assert replica._entries  # promoted to the in-process tier
+
+
+@pytest.mark.asyncio
+async def test_shared_tier_failures_are_misses() -> None:
+    store = MagicMock()
+    store.get = AsyncMock(side_effect=ConnectionError("redis down"))
+    store.set = AsyncMock(side_effect=ConnectionError("redis down"))
+    cache = RetrievalCache(shared=store)
+    ds = _source()
+
+    await cache.put(ds, "q", 5, 0.5, None, _result())
+    cache._entries.clear()
+
+    assert await cache.get(ds, "q", 5, 0.5, None) is None
+
+
+# ---------------------------------------------------------------------------
+# RetrievalService integration
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_repeat_retrieval_skips_the_source() -> None:
+    client = MagicMock()
+    client.query = AsyncMock(return_value=_result())
+    service = RetrievalService(client, retrieval_cache=RetrievalCache())
+
+    first = await service.retrieve([_source()], "query")
+    second = await service.retrieve([_source()], "query")
+
+    assert client.query.await_count == 1
+    assert [d.content for d in second.documents] == [d.content for d in first.documents]
+
+
+@pytest.mark.asyncio
+async def test_failed_retrievals_are_not_cached() -> None:
+    client = MagicMock()
+    client.query = AsyncMock(
+        return_value=RetrievalResult(endpoint_path="alice/docs", status="error", latency_ms=5)
+    )
+    service = RetrievalService(client, retrieval_cache=RetrievalCache())
+
+    await service.retrieve([_source()], "query")
+    await service.retrieve([_source()], "query")
+
+    assert client.query.await_count == 2
@@ -0,0 +1,113 @@
+"""Tests for the retrieval deadline and quorum early return in RetrievalService."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from aggregator.schemas.internal import ResolvedEndpoint, RetrievalResult
+from aggregator.schemas.responses import Document
+from aggregator.services import retrieval as retrieval_module
+from aggregator.services.retrieval import RetrievalService
+
+
+def _source(name: str) -> ResolvedEndpoint:
+    return ResolvedEndpoint(
+        path=f"alice/{name}",
+        url="http://space.example",
+        slug=name,
+        endpoint_type="data_source",
+        name=name,
+    )
+
+
+FAST = _source("fast")
+SLOW = _source("slow")
+
+
+def _client(delays: dict[str, float], scores: tuple[float, ...] = (0.9,)) -> MagicMock:
+    """A data source client whose sources answer after the given delays."""
+    finished: list[str] = []
+
+    async def query(*, slug: str, endpoint_path: str, **_: object) -> RetrievalResult:
+        await asyncio.sleep(delays[slug])
+        finished.append(slug)
+        return RetrievalResult(
+            endpoint_path=endpoint_path,
+            documents=[Document(content=f"{slug} {i}", score=s) for i, s in enumerate(scores)],
+            status="success",
+            latency_ms=int(delays[slug] * 1000),
+        )
+
+    client = MagicMock()
+    client.query = query
+    client.finished = finished
+    return client
+
+
+@pytest.mark.asyncio
+async def test_deadline_reports_late_sources_as_timeout() -> None:
+    client = _client({"fast": 0.0, "slow": 0.5})
+    service = RetrievalService(client, deadline=0.05)
+
+    context = await service.retrieve([SLOW, FAST], "query")
+
+    slow, fast = context.retrieval_results  # request order is kept
+    assert fast.status == "success"
+    assert slow.status == "timeout"
+    assert slow.endpoint_path == "alice/slow"
+    assert slow.error_message is not None
+    assert "retrieval deadline" in slow.error_message
+    assert [d.content for d in context.documents] == ["fast 0"]
+    assert context.total_latency_ms < 500
+
+
+@pytest.mark.asyncio
+async def test_late_source_finishes_in_background() -> None:
+    client = _client({"fast": 0.0, "slow": 0.1})
+    service = RetrievalService(client, deadline=0.02)
+
+    await service.retrieve([FAST, SLOW], "query")
+    assert client.finished == ["fast"]
+    assert retrieval_module._detached_queries
+
+    await asyncio.sleep(0.2)
+
+    assert client.finished == ["fast", "slow"]
+    assert not retrieval_module._detached_queries
+
+
+@pytest.mark.asyncio
+async def test_source_quorum_returns_early() -> None:
+    client = _client({"fast": 0.0, "slow": 0.5})
+    service = RetrievalService(client, quorum_sources=1)
+
+    context = await service.retrieve([FAST, SLOW], "query")
+
+    assert [r.status for r in context.retrieval_results] == ["success", "timeout"]
+
+
+@pytest.mark.asyncio
+async def test_document_quorum_counts_documents_above_threshold() -> None:
+    client = _client({"fast": 0.0, "slow": 0.05}, scores=(0.9, 0.2))
+    service = RetrievalService(client, quorum_documents=2)
+
+    context = await service.retrieve([FAST, SLOW], "query", similarity_threshold=0.5)
+
+    # One relevant document per source: the quorum needs both
+    assert [r.status for r in context.retrieval_results] == ["success", "success"]
+
+
+@pytest.mark.asyncio
+async def test_streaming_yields_late_sources_last() -> None:
+    client = _client({"fast": 0.0, "slow": 0.5})
+    service = RetrievalService(client, deadline=0.05)
+
+    results = [r async for r in service.retrieve_streaming([SLOW, FAST], "query")]
+
+    assert [(r.endpoint_path, r.status) for r in results] == [
+        ("alice/fast", "success"),
+        ("alice/slow", "timeout"),
+    ]
@@ -0,0 +1,45 @@
+"""Add composite indexes for keyset pagination of public endpoint listings.
+
+Public listings (``/endpoints/public``, ``/endpoints/public/by-owner/{owner}``
+and ``/endpoints/trending``) now page with opaque cursors that seek past the
+last ``(updated_at, id)`` or ``(stars_count, id)`` a client has seen instead
+of using ``OFFSET``. These indexes match those orderings so every page is a
+single index range scan, however deep into the listing it is.
+
+Revision ID: 022_add_endpoint_keyset_indexes
+Revises: 021_drop_user_heartbeat_fields
+Create Date: 2026-10-16 00:00:00.000000+00:00
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "022_add_endpoint_keyset_indexes"
+down_revision: str | None = "021_drop_user_heartbeat_fields"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "idx_endpoints_public_updated",
+        "endpoints",
+        ["visibility", "is_active", "updated_at", "id"],
+    )
+    op.create_index(
+        "idx_endpoints_public_stars",
+        "endpoints",
+        ["visibility", "is_active", "stars_count", "id"],
+    )
+    op.create_index(
+        "idx_endpoints_user_updated",
+        "endpoints",
+        ["user_id", "updated_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("idx_endpoints_user_updated", table_name="endpoints")
+    op.drop_index("idx_endpoints_public_stars", table_name="endpoints")
+    op.drop_index("idx_endpoints_public_updated", table_name="endpoints")
@@ -0,0 +1,59 @@
+"""Add pg_trgm GIN indexes for public endpoint directory search.
+
+Directory search matches ``ILIKE '%term%'`` against endpoint name,
+description, tags (as text) and owner username. B-tree indexes cannot serve
+a leading wildcard, so every search was a sequential scan over ``endpoints``
+joined to ``users``. Trigram GIN indexes make each predicate an index scan,
+so search latency stays flat as the catalog grows.
+
+PostgreSQL only; other dialects (SQLite in tests) keep unindexed matching.
+
+Revision ID: 023_add_endpoint_search_trgm
+Revises: 022_add_endpoint_keyset_indexes
+Create Date: 2026-10-16 00:00:01.000000+00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "023_add_endpoint_search_trgm"
+down_revision: str | None = "022_add_endpoint_keyset_indexes"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table, indexed expression) - expressions must match the
+# repository's search predicates exactly for the planner to use them.
+_INDEXES = (
+    ("idx_endpoints_name_trgm", "endpoints", "name"),
+    ("idx_endpoints_description_trgm", "endpoints", "description"),
+    ("idx_endpoints_tags_trgm", "endpoints", "(CAST(tags AS TEXT))"),
+    ("idx_users_username_trgm", "users", "username"),
+)
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and create the trigram indexes."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return  # Only relevant for PostgreSQL
+
+    op.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    for name, table, expression in _INDEXES:
+        op.execute(
+            sa.text(
+                f"CREATE INDEX IF NOT EXISTS {name} ON {table} "
+                f"USING gin ({expression} gin_trgm_ops)"
+            )
+        )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes (the extension is left installed)."""
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return
+
+    for name, _, _ in _INDEXES:
+        op.execute(sa.text(f"DROP INDEX IF EXISTS {name}"))
@@ -0,0 +1,64 @@
+"""Store rendered README HTML on endpoints.
+
+Endpoint detail pages used to convert the README markdown and sanitize the
+result on every browser request. The sanitized HTML is now rendered when the
+README is written and stored next to a SHA-256 digest of the markdown it came
+from, so page views only read it back and unchanged READMEs re-sent by sync
+are not rendered again.
+
+Existing rows are backfilled here so no page view has to render a README.
+
+Revision ID: 024_add_endpoint_readme_html
+Revises: 023_add_endpoint_search_trgm
+Create Date: 2026-10-16 00:00:02.000000+00:00
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "024_add_endpoint_readme_html"
+down_revision: str | None = "023_add_endpoint_search_trgm"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def _backfill_readme_html() -> None:
+    """Render the README of every existing endpoint."""
+    # Import here to avoid top-level dependency on app code in migrations
+    from syfthub.core.html_sanitizer import readme_digest, render_readme_html
+
+    connection = op.get_bind()
+    endpoints = sa.table(
+        "endpoints",
+        sa.column("id", sa.Integer),
+        sa.column("readme", sa.Text),
+        sa.column("readme_html", sa.Text),
+        sa.column("readme_html_hash", sa.String),
+    )
+
+    results = connection.execute(sa.select(endpoints.c.id, endpoints.c.readme))
+    for row in results.fetchall():
+        readme = row.readme or ""
+        connection.execute(
+            endpoints.update()
+            .where(endpoints.c.id == row.id)
+            .values(
+                readme_html=render_readme_html(readme),
+                readme_html_hash=readme_digest(readme),
+            )
+        )
+
+
+def upgrade() -> None:
+    op.add_column("endpoints", sa.Column("readme_html", sa.Text(), nullable=True))
+    op.add_column(
+        "endpoints", sa.Column("readme_html_hash", sa.String(64), nullable=True)
+    )
+    _backfill_readme_html()
+
+
+def downgrade() -> None:
+    op.drop_column("endpoints", "readme_html_hash")
+    op.drop_column("endpoints", "readme_html")
@@ -1,14 +1,17 @@
 """Endpoint endpoints with authentication and visibility controls."""
 
-from typing import Annotated, Optional
+from typing import Annotated, Optional, Union
 
-from fastapi import APIRouter, Depends, Query, status
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 
 from syfthub.auth.db_dependencies import (
     get_current_active_user,
     get_optional_current_user,
     require_admin,
 )
+from syfthub.core.response_cache import cached_public_response
 from syfthub.database.dependencies import (
     get_endpoint_service,
 )
@@ -25,6 +28,7 @@ from syfthub.schemas.endpoint import (
     EndpointVisibility,
     GroupedEndpointsResponse,
     OwnersListResponse,
+    PublicEndpointPage,
     SyncEndpointsRequest,
     SyncEndpointsResponse,
 )
@@ -64,12 +68,37 @@ def list_my_endpoints(
     )
 
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+CURSOR_QUERY_DESCRIPTION = (
+    "Opaque cursor from the previous page's X-Next-Cursor header. "
+    "Seeks past the last row seen instead of using skip, so deep pages are "
+    "as cheap as the first."
+)
+
+
+def _set_next_cursor(response: Response, page: PublicEndpointPage) -> None:
+    """Advertise the next page's cursor, if any, via the X-Next-Cursor header."""
+    if page.next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = page.next_cursor
+
+
+def _page_response(page: PublicEndpointPage) -> Response:
+    """Encode a page as a standalone JSON response for the response cache."""
+    response = JSONResponse(jsonable_encoder(page.items))
+    _set_next_cursor(response, page)
+    return response
+
+
 @router.get("/public", response_model=list[EndpointPublicResponse])
 def list_public_endpoints(
+    response: Response,
     endpoint_service: Annotated[EndpointService, Depends(get_endpoint_service)],
     current_user: Annotated[Optional[User], Depends(get_optional_current_user)],
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, max_length=512, description=CURSOR_QUERY_DESCRIPTION
+    ),
     endpoint_type: Optional[EndpointType] = Query(
         None, description="Filter by endpoint type (model or data_source)"
     ),
@@ -79,15 +108,38 @@ def list_public_endpoints(
         max_length=200,
         description="Search by name, description, or tags",
     ),
-) -> list[EndpointPublicResponse]:
-    """List all public endpoints with optional search filtering."""
-    return endpoint_service.list_public_endpoints(
-        skip=skip,
-        limit=limit,
-        endpoint_type=endpoint_type,
-        search=search,
-        current_user=current_user,
-    )
+) -> Union[list[EndpointPublicResponse], Response]:
+    """List all public endpoints with optional search filtering.
+
+    Anonymous responses are served from the shared public response cache.
+    """
+
+    def load() -> PublicEndpointPage:
+        return endpoint_service.list_public_endpoints(
+            skip=skip,
+            limit=limit,
+            endpoint_type=endpoint_type,
+            search=search,
+            current_user=current_user,
+            cursor=cursor,
+        )
+
+    if current_user is None:
+        return cached_public_response(
+            "endpoints.public",
+            {
+                "skip": skip,
+                "limit": limit,
+                "cursor": cursor,
+                "endpoint_type": endpoint_type,
+                "search": search,
+            },
+            lambda: _page_response(load()),
+        )
+
+    page = load()
+    _set_next_cursor(response, page)
+    return page.items
 
 
 @router.get(
@@ -115,23 +167,51 @@ Returns a list of groups, where each group contains:
 **Ordering:**
 - Groups are ordered by total endpoint count (descending)
 - Within each group, endpoints are ordered by `updated_at` (most recent first)
+
+**Caching:**
+Served from an in-memory snapshot refreshed on endpoint changes. Responses
+carry an `ETag`; send it back in `If-None-Match` to get `304 Not Modified`
+while the directory is unchanged.
 """,
+    responses={304: {"description": "Directory unchanged since the given ETag"}},
 )
 def list_public_endpoints_grouped(
+    request: Request,
+    response: Response,
     endpoint_service: Annotated[EndpointService, Depends(get_endpoint_service)],
     current_user: Annotated[Optional[User], Depends(get_optional_current_user)],
     max_per_owner: int = Query(
         15, ge=1, le=50, description="Maximum endpoints to return per owner"
     ),
-) -> GroupedEndpointsResponse:
+) -> Union[GroupedEndpointsResponse, Response]:
     """List public endpoints grouped by owner with a limit per owner.
 
     This provides a balanced view across multiple owners rather than having
     a single owner dominate the listing.
     """
-    return endpoint_service.list_public_endpoints_grouped(
-        max_per_owner=max_per_owner, current_user=current_user
-    )
+    viewer_email = current_user.email if current_user else None
+    directory = endpoint_service.get_grouped_directory()
+    etag = directory.etag(max_per_owner, viewer_email)
+    headers = {
+        "ETag": etag,
+        # Revalidate every time; the ETag makes that a cheap 304
+        "Cache-Control": "no-cache",
+        "Vary": "Authorization",
+    }
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
+    return directory.render(max_per_owner, viewer_email)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
 
 
 @router.get(
@@ -168,13 +248,22 @@ def list_public_endpoint_owners(
     endpoint_service: Annotated[EndpointService, Depends(get_endpoint_service)],
     skip: int = Query(0, ge=0, description="Number of owners to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum owners to return"),
-) -> OwnersListResponse:
+) -> Response:
     """List owners with public endpoints and their endpoint counts.
 
     Efficient endpoint for directory browsing - returns only owner names
-    and counts, not full endpoint data.
+    and counts, not full endpoint data. The listing is the same for every
+    viewer, so it is always served through the public response cache.
     """
-    return endpoint_service.list_public_endpoint_owners(skip=skip, limit=limit)
+    return cached_public_response(
+        "endpoints.public_owners",
+        {"skip": skip, "limit": limit},
+        lambda: JSONResponse(
+            jsonable_encoder(
+                endpoint_service.list_public_endpoint_owners(skip=skip, limit=limit)
+            )
+        ),
+    )
 
 
 @router.get(
@@ -201,24 +290,38 @@ Returns a list of EndpointPublicResponse objects containing:
 **Ordering:**
 - Endpoints are ordered by `updated_at` (most recent first)
 
+**Pagination:**
+When more endpoints remain, the response carries an `X-Next-Cursor` header;
+pass it back as `cursor` to fetch the next page.
+
 **Use with:**
 - `GET /endpoints/public/owners` to list all owners first
 """,
 )
 def list_public_endpoints_by_owner(
     owner_slug: str,
+    response: Response,
     endpoint_service: Annotated[EndpointService, Depends(get_endpoint_service)],
     current_user: Annotated[Optional[User], Depends(get_optional_current_user)],
     skip: int = Query(0, ge=0, description="Number of endpoints to skip"),
     limit: int = Query(100, ge=1, le=500, description="Maximum endpoints to return"),
+    cursor: Optional[str] = Query(
+        None, max_length=512, description=CURSOR_QUERY_DESCRIPTION
+    ),
 ) -> list[EndpointPublicResponse]:
     """List public endpoints for a specific owner.
 
     Returns all public, active endpoints belonging to the given user.
     """
-    return endpoint_service.list_public_endpoints_by_owner(
-        owner_slug=owner_slug, skip=skip, limit=limit, current_user=current_user
+    page = endpoint_service.list_public_endpoints_by_owner(
+        owner_slug=owner_slug,
+        skip=skip,
+        limit=limit,
+        current_user=current_user,
+        cursor=cursor,
     )
+    _set_next_cursor(response, page)
+    return page.items
 
 
 @router.get(
@@ -249,23 +352,50 @@ def get_public_endpoint_by_path(
 
 @router.get("/trending", response_model=list[EndpointPublicResponse])
 def list_trending_endpoints(
+    response: Response,
     endpoint_service: Annotated[EndpointService, Depends(get_endpoint_service)],
     current_user: Annotated[Optional[User], Depends(get_optional_current_user)],
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = Query(
+        None, max_length=512, description=CURSOR_QUERY_DESCRIPTION
+    ),
     min_stars: Optional[int] = Query(None, ge=0),
     endpoint_type: Optional[EndpointType] = Query(
         None, description="Filter by endpoint type (model or data_source)"
     ),
-) -> list[EndpointPublicResponse]:
-    """List trending public endpoints."""
-    return endpoint_service.list_trending_endpoints(
-        skip=skip,
-        limit=limit,
-        min_stars=min_stars,
-        endpoint_type=endpoint_type,
-        current_user=current_user,
-    )
+) -> Union[list[EndpointPublicResponse], Response]:
+    """List trending public endpoints.
+
+    Anonymous responses are served from the shared public response cache.
+    """
+
+    def load() -> PublicEndpointPage:
+        return endpoint_service.list_trending_endpoints(
+            skip=skip,
+            limit=limit,
+            min_stars=min_stars,
+            endpoint_type=endpoint_type,
+            current_user=current_user,
+            cursor=cursor,
+        )
+
+    if current_user is None:
+        return cached_public_response(
+            "endpoints.trending",
+            {
+                "skip": skip,
+                "limit": limit,
+                "cursor": cursor,
+                "min_stars": min_stars,
+                "endpoint_type": endpoint_type,
+            },
+            lambda: _page_response(load()),
+        )
+
+    page = load()
+    _set_next_cursor(response, page)
+    return page.items
 
 
 @router.get(
@@ -405,14 +535,16 @@ def search_endpoints(
     description="""
 Synchronize user's endpoints with the provided list.
 
-**This is a DESTRUCTIVE operation** that:
-1. Deletes ALL existing endpoints owned by the current user
-2. Creates ALL endpoints from the provided list
-3. Is ATOMIC: either all endpoints sync successfully, or none do
+After the sync the user owns exactly the provided endpoints:
+1. Existing endpoints are matched by slug and compared by content hash
+2. Unchanged endpoints are left untouched, changed ones are updated in place
+3. New slugs are created; endpoints missing from the list are deleted
+4. Is ATOMIC: either all endpoints sync successfully, or none do
 
 **Important Notes:**
-- Stars on existing endpoints will be lost (reset to 0)
-- Endpoint IDs will change (new IDs assigned)
+- Matched endpoints keep their ID and stars
+- Only created and updated endpoints are re-indexed for search
+- The response reports `created`, `updated`, `unchanged` and `deleted` counts
 - Maximum 100 endpoints per sync request
 
 **Validation:**
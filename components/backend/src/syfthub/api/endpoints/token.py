@@ -8,6 +8,7 @@ audience-bound satellite tokens. Satellite services can either:
 
 Per the OpenAPI spec:
 - GET /api/v1/token?aud={audience} - Mint a satellite token
+- POST /api/v1/token/batch - Mint satellite tokens for several audiences
 - POST /api/v1/verify - Verify a satellite token (server-side)
 - Requires valid Hub session (Bearer token)
 - Returns RS256-signed satellite token
@@ -30,10 +31,13 @@ from syfthub.auth.satellite_tokens import (
     GUEST_ROLE,
     GUEST_SUB,
     GUEST_USERNAME,
+    SatelliteTokenBatch,
     TokenVerificationResult,
-    create_guest_satellite_token,
-    create_satellite_token,
+    create_guest_satellite_tokens,
+    create_satellite_tokens,
     get_allowed_audiences,
+    issue_guest_satellite_token,
+    issue_satellite_token,
     verify_satellite_token_for_service,
 )
 from syfthub.core.config import settings
@@ -41,6 +45,8 @@ from syfthub.database.dependencies import get_user_repository
 from syfthub.domain.exceptions import KeyNotConfiguredError
 from syfthub.repositories.user import UserRepository
 from syfthub.schemas.satellite import (
+    SatelliteTokenBatchRequest,
+    SatelliteTokenBatchResponse,
     SatelliteTokenErrorResponse,
     SatelliteTokenResponse,
     TokenVerifyErrorResponse,
@@ -143,9 +149,9 @@ def get_satellite_token(
 
     # Create satellite token — audience validation and domain exceptions
     # (AudienceNotFoundError, AudienceInactiveError, KeyNotConfiguredError)
-    # are handled inside create_satellite_token and bubble up to the
+    # are handled inside issue_satellite_token and bubble up to the
     # DomainException handler which auto-maps them to the correct status code.
-    target_token = create_satellite_token(
+    issued = issue_satellite_token(
         user=current_user,
         audience=aud,
         key_manager=key_manager,
@@ -153,8 +159,8 @@ def get_satellite_token(
     )
 
     return SatelliteTokenResponse(
-        target_token=target_token,
-        expires_in=settings.satellite_token_expire_seconds,
+        target_token=issued.token,
+        expires_in=issued.expires_in,
     )
 
 
@@ -247,20 +253,152 @@ def get_guest_satellite_token(
         )
 
     # Create guest satellite token — audience validation and domain exceptions
-    # are handled inside create_guest_satellite_token and bubble up to the
+    # are handled inside issue_guest_satellite_token and bubble up to the
     # DomainException handler which auto-maps them to the correct status code.
-    target_token = create_guest_satellite_token(
+    issued = issue_guest_satellite_token(
         audience=aud,
         key_manager=key_manager,
         user_repo=user_repo,
     )
 
     return SatelliteTokenResponse(
-        target_token=target_token,
-        expires_in=settings.satellite_token_expire_seconds,
+        target_token=issued.token,
+        expires_in=issued.expires_in,
     )
 
 
+def _check_batch_size(audiences: list[str]) -> None:
+    """Reject batch requests above the configured audience limit."""
+    limit = settings.satellite_token_batch_max_audiences
+    if len(audiences) > limit:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "code": "TOO_MANY_AUDIENCES",
+                "message": f"At most {limit} audiences can be requested at once.",
+            },
+        )
+
+
+def _batch_response(batch: SatelliteTokenBatch) -> SatelliteTokenBatchResponse:
+    """Convert a minted token batch into its API response."""
+    return SatelliteTokenBatchResponse(
+        tokens={
+            aud: SatelliteTokenResponse(
+                target_token=issued.token,
+                expires_in=issued.expires_in,
+            )
+            for aud, issued in batch.tokens.items()
+        },
+        errors={
+            aud: SatelliteTokenErrorResponse(
+                error=result.error_code or "invalid_audience",
+                message=result.error or f"Audience '{aud}' is not valid.",
+            )
+            for aud, result in batch.errors.items()
+        },
+    )
+
+
+@router.post(
+    "/token/batch",
+    response_model=SatelliteTokenBatchResponse,
+    responses={
+        400: {"description": "Too many audiences requested"},
+        401: {"description": "Unauthorized (Invalid or Expired Hub Token)"},
+        503: {"description": "Service Unavailable (Identity Provider not configured)"},
+    },
+    summary="Exchange Hub Session for Satellite Tokens (Batch)",
+    description="""
+Mint satellite tokens for several target services (Audiences) in one request.
+
+Each token is identical to one returned by `GET /token?aud=...`. All audiences
+are validated with a single lookup; audiences that are unknown or inactive are
+reported under `errors` without failing the rest of the batch.
+
+Tokens are reused per (user, audience) until close to expiry, so `expires_in`
+may be shorter than the configured token lifetime.
+""",
+)
+def get_satellite_tokens_batch(
+    request: SatelliteTokenBatchRequest,
+    current_user: Annotated[User, Depends(get_current_active_user)],
+    user_repo: Annotated[UserRepository, Depends(get_user_repository)],
+) -> SatelliteTokenBatchResponse:
+    """Exchange Hub session for satellite tokens for several audiences.
+
+    Args:
+        request: The audiences to mint tokens for
+        current_user: Authenticated user from Hub session token
+        user_repo: User repository for audience validation
+
+    Returns:
+        SatelliteTokenBatchResponse with tokens and per-audience errors
+
+    Raises:
+        HTTPException: 400 if more audiences than allowed are requested
+        HTTPException: 401 if user is not authenticated (handled by dependency)
+        HTTPException: 503 if RSA keys are not configured
+    """
+    if not key_manager.is_configured:
+        raise KeyNotConfiguredError()
+
+    _check_batch_size(request.audiences)
+
+    batch = create_satellite_tokens(
+        user=current_user,
+        audiences=request.audiences,
+        key_manager=key_manager,
+        user_repo=user_repo,
+    )
+    return _batch_response(batch)
+
+
+@router.post(
+    "/token/guest/batch",
+    response_model=SatelliteTokenBatchResponse,
+    responses={
+        400: {"description": "Too many audiences requested"},
+        503: {"description": "Service Unavailable (Identity Provider not configured)"},
+    },
+    summary="Get Guest Satellite Tokens (Batch, No Authentication Required)",
+    description="""
+Mint guest satellite tokens for several target services in one request.
+
+Each token is identical to one returned by `GET /token/guest?aud=...`.
+Audiences that are unknown or inactive are reported under `errors`.
+""",
+)
+def get_guest_satellite_tokens_batch(
+    request: SatelliteTokenBatchRequest,
+    user_repo: Annotated[UserRepository, Depends(get_user_repository)],
+) -> SatelliteTokenBatchResponse:
+    """Get guest satellite tokens for several audiences.
+
+    Args:
+        request: The audiences to mint tokens for
+        user_repo: User repository for audience validation
+
+    Returns:
+        SatelliteTokenBatchResponse with tokens and per-audience errors
+
+    Raises:
+        HTTPException: 400 if more audiences than allowed are requested
+        HTTPException: 503 if RSA keys are not configured
+    """
+    if not key_manager.is_configured:
+        raise KeyNotConfiguredError()
+
+    _check_batch_size(request.audiences)
+
+    batch = create_guest_satellite_tokens(
+        audiences=request.audiences,
+        key_manager=key_manager,
+        user_repo=user_repo,
+    )
+    return _batch_response(batch)
+
+
 @router.get(
     "/token/audiences",
     response_model=dict[str, Any],
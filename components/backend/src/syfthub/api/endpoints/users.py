@@ -12,6 +12,7 @@ from syfthub.auth.db_dependencies import (
     require_admin,
 )
 from syfthub.core.config import settings
+from syfthub.core.response_cache import invalidate_public_responses
 from syfthub.database.dependencies import get_user_service
 from syfthub.schemas.auth import UserRole
 from syfthub.schemas.user import (
@@ -21,6 +22,7 @@ from syfthub.schemas.user import (
     UserResponse,
     UserUpdate,
 )
+from syfthub.services.directory_snapshot import invalidate_directory_owners
 from syfthub.services.user_service import UserService
 
 logger = logging.getLogger(__name__)
@@ -262,3 +264,5 @@ def delete_user(
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="User not found"
         )
+    invalidate_directory_owners([user_id])
+    invalidate_public_responses()
@@ -87,28 +87,28 @@ def create_wallet(
 
     Creates a fresh Ethereum account, derives a TempoAccount, and persists
     both the address and private key on the user record.  If a wallet already
-    exists, the existing address is returned without creating a new one.
+    exists, the existing address is returned and the new keypair discarded.
     """
-    # Guard: if wallet already exists, return it instead of overwriting
-    if current_user.wallet_address:
-        return CreateWalletResponse(address=current_user.wallet_address)
-
     from eth_account import Account
     from mpp.methods.tempo import TempoAccount
 
     acct = Account.create()
     tempo_acct = TempoAccount.from_key(acct.key.hex())
 
-    updated = user_repo.update(
+    # Decided by the database, not by current_user: the principal may be a
+    # cached copy that predates a wallet created moments ago.
+    address = user_repo.create_wallet_if_absent(
         current_user.id,
         wallet_address=tempo_acct.address,
         wallet_private_key=tempo_acct.private_key,
     )
-    if not updated:
+    if address is None:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to save wallet to user record",
         )
+    if address != tempo_acct.address:
+        return CreateWalletResponse(address=address)
 
     logger.info(
         "wallet.created",
@@ -0,0 +1,85 @@
+"""In-memory buffer of API token usage.
+
+Authenticating with an API token used to UPDATE the token's ``last_used_at``
+and ``last_used_ip`` and commit on every request, so busy SDK/CLI clients kept
+writing to the same few rows. Authentication now records the use here, and
+:class:`~syfthub.jobs.api_token_usage_flush.APITokenUsageFlushJob` writes the
+latest use of every token in one bulk UPDATE per
+``api_token_last_used_flush_interval_seconds``. Readers of ``last_used_at``
+see it up to one interval late.
+"""
+
+from __future__ import annotations
+
+import threading
+from datetime import datetime, timezone
+from typing import Optional
+
+
+class APITokenUsageBuffer:
+    """Thread-safe map of token ID to its most recent (time, client IP) use."""
+
+    def __init__(self) -> None:
+        self._usages: dict[int, tuple[datetime, Optional[str]]] = {}
+        self._lock = threading.Lock()
+
+    def record(
+        self,
+        token_id: int,
+        client_ip: Optional[str] = None,
+        used_at: Optional[datetime] = None,
+    ) -> None:
+        """Record that a token was used, replacing any older buffered use.
+
+        Args:
+            token_id: The token ID.
+            client_ip: The client IP address (optional; a missing IP keeps the
+                last known one).
+            used_at: When the token was used (defaults to now).
+        """
+        used_at = used_at or datetime.now(timezone.utc)
+        with self._lock:
+            previous = self._usages.get(token_id)
+            if previous is not None:
+                if previous[0] > used_at:
+                    return
+                client_ip = client_ip or previous[1]
+            self._usages[token_id] = (used_at, client_ip)
+
+    def drain(self) -> dict[int, tuple[datetime, Optional[str]]]:
+        """Remove and return every buffered use."""
+        with self._lock:
+            usages, self._usages = self._usages, {}
+        return usages
+
+    def restore(self, usages: dict[int, tuple[datetime, Optional[str]]]) -> None:
+        """Put back uses that could not be written, keeping newer ones."""
+        for token_id, (used_at, client_ip) in usages.items():
+            self.record(token_id, client_ip, used_at)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._usages)
+
+
+_buffer: Optional[APITokenUsageBuffer] = None
+_buffer_lock = threading.Lock()
+
+
+def get_api_token_usage_buffer() -> APITokenUsageBuffer:
+    """Get the process-wide API token usage buffer."""
+    global _buffer
+
+    if _buffer is None:
+        with _buffer_lock:
+            if _buffer is None:
+                _buffer = APITokenUsageBuffer()
+
+    return _buffer
+
+
+def reset_api_token_usage_buffer() -> None:
+    """Discard the process-wide buffer (used by tests)."""
+    global _buffer
+    with _buffer_lock:
+        _buffer = None
@@ -13,9 +13,12 @@ from typing import Annotated, List, Optional
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 
+from syfthub.auth.api_token_usage import get_api_token_usage_buffer
 from syfthub.auth.api_tokens import hash_api_token, is_api_token
+from syfthub.auth.principal_cache import APITokenPrincipal, get_principal_cache
 from syfthub.auth.security import verify_token
 from syfthub.core.client_ip import get_client_ip
+from syfthub.core.config import settings
 from syfthub.database.dependencies import get_api_token_repository, get_user_repository
 from syfthub.observability.logger import get_logger
 from syfthub.repositories.api_token import APITokenRepository
@@ -53,27 +56,31 @@ def get_user_by_email(
     return user_repo.get_by_email(email)
 
 
-def _authenticate_with_api_token(
-    token: str,
-    api_token_repo: APITokenRepository,
-    request: Optional[Request] = None,
-) -> User:
-    """Authenticate using an API token.
+def _ensure_api_token_not_expired(expires_at: Optional[datetime]) -> None:
+    """Reject an API token whose expiry has passed."""
+    if expires_at is None:
+        return
+    now = datetime.now(timezone.utc)
+    # Ensure timezone-aware comparison
+    if expires_at.tzinfo is None:
+        expires_at = expires_at.replace(tzinfo=timezone.utc)
+    if expires_at <= now:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="API token has expired",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-    Args:
-        token: The API token string (starting with "syft_").
-        api_token_repo: Repository for API token operations.
-        request: Optional request object for IP tracking.
 
-    Returns:
-        User object if authentication succeeds.
+def _load_api_token_principal(
+    token_hash: str, api_token_repo: APITokenRepository
+) -> APITokenPrincipal:
+    """Look up an API token and its user, and check both are usable.
 
     Raises:
-        HTTPException: If authentication fails.
+        HTTPException: If the token is unknown, revoked or expired, or its
+            user is missing or inactive.
     """
-    # Hash the token for lookup
-    token_hash = hash_api_token(token)
-
     # Look up the token
     api_token = api_token_repo.get_by_hash(token_hash)
 
@@ -93,18 +100,7 @@ def _authenticate_with_api_token(
         )
 
     # Check if token is expired
-    if api_token.expires_at is not None:
-        now = datetime.now(timezone.utc)
-        expires_at = api_token.expires_at
-        # Ensure timezone-aware comparison
-        if expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=timezone.utc)
-        if expires_at <= now:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="API token has expired",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    _ensure_api_token_not_expired(api_token.expires_at)
 
     # Get the user from the relationship (eager loaded)
     user_model = api_token.user
@@ -123,16 +119,62 @@ def _authenticate_with_api_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Update last used timestamp (fire-and-forget, don't fail auth on error)
+    return APITokenPrincipal(
+        token_id=api_token.id,
+        user=User.model_validate(user_model),
+        expires_at=api_token.expires_at,
+    )
+
+
+def _authenticate_with_api_token(
+    token: str,
+    api_token_repo: APITokenRepository,
+    request: Optional[Request] = None,
+) -> User:
+    """Authenticate using an API token.
+
+    Valid tokens are served from the principal cache for a short TTL; expiry
+    is checked on every request.
+
+    Args:
+        token: The API token string (starting with "syft_").
+        api_token_repo: Repository for API token operations.
+        request: Optional request object for IP tracking.
+
+    Returns:
+        User object if authentication succeeds.
+
+    Raises:
+        HTTPException: If authentication fails.
+    """
+    # Hash the token for lookup
+    token_hash = hash_api_token(token)
+
+    principal = get_principal_cache().get_or_load_api_token(
+        token_hash, lambda: _load_api_token_principal(token_hash, api_token_repo)
+    )
+    _ensure_api_token_not_expired(principal.expires_at)
+
+    # Track last use (don't fail auth on error). Uses are buffered and written
+    # in bulk by APITokenUsageFlushJob unless the flush interval is 0.
     try:
         client_ip = get_client_ip(request) if request is not None else None
-        api_token_repo.update_last_used(api_token.id, client_ip)
+        if settings.api_token_last_used_flush_interval_seconds > 0:
+            get_api_token_usage_buffer().record(principal.token_id, client_ip)
+        else:
+            api_token_repo.update_last_used(principal.token_id, client_ip)
     except Exception:
         logger.debug("auth.api_token.tracking_failed", exc_info=True)
         pass
 
-    # Convert to User schema
-    return User.model_validate(user_model)
+    return principal.user
+
+
+def _get_user_principal(user_id: int, user_repo: UserRepository) -> Optional[User]:
+    """Get a user by ID through the principal cache."""
+    return get_principal_cache().get_or_load_user(
+        user_id, lambda: user_repo.get_by_id(user_id)
+    )
 
 
 def _authenticate_with_jwt(
@@ -172,8 +214,8 @@ def _authenticate_with_jwt(
     except (ValueError, TypeError):
         raise credentials_exception from None
 
-    # Get user from database
-    user = user_repo.get_by_id(user_id)
+    # Get user from the principal cache or database
+    user = _get_user_principal(user_id, user_repo)
     if user is None:
         raise credentials_exception
 
@@ -271,8 +313,8 @@ def get_optional_current_user(
         except (ValueError, TypeError):
             return None
 
-        # Get user from database
-        user = user_repo.get_by_id(user_id)
+        # Get user from the principal cache or database
+        user = _get_user_principal(user_id, user_repo)
 
         # Defense-in-depth: reject inactive users
         if user is not None and not getattr(user, "is_active", True):
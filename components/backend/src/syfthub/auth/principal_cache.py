@@ -0,0 +1,278 @@
+"""Short-lived cache of authenticated principals.
+
+Every authenticated request used to load its user (JWT) or its API token and
+user (API token) from the database before the handler ran, making auth
+lookups the most frequent query under SDK polling load. Successful lookups
+are now kept for ``auth_principal_cache_ttl_seconds``:
+
+- JWT principals are keyed by user ID.
+- API-token principals are keyed by the token's SHA-256 hash. Token expiry is
+  still checked on every request.
+
+Only successful lookups are cached; unknown, revoked or inactive credentials
+always reach the database.
+
+Writes that change what authentication returns (deactivation, role or password
+changes, profile updates, deletion, token revocation) invalidate the affected
+entries through :func:`invalidate_user_principal` and
+:func:`invalidate_api_token_principal`. Invalidation is per worker, so other
+workers may serve the previous principal for at most one TTL.
+
+Invalidations are numbered, and the cache remembers the last invalidation of
+each user and each token. A lookup that raced an invalidation of *its* user
+or token is not cached; unrelated invalidations (an owner's heartbeat changing
+their domain, say) don't stop other lookups from being cached. Cached token
+principals record the invalidation number they were loaded at and are checked
+against their user and token on each hit, so invalidating a user costs the
+same however many tokens are cached.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import TYPE_CHECKING, Generic, Optional, TypeVar
+
+from syfthub.core.config import settings
+
+if TYPE_CHECKING:
+    from syfthub.schemas.user import User
+
+K = TypeVar("K")
+V = TypeVar("V")
+
+
+@dataclass(frozen=True)
+class APITokenPrincipal:
+    """What API-token authentication needs to know about a valid token."""
+
+    token_id: int
+    user: User
+    expires_at: Optional[datetime]
+
+
+class _TTLMap(Generic[K, V]):
+    """LRU map whose entries expire. Not thread-safe; callers hold a lock."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[K, tuple[V, float]] = OrderedDict()
+
+    def get(self, key: K, now: float) -> Optional[V]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[1] <= now:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key: K, value: V, expires_at: float) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class PrincipalCache:
+    """Thread-safe, TTL-bounded cache of users and API-token principals."""
+
+    def __init__(self, ttl_seconds: float, max_entries: int) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: How long a principal is reused. 0 or less disables
+                the cache (every request is looked up).
+            max_entries: Maximum cached users, and separately tokens, evicted
+                least recently used
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._users: _TTLMap[int, User] = _TTLMap(max_entries)
+        # token hash -> (principal, invalidation number it was loaded at)
+        self._tokens: _TTLMap[str, tuple[APITokenPrincipal, int]] = _TTLMap(max_entries)
+        # Number of the latest invalidation, and the latest per user and token
+        self._generation = 0
+        self._user_generations: OrderedDict[int, int] = OrderedDict()
+        self._token_generations: OrderedDict[int, int] = OrderedDict()
+        # Lookups that started before this invalidation can't be checked
+        # against forgotten per-key generations, so they count as stale
+        self._forgotten_generation = 0
+        self._hits = 0
+        self._misses = 0
+        # Guards the maps, the generations and the counters
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get_or_load_user(
+        self, user_id: int, load: Callable[[], Optional[User]]
+    ) -> Optional[User]:
+        """Return the cached user, loading (and caching) it on a miss.
+
+        Args:
+            user_id: ID from the access token's ``sub`` claim
+            load: Loads the user from the database; ``None`` and inactive
+                users are returned but not cached
+
+        Returns:
+            A copy of the user, so callers can't modify the cached one
+        """
+        if not self.enabled:
+            return load()
+
+        with self._lock:
+            user = self._users.get(user_id, time.monotonic())
+            self._count(user is not None)
+            generation = self._generation
+        if user is not None:
+            return user.model_copy()
+
+        user = load()
+        if user is not None and user.is_active:
+            with self._lock:
+                if not self._is_stale(generation, user_id):
+                    self._users.put(user_id, user, time.monotonic() + self.ttl_seconds)
+            return user.model_copy()
+        return user
+
+    def get_or_load_api_token(
+        self, token_hash: str, load: Callable[[], APITokenPrincipal]
+    ) -> APITokenPrincipal:
+        """Return the cached principal for a token, loading it on a miss.
+
+        Args:
+            token_hash: SHA-256 hash of the presented API token
+            load: Loads and validates the token; raises if it is not usable
+
+        Returns:
+            The principal, with a copy of its user
+        """
+        if not self.enabled:
+            return load()
+
+        with self._lock:
+            entry = self._tokens.get(token_hash, time.monotonic())
+            if entry is not None and self._is_stale(
+                entry[1], entry[0].user.id, entry[0].token_id
+            ):
+                self._tokens.discard(token_hash)
+                entry = None
+            self._count(entry is not None)
+            generation = self._generation
+        if entry is not None:
+            principal = entry[0]
+        else:
+            principal = load()
+            with self._lock:
+                if not self._is_stale(
+                    generation, principal.user.id, principal.token_id
+                ):
+                    self._tokens.put(
+                        token_hash,
+                        (principal, generation),
+                        time.monotonic() + self.ttl_seconds,
+                    )
+        return APITokenPrincipal(
+            token_id=principal.token_id,
+            user=principal.user.model_copy(),
+            expires_at=principal.expires_at,
+        )
+
+    def invalidate_user(self, user_id: int) -> None:
+        """Drop a user and every API-token principal of that user."""
+        with self._lock:
+            self._generation += 1
+            self._remember(self._user_generations, user_id)
+            self._users.discard(user_id)
+
+    def invalidate_api_token(self, token_id: int) -> None:
+        """Drop the principal of one API token."""
+        with self._lock:
+            self._generation += 1
+            self._remember(self._token_generations, token_id)
+
+    def stats(self) -> dict[str, int]:
+        """Return hit and miss counts and the number of cached principals."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "users": len(self._users),
+                "api_tokens": len(self._tokens),
+            }
+
+    def _remember(self, generations: OrderedDict[int, int], key: int) -> None:
+        generations[key] = self._generation
+        generations.move_to_end(key)
+        while len(generations) > self.max_entries:
+            _, forgotten = generations.popitem(last=False)
+            self._forgotten_generation = max(self._forgotten_generation, forgotten)
+
+    def _is_stale(
+        self, generation: int, user_id: int, token_id: Optional[int] = None
+    ) -> bool:
+        """Whether the user or token was invalidated after ``generation``."""
+        if generation < self._forgotten_generation:
+            return True
+        if self._user_generations.get(user_id, 0) > generation:
+            return True
+        return (
+            token_id is not None
+            and self._token_generations.get(token_id, 0) > generation
+        )
+
+    def _count(self, hit: bool) -> None:
+        if hit:
+            self._hits += 1
+        else:
+            self._misses += 1
+
+
+_cache: Optional[PrincipalCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get the process-wide principal cache."""
+    global _cache
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PrincipalCache(
+                    ttl_seconds=settings.auth_principal_cache_ttl_seconds,
+                    max_entries=settings.auth_principal_cache_max_entries,
+                )
+
+    return _cache
+
+
+def invalidate_user_principal(user_id: int) -> None:
+    """Stop serving a cached principal for a user whose account changed."""
+    get_principal_cache().invalidate_user(user_id)
+
+
+def invalidate_api_token_principal(token_id: int) -> None:
+    """Stop serving a cached principal for a revoked or deleted API token."""
+    get_principal_cache().invalidate_api_token(token_id)
+
+
+def reset_principal_cache() -> None:
+    """Discard the process-wide cache (used by tests)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
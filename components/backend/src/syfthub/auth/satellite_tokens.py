@@ -17,12 +17,21 @@ Audience Validation:
 - A valid audience is any active user's username
 - When a user is created, their username becomes a valid audience
 - When a user is deactivated/deleted, their username becomes invalid
+
+Token Reuse:
+- Signed tokens are cached per (sub, role, aud, kid, issuer) and handed out
+  again until they get close to expiry, so RS256 signing happens roughly once
+  per token lifetime instead of once per request
+- Audience validation is never cached; it runs on every mint
 """
 
 from __future__ import annotations
 
 import logging
-from dataclasses import dataclass
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -132,6 +141,65 @@ def validate_audience(
     )
 
 
+def validate_audiences(
+    audiences: list[str],
+    user_repo: Optional[UserRepository] = None,
+) -> dict[str, AudienceValidationResult]:
+    """Validate several audiences with a single database query.
+
+    Batch counterpart of validate_audience(): all audiences are looked up with
+    one ``IN`` query instead of one query per audience.
+
+    Args:
+        audiences: The requested service identifiers (usernames)
+        user_repo: User repository for database lookup. If None, falls back
+                   to static config (deprecated behavior).
+
+    Returns:
+        Mapping of each requested audience (as given) to its validation result
+    """
+    normalized = {aud: aud.strip().lower() for aud in audiences}
+
+    if user_repo is None:
+        return {aud: validate_audience(aud) for aud in audiences}
+
+    try:
+        users = user_repo.get_by_usernames(
+            sorted({name for name in normalized.values() if name})
+        )
+    except Exception as e:
+        # Fail closed on database errors - deny every audience in the batch
+        logger.error(f"Database error during audience validation: {e}")
+        return {
+            aud: AudienceValidationResult(
+                valid=False,
+                error="Unable to validate audience. Please try again.",
+                error_code="validation_error",
+            )
+            for aud in audiences
+        }
+
+    by_username = {user.username.lower(): user for user in users}
+    results: dict[str, AudienceValidationResult] = {}
+    for aud, name in normalized.items():
+        user = by_username.get(name)
+        if user is None:
+            results[aud] = AudienceValidationResult(
+                valid=False,
+                error=f"Audience '{aud}' is not a registered user.",
+                error_code="audience_not_found",
+            )
+        elif not user.is_active:
+            results[aud] = AudienceValidationResult(
+                valid=False,
+                error=f"Audience '{aud}' is inactive.",
+                error_code="audience_inactive",
+            )
+        else:
+            results[aud] = AudienceValidationResult(valid=True)
+    return results
+
+
 def get_allowed_audiences(
     user_repo: Optional[UserRepository] = None,
     limit: int = 100,
@@ -166,17 +234,165 @@ def get_allowed_audiences(
     return settings.allowed_audiences
 
 
+@dataclass(frozen=True)
+class IssuedSatelliteToken:
+    """A signed satellite token and the seconds it has left before expiry."""
+
+    token: str
+    expires_in: int
+
+
+@dataclass
+class SatelliteTokenBatch:
+    """Outcome of minting tokens for several audiences at once.
+
+    Attributes:
+        tokens: Issued tokens keyed by requested audience
+        errors: Validation failures keyed by requested audience
+    """
+
+    tokens: dict[str, IssuedSatelliteToken] = field(default_factory=dict)
+    errors: dict[str, AudienceValidationResult] = field(default_factory=dict)
+
+
+class SatelliteTokenCache:
+    """Process-local cache of signed satellite tokens.
+
+    A satellite token only carries (sub, role, aud), so the same signed token
+    can be handed out for that combination until it is close to expiry.
+    Entries are also keyed by signing key ID and issuer so that a key
+    rotation never serves a token signed with a retired key.
+
+    Args:
+        min_remaining_seconds: A cached token is only returned while it has at
+            least this many seconds left; otherwise a fresh one is signed.
+        max_entries: Upper bound on cached tokens (least recently used first out).
+        enabled: When False, get() always misses and put() is a no-op.
+    """
+
+    def __init__(
+        self,
+        min_remaining_seconds: int = 20,
+        max_entries: int = 10000,
+        enabled: bool = True,
+    ) -> None:
+        self.min_remaining_seconds = min_remaining_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries: OrderedDict[tuple[str, ...], tuple[str, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[str, ...]) -> Optional[IssuedSatelliteToken]:
+        """Return a cached token with enough lifetime left, or None."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            token, expires_at = entry
+            remaining = expires_at - time.time()
+            if remaining < self.min_remaining_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+        return IssuedSatelliteToken(token=token, expires_in=int(remaining))
+
+    def put(self, key: tuple[str, ...], token: str, expires_at: int) -> None:
+        """Cache a signed token that expires at ``expires_at`` (Unix seconds)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (token, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop every cached token."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Process-wide token cache, configured once from settings
+satellite_token_cache = SatelliteTokenCache(
+    min_remaining_seconds=settings.satellite_token_cache_min_remaining_seconds,
+    max_entries=settings.satellite_token_cache_max_entries,
+    enabled=settings.satellite_token_cache_enabled,
+)
+
+
+def _sign_satellite_token(
+    sub: str,
+    role: str,
+    audience: str,
+    key_manager: RSAKeyManager,
+) -> IssuedSatelliteToken:
+    """Sign a token for an already-validated, normalized audience.
+
+    Returns a cached token for the same (sub, role, aud) when one with enough
+    remaining lifetime exists; otherwise signs a new one with RS256 and caches it.
+    """
+    cache_key = (
+        sub,
+        str(role),
+        audience,
+        str(key_manager.current_key_id),
+        settings.issuer_url,
+    )
+    cached = satellite_token_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
+    # Build token payload
+    now = datetime.now(timezone.utc)
+    expire = now + timedelta(seconds=settings.satellite_token_expire_seconds)
+
+    payload = {
+        "sub": sub,
+        "iss": settings.issuer_url,
+        "aud": audience,
+        "exp": expire,
+        "iat": now,
+        "role": role,
+    }
+
+    # Build JWT headers with key ID
+    headers = {
+        "kid": key_manager.current_key_id,
+    }
+
+    # Sign token with RS256 using private key
+    token: str = jwt.encode(
+        payload,
+        key_manager.private_key,
+        algorithm="RS256",
+        headers=headers,
+    )
+
+    # The exp claim is encoded in whole seconds, so cache against that value
+    satellite_token_cache.put(cache_key, token, int(expire.timestamp()))
+
+    return IssuedSatelliteToken(
+        token=token,
+        expires_in=settings.satellite_token_expire_seconds,
+    )
+
+
 def _mint_satellite_token(
     sub: str,
     role: str,
     audience: str,
     key_manager: RSAKeyManager,
     user_repo: Optional[UserRepository] = None,
-) -> str:
+) -> IssuedSatelliteToken:
     """Shared implementation for minting audience-bound satellite tokens.
 
-    Validates the audience, checks key configuration, builds the JWT payload,
-    and signs it with RS256.
+    Validates the audience, checks key configuration, then signs (or reuses)
+    the token.
 
     Args:
         sub: Subject claim (user ID or "guest").
@@ -186,7 +402,7 @@ def _mint_satellite_token(
         user_repo: User repository for audience validation.
 
     Returns:
-        RS256-signed JWT string.
+        The RS256-signed JWT and its remaining lifetime.
 
     Raises:
         AudienceNotFoundError: If audience is not a registered user.
@@ -205,33 +421,84 @@ def _mint_satellite_token(
     if not key_manager.is_configured:
         raise KeyNotConfiguredError()
 
-    # Build token payload
-    now = datetime.now(timezone.utc)
-    expire = now + timedelta(seconds=settings.satellite_token_expire_seconds)
+    return _sign_satellite_token(sub, role, audience.strip().lower(), key_manager)
 
-    payload = {
-        "sub": sub,
-        "iss": settings.issuer_url,
-        "aud": audience.strip().lower(),
-        "exp": expire,
-        "iat": now,
-        "role": role,
-    }
 
-    # Build JWT headers with key ID
-    headers = {
-        "kid": key_manager.current_key_id,
-    }
+def _mint_satellite_tokens(
+    sub: str,
+    role: str,
+    audiences: list[str],
+    key_manager: RSAKeyManager,
+    user_repo: Optional[UserRepository] = None,
+) -> SatelliteTokenBatch:
+    """Shared implementation for minting tokens for several audiences.
 
-    # Sign token with RS256 using private key
-    token: str = jwt.encode(
-        payload,
-        key_manager.private_key,
-        algorithm="RS256",
-        headers=headers,
+    All audiences are validated with one query. Invalid audiences are reported
+    per audience instead of failing the whole batch.
+
+    Raises:
+        KeyNotConfiguredError: If RSA keys are not configured.
+    """
+    if not key_manager.is_configured:
+        raise KeyNotConfiguredError()
+
+    batch = SatelliteTokenBatch()
+    for audience in [aud for aud in audiences if not aud.strip()]:
+        batch.errors[audience] = AudienceValidationResult(
+            valid=False,
+            error="Audience must not be empty.",
+            error_code="invalid_audience",
+        )
+
+    requested = [aud for aud in dict.fromkeys(audiences) if aud.strip()]
+    for audience, result in validate_audiences(requested, user_repo).items():
+        if result.valid:
+            batch.tokens[audience] = _sign_satellite_token(
+                sub, role, audience.strip().lower(), key_manager
+            )
+        else:
+            batch.errors[audience] = result
+
+    return batch
+
+
+def issue_guest_satellite_token(
+    audience: str,
+    key_manager: RSAKeyManager,
+    user_repo: Optional[UserRepository] = None,
+) -> IssuedSatelliteToken:
+    """Issue a guest satellite token, reporting its remaining lifetime.
+
+    Same as create_guest_satellite_token() but also returns ``expires_in``,
+    which is shorter than the configured lifetime for a reused token.
+    """
+    return _mint_satellite_token(
+        sub=GUEST_SUB,
+        role=GUEST_ROLE,
+        audience=audience,
+        key_manager=key_manager,
+        user_repo=user_repo,
     )
 
-    return token
+
+def issue_satellite_token(
+    user: User,
+    audience: str,
+    key_manager: RSAKeyManager,
+    user_repo: Optional[UserRepository] = None,
+) -> IssuedSatelliteToken:
+    """Issue a satellite token for a user, reporting its remaining lifetime.
+
+    Same as create_satellite_token() but also returns ``expires_in``,
+    which is shorter than the configured lifetime for a reused token.
+    """
+    return _mint_satellite_token(
+        sub=str(user.id),
+        role=user.role,
+        audience=audience,
+        key_manager=key_manager,
+        user_repo=user_repo,
+    )
 
 
 def create_guest_satellite_token(
@@ -258,13 +525,7 @@ def create_guest_satellite_token(
         AudienceInactiveError: If audience user is inactive
         KeyNotConfiguredError: If RSA keys are not configured
     """
-    return _mint_satellite_token(
-        sub=GUEST_SUB,
-        role=GUEST_ROLE,
-        audience=audience,
-        key_manager=key_manager,
-        user_repo=user_repo,
-    )
+    return issue_guest_satellite_token(audience, key_manager, user_repo).token
 
 
 def create_satellite_token(
@@ -292,10 +553,60 @@ def create_satellite_token(
         AudienceInactiveError: If audience user is inactive
         KeyNotConfiguredError: If RSA keys are not configured
     """
-    return _mint_satellite_token(
+    return issue_satellite_token(user, audience, key_manager, user_repo).token
+
+
+def create_guest_satellite_tokens(
+    audiences: list[str],
+    key_manager: RSAKeyManager,
+    user_repo: Optional[UserRepository] = None,
+) -> SatelliteTokenBatch:
+    """Create guest satellite tokens for several audiences in one call.
+
+    Args:
+        audiences: Target service identifiers (usernames)
+        key_manager: RSA key manager for signing
+        user_repo: User repository for audience validation.
+
+    Returns:
+        SatelliteTokenBatch with issued tokens and per-audience errors
+
+    Raises:
+        KeyNotConfiguredError: If RSA keys are not configured
+    """
+    return _mint_satellite_tokens(
+        sub=GUEST_SUB,
+        role=GUEST_ROLE,
+        audiences=audiences,
+        key_manager=key_manager,
+        user_repo=user_repo,
+    )
+
+
+def create_satellite_tokens(
+    user: User,
+    audiences: list[str],
+    key_manager: RSAKeyManager,
+    user_repo: Optional[UserRepository] = None,
+) -> SatelliteTokenBatch:
+    """Create satellite tokens for a user for several audiences in one call.
+
+    Args:
+        user: The authenticated user requesting the tokens
+        audiences: Target service identifiers (usernames)
+        key_manager: RSA key manager for signing
+        user_repo: User repository for audience validation.
+
+    Returns:
+        SatelliteTokenBatch with issued tokens and per-audience errors
+
+    Raises:
+        KeyNotConfiguredError: If RSA keys are not configured
+    """
+    return _mint_satellite_tokens(
         sub=str(user.id),
         role=user.role,
-        audience=audience,
+        audiences=audiences,
         key_manager=key_manager,
         user_repo=user_repo,
     )
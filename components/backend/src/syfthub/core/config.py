@@ -68,6 +68,32 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 30
     refresh_token_expire_days: int = 7
 
+    # Authenticated principals (the user behind a JWT, the token and user behind
+    # an API token) are cached per worker. Account and token changes invalidate
+    # the local cache; other workers pick them up within the TTL.
+    auth_principal_cache_ttl_seconds: int = Field(
+        default=15,
+        description=(
+            "How long an authenticated user or API token is reused without a "
+            "database lookup, in seconds. Set to 0 to look up every request."
+        ),
+    )
+    auth_principal_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum cached users, and separately API tokens, per worker",
+    )
+
+    # API token usage tracking. last_used_at / last_used_ip are buffered in
+    # each worker and written in one bulk UPDATE per interval, so they may lag
+    # by up to this long.
+    api_token_last_used_flush_interval_seconds: float = Field(
+        default=30.0,
+        description=(
+            "How often buffered API token last-used timestamps are written, in "
+            "seconds. Set to 0 to write them on every authenticated request."
+        ),
+    )
+
     # Encryption key for sensitive fields (Fernet key, base64-encoded 32 bytes).
     # Generate with: python -c "from cryptography.fernet import Fernet; print(Fernet.generate_key().decode())"
     # If unset, a deterministic key is derived from secret_key (NOT recommended for production).
@@ -112,6 +138,28 @@ class Settings(BaseSettings):
         description="Number of days to retain error logs in the database",
     )
 
+    # Error logs captured by the exception handlers are queued and written in
+    # batches by a background thread, never on the request path
+    error_log_queue_max_size: int = Field(
+        default=1000,
+        description="Maximum error logs waiting to be written; further ones are dropped",
+    )
+    error_log_batch_size: int = Field(
+        default=50,
+        description="Write queued error logs as soon as this many are waiting",
+    )
+    error_log_flush_interval_seconds: float = Field(
+        default=1.0,
+        description="Maximum time a queued error log waits before being written",
+    )
+    error_log_overload_sample_rate: int = Field(
+        default=10,
+        description=(
+            "Keep one in N error logs while the queue is more than half full. "
+            "Set to 1 to keep every error log until the queue is full."
+        ),
+    )
+
     # ===========================================
     # IDENTITY PROVIDER (IdP) SETTINGS
     # ===========================================
@@ -153,6 +201,23 @@ class Settings(BaseSettings):
         default=60,
         description="Satellite token lifetime in seconds (short-lived)",
     )
+    satellite_token_cache_enabled: bool = Field(
+        default=True,
+        description="Reuse signed satellite tokens per (sub, aud) until near expiry",
+    )
+    satellite_token_cache_min_remaining_seconds: int = Field(
+        default=20,
+        description="Minimum remaining lifetime for a cached satellite token to be "
+        "handed out again; below this a fresh token is signed",
+    )
+    satellite_token_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum number of cached satellite tokens per process",
+    )
+    satellite_token_batch_max_audiences: int = Field(
+        default=100,
+        description="Maximum number of audiences accepted by the batch token endpoints",
+    )
 
     # Audience Allowlist - DEPRECATED: Now dynamically generated from user database
     # This static list is kept as a fallback for backward compatibility only.
@@ -395,6 +460,64 @@ class Settings(BaseSettings):
         ),
     )
 
+    # ===========================================
+    # GLOBAL DIRECTORY SNAPSHOT
+    # ===========================================
+    # GET /endpoints/public/grouped is served from an in-memory snapshot that
+    # endpoint writes refresh per owner. The TTL bounds how long writes made
+    # by other worker processes take to show up.
+
+    directory_snapshot_ttl_seconds: int = Field(
+        default=60,
+        description=(
+            "Maximum age of the grouped directory snapshot before a full "
+            "rebuild, in seconds. Set to 0 to query the database on every request."
+        ),
+    )
+
+    # ===========================================
+    # PUBLIC RESPONSE CACHE
+    # ===========================================
+    # Anonymous responses of the public browse routes (/endpoints/public,
+    # /trending, /public/owners, /{owner} and /{owner}/{slug}) are cached per
+    # worker and, optionally, in Redis so every worker shares them. Endpoint
+    # writes invalidate both tiers; the in-process TTL bounds how long writes
+    # made by other workers take to show up when Redis is disabled.
+
+    public_response_cache_ttl_seconds: int = Field(
+        default=10,
+        description=(
+            "Lifetime of in-process cached anonymous responses, in seconds. "
+            "Set to 0 to disable the public response cache."
+        ),
+    )
+    public_response_cache_max_entries: int = Field(
+        default=1024,
+        description="Maximum anonymous responses kept in each worker's cache",
+    )
+    public_response_cache_redis_enabled: bool = Field(
+        default=False,
+        description="Share cached anonymous responses between workers via Redis",
+    )
+    public_response_cache_redis_ttl_seconds: int = Field(
+        default=60,
+        description="Lifetime of anonymous responses cached in Redis, in seconds",
+    )
+
+    # ===========================================
+    # SSRF PROTECTION
+    # ===========================================
+    # Owner domains are resolved once per TTL for the SSRF check, and proxied
+    # invocations connect to the validated address instead of resolving again.
+
+    ssrf_dns_cache_ttl_seconds: int = Field(
+        default=60,
+        description=(
+            "How long a validated owner-domain resolution is reused, in seconds. "
+            "Set to 0 to resolve on every invocation."
+        ),
+    )
+
     # ===========================================
     # RAG / MEILISEARCH SETTINGS
     # ===========================================
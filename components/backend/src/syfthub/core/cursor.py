@@ -0,0 +1,79 @@
+"""Opaque cursors for keyset (seek) pagination.
+
+A cursor carries the sort key of the last row a client has seen, so the next
+page is read with ``WHERE (sort_key, id) < (:last_key, :last_id)`` against a
+matching composite index instead of ``OFFSET``. Every page then costs the same
+index seek, however deep into the listing it is.
+
+Cursors are URL-safe base64 of a small JSON document tagged with the listing
+kind, so a cursor from one listing cannot be replayed against another. A
+listing whose rows depend on a parameter (the search term) also binds its
+cursors to a scope string derived from it, so a cursor is rejected when that
+parameter changes.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+
+class InvalidCursorError(ValueError):
+    """Raised when a pagination cursor is malformed or for another listing."""
+
+
+def encode_cursor(kind: str, values: Sequence[Any], scope: Optional[str] = None) -> str:
+    """Encode a listing's last-seen sort key as an opaque cursor.
+
+    Args:
+        kind: Listing identifier (e.g. ``"updated"`` or ``"stars"``)
+        values: Sort key of the last row; datetimes are stored as ISO 8601
+        scope: Optional value the listing's parameters reduce to; the cursor
+            is only accepted for the same scope
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload: dict[str, Any] = {
+        "k": kind,
+        "v": [v.isoformat() if isinstance(v, datetime) else v for v in values],
+    }
+    if scope is not None:
+        payload["s"] = scope
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str, kind: str, scope: Optional[str] = None) -> list[Any]:
+    """Decode a cursor produced by :func:`encode_cursor` for ``kind``.
+
+    Args:
+        cursor: Cursor string from a previous page
+        kind: Listing identifier the cursor must belong to
+        scope: Scope the cursor must have been encoded with
+
+    Returns:
+        The encoded sort key values (datetimes still as ISO 8601 strings)
+
+    Raises:
+        InvalidCursorError: If the cursor cannot be decoded or is for another kind
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError, binascii.Error) as e:
+        raise InvalidCursorError("Malformed pagination cursor") from e
+
+    if (
+        not isinstance(payload, dict)
+        or payload.get("k") != kind
+        or payload.get("s") != scope
+    ):
+        raise InvalidCursorError("Pagination cursor does not match this listing")
+    values = payload.get("v")
+    if not isinstance(values, list):
+        raise InvalidCursorError("Malformed pagination cursor")
+    return values
@@ -3,11 +3,18 @@
 This module provides functions to sanitize HTML output from markdown conversion
 to prevent stored XSS vulnerabilities. It uses the bleach library to allow only
 safe HTML tags and attributes.
+
+Endpoint READMEs are rendered once, when they are written, and stored with a
+digest of their markdown (see ``EndpointModel``), so page views never run the
+markdown converter or the sanitizer.
 """
 
 from __future__ import annotations
 
+import hashlib
+
 import bleach  # type: ignore[import-untyped]
+import markdown
 
 # Allowed HTML tags for markdown README content
 # These tags are safe and commonly produced by markdown conversion
@@ -133,3 +140,23 @@ def sanitize_readme_html(html: str) -> str:
         strip=False,  # Don't strip disallowed tags, escape them instead
     )
     return result
+
+
+def readme_digest(readme: str) -> str:
+    """Return the SHA-256 hex digest identifying a README's markdown source."""
+    return hashlib.sha256(readme.encode("utf-8")).hexdigest()
+
+
+def render_readme_html(readme: str) -> str:
+    """Convert README markdown to sanitized HTML.
+
+    Args:
+        readme: Markdown source of the README
+
+    Returns:
+        Sanitized HTML safe for rendering in templates ("" for a blank README)
+    """
+    if not readme or not readme.strip():
+        return ""
+    raw_html = markdown.markdown(readme, extensions=["codehilite", "fenced_code"])
+    return sanitize_readme_html(raw_html)
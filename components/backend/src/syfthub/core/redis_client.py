@@ -2,6 +2,7 @@
 
 from typing import Optional
 
+import redis
 from redis.asyncio import Redis
 
 from syfthub.core.config import get_settings
@@ -9,6 +10,9 @@ from syfthub.core.config import get_settings
 # Global Redis client instance (singleton)
 _redis_client: Optional[Redis] = None
 
+# Blocking client for code running in sync routes and worker threads
+_sync_redis_client: Optional[redis.Redis] = None
+
 
 async def get_redis_client() -> Redis:
     """Get or create the Redis client instance.
@@ -33,15 +37,39 @@ async def get_redis_client() -> Redis:
     return _redis_client
 
 
+def get_sync_redis_client() -> redis.Redis:
+    """Get or create the blocking Redis client instance.
+
+    Sync routes run in the threadpool and cannot await the async client, so
+    they share this one. Values are returned as bytes.
+
+    Returns:
+        redis.Redis: The blocking Redis client.
+    """
+    global _sync_redis_client
+    if _sync_redis_client is None:
+        settings = get_settings()
+        _sync_redis_client = redis.Redis.from_url(
+            settings.redis_url,
+            # Callers treat Redis as an optional tier; keep failures fast
+            socket_timeout=0.5,
+            socket_connect_timeout=0.5,
+        )
+    return _sync_redis_client
+
+
 async def close_redis_client() -> None:
-    """Close the Redis client connection.
+    """Close the Redis client connections.
 
     Should be called during application shutdown.
     """
-    global _redis_client
+    global _redis_client, _sync_redis_client
     if _redis_client is not None:
         await _redis_client.close()
         _redis_client = None
+    if _sync_redis_client is not None:
+        _sync_redis_client.close()
+        _sync_redis_client = None
 
 
 async def check_redis_health() -> bool:
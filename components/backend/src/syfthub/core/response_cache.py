@@ -0,0 +1,374 @@
+"""Shared cache for anonymous responses of the public browse routes.
+
+Anonymous visitors of ``/endpoints/public``, ``/endpoints/trending``,
+``/endpoints/public/owners``, ``/{owner}`` and ``/{owner}/{slug}`` all get
+the same payload for the same query, so it is rendered once and the encoded
+body is served to everyone until something changes.
+
+Design choices:
+- **Keyed on the validated parameters.** Routes pass the values FastAPI has
+  already parsed, so ``?limit=10`` and no ``limit`` share one entry and
+  unknown query parameters cannot fragment the cache. Only anonymous requests
+  are cached; signed-in viewers may see private or targeted data.
+- **Two tiers.** Each worker keeps an LRU of recent responses. With
+  ``public_response_cache_redis_enabled`` the encoded responses are also
+  stored in Redis, so one worker's render serves every worker. Redis is
+  optional: errors are logged and the cache falls back to the local tier,
+  backing off briefly so an outage does not add latency to every request.
+- **Generation-based invalidation.** Endpoint writes call
+  :func:`invalidate_public_responses`, which bumps a generation counter (and
+  its Redis twin). Entries rendered under an older generation are ignored, so
+  a render that races a write is never served afterwards. Other workers'
+  local tiers catch up within ``public_response_cache_ttl_seconds``.
+- **Miss coalescing.** Concurrent misses for one key wait on a per-key lock,
+  so only the first request queries the database and the rest reuse it.
+- **Metrics.** Hits (per tier) and misses are counted per route
+  (:meth:`PublicResponseCache.stats`) and reported to clients in an
+  ``X-Cache`` header.
+"""
+
+from __future__ import annotations
+
+import json
+import threading
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from enum import Enum
+from typing import Any, Optional
+
+import redis
+from fastapi import Response, status
+
+from syfthub.core.config import settings
+from syfthub.core.redis_client import get_sync_redis_client
+from syfthub.observability.logger import get_logger
+
+logger = get_logger(__name__)
+
+CACHE_STATUS_HEADER = "X-Cache"
+
+_REDIS_KEY_PREFIX = "public-cache:"
+_REDIS_GENERATION_KEY = "public-cache:generation"
+# How long to skip Redis after an error before trying it again
+_REDIS_BACKOFF_SECONDS = 5.0
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """An encoded response body plus the headers needed to replay it."""
+
+    body: bytes
+    media_type: Optional[str]
+    headers: dict[str, str]
+
+    @classmethod
+    def from_response(cls, response: Response) -> CachedResponse:
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower() not in ("content-length", "content-type")
+        }
+        return cls(
+            body=bytes(response.body),
+            media_type=response.media_type,
+            headers=headers,
+        )
+
+    def to_response(self, cache_status: str) -> Response:
+        return Response(
+            content=self.body,
+            media_type=self.media_type,
+            headers={**self.headers, CACHE_STATUS_HEADER: cache_status},
+        )
+
+    def dumps(self, generation: int) -> bytes:
+        return json.dumps(
+            {
+                "g": generation,
+                "m": self.media_type,
+                "h": self.headers,
+                "b": self.body.decode("utf-8"),
+            }
+        ).encode()
+
+    @classmethod
+    def loads(cls, raw: bytes | str) -> tuple[int, CachedResponse]:
+        data = json.loads(raw)
+        return data["g"], cls(
+            body=data["b"].encode("utf-8"), media_type=data["m"], headers=data["h"]
+        )
+
+
+@dataclass(frozen=True)
+class _LocalEntry:
+    response: CachedResponse
+    generation: int
+    expires_at: float
+
+
+def make_cache_key(route: str, params: Mapping[str, Any]) -> str:
+    """Build a cache key from a route name and its validated parameters.
+
+    ``None`` values are dropped and the rest sorted by name, so requests that
+    differ only in parameter order or omitted defaults share an entry.
+    """
+    normalized = sorted(
+        (name, value.value if isinstance(value, Enum) else value)
+        for name, value in params.items()
+        if value is not None
+    )
+    return f"{route}?{json.dumps(normalized, separators=(',', ':'), default=str)}"
+
+
+class PublicResponseCache:
+    """Two-tier, thread-safe cache of anonymous public responses."""
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int,
+        redis_enabled: bool = False,
+        redis_ttl_seconds: int = 60,
+    ) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: Lifetime of in-process entries. 0 or less disables
+                the cache (every request is rendered).
+            max_entries: Maximum in-process entries, evicted least recently used
+            redis_enabled: Also share entries between workers through Redis
+            redis_ttl_seconds: Lifetime of entries stored in Redis
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.redis_enabled = redis_enabled
+        self.redis_ttl_seconds = redis_ttl_seconds
+        self._entries: OrderedDict[str, _LocalEntry] = OrderedDict()
+        self._generation = 0
+        self._stats: Counter[tuple[str, str]] = Counter()
+        # Guards _entries, _generation, _stats and _key_locks
+        self._lock = threading.Lock()
+        # Per-key locks (with waiter counts) used to coalesce misses
+        self._key_locks: dict[str, tuple[threading.Lock, int]] = {}
+        self._redis_retry_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get_or_render(
+        self, route: str, params: Mapping[str, Any], render: Callable[[], Response]
+    ) -> Response:
+        """Serve a cached response, rendering and storing it on a miss.
+
+        Only ``200 OK`` responses are stored; errors raised by ``render``
+        propagate uncached.
+
+        Args:
+            route: Stable route name, used in the key and the metrics
+            params: The route's validated query and path parameters
+            render: Builds the response for an anonymous viewer
+
+        Returns:
+            The response, with an ``X-Cache: HIT`` or ``MISS`` header
+        """
+        if not self.enabled:
+            return render()
+
+        key = make_cache_key(route, params)
+        cached, tier = self._lookup(key)
+        if cached is not None:
+            self._count(route, f"hit_{tier}")
+            return cached.to_response("HIT")
+
+        with self._key_lock(key):
+            # Another request may have rendered this key while we waited
+            cached, tier = self._lookup(key)
+            if cached is not None:
+                self._count(route, f"hit_{tier}")
+                return cached.to_response("HIT")
+
+            with self._lock:
+                generation = self._generation
+            shared_generation = self._redis_generation()
+
+            response = render()
+            self._count(route, "miss")
+            if response.status_code != status.HTTP_200_OK:
+                return response
+
+            cached = CachedResponse.from_response(response)
+            self._store_local(key, cached, generation)
+            if shared_generation is not None:
+                self._store_shared(key, cached, shared_generation)
+            response.headers[CACHE_STATUS_HEADER] = "MISS"
+            return response
+
+    def invalidate(self) -> None:
+        """Drop every cached response, locally and in Redis."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+        if self._redis_available():
+            try:
+                get_sync_redis_client().incr(_REDIS_GENERATION_KEY)
+            except redis.RedisError as e:
+                self._redis_failed(e)
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        """Return hit and miss counts per route.
+
+        Outcomes are ``hit_local``, ``hit_shared`` and ``miss``.
+        """
+        with self._lock:
+            result: dict[str, dict[str, int]] = {}
+            for (route, outcome), count in self._stats.items():
+                result.setdefault(route, {})[outcome] = count
+            return result
+
+    def _count(self, route: str, outcome: str) -> None:
+        with self._lock:
+            self._stats[(route, outcome)] += 1
+
+    def _lookup(self, key: str) -> tuple[Optional[CachedResponse], str]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.generation == self._generation and entry.expires_at > now:
+                    self._entries.move_to_end(key)
+                    return entry.response, "local"
+                del self._entries[key]
+            generation = self._generation
+
+        shared = self._lookup_shared(key)
+        if shared is None:
+            return None, ""
+        # Promote to the local tier so the next hit skips Redis
+        self._store_local(key, shared, generation)
+        return shared, "shared"
+
+    def _store_local(self, key: str, cached: CachedResponse, generation: int) -> None:
+        with self._lock:
+            if generation != self._generation:
+                # Invalidated while rendering; the response may be stale
+                return
+            self._entries[key] = _LocalEntry(
+                response=cached,
+                generation=generation,
+                expires_at=time.monotonic() + self.ttl_seconds,
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _lookup_shared(self, key: str) -> Optional[CachedResponse]:
+        if not self._redis_available():
+            return None
+        try:
+            raw_generation, raw = get_sync_redis_client().mget(
+                _REDIS_GENERATION_KEY, _REDIS_KEY_PREFIX + key
+            )
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return None
+        if raw is None:
+            return None
+        try:
+            stored_generation, cached = CachedResponse.loads(raw)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Discarding unreadable cached response for {key}: {e}")
+            return None
+        if stored_generation != int(raw_generation or 0):
+            return None
+        return cached
+
+    def _redis_generation(self) -> Optional[int]:
+        """Read the shared generation before rendering (None if unavailable)."""
+        if not self._redis_available():
+            return None
+        try:
+            return int(get_sync_redis_client().get(_REDIS_GENERATION_KEY) or 0)
+        except redis.RedisError as e:
+            self._redis_failed(e)
+            return None
+
+    def _store_shared(self, key: str, cached: CachedResponse, generation: int) -> None:
+        try:
+            get_sync_redis_client().set(
+                _REDIS_KEY_PREFIX + key,
+                cached.dumps(generation),
+                ex=self.redis_ttl_seconds,
+            )
+        except redis.RedisError as e:
+            self._redis_failed(e)
+
+    def _redis_available(self) -> bool:
+        return self.redis_enabled and time.monotonic() >= self._redis_retry_at
+
+    def _redis_failed(self, error: Exception) -> None:
+        self._redis_retry_at = time.monotonic() + _REDIS_BACKOFF_SECONDS
+        logger.warning(
+            f"Public response cache Redis tier unavailable, using local tier "
+            f"for {_REDIS_BACKOFF_SECONDS:.0f}s: {error}"
+        )
+
+    @contextmanager
+    def _key_lock(self, key: str) -> Iterator[None]:
+        """Hold the lock for one key, dropping it once nobody waits on it."""
+        with self._lock:
+            lock, waiters = self._key_locks.get(key, (threading.Lock(), 0))
+            self._key_locks[key] = (lock, waiters + 1)
+        try:
+            with lock:
+                yield
+        finally:
+            with self._lock:
+                lock, waiters = self._key_locks[key]
+                if waiters == 1:
+                    del self._key_locks[key]
+                else:
+                    self._key_locks[key] = (lock, waiters - 1)
+
+
+_cache: Optional[PublicResponseCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_public_response_cache() -> PublicResponseCache:
+    """Get the process-wide public response cache."""
+    global _cache
+
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = PublicResponseCache(
+                    ttl_seconds=settings.public_response_cache_ttl_seconds,
+                    max_entries=settings.public_response_cache_max_entries,
+                    redis_enabled=settings.public_response_cache_redis_enabled,
+                    redis_ttl_seconds=settings.public_response_cache_redis_ttl_seconds,
+                )
+
+    return _cache
+
+
+def cached_public_response(
+    route: str, params: Mapping[str, Any], render: Callable[[], Response]
+) -> Response:
+    """Serve an anonymous public response through the shared cache."""
+    return get_public_response_cache().get_or_render(route, params, render)
+
+
+def invalidate_public_responses() -> None:
+    """Drop every cached anonymous response after a public-facing write."""
+    get_public_response_cache().invalidate()
+
+
+def reset_public_response_cache() -> None:
+    """Discard the process-wide cache (used by tests)."""
+    global _cache
+    with _cache_lock:
+        _cache = None
@@ -4,16 +4,32 @@ This module provides functions to validate domains and IP addresses
 to prevent SSRF attacks where an attacker could force the server to
 make requests to internal services, cloud metadata endpoints, or
 other sensitive resources.
+
+Domain resolutions are cached for ``ssrf_dns_cache_ttl_seconds`` so proxied
+invocations don't pay a blocking DNS round-trip each time.
+``validate_domain_for_ssrf`` returns the IP address it validated, and callers
+connect to that exact address. Without that pinning, a second lookup by the
+HTTP client could be answered with a different (internal) address, which is
+the DNS-rebinding attack. The pinning happens at connect time
+(``PinnedNetworkBackend``), so URLs, pooling, SNI and certificate checks all
+keep using the real hostname.
 """
 
 from __future__ import annotations
 
 import ipaddress
 import socket
-from typing import Union
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Optional, Union
 
+import httpcore
+import httpx
 from fastapi import HTTPException, status
 
+from syfthub.core.config import settings
 from syfthub.observability import get_logger
 
 logger = get_logger(__name__)
@@ -124,16 +140,118 @@ def resolve_domain_to_ip(domain: str) -> str:
         ) from e
 
 
-def validate_domain_for_ssrf(domain: str) -> None:
+class DNSResolutionCache:
+    """Thread-safe, TTL-bounded cache of domain resolutions.
+
+    Only successful resolutions are cached; the blocked-range check is applied
+    to every use, so a cached address is never trusted without re-checking.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: int = 4096) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            ttl_seconds: How long a resolution is reused. 0 or less disables
+                caching (every call resolves).
+            max_entries: Maximum cached hostnames, evicted least recently used
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+        self._hits = 0
+        self._misses = 0
+        self._lookup_ms_total = 0.0
+        self._lookup_ms_max = 0.0
+        self._lock = threading.Lock()
+
+    def resolve(self, domain: str) -> str:
+        """Resolve a domain (optionally with port) through the cache.
+
+        Raises:
+            HTTPException: If the domain cannot be resolved
+        """
+        hostname = (domain.split(":")[0] if ":" in domain else domain).lower()
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(hostname)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(hostname)
+                self._hits += 1
+                return entry[0]
+
+        started = time.perf_counter()
+        try:
+            ip = resolve_domain_to_ip(hostname)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            with self._lock:
+                self._misses += 1
+                self._lookup_ms_total += elapsed_ms
+                self._lookup_ms_max = max(self._lookup_ms_max, elapsed_ms)
+        logger.debug(
+            "ssrf.dns_resolved",
+            domain=hostname,
+            resolved_ip=ip,
+            duration_ms=round(elapsed_ms, 2),
+        )
+
+        if self.ttl_seconds > 0:
+            with self._lock:
+                self._entries[hostname] = (ip, time.monotonic() + self.ttl_seconds)
+                self._entries.move_to_end(hostname)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return ip
+
+    def stats(self) -> dict[str, float]:
+        """Return hit and miss counts and DNS lookup latency (milliseconds)."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "lookup_ms_total": round(self._lookup_ms_total, 2),
+                "lookup_ms_max": round(self._lookup_ms_max, 2),
+            }
+
+
+_dns_cache: Optional[DNSResolutionCache] = None
+_dns_cache_lock = threading.Lock()
+
+
+def get_dns_cache() -> DNSResolutionCache:
+    """Get the process-wide DNS resolution cache."""
+    global _dns_cache
+
+    if _dns_cache is None:
+        with _dns_cache_lock:
+            if _dns_cache is None:
+                _dns_cache = DNSResolutionCache(settings.ssrf_dns_cache_ttl_seconds)
+
+    return _dns_cache
+
+
+def reset_dns_cache() -> None:
+    """Discard the process-wide DNS cache (used by tests)."""
+    global _dns_cache
+    with _dns_cache_lock:
+        _dns_cache = None
+
+
+def validate_domain_for_ssrf(domain: str) -> str:
     """Validate that a domain does not resolve to a blocked IP address.
 
-    This function performs DNS resolution and checks if the resolved IP
-    is in any of the blocked ranges (private networks, localhost, cloud
-    metadata services, etc.).
+    This function performs DNS resolution (through the TTL-bounded cache)
+    and checks if the resolved IP is in any of the blocked ranges (private
+    networks, localhost, cloud metadata services, etc.).
 
     Args:
         domain: The domain to validate (without protocol)
 
+    Returns:
+        The validated IP address. Connect to this address rather than
+        resolving the domain again, so the check cannot be bypassed by DNS
+        rebinding.
+
     Raises:
         HTTPException: If the domain resolves to a blocked IP or cannot be resolved
 
@@ -171,13 +289,13 @@ def validate_domain_for_ssrf(domain: str) -> None:
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Access to internal or private IP addresses is not allowed",
             )
-        return  # IP is safe
+        return str(ip)  # IP is safe
     except ValueError:
         # Not an IP address, need to resolve the domain
         pass
 
     # Resolve the domain to an IP
-    resolved_ip_str = resolve_domain_to_ip(clean_domain)
+    resolved_ip_str = get_dns_cache().resolve(clean_domain)
 
     try:
         resolved_ip = ipaddress.ip_address(resolved_ip_str)
@@ -208,3 +326,116 @@ def validate_domain_for_ssrf(domain: str) -> None:
         domain=domain,
         resolved_ip=str(resolved_ip),
     )
+    return str(resolved_ip)
+
+
+class PinnedNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Network backend that connects pinned hostnames to their validated IP.
+
+    Request URLs keep their hostname, so the connection pool keys connections
+    by hostname and TLS uses it for SNI and certificate verification. Only the
+    TCP connect is redirected to the address ``validate_domain_for_ssrf``
+    returned for that hostname. Hostnames that were never pinned are resolved
+    by the wrapped backend as usual.
+    """
+
+    def __init__(
+        self,
+        backend: Optional[httpcore.AsyncNetworkBackend] = None,
+        max_entries: int = 4096,
+    ) -> None:
+        """Initialize with no pinned hostnames.
+
+        Args:
+            backend: Backend that opens the connections (default: anyio)
+            max_entries: Maximum pinned hostnames, evicted least recently used
+        """
+        self._backend = backend or httpcore.AnyIOBackend()
+        self.max_entries = max_entries
+        self._pins: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def pin(self, hostname: str, ip: str) -> None:
+        """Connect to ``ip`` whenever a new connection to ``hostname`` is opened."""
+        with self._lock:
+            self._pins[hostname.lower()] = ip
+            self._pins.move_to_end(hostname.lower())
+            while len(self._pins) > self.max_entries:
+                self._pins.popitem(last=False)
+
+    def pinned_ip(self, hostname: str) -> Optional[str]:
+        """Return the address a hostname is pinned to, if any."""
+        with self._lock:
+            return self._pins.get(hostname.lower())
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: Optional[float] = None,
+        local_address: Optional[str] = None,
+        socket_options: Optional[Iterable[httpcore.SOCKET_OPTION]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Open a TCP connection, to the pinned address when there is one."""
+        return await self._backend.connect_tcp(
+            self.pinned_ip(host) or host,
+            port,
+            timeout=timeout,
+            local_address=local_address,
+            socket_options=socket_options,
+        )
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: Optional[float] = None,
+        socket_options: Optional[Iterable[httpcore.SOCKET_OPTION]] = None,
+    ) -> httpcore.AsyncNetworkStream:
+        """Open a Unix socket connection through the wrapped backend."""
+        return await self._backend.connect_unix_socket(
+            path, timeout=timeout, socket_options=socket_options
+        )
+
+    async def sleep(self, seconds: float) -> None:
+        """Sleep through the wrapped backend."""
+        await self._backend.sleep(seconds)
+
+
+_pinned_backend: Optional[PinnedNetworkBackend] = None
+_pinned_backend_lock = threading.Lock()
+
+
+def get_pinned_network_backend() -> PinnedNetworkBackend:
+    """Get the process-wide backend used by outbound HTTP clients."""
+    global _pinned_backend
+
+    if _pinned_backend is None:
+        with _pinned_backend_lock:
+            if _pinned_backend is None:
+                _pinned_backend = PinnedNetworkBackend()
+
+    return _pinned_backend
+
+
+def create_pinned_http_client(
+    *,
+    timeout: Union[httpx.Timeout, float],
+    limits: httpx.Limits = httpx.Limits(
+        max_connections=100, max_keepalive_connections=20
+    ),
+) -> httpx.AsyncClient:
+    """Create an HTTP client whose connections honour pinned addresses.
+
+    httpx has no option for a custom network backend, so the transport's
+    connection pool is rebuilt with the same settings on top of
+    ``get_pinned_network_backend()``.
+    """
+    transport = httpx.AsyncHTTPTransport(limits=limits)
+    transport._pool = httpcore.AsyncConnectionPool(
+        ssl_context=httpx.create_ssl_context(),
+        max_connections=limits.max_connections,
+        max_keepalive_connections=limits.max_keepalive_connections,
+        keepalive_expiry=limits.keepalive_expiry,
+        network_backend=get_pinned_network_backend(),
+    )
+    return httpx.AsyncClient(timeout=timeout, limits=limits, transport=transport)
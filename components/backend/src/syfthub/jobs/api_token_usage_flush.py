@@ -0,0 +1,97 @@
+"""API token usage flush background job.
+
+Periodically writes the API token uses buffered by authentication
+(:mod:`syfthub.auth.api_token_usage`) to the database with one bulk UPDATE,
+and once more on shutdown. Uses that fail to write are put back and retried
+on the next cycle.
+
+Multi-worker safety:
+    Every worker flushes its own buffer. The UPDATE only moves
+    ``last_used_at`` forward, so workers flushing in any order leave each
+    token with its most recent use.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import TYPE_CHECKING
+
+from syfthub.auth.api_token_usage import get_api_token_usage_buffer
+from syfthub.database.connection import db_manager
+from syfthub.repositories.api_token import APITokenRepository
+
+if TYPE_CHECKING:
+    from syfthub.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+
+class APITokenUsageFlushJob:
+    """Background job that writes buffered API token usage to the database."""
+
+    def __init__(self, settings: Settings) -> None:
+        self.interval = settings.api_token_last_used_flush_interval_seconds
+        self._running = False
+
+    async def run_flush_cycle(self) -> None:
+        """Run a single flush cycle, offloaded to a worker thread."""
+        await asyncio.to_thread(self._run_flush_cycle_sync)
+
+    def _run_flush_cycle_sync(self) -> None:
+        """Write every buffered use in one bulk UPDATE (blocking DB work)."""
+        buffer = get_api_token_usage_buffer()
+        usages = buffer.drain()
+        if not usages:
+            return
+
+        written = False
+        try:
+            session = db_manager.get_session()
+            try:
+                written = APITokenRepository(session).bulk_update_last_used(usages)
+            finally:
+                session.close()
+        except Exception as e:
+            logger.error(f"API token usage flush failed: {e}", exc_info=True)
+
+        if written:
+            logger.debug(f"API token usage flush: wrote {len(usages)} token(s)")
+        else:
+            logger.warning(
+                f"API token usage flush failed; retrying {len(usages)} token(s) "
+                f"next cycle"
+            )
+            buffer.restore(usages)
+
+    async def start(self) -> None:
+        """Start the flush background loop."""
+        self._running = True
+        logger.info(f"Starting API token usage flush job (interval: {self.interval}s)")
+
+        while self._running:
+            cycle_start = time.monotonic()
+            try:
+                await self.run_flush_cycle()
+            except asyncio.CancelledError:
+                logger.info("API token usage flush cycle cancelled")
+                break
+            except Exception as e:
+                logger.error(f"API token usage flush cycle failed: {e}", exc_info=True)
+
+            elapsed = time.monotonic() - cycle_start
+            sleep_for = max(0.0, self.interval - elapsed)
+            try:
+                await asyncio.sleep(sleep_for)
+            except asyncio.CancelledError:
+                logger.info("API token usage flush sleep cancelled")
+                break
+
+        logger.info("API token usage flush job stopped")
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write whatever is still buffered."""
+        logger.info("Stopping API token usage flush job...")
+        self._running = False
+        await self.run_flush_cycle()
@@ -26,17 +26,19 @@ import asyncio
 import contextlib
 import logging
 import time
+from collections.abc import Iterator
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import case, select, text, update
+from sqlalchemy import case, or_, select, text, update
 from sqlalchemy.sql import label
-from sqlalchemy.sql.expression import literal
 
+from syfthub.core.response_cache import invalidate_public_responses
 from syfthub.database.connection import db_manager
 from syfthub.models.endpoint import EndpointModel
 from syfthub.models.user import UserModel
+from syfthub.services.directory_snapshot import invalidate_directory_owners
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -50,6 +52,15 @@ logger = logging.getLogger(__name__)
 # multi-worker deployments (e.g., uvicorn --workers 4).
 HEALTH_MONITOR_LOCK_ID = 839201
 
+# Maximum endpoint IDs per bulk UPDATE/INSERT statement. Keeps bind parameter
+# counts well below driver limits (SQLite: 32766, asyncpg/psycopg: 65535).
+HEALTH_UPDATE_CHUNK_SIZE = 5000
+
+
+def _chunks(ids: list[int]) -> Iterator[list[int]]:
+    for start in range(0, len(ids), HEALTH_UPDATE_CHUNK_SIZE):
+        yield ids[start : start + HEALTH_UPDATE_CHUNK_SIZE]
+
 
 @dataclass
 class EndpointHealthInfo:
@@ -271,68 +282,70 @@ class EndpointHealthMonitor:
         logger.debug(f"Endpoint {endpoint.id}: no fresh health signal (unhealthy)")
         return (endpoint.id, False)
 
-    def _update_endpoint_health_status(
-        self, session: Session, endpoint_id: int, is_healthy: bool
-    ) -> tuple[bool, int] | None:
-        """Atomically update endpoint health status with failure tracking.
+    def _apply_health_results(
+        self, session: Session, results: dict[int, bool]
+    ) -> dict[int, tuple[bool, int]]:
+        """Apply one cycle's health results with set-based UPDATEs.
 
-        Uses a single atomic UPDATE with CASE expressions to:
-        1. Reset consecutive_failure_count to 0 if healthy
-        2. Increment consecutive_failure_count if unhealthy
-        3. Set is_active=True if healthy
-        4. Set is_active=False only if failure count reaches threshold
+        Endpoints are partitioned by result, so a handful of statements cover
+        the whole cycle (one per chunk of ``HEALTH_UPDATE_CHUNK_SIZE`` IDs):
 
-        This is multi-worker safe because all state is managed in the database
-        atomically, not in memory.
+        1. Healthy: reset consecutive_failure_count to 0 and set is_active=True.
+           Rows already in that state are skipped, so a steady fleet of
+           healthy endpoints writes nothing.
+        2. Unhealthy: increment consecutive_failure_count and set
+           is_active=False once the incremented count reaches the threshold.
+
+        All state is managed in the database, so this stays multi-worker safe.
+        Does NOT commit — the caller owns the cycle's transaction.
 
         Args:
-            session: Database session to use for the update
-            endpoint_id: ID of the endpoint to update
-            is_healthy: Whether the endpoint is currently healthy
+            session: Database session to use for the updates
+            results: Endpoint ID -> whether the endpoint is currently healthy
 
         Returns:
-            Tuple of (new_is_active, new_failure_count) if successful,
-            None if the endpoint was not found
+            Endpoint ID -> (new_is_active, new_failure_count) for every row
+            written. Healthy endpoints that needed no write, and endpoints
+            deleted since they were read, are absent.
         """
-        try:
-            # Build atomic UPDATE with CASE expressions
-            # Note: The CASE for is_active checks (count + 1) >= threshold because
-            # the increment happens in the same statement
-            stmt = (
-                update(EndpointModel)
-                .where(EndpointModel.id == endpoint_id)
-                .values(
-                    consecutive_failure_count=case(
-                        (literal(is_healthy), 0),
-                        else_=EndpointModel.consecutive_failure_count + 1,  # type: ignore[operator]
-                    ),
-                    is_active=case(
-                        (literal(is_healthy), True),
-                        (
-                            EndpointModel.consecutive_failure_count + 1  # type: ignore[operator]
-                            >= self.failure_threshold,
-                            False,
-                        ),
-                        else_=EndpointModel.is_active,
-                    ),
-                )
-                .returning(
-                    EndpointModel.is_active, EndpointModel.consecutive_failure_count
-                )
+        healthy_ids = [eid for eid, ok in results.items() if ok]
+        unhealthy_ids = [eid for eid, ok in results.items() if not ok]
+        failure_count = EndpointModel.consecutive_failure_count
+        written: dict[int, tuple[bool, int]] = {}
+
+        statements = [
+            update(EndpointModel)
+            .where(
+                EndpointModel.id.in_(chunk),
+                or_(failure_count != 0, EndpointModel.is_active.is_(False)),
             )
-            result = session.execute(stmt)
-            row = result.fetchone()
-            session.commit()
+            .values(consecutive_failure_count=0, is_active=True)
+            for chunk in _chunks(healthy_ids)
+        ]
+        # Note: The CASE for is_active checks (count + 1) >= threshold because
+        # the increment happens in the same statement
+        statements.extend(
+            update(EndpointModel)
+            .where(EndpointModel.id.in_(chunk))
+            .values(
+                consecutive_failure_count=failure_count + 1,
+                is_active=case(
+                    (failure_count + 1 >= self.failure_threshold, False),
+                    else_=EndpointModel.is_active,
+                ),
+            )
+            for chunk in _chunks(unhealthy_ids)
+        )
 
-            if row:
-                is_active: bool = row[0]  # type: ignore[assignment]
-                failure_count: int = row[1]  # type: ignore[assignment]
-                return (is_active, failure_count)
-            return None
-        except Exception as e:
-            logger.error(f"Failed to update endpoint {endpoint_id} health status: {e}")
-            session.rollback()
-            return None
+        for stmt in statements:
+            result = session.execute(
+                stmt.returning(
+                    EndpointModel.id, EndpointModel.is_active, failure_count
+                ).execution_options(synchronize_session=False)
+            )
+            for endpoint_id, is_active, count in result:
+                written[endpoint_id] = (is_active, count)
+        return written
 
     def _current_bucket_start(self, now: datetime) -> datetime:
         """Return the UTC bucket boundary that ``now`` falls into."""
@@ -340,33 +353,6 @@ class EndpointHealthMonitor:
         floored = (epoch // self.bucket_seconds) * self.bucket_seconds
         return datetime.fromtimestamp(floored, tz=timezone.utc)
 
-    def _emit_uptime_sample(
-        self,
-        session: Session,
-        endpoint_id: int,
-        is_healthy: bool,
-        now: datetime,
-    ) -> None:
-        """Persist one uptime sample for this cycle, swallowing errors.
-
-        The sample is bucketed by ``self.bucket_seconds`` so a single bucket
-        accumulates many monitor cycles (e.g. 60 cycles per 30-minute bucket
-        at the default 30s interval).
-        """
-        from syfthub.repositories.endpoint import EndpointRepository
-
-        try:
-            repo = EndpointRepository(session)
-            repo.upsert_uptime_sample(
-                endpoint_id=endpoint_id,
-                bucket_start=self._current_bucket_start(now),
-                is_healthy=is_healthy,
-            )
-        except Exception as e:  # pragma: no cover - defensive
-            logger.warning(
-                f"Failed to record uptime sample for endpoint {endpoint_id}: {e}"
-            )
-
     def _maybe_run_uptime_retention(self, session: Session, now: datetime) -> None:
         """Delete uptime samples older than the configured retention window.
 
@@ -399,7 +385,7 @@ class EndpointHealthMonitor:
         """Run one health check cycle, offloaded to a worker thread.
 
         The cycle body is fully synchronous (blocking SQLAlchemy: advisory lock,
-        full endpoint scan, per-row commits). Running it inline would block the
+        full endpoint scan, bulk updates). Running it inline would block the
         shared event loop for the whole cycle, so it is dispatched to a thread.
         """
         await asyncio.to_thread(self._run_health_check_cycle_sync)
@@ -410,9 +396,13 @@ class EndpointHealthMonitor:
         This method:
         1. Queries all endpoints with their owner's domain and per-endpoint health
         2. Evaluates each endpoint from the client-reported per-endpoint health
-        3. Atomically updates is_active status and failure counts in the database
-           (multi-worker safe - no in-memory state)
+        3. Updates is_active status and failure counts with set-based UPDATEs
+           and records every uptime sample with one bulk upsert, in a single
+           transaction (multi-worker safe - no in-memory state)
         """
+        from syfthub.repositories.endpoint import EndpointRepository
+
+        cycle_start = time.monotonic()
         session = db_manager.get_session()
         try:
             # Acquire advisory lock to prevent multiple workers from running
@@ -436,65 +426,76 @@ class EndpointHealthMonitor:
 
             logger.debug(f"Starting health check for {len(endpoints)} endpoints")
 
-            # Build a map of endpoint_id -> old_is_active for state change detection
-            old_status_map = {ep.id: ep.is_active for ep in endpoints}
-
             # Evaluate each endpoint's health (no I/O — purely signal-based)
             now = datetime.now(timezone.utc)
-            state_changes = 0
-            for endpoint in endpoints:
-                endpoint_id, is_healthy = self._check_endpoint_health(endpoint)
+            results = dict(self._check_endpoint_health(ep) for ep in endpoints)
 
-                # Get the old status for comparison
-                old_is_active = old_status_map.get(endpoint_id, True)
-
-                # Atomically update failure count and status in database
-                update_result = self._update_endpoint_health_status(
-                    session, endpoint_id, is_healthy
+            # Failure counters, is_active and one uptime sample per endpoint
+            # (bucketed by self.bucket_seconds) are written in one transaction
+            try:
+                written = self._apply_health_results(session, results)
+                EndpointRepository(session).bulk_upsert_uptime_samples(
+                    bucket_start=self._current_bucket_start(now),
+                    results=results,
+                    chunk_size=HEALTH_UPDATE_CHUNK_SIZE,
                 )
+                session.commit()
+            except Exception as e:
+                logger.error(f"Failed to apply health check results: {e}")
+                session.rollback()
+                return
 
+            state_changes = 0
+            flipped_owner_ids: set[int] = set()
+            for endpoint in endpoints:
+                update_result = written.get(endpoint.id)
                 if update_result is None:
-                    # Endpoint was deleted between query and update
+                    # Already healthy and active, or deleted since the query
                     continue
 
-                # Record one uptime sample per cycle. Use a fresh session
-                # transaction (the failure-counter update above already
-                # committed) so an error here cannot poison the next loop.
-                self._emit_uptime_sample(session, endpoint_id, is_healthy, now)
-                try:
-                    session.commit()
-                except Exception as e:  # pragma: no cover - defensive
-                    logger.warning(
-                        f"Failed to commit uptime sample for endpoint "
-                        f"{endpoint_id}: {e}"
-                    )
-                    session.rollback()
-
                 new_is_active, failure_count = update_result
 
                 # Log state changes
-                if old_is_active != new_is_active:
+                if endpoint.is_active != new_is_active:
+                    flipped_owner_ids.add(endpoint.owner_id)
                     state_changes += 1
                     if new_is_active:
                         logger.info(
-                            f"Endpoint {endpoint_id} recovered, now active "
+                            f"Endpoint {endpoint.id} recovered, now active "
                             f"(failure count reset to 0)"
                         )
                     else:
                         logger.info(
-                            f"Endpoint {endpoint_id} marked inactive after "
+                            f"Endpoint {endpoint.id} marked inactive after "
                             f"{failure_count} consecutive failures "
                             f"(threshold: {self.failure_threshold})"
                         )
-                elif not is_healthy and failure_count < self.failure_threshold:
+                elif (
+                    not results[endpoint.id] and failure_count < self.failure_threshold
+                ):
                     # Still accumulating failures
                     logger.debug(
-                        f"Endpoint {endpoint_id} health check failed "
+                        f"Endpoint {endpoint.id} health check failed "
                         f"({failure_count}/{self.failure_threshold})"
                     )
 
             if state_changes > 0:
                 logger.info(f"Updated {state_changes} endpoint(s) status")
+                # Endpoints that went up or down enter or leave the directory
+                invalidate_directory_owners(flipped_owner_ids)
+                invalidate_public_responses()
+
+            elapsed = time.monotonic() - cycle_start
+            if elapsed > self.interval:
+                logger.warning(
+                    f"Health check cycle for {len(endpoints)} endpoints took "
+                    f"{elapsed:.1f}s (interval: {self.interval}s)"
+                )
+            else:
+                logger.debug(
+                    f"Health check cycle for {len(endpoints)} endpoints took "
+                    f"{elapsed:.3f}s"
+                )
 
         finally:
             session.close()
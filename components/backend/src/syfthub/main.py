@@ -2,17 +2,18 @@
 
 import asyncio
 import contextlib
+import ipaddress
 import time
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Annotated, Any, Optional, Union
 
 import httpx
-import markdown
-from fastapi import Depends, FastAPI, HTTPException, Query, Request, status
+from fastapi import Depends, FastAPI, HTTPException, Query, Request, Response, status
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, StreamingResponse
 from fastapi.templating import Jinja2Templates
 from starlette.concurrency import run_in_threadpool
 
@@ -21,9 +22,18 @@ from syfthub.api.router import api_router
 from syfthub.auth.db_dependencies import get_optional_current_user
 from syfthub.auth.keys import key_manager
 from syfthub.core.config import settings
-from syfthub.core.html_sanitizer import sanitize_readme_html
+from syfthub.core.html_sanitizer import readme_digest, render_readme_html
 from syfthub.core.redis_client import close_redis_client
-from syfthub.core.ssrf_protection import validate_domain_for_ssrf
+from syfthub.core.response_cache import (
+    cached_public_response,
+    get_public_response_cache,
+)
+from syfthub.core.ssrf_protection import (
+    create_pinned_http_client,
+    get_dns_cache,
+    get_pinned_network_backend,
+    validate_domain_for_ssrf,
+)
 from syfthub.core.url_builder import (
     build_connection_url,
     get_first_enabled_connection,
@@ -34,6 +44,7 @@ from syfthub.database.dependencies import (
     get_endpoint_repository,
     get_user_repository,
 )
+from syfthub.jobs.api_token_usage_flush import APITokenUsageFlushJob
 from syfthub.jobs.health_monitor import EndpointHealthMonitor
 from syfthub.jobs.otp_cleanup import OTPCleanupJob
 from syfthub.observability import (
@@ -42,6 +53,10 @@ from syfthub.observability import (
     configure_logging,
     get_logger,
 )
+from syfthub.observability.error_log_writer import (
+    get_error_log_writer,
+    stop_error_log_writer,
+)
 from syfthub.observability.handlers import register_exception_handlers
 from syfthub.repositories.endpoint import EndpointRepository
 from syfthub.repositories.user import UserRepository
@@ -70,6 +85,15 @@ templates = Jinja2Templates(directory=str(templates_dir))
 PROXY_TIMEOUT_DATA_SOURCE = 30.0
 PROXY_TIMEOUT_MODEL = 120.0
 
+# Target response headers relayed to the caller on successful invocations
+PROXY_FORWARDED_RESPONSE_HEADERS = (
+    "content-type",
+    "content-encoding",
+    "content-language",
+    "content-disposition",
+    "cache-control",
+)
+
 
 def build_invocation_url(
     owner: User,
@@ -177,6 +201,22 @@ def get_owner_username(owner: User) -> str:
     return owner.username
 
 
+def get_endpoint_readme_html(endpoint: Endpoint) -> str:
+    """Return the endpoint's sanitized README HTML.
+
+    READMEs are rendered when written, so this normally returns the stored
+    HTML. Rows whose stored HTML is missing or stale (written before READMEs
+    were pre-rendered, or edited outside the ORM) are rendered on the fly.
+    """
+    if not endpoint.readme or not endpoint.readme.strip():
+        return ""
+    if endpoint.readme_html is not None and endpoint.readme_html_hash == (
+        readme_digest(endpoint.readme)
+    ):
+        return endpoint.readme_html
+    return render_readme_html(endpoint.readme)
+
+
 def is_browser_request(request: Request) -> bool:
     """Check if request is from a browser (wants HTML) vs API client (wants JSON)."""
     accept_header = request.headers.get("accept", "")
@@ -249,8 +289,15 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
     otp_cleanup = OTPCleanupJob(settings)
     otp_cleanup_task = asyncio.create_task(otp_cleanup.start())
 
+    # Initialize API token usage flush job (writes buffered last_used_at)
+    token_usage_flush: Optional[APITokenUsageFlushJob] = None
+    token_usage_flush_task: Optional[asyncio.Task[None]] = None
+    if settings.api_token_last_used_flush_interval_seconds > 0:
+        token_usage_flush = APITokenUsageFlushJob(settings)
+        token_usage_flush_task = asyncio.create_task(token_usage_flush.start())
+
     # Create shared httpx client for outbound requests
-    _app.state.http_client = httpx.AsyncClient(
+    _app.state.http_client = create_pinned_http_client(
         timeout=httpx.Timeout(30.0),
         limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
     )
@@ -285,6 +332,17 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
         await otp_cleanup_task
     logger.info("OTP Cleanup Job stopped")
 
+    if token_usage_flush and token_usage_flush_task:
+        token_usage_flush_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await token_usage_flush_task
+        await token_usage_flush.stop()
+        logger.info("API token usage flush job stopped")
+
+    # Write error logs still waiting in the queue
+    await run_in_threadpool(stop_error_log_writer)
+    logger.info("Error log writer stopped")
+
     # Close Redis connection
     logger.info("Closing Redis connection...")
     await close_redis_client()
@@ -317,6 +375,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Cache"],
 )
 
 # Add observability middleware (order matters - CorrelationID must be first to process)
@@ -345,9 +404,15 @@ def root() -> dict[str, str]:
 
 
 @app.get("/health")
-async def health_check() -> dict[str, str]:
-    """Health check endpoint."""
-    return {"status": "healthy", "version": __version__}
+async def health_check() -> dict[str, Any]:
+    """Health check endpoint, with cache and error log writer counters."""
+    return {
+        "status": "healthy",
+        "version": __version__,
+        "dns_cache": get_dns_cache().stats(),
+        "public_response_cache": get_public_response_cache().stats(),
+        "error_log_writer": get_error_log_writer().stats(),
+    }
 
 
 # ===========================================
@@ -398,8 +463,36 @@ def list_owner_public_endpoints(
     user_repo: Annotated[UserRepository, Depends(get_user_repository)],
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+) -> Union[list[EndpointPublicResponse], Response]:
+    """List an owner's public endpoints.
+
+    Anonymous responses are served from the shared public response cache.
+    """
+    if current_user is None:
+        return cached_public_response(
+            "owner.endpoints",
+            {"owner_slug": owner_slug.lower(), "skip": skip, "limit": limit},
+            lambda: JSONResponse(
+                jsonable_encoder(
+                    _list_owner_public_endpoints(
+                        owner_slug, None, endpoint_repo, user_repo, skip, limit
+                    )
+                )
+            ),
+        )
+    return _list_owner_public_endpoints(
+        owner_slug, current_user, endpoint_repo, user_repo, skip, limit
+    )
+
+
+def _list_owner_public_endpoints(
+    owner_slug: str,
+    current_user: Optional[User],
+    endpoint_repo: EndpointRepository,
+    user_repo: UserRepository,
+    skip: int,
+    limit: int,
 ) -> list[EndpointPublicResponse]:
-    """List an owner's public endpoints."""
     # Resolve owner
     owner = resolve_owner(owner_slug, user_repo)
     if not owner:
@@ -463,8 +556,44 @@ def get_owner_endpoint(
     current_user: Annotated[Optional[User], Depends(get_optional_current_user)],
     endpoint_repo: Annotated[EndpointRepository, Depends(get_endpoint_repository)],
     user_repo: Annotated[UserRepository, Depends(get_user_repository)],
+) -> Union[Response, EndpointResponse, EndpointPublicResponse]:
+    """Get a specific endpoint by owner and slug.
+
+    Anonymous responses are served from the shared public response cache.
+    """
+    if current_user is None:
+        browser = is_browser_request(request)
+
+        def render() -> Response:
+            result = _get_owner_endpoint(
+                request, owner_slug, endpoint_slug, None, endpoint_repo, user_repo
+            )
+            if isinstance(result, Response):
+                return result
+            return JSONResponse(jsonable_encoder(result))
+
+        return cached_public_response(
+            "owner.endpoint",
+            {
+                "owner_slug": owner_slug.lower(),
+                "endpoint_slug": endpoint_slug.lower(),
+                "format": "html" if browser else "json",
+            },
+            render,
+        )
+    return _get_owner_endpoint(
+        request, owner_slug, endpoint_slug, current_user, endpoint_repo, user_repo
+    )
+
+
+def _get_owner_endpoint(
+    request: Request,
+    owner_slug: str,
+    endpoint_slug: str,
+    current_user: Optional[User],
+    endpoint_repo: EndpointRepository,
+    user_repo: UserRepository,
 ) -> Union[HTMLResponse, EndpointResponse, EndpointPublicResponse]:
-    """Get a specific endpoint by owner and slug."""
     # Resolve owner
     owner = resolve_owner(owner_slug, user_repo)
     if not owner:
@@ -507,14 +636,7 @@ def get_owner_endpoint(
         # Render HTML template for browsers
         owner_name = owner.username
 
-        # Convert README markdown to HTML and sanitize to prevent XSS
-        readme_html = ""
-        if endpoint.readme and endpoint.readme.strip():
-            raw_html = markdown.markdown(
-                endpoint.readme, extensions=["codehilite", "fenced_code"]
-            )
-            # Sanitize HTML to remove potentially dangerous tags/attributes
-            readme_html = sanitize_readme_html(raw_html)
+        readme_html = get_endpoint_readme_html(endpoint)
 
         return templates.TemplateResponse(
             request,
@@ -559,14 +681,19 @@ def _resolve_invocation_target(
     current_user: Optional[User],
     endpoint_repo: EndpointRepository,
     user_repo: UserRepository,
-) -> tuple[Endpoint, str]:
+) -> tuple[Endpoint, str, Optional[str]]:
     """Resolve owner + endpoint, enforce access, build the invocation URL, and
     run the SSRF check.
 
-    All of this is blocking work — synchronous DB lookups plus a blocking
-    ``socket.getaddrinfo`` inside ``validate_domain_for_ssrf`` — so it is a
-    plain ``def`` meant to be dispatched via ``run_in_threadpool`` to keep the
-    event loop free. Raises the same ``HTTPException``s as the inline code did.
+    All of this is blocking work — synchronous DB lookups plus a (cached)
+    blocking ``socket.getaddrinfo`` inside ``validate_domain_for_ssrf`` — so it
+    is a plain ``def`` meant to be dispatched via ``run_in_threadpool`` to keep
+    the event loop free. Raises the same ``HTTPException``s as the inline code
+    did.
+
+    Returns:
+        The endpoint, the invocation URL and the IP address the owner's domain
+        was validated against (None if the owner has no domain).
     """
     # Resolve owner
     owner = resolve_owner(owner_slug, user_repo)
@@ -617,10 +744,34 @@ def _resolve_invocation_target(
     # This is placed after build_invocation_url to ensure connection validation
     # happens first (no connections, no domain errors returned before SSRF check)
     owner_domain = getattr(owner, "domain", None)
-    if owner_domain:
-        validate_domain_for_ssrf(owner_domain)
+    validated_ip = validate_domain_for_ssrf(owner_domain) if owner_domain else None
 
-    return endpoint, query_url
+    return endpoint, query_url, validated_ip
+
+
+def _pin_request_to_ip(url: str, validated_ip: Optional[str]) -> None:
+    """Make connections for a proxied request go to the IP the SSRF check validated.
+
+    Connecting by hostname would make the HTTP client resolve the domain a
+    second time, and a rebinding DNS server could answer that lookup with an
+    internal address. The URL keeps its hostname, so pooled connections are
+    never shared between hostnames that resolve to the same address and TLS
+    still verifies the right certificate; the pin only redirects the TCP
+    connect (see ``PinnedNetworkBackend``).
+
+    Args:
+        url: The invocation URL
+        validated_ip: Address returned by ``validate_domain_for_ssrf``
+    """
+    host = httpx.URL(url).host
+    if not validated_ip or not host or host == validated_ip:
+        return
+    try:
+        ipaddress.ip_address(host)
+        return  # Already an address; nothing to resolve
+    except ValueError:
+        pass
+    get_pinned_network_backend().pin(host, validated_ip)
 
 
 @app.post("/{owner_slug}/{endpoint_slug}", response_model=None)
@@ -631,15 +782,19 @@ async def invoke_owner_endpoint(
     current_user: Annotated[Optional[User], Depends(get_optional_current_user)],
     endpoint_repo: Annotated[EndpointRepository, Depends(get_endpoint_repository)],
     user_repo: Annotated[UserRepository, Depends(get_user_repository)],
-) -> JSONResponse:
+) -> StreamingResponse:
     """Invoke a specific endpoint by owner and slug.
 
     This endpoint handles POST requests to /{owner_slug}/{endpoint_slug} for
-    invoking/executing the endpoint's functionality.
+    invoking/executing the endpoint's functionality. The request body is
+    streamed to the target as-is and a successful response is streamed back
+    byte for byte, so large payloads and streamed model output are never
+    buffered or re-encoded here. ``X-Proxy-Latency-Ms`` is the time until the
+    target answered (time to first byte).
     """
     # Resolve owner + endpoint, enforce access, build URL, SSRF-check — all
     # blocking work, offloaded to the threadpool so it can't stall the loop.
-    endpoint, query_url = await run_in_threadpool(
+    endpoint, query_url, validated_ip = await run_in_threadpool(
         _resolve_invocation_target,
         owner_slug,
         endpoint_slug,
@@ -648,15 +803,6 @@ async def invoke_owner_endpoint(
         user_repo,
     )
 
-    # Get the request body
-    try:
-        request_body = await request.json()
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid JSON request body",
-        ) from None
-
     # Set timeout based on endpoint type
     timeout = (
         PROXY_TIMEOUT_DATA_SOURCE
@@ -664,111 +810,150 @@ async def invoke_owner_endpoint(
         else PROXY_TIMEOUT_MODEL
     )
 
-    # Prepare headers for the proxied request
-    headers: dict[str, str] = {"Content-Type": "application/json"}
+    # Prepare headers for the proxied request. The body is streamed through
+    # untouched, so its type and length come from the caller.
+    headers: dict[str, str] = {
+        "Content-Type": request.headers.get("content-type", "application/json")
+    }
+    content_length = request.headers.get("content-length")
+    if content_length:
+        headers["Content-Length"] = content_length
 
     # Forward X-Tenant-Name header if present (for multi-tenancy)
     tenant_header = request.headers.get("X-Tenant-Name")
     if tenant_header:
         headers["X-Tenant-Name"] = tenant_header
 
+    # Connect to the address the SSRF check validated (no second DNS lookup)
+    _pin_request_to_ip(query_url, validated_ip)
+
+    # Use the lifespan-scoped client when available (production), fall back
+    # to a per-request client for tests that don't run the lifespan.
+    shared_client = getattr(request.app.state, "http_client", None)
+    client: httpx.AsyncClient
+    owned_client: Optional[httpx.AsyncClient] = None
+    if shared_client is not None:
+        client = shared_client
+    else:
+        client = owned_client = create_pinned_http_client(timeout=timeout)
+
     # Make the proxied request to the target endpoint
     start_time = time.perf_counter()
 
     try:
-        # Use the lifespan-scoped client when available (production), fall back
-        # to a per-request client for tests that don't run the lifespan.
-        shared_client = getattr(request.app.state, "http_client", None)
-        if shared_client is not None:
-            response = await shared_client.post(
+        upstream = await client.send(
+            client.build_request(
+                "POST",
                 query_url,
-                json=request_body,
+                content=request.stream(),
                 headers=headers,
                 timeout=timeout,
-            )
-        else:
-            async with httpx.AsyncClient(timeout=timeout) as client:
-                response = await client.post(
-                    query_url,
-                    json=request_body,
-                    headers=headers,
-                )
-
-        latency_ms = int((time.perf_counter() - start_time) * 1000)
-
-        # Handle different response status codes
-        if response.status_code == 200:
-            # Success - return the response from the target endpoint
-            try:
-                response_data = response.json()
-                return JSONResponse(
-                    status_code=status.HTTP_200_OK,
-                    content=response_data,
-                    headers={"X-Proxy-Latency-Ms": str(latency_ms)},
-                )
-            except Exception:
-                # Response is not JSON, return as-is
-                return JSONResponse(
-                    status_code=status.HTTP_200_OK,
-                    content={"raw_response": response.text},
-                    headers={"X-Proxy-Latency-Ms": str(latency_ms)},
-                )
-
-        elif response.status_code == 403:
-            # Access denied by target endpoint
-            try:
-                error_detail = response.json().get("detail", "Access denied")
-            except Exception:
-                error_detail = response.text[:200] or "Access denied"
-
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail=f"Target endpoint denied access: {error_detail}",
-            )
-
-        else:
-            # Other error from target endpoint
-            try:
-                error_data = response.json()
-                error_detail = error_data.get("detail", str(error_data))
-            except Exception:
-                error_detail = response.text[:200] or f"HTTP {response.status_code}"
-
-            logger.warning(
-                "Target endpoint error (status=%s): %s",
-                response.status_code,
-                error_detail,
-            )
-            raise HTTPException(
-                status_code=response.status_code,
-                detail="Target endpoint returned an error",
-            )
-
+            ),
+            stream=True,
+        )
     except httpx.TimeoutException:
-        latency_ms = int((time.perf_counter() - start_time) * 1000)
+        await _close_proxy(None, owned_client)
         raise HTTPException(
             status_code=status.HTTP_504_GATEWAY_TIMEOUT,
             detail=f"Request to target endpoint timed out after {timeout}s",
         ) from None
-
     except httpx.RequestError as e:
-        latency_ms = int((time.perf_counter() - start_time) * 1000)
+        await _close_proxy(None, owned_client)
         logger.warning("Failed to connect to target endpoint: %s", e)
         raise HTTPException(
             status_code=status.HTTP_502_BAD_GATEWAY,
             detail="Failed to connect to target endpoint",
         ) from None
-
-    except HTTPException:
-        # Re-raise HTTPExceptions as-is
-        raise
-
     except Exception as e:
+        await _close_proxy(None, owned_client)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Unexpected error during proxy request: {e}",
         ) from None
 
+    # Time to first byte: the target has answered with its status and headers
+    latency_ms = int((time.perf_counter() - start_time) * 1000)
+
+    if upstream.is_success:
+        # Success - relay the target's bytes as they arrive
+        response_headers = {
+            name: upstream.headers[name]
+            for name in PROXY_FORWARDED_RESPONSE_HEADERS
+            if name in upstream.headers
+        }
+        response_headers["X-Proxy-Latency-Ms"] = str(latency_ms)
+        return StreamingResponse(
+            _relay_proxy_body(upstream, owned_client),
+            status_code=upstream.status_code,
+            headers=response_headers,
+        )
+
+    # Error bodies are small; read them to build a consistent error response
+    try:
+        await upstream.aread()
+    except httpx.HTTPError:
+        pass
+    finally:
+        await _close_proxy(upstream, owned_client)
+
+    if upstream.status_code == 403:
+        # Access denied by target endpoint
+        try:
+            error_detail = upstream.json().get("detail", "Access denied")
+        except Exception:
+            error_detail = upstream.text[:200] or "Access denied"
+
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=f"Target endpoint denied access: {error_detail}",
+        )
+
+    # Other error from target endpoint
+    try:
+        error_data = upstream.json()
+        error_detail = error_data.get("detail", str(error_data))
+    except Exception:
+        error_detail = upstream.text[:200] or f"HTTP {upstream.status_code}"
+
+    logger.warning(
+        "Target endpoint error (status=%s): %s",
+        upstream.status_code,
+        error_detail,
+    )
+    raise HTTPException(
+        status_code=upstream.status_code,
+        detail="Target endpoint returned an error",
+    )
+
+
+async def _relay_proxy_body(
+    upstream: httpx.Response, owned_client: Optional[httpx.AsyncClient]
+) -> AsyncIterator[bytes]:
+    """Yield the target's response bytes unchanged, then release the connection.
+
+    Bytes are relayed raw (still content-encoded), so nothing is decoded or
+    buffered. A failure mid-stream is re-raised to abort the client connection
+    rather than end a truncated body cleanly.
+    """
+    try:
+        async for chunk in upstream.aiter_raw():
+            yield chunk
+    except httpx.HTTPError as e:
+        logger.warning("Target endpoint response stream failed: %s", e)
+        raise
+    finally:
+        await _close_proxy(upstream, owned_client)
+
+
+async def _close_proxy(
+    upstream: Optional[httpx.Response], owned_client: Optional[httpx.AsyncClient]
+) -> None:
+    """Close a streamed target response and any per-request client."""
+    if upstream is not None:
+        await upstream.aclose()
+    if owned_client is not None:
+        await owned_client.aclose()
+
 
 def main() -> None:
     """Entry point for running the server via script."""
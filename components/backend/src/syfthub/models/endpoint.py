@@ -15,8 +15,9 @@ from sqlalchemy import (
     Text,
 )
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, validates
 
+from syfthub.core.html_sanitizer import readme_digest, render_readme_html
 from syfthub.models.base import Base, BaseModel, TimestampMixin
 
 # Use JSONB for PostgreSQL, JSON for other databases (e.g., SQLite in tests)
@@ -80,6 +81,14 @@ class EndpointModel(BaseModel, TimestampMixin):
 
     version: Mapped[str] = mapped_column(String(20), nullable=False, default="0.1.0")
     readme: Mapped[str] = mapped_column(Text, nullable=False, default="")
+    # Sanitized HTML of the README, rendered when the README is written, and
+    # the digest of the markdown it was rendered from (see _render_readme)
+    readme_html: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, default=None
+    )
+    readme_html_hash: Mapped[Optional[str]] = mapped_column(
+        String(64), nullable=True, default=None
+    )
     stars_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
     tags: Mapped[List[str]] = mapped_column(
         JSONType, nullable=False, default=lambda: []
@@ -116,6 +125,19 @@ class EndpointModel(BaseModel, TimestampMixin):
         )
     )
 
+    @validates("readme")
+    def _render_readme(self, _key: str, readme: str) -> str:
+        """Render the README to HTML whenever its markdown actually changes.
+
+        Sync re-sends unchanged READMEs, so the digest check skips the
+        markdown and sanitizer work when the source is the same.
+        """
+        digest = readme_digest(readme or "")
+        if digest != self.readme_html_hash:
+            self.readme_html = render_readme_html(readme or "")
+            self.readme_html_hash = digest
+        return readme
+
     # Indexes for performance - slug uniqueness is per-user
     __table_args__ = (
         Index("idx_endpoints_user_id", "user_id"),
@@ -129,6 +151,22 @@ class EndpointModel(BaseModel, TimestampMixin):
         Index("idx_endpoints_version", "version"),
         Index("idx_endpoints_stars_count", "stars_count"),
         Index("idx_endpoints_rag_file_id", "rag_file_id"),
+        # Keyset pagination of public listings: (sort key, id) seeks
+        Index(
+            "idx_endpoints_public_updated",
+            "visibility",
+            "is_active",
+            "updated_at",
+            "id",
+        ),
+        Index(
+            "idx_endpoints_public_stars",
+            "visibility",
+            "is_active",
+            "stars_count",
+            "id",
+        ),
+        Index("idx_endpoints_user_updated", "user_id", "updated_at", "id"),
     )
 
     def __repr__(self) -> str:
@@ -13,6 +13,7 @@ Note:
     Some items are not exported here to avoid circular imports:
     - register_exception_handlers: import from syfthub.observability.handlers
     - ErrorLogRepository: import from syfthub.observability.repository
+    - get_error_log_writer: import from syfthub.observability.error_log_writer
     - ErrorLogModel: import from syfthub.observability.models
 """
 
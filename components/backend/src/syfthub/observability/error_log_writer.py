@@ -0,0 +1,232 @@
+"""Background, batched persistence of error logs.
+
+Exception handlers run on the event loop, so they must not wait on a database
+round-trip, least of all while the system is already failing. They hand each
+error log to :class:`ErrorLogWriter`, which keeps a bounded in-memory queue and
+drains it from a dedicated thread with multi-row inserts, once
+``error_log_batch_size`` entries are waiting or ``error_log_flush_interval_seconds``
+has passed.
+
+Under overload an error storm must not become a database write storm:
+- Once the queue is half full only one in ``error_log_overload_sample_rate``
+  entries is kept (the rest are counted as ``sampled``).
+- Once it is full new entries are dropped (counted as ``dropped``).
+
+Counters for queued, sampled, dropped, flushed and failed entries are exposed
+through :meth:`ErrorLogWriter.stats` and reported by ``/health``.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import queue
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Optional
+
+from syfthub.core.config import settings
+from syfthub.database.connection import SessionLocal
+from syfthub.observability.logger import get_logger
+from syfthub.observability.repository import ErrorLogRepository
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import Session
+
+logger = get_logger(__name__)
+
+# Wakes the writer thread when it is asked to stop
+_STOP = object()
+
+
+class ErrorLogWriter:
+    """Bounded queue of error logs flushed in batches by a background thread."""
+
+    def __init__(
+        self,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval_seconds: float,
+        overload_sample_rate: int = 10,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        """Initialize the writer. Call :meth:`start` to begin flushing.
+
+        Args:
+            max_queue_size: Maximum error logs waiting to be written.
+            batch_size: Flush as soon as this many entries are waiting.
+            flush_interval_seconds: Flush waiting entries at least this often.
+            overload_sample_rate: Keep one in N entries while the queue is more
+                than half full. 1 keeps everything until the queue is full.
+            session_factory: Creates the sessions used for the inserts.
+        """
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.flush_interval_seconds = flush_interval_seconds
+        self.overload_sample_rate = max(1, overload_sample_rate)
+        self._session_factory = session_factory
+        self._queue: queue.Queue[Any] = queue.Queue(maxsize=max_queue_size)
+        self._stats: Counter[str] = Counter()
+        self._overload_seen = 0
+        # Guards _stats and _overload_seen
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def enqueue(self, **entry: Any) -> bool:
+        """Queue an error log for writing, without blocking.
+
+        Takes ``ErrorLogRepository.create()``'s keyword arguments. The time of
+        the error is recorded now, not when the entry is written.
+
+        Returns:
+            True if the entry was queued, False if it was sampled out or
+            dropped because the queue is full.
+        """
+        entry.setdefault("timestamp", datetime.now(timezone.utc))
+
+        overloaded = self._queue.qsize() >= self.max_queue_size // 2
+        if overloaded and self.overload_sample_rate > 1:
+            with self._lock:
+                self._overload_seen += 1
+                if self._overload_seen % self.overload_sample_rate != 1:
+                    self._stats["sampled"] += 1
+                    return False
+
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            self._count("dropped")
+            return False
+        self._count("queued")
+        return True
+
+    def start(self) -> None:
+        """Start the background thread that flushes the queue."""
+        if self._thread is not None:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="error-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the background thread, writing whatever is still queued."""
+        self._stopping.set()
+        thread, self._thread = self._thread, None
+        if thread is None:
+            self._drain()
+            return
+        # If the queue is full the thread is busy flushing and sees the flag
+        with contextlib.suppress(queue.Full):
+            self._queue.put_nowait(_STOP)
+        thread.join(timeout)
+
+    def stats(self) -> dict[str, int]:
+        """Return entry counters and the current queue depth.
+
+        Counters are ``queued``, ``sampled``, ``dropped``, ``flushed`` (written)
+        and ``failed`` (queued but lost to a failed insert).
+        """
+        with self._lock:
+            result = {
+                name: self._stats[name]
+                for name in ("queued", "sampled", "dropped", "flushed", "failed")
+            }
+        result["pending"] = self._queue.qsize()
+        return result
+
+    def _count(self, name: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[name] += amount
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            batch = self._next_batch()
+            if batch:
+                self._write(batch)
+        self._drain()
+
+    def _next_batch(self) -> list[dict[str, Any]]:
+        """Wait for a full batch, or the flush interval after the first entry."""
+        batch: list[dict[str, Any]] = []
+        deadline: Optional[float] = None
+        while len(batch) < self.batch_size:
+            timeout = None if deadline is None else deadline - time.monotonic()
+            if timeout is not None and timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                break
+            batch.append(item)
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval_seconds
+        return batch
+
+    def _drain(self) -> None:
+        """Write everything still queued (on shutdown)."""
+        batch: list[dict[str, Any]] = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                batch.append(item)
+            if len(batch) >= self.batch_size:
+                self._write(batch)
+                batch = []
+        if batch:
+            self._write(batch)
+
+    def _write(self, batch: list[dict[str, Any]]) -> None:
+        try:
+            session = self._session_factory()
+            try:
+                written = ErrorLogRepository(session).create_many(batch)
+            finally:
+                session.close()
+        except Exception as e:
+            # Never let error logging take down the writer thread
+            logger.warning("error_log.flush.failed", count=len(batch), error=str(e))
+            written = 0
+        self._count("flushed", written)
+        self._count("failed", len(batch) - written)
+
+
+_writer: Optional[ErrorLogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def get_error_log_writer() -> ErrorLogWriter:
+    """Get the process-wide error log writer, starting it on first use."""
+    global _writer
+
+    if _writer is None:
+        with _writer_lock:
+            if _writer is None:
+                writer = ErrorLogWriter(
+                    max_queue_size=settings.error_log_queue_max_size,
+                    batch_size=settings.error_log_batch_size,
+                    flush_interval_seconds=settings.error_log_flush_interval_seconds,
+                    overload_sample_rate=settings.error_log_overload_sample_rate,
+                )
+                writer.start()
+                _writer = writer
+
+    return _writer
+
+
+def stop_error_log_writer() -> None:
+    """Flush and stop the process-wide writer (on shutdown and in tests)."""
+    global _writer
+    with _writer_lock:
+        writer, _writer = _writer, None
+    if writer is not None:
+        writer.stop()
@@ -9,7 +9,6 @@ from fastapi.responses import JSONResponse
 from pydantic import BaseModel, ConfigDict
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
-from syfthub.database.connection import SessionLocal
 from syfthub.domain.exceptions import (
     AudienceInactiveError,
     AudienceNotFoundError,
@@ -32,8 +31,8 @@ from syfthub.observability.constants import (
     LogEvents,
 )
 from syfthub.observability.context import get_correlation_id
+from syfthub.observability.error_log_writer import get_error_log_writer
 from syfthub.observability.logger import get_logger
-from syfthub.observability.repository import ErrorLogRepository
 from syfthub.observability.sanitizer import sanitize, truncate_body
 
 logger = get_logger(__name__)
@@ -127,7 +126,7 @@ def _get_request_body(request: Request) -> Optional[dict[str, Any]]:
     return None
 
 
-async def _persist_error(
+def _persist_error(
     correlation_id: str,
     event: str,
     message: str,
@@ -138,7 +137,10 @@ async def _persist_error(
     context: Optional[dict[str, Any]] = None,
     level: str = "ERROR",
 ) -> None:
-    """Persist error to database.
+    """Queue an error for persistence to the database.
+
+    The insert happens in the background (see ``error_log_writer``), so the
+    handler never waits on the database.
 
     Args:
         correlation_id: Request correlation ID.
@@ -152,27 +154,21 @@ async def _persist_error(
         level: Log level.
     """
     try:
-        # Create a new session for error logging (don't use request's session)
-        session = SessionLocal()
-        try:
-            repo = ErrorLogRepository(session)
-            repo.create(
-                correlation_id=correlation_id,
-                service=SERVICE_NAME,
-                level=level,
-                event=event,
-                message=message,
-                user_id=_get_user_id_from_request(request),
-                endpoint=str(request.url.path),
-                method=request.method,
-                error_type=error_type,
-                error_code=error_code,
-                stack_trace=stack_trace,
-                context=context,
-                request_data=_get_request_body(request),
-            )
-        finally:
-            session.close()
+        get_error_log_writer().enqueue(
+            correlation_id=correlation_id,
+            service=SERVICE_NAME,
+            level=level,
+            event=event,
+            message=message,
+            user_id=_get_user_id_from_request(request),
+            endpoint=str(request.url.path),
+            method=request.method,
+            error_type=error_type,
+            error_code=error_code,
+            stack_trace=stack_trace,
+            context=context,
+            request_data=_get_request_body(request),
+        )
     except Exception as e:
         # Don't let error logging failures break the response
         logger.warning("error_log.persist.failed", error=str(e))
@@ -224,7 +220,7 @@ def register_exception_handlers(app: FastAPI) -> None:
 
         # Persist 5xx errors to database
         if exc.status_code >= 500:
-            await _persist_error(
+            _persist_error(
                 correlation_id=correlation_id,
                 event=event,
                 message=str(exc.detail),
@@ -319,7 +315,7 @@ def register_exception_handlers(app: FastAPI) -> None:
         )
 
         if http_status >= 500:
-            await _persist_error(
+            _persist_error(
                 correlation_id=correlation_id,
                 event=LogEvents.ERROR_DOMAIN,
                 message=exc.message,
@@ -362,7 +358,7 @@ def register_exception_handlers(app: FastAPI) -> None:
         )
 
         # Persist to database for analysis
-        await _persist_error(
+        _persist_error(
             correlation_id=correlation_id,
             event=LogEvents.ERROR_UNHANDLED,
             message=str(exc),
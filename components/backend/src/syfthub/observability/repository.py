@@ -1,9 +1,10 @@
 """Repository for error log persistence."""
 
+from collections.abc import Sequence
 from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
-from sqlalchemy import and_, desc, select
+from sqlalchemy import and_, desc, insert, select
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -101,6 +102,54 @@ class ErrorLogRepository:
             self.session.rollback()
             return None
 
+    def create_many(self, entries: Sequence[dict[str, Any]]) -> int:
+        """Insert several error log entries with one multi-row INSERT.
+
+        Each entry holds ``create()``'s keyword arguments, plus an optional
+        ``timestamp`` for when the error happened (defaults to now).
+
+        Args:
+            entries: Error log entries to insert.
+
+        Returns:
+            Number of entries inserted (0 if the insert failed).
+        """
+        if not entries:
+            return 0
+
+        now = datetime.now(timezone.utc)
+        rows = []
+        for entry in entries:
+            row = {
+                "timestamp": now,
+                "message": None,
+                "user_id": None,
+                "endpoint": None,
+                "method": None,
+                "error_type": None,
+                "error_code": None,
+                "stack_trace": None,
+                **entry,
+            }
+            # Sanitize sensitive data before storing
+            for field in ("context", "request_data", "response_data"):
+                value = entry.get(field)
+                row[field] = sanitize(value) if value else None
+            rows.append(row)
+
+        try:
+            self.session.execute(insert(ErrorLogModel), rows)
+            self.session.commit()
+            return len(rows)
+        except SQLAlchemyError as e:
+            logger.warning(
+                "error_log.create_many.failed",
+                count=len(rows),
+                error=str(e),
+            )
+            self.session.rollback()
+            return 0
+
     def get_by_correlation_id(self, correlation_id: str) -> list[ErrorLogModel]:
         """Get all error logs for a correlation ID.
 
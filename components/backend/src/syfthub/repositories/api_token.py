@@ -5,12 +5,15 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import and_, select
+from sqlalchemy import and_, bindparam, func, or_, select, update
 
+from syfthub.auth.principal_cache import invalidate_api_token_principal
 from syfthub.models.api_token import APITokenModel
 from syfthub.repositories.base import BaseRepository
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from sqlalchemy.orm import Session
 
 
@@ -167,6 +170,55 @@ class APITokenRepository(BaseRepository[APITokenModel]):
             self.session.rollback()
             return False
 
+    def bulk_update_last_used(
+        self, usages: Mapping[int, tuple[datetime, Optional[str]]]
+    ) -> bool:
+        """Write buffered last-used timestamps and IPs in one bulk UPDATE.
+
+        A token's row is only updated if the buffered timestamp is newer than
+        the stored one, so flushes from several workers can't move it back. A
+        missing IP keeps the stored one.
+
+        Args:
+            usages: Token ID to (last used at, client IP).
+
+        Returns:
+            True if updated successfully, False otherwise.
+        """
+        if not usages:
+            return True
+
+        table = APITokenModel.__table__
+        statement = (
+            update(table)
+            .where(table.c.id == bindparam("token_id"))
+            .where(
+                or_(
+                    table.c.last_used_at.is_(None),
+                    table.c.last_used_at < bindparam("used_at"),
+                )
+            )
+            .values(
+                last_used_at=bindparam("used_at"),
+                last_used_ip=func.coalesce(
+                    bindparam("client_ip"), table.c.last_used_ip
+                ),
+            )
+        )
+        try:
+            self.session.execute(
+                statement,
+                [
+                    {"token_id": token_id, "used_at": used_at, "client_ip": ip}
+                    for token_id, (used_at, ip) in usages.items()
+                ],
+            )
+            self.session.commit()
+            return True
+        except Exception:
+            self.session.rollback()
+            return False
+
     def update_name(
         self, token_id: int, user_id: int, name: str
     ) -> Optional[APITokenModel]:
@@ -211,6 +263,7 @@ class APITokenRepository(BaseRepository[APITokenModel]):
 
             token_model.is_active = False
             self.session.commit()
+            invalidate_api_token_principal(token_id)
             return True
         except Exception:
             self.session.rollback()
@@ -233,6 +286,7 @@ class APITokenRepository(BaseRepository[APITokenModel]):
 
             self.session.delete(token_model)
             self.session.commit()
+            invalidate_api_token_principal(token_id)
             return True
         except Exception:
             self.session.rollback()
@@ -2,13 +2,29 @@
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from collections.abc import Callable, Sequence
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Any, List, Optional
 
-from sqlalchemy import Text, and_, cast, delete, func, or_, select, text, update
+from sqlalchemy import (
+    Text,
+    and_,
+    case,
+    cast,
+    delete,
+    func,
+    literal,
+    or_,
+    select,
+    text,
+    tuple_,
+    update,
+)
 from sqlalchemy.exc import SQLAlchemyError
 
+from syfthub.core.cursor import InvalidCursorError, decode_cursor, encode_cursor
 from syfthub.core.url_builder import transform_connection_urls
 from syfthub.models.endpoint import (
     EndpointModel,
@@ -27,6 +43,7 @@ from syfthub.schemas.endpoint import (
     EndpointUpdate,
     EndpointVisibility,
     GroupedEndpointsResponse,
+    PublicEndpointPage,
     filter_visible_policies,
     get_matching_types,
 )
@@ -36,6 +53,16 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Cursor kinds for keyset-paginated public listings
+CURSOR_UPDATED = "updated"  # (updated_at DESC, id DESC)
+CURSOR_STARS = "stars"  # (stars_count DESC, id DESC)
+CURSOR_SEARCH = "search"  # (relevance DESC, updated_at DESC, id DESC)
+
+
+def _search_cursor_scope(search: str) -> str:
+    """Bind search cursors to the term (matching is case-insensitive)."""
+    return hashlib.sha256(search.lower().encode()).hexdigest()[:16]
+
 
 class EndpointRepository(BaseRepository[EndpointModel]):
     """Repository for endpoint database operations."""
@@ -171,6 +198,107 @@ class EndpointRepository(BaseRepository[EndpointModel]):
         except SQLAlchemyError:
             return []
 
+    def _public_search_filter(self, search: str) -> tuple[Any, Any]:
+        """Build the directory search predicate and its relevance rank.
+
+        Each column predicate is a plain ``ILIKE '%term%'`` on ``endpoints``,
+        which PostgreSQL serves from the pg_trgm GIN indexes (migration 023)
+        and combines with a BitmapOr. The owner match is an ``IN`` over
+        ``users`` (also trigram-indexed) rather than a predicate on the joined
+        row, so the OR stays on one table and can still use those indexes.
+        Other dialects (SQLite in tests) run the same query unindexed.
+
+        Returns:
+            ``(predicate, rank)`` where rank is higher for better matches:
+            exact name, then name substring, then tags or owner, then description.
+        """
+        search_pattern = f"%{search}%"
+        tags_text = cast(self.model.tags, Text)
+        owner_ids = select(UserModel.id).where(UserModel.username.ilike(search_pattern))
+
+        predicate = or_(
+            self.model.name.ilike(search_pattern),
+            self.model.description.ilike(search_pattern),
+            # Search within tags JSON array by casting to text
+            tags_text.ilike(search_pattern),
+            # Search by owner username
+            self.model.user_id.in_(owner_ids),
+        )
+        rank = case(
+            (func.lower(self.model.name) == search.lower(), 4),
+            (self.model.name.ilike(search_pattern), 3),
+            (
+                or_(
+                    tags_text.ilike(search_pattern),
+                    UserModel.username.ilike(search_pattern),
+                ),
+                2,
+            ),
+            else_=1,
+        )
+        return predicate, rank
+
+    def _seek_public_page(
+        self,
+        stmt: Any,
+        kind: str,
+        sort_keys: Sequence[tuple[Any, Callable[[Any], Any]]],
+        *,
+        cursor: Optional[str],
+        skip: int,
+        limit: int,
+        viewer_email: Optional[str],
+        cursor_scope: Optional[str] = None,
+    ) -> PublicEndpointPage:
+        """Run a public listing ordered by ``sort_keys`` (all DESC), then id DESC.
+
+        Each sort key is ``(expression, parse)`` where ``parse`` turns the
+        cursor's JSON value back into a bind value. With a cursor, rows are
+        sought past the cursor's key instead of skipped with OFFSET, so a deep
+        page costs the same as the first one (backed by the matching composite
+        indexes). One extra row is read to tell whether a next page exists.
+        ``cursor_scope`` binds cursors to the listing's parameters (see
+        :mod:`syfthub.core.cursor`).
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed or for another listing
+        """
+        expressions = [expr for expr, _ in sort_keys] + [self.model.id]
+        parsers = [parse for _, parse in sort_keys] + [int]
+
+        if cursor:
+            values = decode_cursor(cursor, kind, cursor_scope)
+            try:
+                last = [
+                    parse(value) for parse, value in zip(parsers, values, strict=True)
+                ]
+            except (TypeError, ValueError) as e:
+                raise InvalidCursorError("Malformed pagination cursor") from e
+            stmt = stmt.where(tuple_(*expressions) < tuple_(*last))
+
+        stmt = (
+            stmt.add_columns(*expressions)
+            .order_by(*(expr.desc() for expr in expressions))
+            .offset(skip)
+            .limit(limit + 1)
+        )
+        rows = self.session.execute(stmt).all()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(kind, list(rows[-1][3:]), cursor_scope)
+
+        return PublicEndpointPage(
+            items=[
+                self._build_public_response(
+                    endpoint_model, username, domain, viewer_email
+                )
+                for endpoint_model, username, domain, *_ in rows
+            ],
+            next_cursor=next_cursor,
+        )
+
     def get_public_endpoints(
         self,
         skip: int = 0,
@@ -190,6 +318,39 @@ class EndpointRepository(BaseRepository[EndpointModel]):
         Returns:
             List of EndpointPublicResponse objects
         """
+        return self.get_public_endpoints_page(
+            skip=skip,
+            limit=limit,
+            endpoint_type=endpoint_type,
+            search=search,
+            viewer_email=viewer_email,
+        ).items
+
+    def get_public_endpoints_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        skip: int = 0,
+        endpoint_type: Optional[EndpointType] = None,
+        search: Optional[str] = None,
+        viewer_email: Optional[str] = None,
+    ) -> PublicEndpointPage:
+        """Get a page of public endpoints, most recently updated first.
+
+        Args:
+            cursor: Cursor from the previous page (keyset over updated_at, id)
+            limit: Maximum number of endpoints to return
+            skip: Number of endpoints to skip (legacy offset pagination)
+            endpoint_type: Optional filter by endpoint type (model or data_source)
+            search: Optional search string to filter by name, description, tags, or
+                owner username; matches are ordered by relevance, then recency
+
+        Returns:
+            PublicEndpointPage with the endpoints and the next page's cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
         try:
             stmt = self._build_public_select().where(
                 and_(
@@ -202,37 +363,32 @@ class EndpointRepository(BaseRepository[EndpointModel]):
                 matching_types = get_matching_types(endpoint_type)
                 stmt = stmt.where(self.model.type.in_(matching_types))
 
-            # Add search filter if provided
+            # Add search filter if provided; matches are ranked by relevance
             if search:
-                search_pattern = f"%{search}%"
-                stmt = stmt.where(
-                    or_(
-                        self.model.name.ilike(search_pattern),
-                        self.model.description.ilike(search_pattern),
-                        # Search within tags JSON array by casting to text
-                        cast(self.model.tags, Text).ilike(search_pattern),
-                        # Search by owner username
-                        UserModel.username.ilike(search_pattern),
-                    )
-                )
-
-            stmt = stmt.order_by(self.model.updated_at.desc()).offset(skip).limit(limit)
-
-            result = self.session.execute(stmt)
-            rows = result.all()
-
-            endpoints = []
-            for endpoint_model, username, domain in rows:
-                endpoints.append(
-                    self._build_public_response(
-                        endpoint_model, username, domain, viewer_email
-                    )
+                predicate, rank = self._public_search_filter(search)
+                return self._seek_public_page(
+                    stmt.where(predicate),
+                    CURSOR_SEARCH,
+                    [(rank, int), (self.model.updated_at, datetime.fromisoformat)],
+                    cursor=cursor,
+                    skip=skip,
+                    limit=limit,
+                    viewer_email=viewer_email,
+                    cursor_scope=_search_cursor_scope(search),
                 )
 
-            return endpoints
+            return self._seek_public_page(
+                stmt,
+                CURSOR_UPDATED,
+                [(self.model.updated_at, datetime.fromisoformat)],
+                cursor=cursor,
+                skip=skip,
+                limit=limit,
+                viewer_email=viewer_email,
+            )
         except SQLAlchemyError as e:
             logger.error("Failed to query public endpoints: %s", e)
-            return []
+            return PublicEndpointPage()
 
     def get_public_endpoints_by_owner(
         self,
@@ -254,6 +410,32 @@ class EndpointRepository(BaseRepository[EndpointModel]):
         Returns:
             List of EndpointPublicResponse objects for the given owner.
         """
+        return self.get_public_endpoints_by_owner_page(
+            owner_slug, skip=skip, limit=limit, viewer_email=viewer_email
+        ).items
+
+    def get_public_endpoints_by_owner_page(
+        self,
+        owner_slug: str,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        skip: int = 0,
+        viewer_email: Optional[str] = None,
+    ) -> PublicEndpointPage:
+        """Get a page of public endpoints for a specific owner, newest first.
+
+        Args:
+            owner_slug: The username to filter by.
+            cursor: Cursor from the previous page (keyset over updated_at, id).
+            limit: Maximum number of endpoints to return.
+            skip: Number of endpoints to skip (legacy offset pagination).
+
+        Returns:
+            PublicEndpointPage with the owner's endpoints and the next cursor.
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
         try:
             # Build the base query with owner join
             owner_username_expr = UserModel.username
@@ -266,23 +448,18 @@ class EndpointRepository(BaseRepository[EndpointModel]):
                 )
             )
 
-            stmt = stmt.order_by(self.model.updated_at.desc()).offset(skip).limit(limit)
-
-            result = self.session.execute(stmt)
-            rows = result.all()
-
-            endpoints = []
-            for endpoint_model, username, domain in rows:
-                endpoints.append(
-                    self._build_public_response(
-                        endpoint_model, username, domain, viewer_email
-                    )
-                )
-
-            return endpoints
+            return self._seek_public_page(
+                stmt,
+                CURSOR_UPDATED,
+                [(self.model.updated_at, datetime.fromisoformat)],
+                cursor=cursor,
+                skip=skip,
+                limit=limit,
+                viewer_email=viewer_email,
+            )
         except SQLAlchemyError as e:
             logger.error("Failed to query endpoints by owner %s: %s", owner_slug, e)
-            return []
+            return PublicEndpointPage()
 
     def get_public_endpoint_by_owner_and_slug(
         self,
@@ -312,7 +489,7 @@ class EndpointRepository(BaseRepository[EndpointModel]):
                         self.model.visibility == EndpointVisibility.PUBLIC.value,
                         self.model.is_active,
                         self.model.slug == slug.lower(),
-                        owner_username_col == owner_username,
+                        owner_username_col == owner_username.lower(),
                     )
                 )
                 .limit(1)
@@ -324,10 +501,10 @@ class EndpointRepository(BaseRepository[EndpointModel]):
             if row is None:
                 return None
 
-            endpoint_model, _username, domain = row
+            endpoint_model, username, domain = row
 
             return self._build_public_response(
-                endpoint_model, owner_username, domain, viewer_email
+                endpoint_model, username, domain, viewer_email
             )
         except SQLAlchemyError as e:
             logger.error(
@@ -449,6 +626,38 @@ class EndpointRepository(BaseRepository[EndpointModel]):
         viewer_email: Optional[str] = None,
     ) -> List[EndpointPublicResponse]:
         """Get trending public endpoints with owner usernames and transformed URLs, sorted by stars count."""
+        return self.get_trending_endpoints_page(
+            skip=skip,
+            limit=limit,
+            min_stars=min_stars,
+            endpoint_type=endpoint_type,
+            viewer_email=viewer_email,
+        ).items
+
+    def get_trending_endpoints_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 10,
+        skip: int = 0,
+        min_stars: Optional[int] = None,
+        endpoint_type: Optional[EndpointType] = None,
+        viewer_email: Optional[str] = None,
+    ) -> PublicEndpointPage:
+        """Get a page of trending public endpoints, most starred first.
+
+        Args:
+            cursor: Cursor from the previous page (keyset over stars_count, id)
+            limit: Maximum number of endpoints to return
+            skip: Number of endpoints to skip (legacy offset pagination)
+            min_stars: Optional minimum stars filter
+            endpoint_type: Optional filter by endpoint type (model or data_source)
+
+        Returns:
+            PublicEndpointPage with the endpoints and the next page's cursor
+
+        Raises:
+            InvalidCursorError: If the cursor is malformed
+        """
         try:
             stmt = self._build_public_select().where(
                 and_(
@@ -464,24 +673,106 @@ class EndpointRepository(BaseRepository[EndpointModel]):
                 matching_types = get_matching_types(endpoint_type)
                 stmt = stmt.where(self.model.type.in_(matching_types))
 
-            stmt = (
-                stmt.order_by(self.model.stars_count.desc()).offset(skip).limit(limit)
+            return self._seek_public_page(
+                stmt,
+                CURSOR_STARS,
+                [(self.model.stars_count, int)],
+                cursor=cursor,
+                skip=skip,
+                limit=limit,
+                viewer_email=viewer_email,
             )
+        except SQLAlchemyError:
+            return PublicEndpointPage()
 
-            result = self.session.execute(stmt)
-            rows = result.all()
+    def _grouped_public_rows(
+        self, max_per_owner: int, user_ids: Optional[List[int]] = None
+    ) -> List[Any]:
+        """Run the grouped-directory window query.
 
-            endpoints = []
-            for endpoint_model, username, domain in rows:
-                endpoints.append(
-                    self._build_public_response(
-                        endpoint_model, username, domain, viewer_email
-                    )
+        Returns rows carrying every endpoint column plus ``owner_username``,
+        ``owner_domain``, ``rn`` (rank within the owner, newest first) and
+        ``owner_count``, ordered by owner count, username, then rank.
+        """
+        # First, get the count per owner for ALL owners with public/active endpoints
+        owner_username_expr = UserModel.username
+        owner_domain_expr = UserModel.domain
+
+        # Subquery to rank endpoints within each owner
+        row_number = (
+            func.row_number()
+            .over(
+                partition_by=owner_username_expr,
+                order_by=self.model.updated_at.desc(),
+            )
+            .label("rn")
+        )
+
+        # Count per owner (using window function)
+        count_per_owner = (
+            func.count().over(partition_by=owner_username_expr).label("owner_count")
+        )
+
+        # Build the main query with ranking
+        stmt = (
+            select(
+                self.model,
+                owner_username_expr.label("owner_username"),
+                owner_domain_expr.label("owner_domain"),
+                row_number,
+                count_per_owner,
+            )
+            .join(UserModel, self.model.user_id == UserModel.id)
+            .where(
+                and_(
+                    self.model.visibility == EndpointVisibility.PUBLIC.value,
+                    self.model.is_active,
                 )
+            )
+        )
+        if user_ids is not None:
+            stmt = stmt.where(self.model.user_id.in_(user_ids))
 
-            return endpoints
-        except SQLAlchemyError:
-            return []
+        # Wrap in a subquery to filter by row number
+        subq = stmt.subquery()
+
+        # Select from the subquery, filtering to top N per owner
+        final_stmt = (
+            select(subq)
+            .where(subq.c.rn <= max_per_owner)
+            .order_by(subq.c.owner_count.desc(), subq.c.owner_username, subq.c.rn)
+        )
+
+        return list(self.session.execute(final_stmt).all())
+
+    def get_public_directory_rows(
+        self, max_per_owner: int, user_ids: Optional[List[int]] = None
+    ) -> List[tuple[Any, EndpointPublicResponse]]:
+        """Get the grouped-directory rows with their anonymous responses.
+
+        Used to build the Global Directory snapshot. Unlike the other listing
+        methods this does not swallow database errors, so a failed refresh is
+        never mistaken for an empty directory.
+
+        Args:
+            max_per_owner: Maximum endpoints to return per owner
+            user_ids: Only query these owners (incremental refresh)
+
+        Returns:
+            (row, response) pairs; ``row`` carries ``user_id``, ``policies``,
+            ``owner_username`` and ``owner_count``, and ``response`` is built
+            for an anonymous viewer.
+
+        Raises:
+            SQLAlchemyError: If the query fails
+        """
+        return [
+            (
+                row,
+                self._build_public_response(row, row.owner_username, row.owner_domain),
+            )
+            for row in self._grouped_public_rows(max_per_owner, user_ids)
+        ]
 
     def get_public_endpoints_grouped(
         self,
@@ -503,55 +794,7 @@ class EndpointRepository(BaseRepository[EndpointModel]):
             GroupedEndpointsResponse with groups ordered by total endpoint count (descending)
         """
         try:
-            # First, get the count per owner for ALL owners with public/active endpoints
-            owner_username_expr = UserModel.username
-            owner_domain_expr = UserModel.domain
-
-            # Subquery to rank endpoints within each owner
-            row_number = (
-                func.row_number()
-                .over(
-                    partition_by=owner_username_expr,
-                    order_by=self.model.updated_at.desc(),
-                )
-                .label("rn")
-            )
-
-            # Count per owner (using window function)
-            count_per_owner = (
-                func.count().over(partition_by=owner_username_expr).label("owner_count")
-            )
-
-            # Build the main query with ranking
-            stmt = (
-                select(
-                    self.model,
-                    owner_username_expr.label("owner_username"),
-                    owner_domain_expr.label("owner_domain"),
-                    row_number,
-                    count_per_owner,
-                )
-                .join(UserModel, self.model.user_id == UserModel.id)
-                .where(
-                    and_(
-                        self.model.visibility == EndpointVisibility.PUBLIC.value,
-                        self.model.is_active,
-                    )
-                )
-            )
-
-            # Wrap in a subquery to filter by row number
-            subq = stmt.subquery()
-
-            # Select from the subquery, filtering to top N per owner
-            final_stmt = (
-                select(subq)
-                .where(subq.c.rn <= max_per_owner)
-                .order_by(subq.c.owner_count.desc(), subq.c.owner_username, subq.c.rn)
-            )
-
-            result = self.session.execute(final_stmt)
-            rows = result.all()
+            rows = self._grouped_public_rows(max_per_owner)
 
             # Group results by owner
             owner_groups: dict[str, dict] = {}
@@ -864,6 +1107,86 @@ class EndpointRepository(BaseRepository[EndpointModel]):
         # Convert to schema objects
         return [Endpoint.model_validate(model) for model in created_endpoints]
 
+    def get_user_endpoint_models(self, user_id: int) -> List[EndpointModel]:
+        """Get every endpoint model owned by a user (for sync operation).
+
+        Includes inactive and archived endpoints, since slugs are unique per
+        user regardless of status.
+
+        Args:
+            user_id: The owner's user ID
+
+        Returns:
+            List of EndpointModel objects attached to the session
+        """
+        stmt = select(self.model).where(self.model.user_id == user_id)
+        return list(self.session.execute(stmt).scalars().all())
+
+    def get_endpoint_models_by_ids(
+        self, endpoint_ids: List[int]
+    ) -> List[EndpointModel]:
+        """Get raw endpoint models by ID in a single query (for RAG operations).
+
+        Args:
+            endpoint_ids: The endpoint IDs.
+
+        Returns:
+            The matching EndpointModel objects.
+        """
+        if not endpoint_ids:
+            return []
+        stmt = select(self.model).where(self.model.id.in_(endpoint_ids))
+        return list(self.session.execute(stmt).scalars().all())
+
+    def delete_endpoints_by_ids(self, endpoint_ids: List[int]) -> int:
+        """Delete endpoints by ID (for sync operation).
+
+        This method does NOT commit the transaction - caller must commit.
+
+        Args:
+            endpoint_ids: IDs of the endpoints to delete
+
+        Returns:
+            Number of endpoints deleted
+        """
+        if not endpoint_ids:
+            return 0
+        delete_stmt = delete(self.model).where(self.model.id.in_(endpoint_ids))
+        self.session.execute(delete_stmt)
+        return len(endpoint_ids)
+
+    def bulk_update_endpoints(
+        self,
+        updates: List[tuple[EndpointModel, dict]],
+    ) -> List[Endpoint]:
+        """Apply synced content to existing endpoints (for sync operation).
+
+        Only content fields are written; ID, stars, health and activity state
+        are kept. This method does NOT commit the transaction - caller must commit.
+
+        Args:
+            updates: (endpoint model, validated endpoint data) pairs
+
+        Returns:
+            List of updated Endpoint objects
+        """
+        now = datetime.now(timezone.utc)
+        for endpoint_model, data in updates:
+            endpoint_model.name = data["name"]
+            endpoint_model.description = data.get("description", "")
+            endpoint_model.type = data["type"]
+            endpoint_model.visibility = data.get("visibility", "public")
+            endpoint_model.version = data.get("version", "0.1.0")
+            endpoint_model.readme = data.get("readme", "")
+            endpoint_model.tags = data.get("tags", [])
+            endpoint_model.contributors = data.get("contributors", [])
+            endpoint_model.policies = data.get("policies", [])
+            endpoint_model.connect = data.get("connect", [])
+            endpoint_model.updated_at = now
+
+        self.session.flush()
+        return [Endpoint.model_validate(model) for model, _ in updates]
+
     def slug_exists_for_user(
         self, user_id: int, slug: str, exclude_endpoint_id: Optional[int] = None
     ) -> bool:
@@ -1269,6 +1592,62 @@ class EndpointRepository(BaseRepository[EndpointModel]):
                 f"at {bucket_start}: {e}"
             )
 
+    def bulk_upsert_uptime_samples(
+        self,
+        bucket_start: datetime,
+        results: dict[int, bool],
+        chunk_size: int = 5000,
+    ) -> None:
+        """Upsert one health-monitor tick for many endpoints at once.
+
+        Issues one multi-row ``INSERT … SELECT … ON CONFLICT`` per chunk of
+        endpoints on Postgres and SQLite; the ``SELECT`` from ``endpoints``
+        drops IDs deleted since the monitor read them. Other dialects fall
+        back to :meth:`upsert_uptime_sample` per endpoint. Does NOT commit,
+        and errors propagate so the caller can roll back the whole cycle.
+
+        Args:
+            bucket_start: Truncated UTC bucket boundary shared by all samples.
+            results: Endpoint ID -> result of the monitor's evaluation.
+            chunk_size: Maximum endpoints per statement (bounds bind params).
+        """
+        dialect = self.session.bind.dialect.name if self.session.bind else ""
+        if dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert
+        elif dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert  # type: ignore[assignment]
+        else:
+            for endpoint_id, is_healthy in results.items():
+                self.upsert_uptime_sample(endpoint_id, bucket_start, is_healthy)
+            return
+
+        sample = EndpointUptimeSampleModel
+        endpoint_ids = list(results)
+        for start in range(0, len(endpoint_ids), chunk_size):
+            chunk = endpoint_ids[start : start + chunk_size]
+            healthy_ids = [eid for eid in chunk if results[eid]]
+            rows = select(
+                self.model.id,
+                literal(bucket_start, type_=sample.bucket_start.type),
+                literal(1),
+                case((self.model.id.in_(healthy_ids), 1), else_=0)
+                if healthy_ids
+                else literal(0),
+            ).where(self.model.id.in_(chunk))
+            stmt = insert(sample).from_select(
+                ["endpoint_id", "bucket_start", "total_checks", "healthy_checks"],
+                rows,
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[sample.endpoint_id, sample.bucket_start],
+                set_={
+                    "total_checks": sample.total_checks + 1,
+                    "healthy_checks": sample.healthy_checks
+                    + stmt.excluded.healthy_checks,
+                },
+            )
+            self.session.execute(stmt)
+
     def get_uptime_samples(
         self,
         endpoint_id: int,
@@ -5,9 +5,10 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Optional
 
-from sqlalchemy import case, func, or_, select
+from sqlalchemy import case, func, or_, select, update
 from sqlalchemy.exc import SQLAlchemyError
 
+from syfthub.auth.principal_cache import invalidate_user_principal
 from syfthub.models.user import UserModel
 from syfthub.repositories.base import BaseRepository
 from syfthub.schemas.auth import UserRole
@@ -71,6 +72,23 @@ class UserRepository(BaseRepository[UserModel]):
         except Exception:
             return []
 
+    def get_by_usernames(self, usernames: list[str]) -> list[User]:
+        """Get multiple users by their usernames in a single query.
+
+        Database errors propagate (unlike the single-user getters) so callers
+        can tell an outage from usernames that are not registered.
+
+        Raises:
+            SQLAlchemyError: If the query fails.
+        """
+        if not usernames:
+            return []
+        stmt = select(self.model).where(
+            self.model.username.in_({name.lower() for name in usernames})
+        )
+        result = self.session.execute(stmt)
+        return [User.model_validate(m) for m in result.scalars().all()]
+
     def get_by_google_id(self, google_id: str) -> Optional[User]:
         """Get user by Google OAuth ID."""
         try:
@@ -154,6 +172,7 @@ class UserRepository(BaseRepository[UserModel]):
                 user_model.is_email_public = user_data.is_email_public
 
             self.session.commit()
+            invalidate_user_principal(user_id)
             self.session.refresh(user_model)
 
             return User.model_validate(user_model)
@@ -170,6 +189,7 @@ class UserRepository(BaseRepository[UserModel]):
 
             user_model.password_hash = new_password_hash
             self.session.commit()
+            invalidate_user_principal(user_id)
             return True
         except Exception:
             self.session.rollback()
@@ -198,6 +218,7 @@ class UserRepository(BaseRepository[UserModel]):
 
             user_model.is_email_verified = True
             self.session.commit()
+            invalidate_user_principal(user_id)
             return True
         except Exception:
             self.session.rollback()
@@ -226,6 +247,7 @@ class UserRepository(BaseRepository[UserModel]):
                 user_model.avatar_url = avatar_url
 
             self.session.commit()
+            invalidate_user_principal(user_id)
             return True
         except Exception:
             self.session.rollback()
@@ -240,6 +262,7 @@ class UserRepository(BaseRepository[UserModel]):
 
             user_model.role = role
             self.session.commit()
+            invalidate_user_principal(user_id)
             return True
         except Exception:
             self.session.rollback()
@@ -254,6 +277,7 @@ class UserRepository(BaseRepository[UserModel]):
 
             user_model.is_active = False
             self.session.commit()
+            invalidate_user_principal(user_id)
             return True
         except Exception:
             self.session.rollback()
@@ -268,6 +292,7 @@ class UserRepository(BaseRepository[UserModel]):
 
             user_model.is_active = True
             self.session.commit()
+            invalidate_user_principal(user_id)
             return True
         except Exception:
             self.session.rollback()
@@ -280,17 +305,18 @@ class UserRepository(BaseRepository[UserModel]):
         the domain is extracted from the report URL so the health monitor and
         endpoint URL construction know where the owner's node lives.
 
-        Does NOT commit — the caller manages the transaction.
+        Does NOT commit — the caller manages the transaction, and invalidates
+        the user's cached principal after committing when the domain changed.
 
         Args:
             user_id: ID of the user to update
             domain: Normalized domain (scheme + netloc, or tunneling URL)
 
         Returns:
-            True if the user was found and updated, False otherwise
+            True if the user was found and their domain changed, False otherwise
         """
         user_model = self.session.get(self.model, user_id)
-        if not user_model:
+        if not user_model or user_model.domain == domain:
             return False
 
         user_model.domain = domain
@@ -565,11 +591,59 @@ class UserRepository(BaseRepository[UserModel]):
                 user_model.wallet_private_key = wallet_private_key
 
             self.session.commit()
+            invalidate_user_principal(user_id)
             return True
         except SQLAlchemyError:
             self.session.rollback()
             return False
 
+    def create_wallet_if_absent(
+        self,
+        user_id: int,
+        wallet_address: str,
+        wallet_private_key: str,
+    ) -> Optional[str]:
+        """Store a new wallet unless the user already has one.
+
+        The check and the write are one conditional UPDATE, so neither a
+        stale cached principal nor a concurrent request can overwrite an
+        existing wallet's private key.
+
+        Args:
+            user_id: ID of the user to update
+            wallet_address: Ethereum/Tempo wallet address
+            wallet_private_key: Private key for the wallet
+
+        Returns:
+            The user's wallet address afterwards (the new one, or the one
+            they already had), or None if the user does not exist or the
+            update failed
+        """
+        try:
+            result = self.session.execute(
+                update(self.model)
+                .where(
+                    self.model.id == user_id,
+                    self.model.wallet_address.is_(None),
+                )
+                .values(
+                    wallet_address=wallet_address,
+                    wallet_private_key=wallet_private_key,
+                )
+            )
+            self.session.commit()
+            if result.rowcount:  # type: ignore[attr-defined]
+                invalidate_user_principal(user_id)
+                return wallet_address
+
+            existing = self.session.execute(
+                select(self.model.wallet_address).where(self.model.id == user_id)
+            ).scalar_one_or_none()
+            return existing
+        except SQLAlchemyError:
+            self.session.rollback()
+            return None
+
     def get_wallet_private_key(self, user_id: int) -> Optional[str]:
         """Get wallet private key directly from the DB model.
 
@@ -605,6 +679,7 @@ class UserRepository(BaseRepository[UserModel]):
 
             self.session.delete(user_model)
             self.session.commit()
+            invalidate_user_principal(user_id)
             return True
         except Exception:
             self.session.rollback()
@@ -648,6 +723,7 @@ class UserRepository(BaseRepository[UserModel]):
                     setattr(user_model, field, value)
 
             self.session.commit()
+            invalidate_user_principal(user_id)
             self.session.refresh(user_model)
             return User.model_validate(user_model)
         except Exception:
@@ -121,7 +121,11 @@ class APIToken(BaseModel):
         None, description="Expiration timestamp, null if never expires"
     )
     last_used_at: Optional[datetime] = Field(
-        None, description="Last time the token was used for authentication"
+        None,
+        description=(
+            "Last time the token was used for authentication. Written "
+            "periodically, so it may lag by up to the flush interval."
+        ),
     )
     last_used_ip: Optional[str] = Field(
         None, description="IP address from the last authentication"
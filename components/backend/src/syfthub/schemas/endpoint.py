@@ -440,6 +440,14 @@ class Endpoint(BaseModel):
     health_ttl_seconds: Optional[int] = Field(
         None, description="TTL for the health status report in seconds"
     )
+
+    # Pre-rendered README (internal; never serialized into responses)
+    readme_html: Optional[str] = Field(
+        None, exclude=True, description="Sanitized HTML rendered from the README"
+    )
+    readme_html_hash: Optional[str] = Field(
+        None, exclude=True, description="Digest of the README readme_html came from"
+    )
     model_config = {"from_attributes": True}
 
 
@@ -563,10 +571,19 @@ class SyncEndpointsRequest(BaseModel):
 class SyncEndpointsResponse(BaseModel):
     """Response schema for sync operation."""
 
-    synced: int = Field(..., ge=0, description="Number of endpoints created")
+    synced: int = Field(
+        ..., ge=0, description="Number of endpoints the user owns after the sync"
+    )
+    created: int = Field(default=0, ge=0, description="Number of endpoints created")
+    updated: int = Field(
+        default=0, ge=0, description="Number of endpoints whose content changed"
+    )
+    unchanged: int = Field(
+        default=0, ge=0, description="Number of endpoints left untouched"
+    )
     deleted: int = Field(..., ge=0, description="Number of endpoints deleted")
     endpoints: List[EndpointResponse] = Field(
-        ..., description="Created endpoints with full details"
+        ..., description="Synced endpoints with full details, in request order"
     )
 
     model_config = {"from_attributes": True}
@@ -598,6 +615,21 @@ class EndpointGroupItem(BaseModel):
     )
 
 
+class PublicEndpointPage(BaseModel):
+    """One page of a cursor-paginated public endpoint listing.
+
+    The API returns ``items`` as the response body and ``next_cursor`` in the
+    ``X-Next-Cursor`` header, so list-shaped clients keep working unchanged.
+    """
+
+    items: List[EndpointPublicResponse] = Field(
+        default_factory=list, description="Endpoints on this page"
+    )
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page; None on the last page"
+    )
+
+
 class GroupedEndpointsResponse(BaseModel):
     """Response containing endpoints grouped by owner.
 
@@ -9,7 +9,7 @@ Based on OpenAPI 3.0 specification for SyftHub Identity & Trust API.
 
 from __future__ import annotations
 
-from typing import List, Literal, Union
+from typing import Dict, List, Literal, Union
 
 from pydantic import BaseModel, Field
 
@@ -175,6 +175,61 @@ class SatelliteTokenErrorResponse(BaseModel):
     }
 
 
+class SatelliteTokenBatchRequest(BaseModel):
+    """Request to mint satellite tokens for several audiences at once.
+
+    Attributes:
+        audiences: Usernames of the target services/users
+    """
+
+    audiences: List[str] = Field(
+        ...,
+        min_length=1,
+        description="Usernames of target services/users",
+        examples=[["alice", "syftai-space"]],
+    )
+
+
+class SatelliteTokenBatchResponse(BaseModel):
+    """Satellite tokens minted for several audiences.
+
+    Audiences that fail validation do not fail the whole request; they are
+    reported under ``errors`` and omitted from ``tokens``.
+
+    Attributes:
+        tokens: Satellite tokens keyed by requested audience
+        errors: Validation errors keyed by requested audience
+    """
+
+    tokens: Dict[str, SatelliteTokenResponse] = Field(
+        default_factory=dict,
+        description="Satellite tokens keyed by requested audience",
+    )
+    errors: Dict[str, SatelliteTokenErrorResponse] = Field(
+        default_factory=dict,
+        description="Per-audience errors for audiences that could not be minted",
+    )
+
+    model_config = {
+        "json_schema_extra": {
+            "example": {
+                "tokens": {
+                    "syftai-space": {
+                        "target_token": "eyJhbGciOiJSUzI1NiIsInR5cCI6IkpXVCJ9...",
+                        "expires_in": 60,
+                    }
+                },
+                "errors": {
+                    "syft-mars": {
+                        "error": "audience_not_found",
+                        "message": "Audience 'syft-mars' is not a registered user.",
+                    }
+                },
+            }
+        }
+    }
+
+
 # ===========================================
 # TOKEN VERIFICATION SCHEMAS
 # ===========================================
@@ -0,0 +1,336 @@
+"""In-memory snapshot of the grouped Global Directory.
+
+``GET /endpoints/public/grouped`` backs the home page, so it is read far more
+often than the endpoints it lists change. Instead of running the window query
+on every page view, each worker keeps a snapshot of every owner's group
+(their most recently updated endpoints, up to ``SNAPSHOT_MAX_PER_OWNER``, plus
+their total count) and serves requests from it.
+
+The snapshot is refreshed incrementally: endpoint writes, health flips and
+owner profile changes mark the affected owners dirty
+(``invalidate_directory_owners``) and the next read re-queries just those
+owners. Writes made by another worker process are picked up when the
+snapshot expires (``directory_snapshot_ttl_seconds``) and is fully rebuilt.
+
+Entries are stored viewer-independent: each endpoint keeps its anonymous
+response plus its raw policies, and targeted policies are re-filtered per
+viewer at render time. Every snapshot carries a content hash, from which the
+route derives an ETag so unchanged directories are answered with 304.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from syfthub.core.config import settings
+from syfthub.schemas.endpoint import (
+    EndpointGroupItem,
+    EndpointPublicResponse,
+    GroupedEndpointsResponse,
+    Policy,
+    filter_visible_policies,
+)
+
+if TYPE_CHECKING:
+    from syfthub.repositories.endpoint import EndpointRepository
+
+logger = logging.getLogger(__name__)
+
+# Endpoints kept per owner; matches the route's max_per_owner upper bound so
+# one snapshot serves every allowed page size.
+SNAPSHOT_MAX_PER_OWNER = 50
+
+
+@dataclass(frozen=True)
+class _DirectoryEntry:
+    """One endpoint in the snapshot, stored independent of the viewer."""
+
+    anonymous: EndpointPublicResponse
+    policies: list[Any]
+    # True when some policy targets specific emails, so viewers may differ
+    targeted: bool
+
+    def render(self, viewer_email: Optional[str]) -> EndpointPublicResponse:
+        if viewer_email is None or not self.targeted:
+            return self.anonymous
+        visible = filter_visible_policies(self.policies, viewer_email)
+        return self.anonymous.model_copy(
+            update={"policies": [Policy.model_validate(p) for p in visible]}
+        )
+
+
+@dataclass(frozen=True)
+class _OwnerGroup:
+    """One owner's group: their newest endpoints and total endpoint count."""
+
+    owner_id: int
+    owner_username: str
+    total_count: int
+    entries: tuple[_DirectoryEntry, ...]
+
+
+@dataclass(frozen=True)
+class DirectoryState:
+    """An immutable view of the grouped directory at one point in time."""
+
+    groups: tuple[_OwnerGroup, ...]
+    version: str
+    built_at: float
+    targeted: bool = False
+
+    def etag(self, max_per_owner: int, viewer_email: Optional[str] = None) -> str:
+        """Return the ETag for this directory rendered for one request.
+
+        Viewers only get a distinct tag when some endpoint has targeted
+        policies, so anonymous and most signed-in views share one tag.
+        """
+        viewer = (viewer_email or "").strip().lower() if self.targeted else ""
+        digest = hashlib.sha256(
+            f"{self.version}:{max_per_owner}:{viewer}".encode()
+        ).hexdigest()
+        return f'"{digest[:32]}"'
+
+    def render(
+        self, max_per_owner: int, viewer_email: Optional[str] = None
+    ) -> GroupedEndpointsResponse:
+        """Build the response for one request from the snapshot."""
+        groups = []
+        for group in self.groups:
+            endpoints = [
+                entry.render(viewer_email) for entry in group.entries[:max_per_owner]
+            ]
+            groups.append(
+                EndpointGroupItem(
+                    owner_username=group.owner_username,
+                    endpoints=endpoints,
+                    total_count=group.total_count,
+                    has_more=group.total_count > len(endpoints),
+                )
+            )
+        return GroupedEndpointsResponse(groups=groups)
+
+
+_EMPTY_STATE = DirectoryState(groups=(), version="empty", built_at=0.0)
+
+
+@dataclass
+class _Pending:
+    """Invalidations recorded since the snapshot was last refreshed."""
+
+    everything: bool = True
+    owner_ids: set[int] = field(default_factory=set)
+
+
+class DirectorySnapshot:
+    """Thread-safe, incrementally refreshed grouped directory snapshot."""
+
+    def __init__(self, ttl_seconds: float) -> None:
+        """Initialize an empty snapshot.
+
+        Args:
+            ttl_seconds: Maximum snapshot age before a full rebuild. 0 or
+                less disables the snapshot (every read queries the database).
+        """
+        self.ttl_seconds = ttl_seconds
+        self._state: Optional[DirectoryState] = None
+        self._pending = _Pending()
+        # Guards _state and _pending
+        self._lock = threading.Lock()
+        # Serializes refreshes so concurrent readers share one query
+        self._refresh_lock = threading.Lock()
+
+    def invalidate(self) -> None:
+        """Drop the whole snapshot; the next read rebuilds it."""
+        with self._lock:
+            self._pending.everything = True
+            self._pending.owner_ids.clear()
+
+    def invalidate_owners(self, owner_ids: Iterable[int]) -> None:
+        """Mark owners whose public endpoints changed for re-query."""
+        with self._lock:
+            if not self._pending.everything:
+                self._pending.owner_ids.update(owner_ids)
+
+    def get(self, repository: EndpointRepository) -> DirectoryState:
+        """Return the current directory, refreshing what is stale.
+
+        Args:
+            repository: Repository used to (re)query owner groups
+
+        Returns:
+            The up-to-date DirectoryState (an empty one if the query fails)
+        """
+        if self.ttl_seconds <= 0:
+            return self._build(repository) or _EMPTY_STATE
+
+        state = self._fresh_state()
+        if state is not None:
+            return state
+
+        with self._refresh_lock:
+            # Another thread may have refreshed while we waited
+            state = self._fresh_state()
+            if state is not None:
+                return state
+
+            with self._lock:
+                pending, self._pending = self._pending, _Pending(everything=False)
+                current = self._state
+            expired = (
+                current is None
+                or time.monotonic() - current.built_at >= self.ttl_seconds
+            )
+
+            if pending.everything or expired or current is None:
+                refreshed = self._build(repository)
+            else:
+                refreshed = self._refresh_owners(repository, current, pending.owner_ids)
+
+            if refreshed is None:
+                # Query failed: keep the invalidations for the next read
+                with self._lock:
+                    self._pending.everything = True
+                return _EMPTY_STATE if current is None else current
+
+            with self._lock:
+                self._state = refreshed
+            return refreshed
+
+    def _fresh_state(self) -> Optional[DirectoryState]:
+        with self._lock:
+            state = self._state
+            if (
+                state is None
+                or self._pending.everything
+                or self._pending.owner_ids
+                or time.monotonic() - state.built_at >= self.ttl_seconds
+            ):
+                return None
+            return state
+
+    def _query_groups(
+        self, repository: EndpointRepository, owner_ids: Optional[list[int]] = None
+    ) -> Optional[list[_OwnerGroup]]:
+        try:
+            rows = repository.get_public_directory_rows(
+                SNAPSHOT_MAX_PER_OWNER, user_ids=owner_ids
+            )
+        except SQLAlchemyError as e:
+            logger.error(f"Failed to refresh directory snapshot: {e}")
+            return None
+
+        groups: dict[int, dict[str, Any]] = {}
+        for row, anonymous in rows:
+            group = groups.setdefault(
+                row.user_id,
+                {
+                    "owner_username": row.owner_username,
+                    "total_count": row.owner_count,
+                    "entries": [],
+                },
+            )
+            policies = list(row.policies or [])
+            group["entries"].append(
+                _DirectoryEntry(
+                    anonymous=anonymous,
+                    policies=policies,
+                    targeted=len(filter_visible_policies(policies, None))
+                    != len(policies),
+                )
+            )
+        return [
+            _OwnerGroup(
+                owner_id=owner_id,
+                owner_username=data["owner_username"],
+                total_count=data["total_count"],
+                entries=tuple(data["entries"]),
+            )
+            for owner_id, data in groups.items()
+        ]
+
+    def _build(self, repository: EndpointRepository) -> Optional[DirectoryState]:
+        groups = self._query_groups(repository)
+        if groups is None:
+            return None
+        logger.debug(f"Rebuilt directory snapshot ({len(groups)} owners)")
+        return _make_state(groups)
+
+    def _refresh_owners(
+        self,
+        repository: EndpointRepository,
+        current: DirectoryState,
+        owner_ids: set[int],
+    ) -> Optional[DirectoryState]:
+        refreshed = self._query_groups(repository, sorted(owner_ids))
+        if refreshed is None:
+            return None
+        # Owners with no public endpoints left simply drop out
+        kept = [g for g in current.groups if g.owner_id not in owner_ids]
+        state = _make_state(kept + refreshed, built_at=current.built_at)
+        logger.debug(f"Refreshed {len(owner_ids)} owner(s) in directory snapshot")
+        return state
+
+
+def _make_state(
+    groups: list[_OwnerGroup], built_at: Optional[float] = None
+) -> DirectoryState:
+    groups.sort(key=lambda g: (-g.total_count, g.owner_username))
+    hasher = hashlib.sha256()
+    for group in groups:
+        hasher.update(
+            json.dumps(
+                [
+                    group.owner_username,
+                    group.total_count,
+                    [
+                        [entry.anonymous.model_dump(mode="json"), entry.policies]
+                        for entry in group.entries
+                    ],
+                ],
+                sort_keys=True,
+                default=str,
+            ).encode()
+        )
+    return DirectoryState(
+        groups=tuple(groups),
+        version=hasher.hexdigest(),
+        built_at=time.monotonic() if built_at is None else built_at,
+        targeted=any(entry.targeted for g in groups for entry in g.entries),
+    )
+
+
+_snapshot: Optional[DirectorySnapshot] = None
+_snapshot_lock = threading.Lock()
+
+
+def get_directory_snapshot() -> DirectorySnapshot:
+    """Get the process-wide directory snapshot."""
+    global _snapshot
+
+    if _snapshot is None:
+        with _snapshot_lock:
+            if _snapshot is None:
+                _snapshot = DirectorySnapshot(settings.directory_snapshot_ttl_seconds)
+
+    return _snapshot
+
+
+def invalidate_directory_owners(owner_ids: Iterable[int]) -> None:
+    """Re-query these owners' groups on the next directory read."""
+    get_directory_snapshot().invalidate_owners(owner_ids)
+
+
+def reset_directory_snapshot() -> None:
+    """Discard the process-wide snapshot (used by tests)."""
+    global _snapshot
+    with _snapshot_lock:
+        _snapshot = None
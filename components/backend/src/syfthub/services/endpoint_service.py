@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+from collections.abc import Iterable
 from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, List, Optional
 from urllib.parse import urlparse
 
 from fastapi import HTTPException, status
 
+from syfthub.auth.principal_cache import invalidate_user_principal
 from syfthub.core.config import settings
+from syfthub.core.cursor import InvalidCursorError
+from syfthub.core.response_cache import invalidate_public_responses
 from syfthub.core.url_builder import transform_connection_urls
 from syfthub.repositories.endpoint import EndpointRepository, EndpointStarRepository
 from syfthub.repositories.user import UserRepository
@@ -30,6 +36,7 @@ from syfthub.schemas.endpoint import (
     GroupedEndpointsResponse,
     OwnersListResponse,
     Policy,
+    PublicEndpointPage,
     SyncEndpointsResponse,
     SyncValidationError,
     UptimeBucket,
@@ -39,20 +46,71 @@ from syfthub.schemas.endpoint import (
 )
 from syfthub.schemas.search import EndpointSearchResponse, EndpointSearchResult
 from syfthub.services.base import BaseService
+from syfthub.services.directory_snapshot import (
+    DirectoryState,
+    get_directory_snapshot,
+    invalidate_directory_owners,
+)
 from syfthub.services.rag_service import RAGService, get_rag_service
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
 
+    from syfthub.models.endpoint import EndpointModel
     from syfthub.schemas.user import User
 
 logger = logging.getLogger(__name__)
 
+# Endpoint fields written by sync; their hash decides whether a row changed
+SYNC_CONTENT_FIELDS = (
+    "name",
+    "slug",
+    "description",
+    "type",
+    "visibility",
+    "version",
+    "readme",
+    "tags",
+    "contributors",
+    "policies",
+    "connect",
+)
+
 
 def _viewer_email(user: Optional[User]) -> Optional[str]:
     return user.email if user else None
 
 
+def _public_listings_changed(owner_ids: Iterable[int]) -> None:
+    """Refresh everything anonymous visitors see after a public-facing write."""
+    invalidate_directory_owners(owner_ids)
+    invalidate_public_responses()
+
+
+def _invalid_cursor(error: InvalidCursorError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail={"code": "INVALID_CURSOR", "message": str(error)},
+    )
+
+
+def endpoint_content_hash(data: dict[str, Any]) -> str:
+    """Hash the synced content of an endpoint.
+
+    ``data`` is a validated sync dict or the same fields read off a stored
+    endpoint; equal content gives equal hashes regardless of key order.
+    """
+    content = {field: data.get(field) for field in SYNC_CONTENT_FIELDS}
+    encoded = json.dumps(content, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _stored_content_hash(endpoint_model: EndpointModel) -> str:
+    return endpoint_content_hash(
+        {field: getattr(endpoint_model, field) for field in SYNC_CONTENT_FIELDS}
+    )
+
+
 class EndpointService(BaseService):
     """Endpoint service for handling endpoint operations."""
 
@@ -247,6 +305,7 @@ class EndpointService(BaseService):
         # Ingest to RAG if public (best effort - non-blocking)
         if endpoint.visibility == EndpointVisibility.PUBLIC:
             self._ingest_to_rag(endpoint.id)
+            _public_listings_changed([owner_id])
 
         return self._to_response_with_urls(endpoint, current_user=current_user)
 
@@ -354,6 +413,7 @@ class EndpointService(BaseService):
         self._update_rag_on_visibility_change(
             endpoint.id, old_visibility, new_visibility
         )
+        _public_listings_changed([endpoint.user_id])
 
         return self._to_response_with_urls(updated_endpoint, current_user=current_user)
 
@@ -424,6 +484,7 @@ class EndpointService(BaseService):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to update endpoint",
             )
+        _public_listings_changed([endpoint.user_id])
 
         return self._to_response_with_urls(updated_endpoint, current_user=current_user)
 
@@ -453,15 +514,20 @@ class EndpointService(BaseService):
         endpoint_type: Optional[EndpointType] = None,
         search: Optional[str] = None,
         current_user: Optional[User] = None,
-    ) -> List[EndpointPublicResponse]:
-        """List public endpoints - router-compatible wrapper."""
-        return self.get_public_endpoints(
-            skip=skip,
-            limit=limit,
-            endpoint_type=endpoint_type,
-            search=search,
-            current_user=current_user,
-        )
+        cursor: Optional[str] = None,
+    ) -> PublicEndpointPage:
+        """List a page of public endpoints - router-compatible wrapper."""
+        try:
+            return self.endpoint_repository.get_public_endpoints_page(
+                cursor=cursor,
+                limit=limit,
+                skip=skip,
+                endpoint_type=endpoint_type,
+                search=search,
+                viewer_email=_viewer_email(current_user),
+            )
+        except InvalidCursorError as e:
+            raise _invalid_cursor(e) from e
 
     def list_public_endpoints_by_owner(
         self,
@@ -469,23 +535,32 @@ class EndpointService(BaseService):
         skip: int = 0,
         limit: int = 100,
         current_user: Optional[User] = None,
-    ) -> List[EndpointPublicResponse]:
-        """List public endpoints for a specific owner.
+        cursor: Optional[str] = None,
+    ) -> PublicEndpointPage:
+        """List a page of public endpoints for a specific owner.
 
         Args:
             owner_slug: The username.
             skip: Number of endpoints to skip (for pagination).
             limit: Maximum number of endpoints to return.
+            cursor: Cursor from the previous page, if any.
 
         Returns:
-            List of EndpointPublicResponse objects for the owner.
+            PublicEndpointPage with the owner's endpoints and the next cursor.
+
+        Raises:
+            HTTPException: 400 if the cursor is invalid
         """
-        return self.endpoint_repository.get_public_endpoints_by_owner(
-            owner_slug=owner_slug,
-            skip=skip,
-            limit=limit,
-            viewer_email=_viewer_email(current_user),
-        )
+        try:
+            return self.endpoint_repository.get_public_endpoints_by_owner_page(
+                owner_slug,
+                cursor=cursor,
+                limit=limit,
+                skip=skip,
+                viewer_email=_viewer_email(current_user),
+            )
+        except InvalidCursorError as e:
+            raise _invalid_cursor(e) from e
 
     def get_public_endpoint_by_path(
         self,
@@ -525,15 +600,20 @@ class EndpointService(BaseService):
         min_stars: Optional[int] = None,
         endpoint_type: Optional[EndpointType] = None,
         current_user: Optional[User] = None,
-    ) -> List[EndpointPublicResponse]:
+        cursor: Optional[str] = None,
+    ) -> PublicEndpointPage:
         """List trending public endpoints sorted by stars count with optional min_stars filter."""
-        return self.endpoint_repository.get_trending_endpoints(
-            skip,
-            limit,
-            min_stars,
-            endpoint_type,
-            viewer_email=_viewer_email(current_user),
-        )
+        try:
+            return self.endpoint_repository.get_trending_endpoints_page(
+                cursor=cursor,
+                limit=limit,
+                skip=skip,
+                min_stars=min_stars,
+                endpoint_type=endpoint_type,
+                viewer_email=_viewer_email(current_user),
+            )
+        except InvalidCursorError as e:
+            raise _invalid_cursor(e) from e
 
     def list_guest_accessible_endpoints(
         self,
@@ -577,17 +657,23 @@ class EndpointService(BaseService):
         max_per_owner endpoints shown per owner. This prevents a single owner
         with many endpoints from dominating the display (e.g., in Global Directory).
 
+        Served from the in-memory directory snapshot rather than queried on
+        every call.
+
         Args:
             max_per_owner: Maximum number of endpoints to return per owner (default 15)
 
         Returns:
             GroupedEndpointsResponse with groups ordered by total endpoint count (descending)
         """
-        return self.endpoint_repository.get_public_endpoints_grouped(
-            max_per_owner=max_per_owner,
-            viewer_email=_viewer_email(current_user),
+        return self.get_grouped_directory().render(
+            max_per_owner, _viewer_email(current_user)
         )
 
+    def get_grouped_directory(self) -> DirectoryState:
+        """Get the current grouped directory snapshot (refreshing stale owners)."""
+        return get_directory_snapshot().get(self.endpoint_repository)
+
     def list_public_endpoint_owners(
         self,
         skip: int = 0,
@@ -858,6 +944,7 @@ class EndpointService(BaseService):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to delete endpoint",
             )
+        _public_listings_changed([endpoint.user_id])
 
         return True
 
@@ -887,6 +974,7 @@ class EndpointService(BaseService):
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to delete endpoint",
             )
+        _public_listings_changed([endpoint.user_id])
 
         return True
 
@@ -910,6 +998,7 @@ class EndpointService(BaseService):
         success = self.star_repository.star_endpoint(current_user.id, endpoint_id)
         if success:
             self.endpoint_repository.increment_stars(endpoint_id)
+            _public_listings_changed([endpoint.user_id])
 
         return success
 
@@ -918,6 +1007,9 @@ class EndpointService(BaseService):
         success = self.star_repository.unstar_endpoint(current_user.id, endpoint_id)
         if success:
             self.endpoint_repository.decrement_stars(endpoint_id)
+            endpoint = self.endpoint_repository.get_by_id(endpoint_id)
+            if endpoint:
+                _public_listings_changed([endpoint.user_id])
 
         return success
 
@@ -1107,15 +1199,18 @@ class EndpointService(BaseService):
         """Synchronize user's endpoints with provided list.
 
         This operation is ATOMIC: either all endpoints are synced, or none are.
-        It replaces ALL user-owned endpoints with the provided list.
+        After it, the user owns exactly the provided endpoints. Endpoints are
+        matched by slug and compared by content hash, so only rows whose content
+        changed are written and re-indexed; matched rows keep their ID and stars.
 
         Flow:
         1. Validate all endpoints in the batch (no DB changes)
         2. If validation fails, return 400 with ALL errors
-        3. Delete all existing user endpoints
-        4. Create all new endpoints
+        3. Diff against existing endpoints by slug and content hash
+        4. Delete removed, update changed, create new endpoints
         5. Commit transaction
-        6. Return sync results
+        6. Update the search index for changed endpoints only
+        7. Return sync results
 
         Args:
             endpoints_data: List of endpoint specifications to sync
@@ -1151,63 +1246,68 @@ class EndpointService(BaseService):
                 },
             )
 
-        # Phase 2: Remove old endpoints from RAG (best effort, before DB delete)
-        if self.rag_service.is_available:
-            old_rag_files = self.endpoint_repository.get_user_rag_file_ids(
-                current_user.id
-            )
-            for endpoint_id, file_id in old_rag_files:
-                try:
-                    self.rag_service.remove_endpoint(file_id)
-                    logger.debug(f"Removed endpoint {endpoint_id} from RAG during sync")
-                except Exception as e:
-                    logger.warning(
-                        f"Failed to remove endpoint {endpoint_id} from RAG during sync: {e}"
-                    )
-
-        # Phase 3: Atomic database operation
         try:
-            # Delete all existing user endpoints
-            deleted_count = self.endpoint_repository.delete_all_user_endpoints(
-                current_user.id
+            # Phase 2: Diff against existing endpoints (slug -> content hash)
+            existing = {
+                model.slug: model
+                for model in self.endpoint_repository.get_user_endpoint_models(
+                    current_user.id
+                )
+            }
+            public = EndpointVisibility.PUBLIC.value
+            unchanged: List[Endpoint] = []
+            updates: List[tuple[EndpointModel, dict[str, Any]]] = []
+            to_create: List[dict[str, Any]] = []
+            # Search index work, planned before commit expires the loaded rows
+            rag_remove: List[str] = []
+            rag_index_ids: List[int] = []
+
+            for data in validated_endpoints:
+                model = existing.pop(data["slug"], None)
+                if model is None:
+                    to_create.append(data)
+                elif _stored_content_hash(model) == endpoint_content_hash(data):
+                    unchanged.append(Endpoint.model_validate(model))
+                    # Self-heal public endpoints missing from the index
+                    if model.visibility == public and not model.rag_file_id:
+                        rag_index_ids.append(model.id)
+                else:
+                    if data["visibility"] == public:
+                        rag_index_ids.append(model.id)
+                    elif model.rag_file_id:
+                        rag_remove.append(model.rag_file_id)
+                        model.rag_file_id = None
+                    updates.append((model, data))
+
+            # Whatever is left over is no longer part of the user's endpoints
+            removed = list(existing.values())
+            rag_remove.extend(m.rag_file_id for m in removed if m.rag_file_id)
+
+            # Phase 3: Atomic database operation
+            deleted_count = self.endpoint_repository.delete_endpoints_by_ids(
+                [m.id for m in removed]
             )
-
-            # Create all new endpoints
-            if validated_endpoints:
-                created_endpoints = self.endpoint_repository.bulk_create_endpoints(
-                    validated_endpoints, current_user.id
+            updated_endpoints = self.endpoint_repository.bulk_update_endpoints(updates)
+            created_endpoints = (
+                self.endpoint_repository.bulk_create_endpoints(
+                    to_create, current_user.id
                 )
-            else:
-                created_endpoints = []
+                if to_create
+                else []
+            )
+            rag_index_ids.extend(
+                ep.id for ep in created_endpoints if ep.visibility == public
+            )
 
-            # Commit the transaction (delete + creates)
+            # Commit the transaction (deletes + updates + creates)
             self.session.commit()
+            if removed or updates or created_endpoints:
+                _public_listings_changed([current_user.id])
 
             logger.info(
                 f"Sync completed for user {current_user.id}: "
-                f"deleted={deleted_count}, created={len(created_endpoints)}"
-            )
-
-            # Phase 4: Ingest new public endpoints to RAG (best effort, after commit)
-            if self.rag_service.is_available:
-                for endpoint in created_endpoints:
-                    if endpoint.visibility == EndpointVisibility.PUBLIC:
-                        self._ingest_to_rag(endpoint.id)
-
-            # Transform URLs for response (look up user domain once)
-            user = self.user_repository.get_by_id(current_user.id)
-            user_domain = user.domain if user else None
-            response_endpoints = [
-                self._to_response_with_urls(
-                    ep, owner_domain=user_domain, current_user=current_user
-                )
-                for ep in created_endpoints
-            ]
-
-            return SyncEndpointsResponse(
-                synced=len(created_endpoints),
-                deleted=deleted_count,
-                endpoints=response_endpoints,
+                f"unchanged={len(unchanged)}, updated={len(updated_endpoints)}, "
+                f"created={len(created_endpoints)}, deleted={deleted_count}"
             )
 
         except Exception as e:
@@ -1225,6 +1325,58 @@ class EndpointService(BaseService):
                 },
             ) from e
 
+        # Phase 4: Search index maintenance (best effort, after commit)
+        if self.rag_service.is_available and (rag_remove or rag_index_ids):
+            self._sync_rag_index(rag_remove, rag_index_ids)
+
+        # Transform URLs for response, in request order (look up user domain once)
+        by_slug = {ep.slug: ep for ep in unchanged + updated_endpoints}
+        by_slug.update({ep.slug: ep for ep in created_endpoints})
+        user = self.user_repository.get_by_id(current_user.id)
+        user_domain = user.domain if user else None
+        response_endpoints = [
+            self._to_response_with_urls(
+                by_slug[data["slug"]],
+                owner_domain=user_domain,
+                current_user=current_user,
+            )
+            for data in validated_endpoints
+        ]
+
+        return SyncEndpointsResponse(
+            synced=len(response_endpoints),
+            created=len(created_endpoints),
+            updated=len(updated_endpoints),
+            unchanged=len(unchanged),
+            deleted=deleted_count,
+            endpoints=response_endpoints,
+        )
+
+    def _sync_rag_index(self, remove_file_ids: List[str], index_ids: List[int]) -> None:
+        """Apply a sync's search index changes in two bulk requests (best effort).
+
+        Args:
+            remove_file_ids: Index document IDs to delete.
+            index_ids: IDs of public endpoints to (re-)index.
+        """
+        try:
+            if remove_file_ids:
+                self.rag_service.remove_endpoints(remove_file_ids)
+            if index_ids:
+                models = self.endpoint_repository.get_endpoint_models_by_ids(index_ids)
+                indexed = set(self.rag_service.ingest_endpoints(models))
+                for model in models:
+                    if model.id in indexed:
+                        model.rag_file_id = str(model.id)
+                self.session.commit()
+            logger.debug(
+                f"Sync search index: removed={len(remove_file_ids)}, "
+                f"indexed={len(index_ids)}"
+            )
+        except Exception as e:
+            self.session.rollback()
+            logger.warning(f"Failed to update search index during sync: {e}")
+
     # ===========================================
     # ENDPOINT HEALTH REPORTING
     # ===========================================
@@ -1283,12 +1435,14 @@ class EndpointService(BaseService):
 
         # --- Build health updates ---
         health_updates = []
+        health_changed = False
 
         for item in endpoints_health:
             slug = item.slug.lower()
             endpoint = slug_to_endpoint.get(slug)  # type: ignore[call-overload]
             if endpoint is None:
                 continue
+            health_changed |= endpoint.health_status != item.status.value
 
             health_updates.append(
                 {
@@ -1307,7 +1461,7 @@ class EndpointService(BaseService):
         ignored = len(endpoints_health) - updated
 
         # --- Update owner domain for dynamic endpoint URL construction ---
-        self.user_repository.update_domain(
+        domain_changed = self.user_repository.update_domain(
             user_id=current_user.id,
             domain=domain,
         )
@@ -1327,6 +1481,13 @@ class EndpointService(BaseService):
                 detail="Failed to update endpoint health",
             ) from e
 
+        # Connection URLs in the directory are built from the owner's domain,
+        # and listings show each endpoint's health
+        if domain_changed:
+            invalidate_user_principal(current_user.id)
+        if domain_changed or health_changed:
+            _public_listings_changed([current_user.id])
+
         logger.info(
             f"Endpoint health reported by user {current_user.id}: "
             f"updated={updated}, ignored={ignored}"
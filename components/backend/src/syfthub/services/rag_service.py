@@ -183,6 +183,59 @@ class RAGService:
             logger.exception(f"Unexpected error indexing endpoint {endpoint.id}: {e}")
             return None
 
+    def ingest_endpoints(self, endpoints: list[EndpointModel]) -> list[int]:
+        """Index several endpoints in Meilisearch with a single request.
+
+        Args:
+            endpoints: The endpoints to index.
+
+        Returns:
+            IDs of the endpoints that were submitted for indexing (empty on error).
+        """
+        if not endpoints or not self.is_available:
+            return []
+
+        if not self._ensure_index():
+            logger.warning("Could not configure search index, skipping ingestion")
+            return []
+
+        assert self.client is not None
+        try:
+            documents = [self._build_document(endpoint) for endpoint in endpoints]
+            self.client.index(settings.meili_index_name).add_documents(documents)
+            logger.info(f"Successfully indexed {len(documents)} endpoints")
+            return [endpoint.id for endpoint in endpoints]
+        except (MeilisearchApiError, MeilisearchCommunicationError) as e:
+            logger.error(f"Failed to index {len(endpoints)} endpoints: {e}")
+            return []
+        except Exception as e:
+            logger.exception(f"Unexpected error indexing endpoints: {e}")
+            return []
+
+    def remove_endpoints(self, file_ids: list[str]) -> bool:
+        """Remove several endpoints from the Meilisearch index in one request.
+
+        Args:
+            file_ids: The document IDs to remove (str(endpoint.id) each).
+
+        Returns:
+            True if successful or not applicable, False on error.
+        """
+        if not file_ids or not self.is_available:
+            return True
+
+        assert self.client is not None
+        try:
+            self.client.index(settings.meili_index_name).delete_documents([*file_ids])
+            logger.info(f"Successfully removed {len(file_ids)} documents from index")
+            return True
+        except (MeilisearchApiError, MeilisearchCommunicationError) as e:
+            logger.error(f"Failed to remove {len(file_ids)} documents: {e}")
+            return False
+        except Exception as e:
+            logger.exception(f"Unexpected error removing documents: {e}")
+            return False
+
     def remove_endpoint(self, file_id: str) -> bool:
         """Remove an endpoint from the Meilisearch index.
 
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, List, Optional
 
+from syfthub.core.response_cache import invalidate_public_responses
 from syfthub.domain.exceptions import (
     ConflictError,
     NotFoundError,
@@ -18,6 +19,7 @@ from syfthub.schemas.user import (
     UserUpdate,
 )
 from syfthub.services.base import BaseService
+from syfthub.services.directory_snapshot import invalidate_directory_owners
 
 if TYPE_CHECKING:
     from sqlalchemy.orm import Session
@@ -111,6 +113,11 @@ class UserService(BaseService):
         if not updated_user:
             raise NotFoundError("User")
 
+        # Owner username and domain are shown in the Global Directory
+        if user_data.username is not None or user_data.domain is not None:
+            invalidate_directory_owners([user_id])
+            invalidate_public_responses()
+
         return UserResponse.model_validate(updated_user)
 
     def deactivate_user(self, user_id: int, current_user: User) -> bool:
@@ -19,7 +19,12 @@ import pytest  # noqa: E402
 from sqlalchemy import create_engine, event  # noqa: E402
 from sqlalchemy.orm import Session, sessionmaker  # noqa: E402
 
+from syfthub.auth.api_token_usage import reset_api_token_usage_buffer  # noqa: E402
+from syfthub.auth.principal_cache import reset_principal_cache  # noqa: E402
+from syfthub.core.response_cache import reset_public_response_cache  # noqa: E402
+from syfthub.core.ssrf_protection import reset_dns_cache  # noqa: E402
 from syfthub.models import Base  # noqa: E402
+from syfthub.services.directory_snapshot import reset_directory_snapshot  # noqa: E402
 
 
 def pytest_sessionfinish(session, exitstatus):
@@ -32,6 +37,46 @@ def pytest_sessionfinish(session, exitstatus):
             os.unlink(db_file)
 
 
+@pytest.fixture(autouse=True)
+def _reset_directory_snapshot() -> Generator[None, None, None]:
+    """Keep the process-wide directory snapshot from leaking between tests."""
+    reset_directory_snapshot()
+    yield
+    reset_directory_snapshot()
+
+
+@pytest.fixture(autouse=True)
+def _reset_public_response_cache() -> Generator[None, None, None]:
+    """Keep cached anonymous responses from leaking between tests."""
+    reset_public_response_cache()
+    yield
+    reset_public_response_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_api_token_usage_buffer() -> Generator[None, None, None]:
+    """Keep buffered API token uses from leaking between tests."""
+    reset_api_token_usage_buffer()
+    yield
+    reset_api_token_usage_buffer()
+
+
+@pytest.fixture(autouse=True)
+def _reset_principal_cache() -> Generator[None, None, None]:
+    """Keep cached authenticated users and API tokens from leaking between tests."""
+    reset_principal_cache()
+    yield
+    reset_principal_cache()
+
+
+@pytest.fixture(autouse=True)
+def _reset_dns_cache() -> Generator[None, None, None]:
+    """Keep cached SSRF resolutions from leaking between tests."""
+    reset_dns_cache()
+    yield
+    reset_dns_cache()
+
+
 @pytest.fixture
 def example_fixture() -> str:
     """Example fixture that can be used across tests."""
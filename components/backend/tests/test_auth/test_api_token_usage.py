@@ -0,0 +1,81 @@
+"""Tests for buffered API token usage tracking."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from syfthub.auth.api_token_usage import (
+    APITokenUsageBuffer,
+    get_api_token_usage_buffer,
+)
+from syfthub.auth.db_dependencies import _authenticate_with_api_token
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+class TestAPITokenUsageBuffer:
+    """Tests for APITokenUsageBuffer."""
+
+    def test_keeps_latest_use_per_token(self):
+        buffer = APITokenUsageBuffer()
+        buffer.record(1, "10.0.0.1", T0)
+        buffer.record(1, "10.0.0.2", T0 + timedelta(seconds=5))
+        buffer.record(2, None, T0)
+
+        assert buffer.drain() == {
+            1: (T0 + timedelta(seconds=5), "10.0.0.2"),
+            2: (T0, None),
+        }
+        assert len(buffer) == 0
+
+    def test_missing_ip_keeps_previous_ip(self):
+        buffer = APITokenUsageBuffer()
+        buffer.record(1, "10.0.0.1", T0)
+        buffer.record(1, None, T0 + timedelta(seconds=1))
+
+        assert buffer.drain()[1] == (T0 + timedelta(seconds=1), "10.0.0.1")
+
+    def test_restore_does_not_overwrite_newer_use(self):
+        buffer = APITokenUsageBuffer()
+        failed = {1: (T0, "10.0.0.1"), 2: (T0, "10.0.0.9")}
+        buffer.record(1, "10.0.0.2", T0 + timedelta(seconds=1))
+
+        buffer.restore(failed)
+
+        assert buffer.drain() == {
+            1: (T0 + timedelta(seconds=1), "10.0.0.2"),
+            2: (T0, "10.0.0.9"),
+        }
+
+
+class TestAuthenticationTracksUsage:
+    """_authenticate_with_api_token records uses instead of writing them."""
+
+    @pytest.fixture
+    def api_token_repo(self):
+        repo = MagicMock()
+        token = repo.get_by_hash.return_value
+        token.id = 42
+        token.is_active = True
+        token.expires_at = None
+        token.user.is_active = True
+        return repo
+
+    def _authenticate(self, repo):
+        with patch("syfthub.auth.db_dependencies.User.model_validate"):
+            _authenticate_with_api_token("syft_pat_x", repo)
+
+    def test_use_is_buffered(self, api_token_repo):
+        self._authenticate(api_token_repo)
+
+        api_token_repo.update_last_used.assert_not_called()
+        assert 42 in get_api_token_usage_buffer().drain()
+
+    def test_zero_interval_writes_on_every_request(self, api_token_repo):
+        with patch("syfthub.auth.db_dependencies.settings") as settings:
+            settings.api_token_last_used_flush_interval_seconds = 0
+            self._authenticate(api_token_repo)
+
+        api_token_repo.update_last_used.assert_called_once_with(42, None)
+        assert len(get_api_token_usage_buffer()) == 0
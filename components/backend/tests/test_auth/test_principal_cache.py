@@ -0,0 +1,223 @@
+"""Tests for the authenticated-principal cache."""
+
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+
+from syfthub.auth.api_tokens import hash_api_token
+from syfthub.auth.db_dependencies import (
+    _authenticate_with_api_token,
+    _get_user_principal,
+)
+from syfthub.auth.principal_cache import (
+    APITokenPrincipal,
+    PrincipalCache,
+    invalidate_user_principal,
+)
+from syfthub.schemas.auth import UserRole
+from syfthub.schemas.user import User
+
+
+def _user(user_id: int = 1, is_active: bool = True) -> User:
+    now = datetime.now(timezone.utc)
+    return User(
+        id=user_id,
+        username=f"user{user_id}",
+        email=f"user{user_id}@example.com",
+        full_name="Test User",
+        role=UserRole.USER,
+        is_active=is_active,
+        created_at=now,
+        updated_at=now,
+        password_hash="hash",
+    )
+
+
+@pytest.fixture
+def cache() -> PrincipalCache:
+    return PrincipalCache(ttl_seconds=60, max_entries=10)
+
+
+class TestPrincipalCacheUsers:
+    def test_user_is_loaded_once(self, cache):
+        load = MagicMock(return_value=_user())
+
+        first = cache.get_or_load_user(1, load)
+        second = cache.get_or_load_user(1, load)
+
+        load.assert_called_once()
+        assert first == second
+        assert first is not second
+        assert cache.stats()["hits"] == 1
+
+    def test_missing_and_inactive_users_are_not_cached(self, cache):
+        missing = MagicMock(return_value=None)
+        inactive = MagicMock(return_value=_user(2, is_active=False))
+
+        for _ in range(2):
+            assert cache.get_or_load_user(1, missing) is None
+            assert cache.get_or_load_user(2, inactive).is_active is False
+
+        assert missing.call_count == 2
+        assert inactive.call_count == 2
+
+    def test_entries_expire(self, cache):
+        load = MagicMock(return_value=_user())
+        clock = [1000.0]
+
+        with patch(
+            "syfthub.auth.principal_cache.time.monotonic",
+            side_effect=lambda: clock[0],
+        ):
+            cache.get_or_load_user(1, load)
+            clock[0] += 59
+            cache.get_or_load_user(1, load)
+            clock[0] += 1
+            cache.get_or_load_user(1, load)
+
+        assert load.call_count == 2
+
+    def test_invalidate_user_drops_user_and_tokens(self, cache):
+        load_user = MagicMock(return_value=_user())
+        load_token = MagicMock(
+            return_value=APITokenPrincipal(token_id=7, user=_user(), expires_at=None)
+        )
+        cache.get_or_load_user(1, load_user)
+        cache.get_or_load_api_token("hash", load_token)
+
+        cache.invalidate_user(1)
+        cache.get_or_load_user(1, load_user)
+        cache.get_or_load_api_token("hash", load_token)
+
+        assert load_user.call_count == 2
+        assert load_token.call_count == 2
+
+    def test_lookup_racing_invalidation_is_not_cached(self, cache):
+        """A user loaded across an account change may be stale and is dropped."""
+
+        def load() -> User:
+            cache.invalidate_user(1)
+            return _user()
+
+        cache.get_or_load_user(1, load)
+        fresh = MagicMock(return_value=_user())
+        cache.get_or_load_user(1, fresh)
+
+        fresh.assert_called_once()
+
+    def test_unrelated_invalidation_does_not_block_caching(self, cache):
+        """Only an invalidation of the user being loaded discards the lookup."""
+
+        def load() -> User:
+            cache.invalidate_user(2)
+            return _user()
+
+        cache.get_or_load_user(1, load)
+        fresh = MagicMock(return_value=_user())
+        cache.get_or_load_user(1, fresh)
+
+        fresh.assert_not_called()
+
+    def test_forgotten_invalidations_count_as_races(self):
+        """Once per-user generations are evicted, older lookups aren't cached."""
+        cache = PrincipalCache(ttl_seconds=60, max_entries=1)
+
+        def load() -> User:
+            cache.invalidate_user(1)
+            cache.invalidate_user(2)  # evicts user 1's generation
+            return _user()
+
+        cache.get_or_load_user(1, load)
+        fresh = MagicMock(return_value=_user())
+        cache.get_or_load_user(1, fresh)
+
+        fresh.assert_called_once()
+
+    def test_disabled_cache_always_loads(self):
+        cache = PrincipalCache(ttl_seconds=0, max_entries=10)
+        load = MagicMock(return_value=_user())
+
+        cache.get_or_load_user(1, load)
+        cache.get_or_load_user(1, load)
+
+        assert load.call_count == 2
+
+
+class TestPrincipalCacheAPITokens:
+    def test_invalidate_api_token(self, cache):
+        load = MagicMock(
+            return_value=APITokenPrincipal(token_id=7, user=_user(), expires_at=None)
+        )
+        cache.get_or_load_api_token("hash", load)
+        cache.get_or_load_api_token("hash", load)
+        assert load.call_count == 1
+
+        cache.invalidate_api_token(7)
+        cache.get_or_load_api_token("hash", load)
+
+        assert load.call_count == 2
+
+    def test_failed_load_is_not_cached(self, cache):
+        load = MagicMock(side_effect=HTTPException(status_code=401))
+
+        for _ in range(2):
+            with pytest.raises(HTTPException):
+                cache.get_or_load_api_token("hash", load)
+
+        assert load.call_count == 2
+
+
+class TestAuthenticationUsesCache:
+    @pytest.fixture
+    def api_token_repo(self):
+        repo = MagicMock()
+        token = repo.get_by_hash.return_value
+        token.id = 7
+        token.is_active = True
+        token.expires_at = None
+        return repo
+
+    def test_api_token_is_looked_up_once(self, api_token_repo):
+        with patch(
+            "syfthub.auth.db_dependencies.User.model_validate", return_value=_user()
+        ):
+            first = _authenticate_with_api_token("syft_pat_abc", api_token_repo)
+            second = _authenticate_with_api_token("syft_pat_abc", api_token_repo)
+
+        api_token_repo.get_by_hash.assert_called_once_with(
+            hash_api_token("syft_pat_abc")
+        )
+        assert first.id == second.id == 1
+
+    def test_cached_api_token_expiry_is_still_enforced(self, api_token_repo):
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        api_token_repo.get_by_hash.return_value.expires_at = expires_at
+        with patch(
+            "syfthub.auth.db_dependencies.User.model_validate", return_value=_user()
+        ):
+            _authenticate_with_api_token("syft_pat_abc", api_token_repo)
+
+            later = expires_at + timedelta(seconds=1)
+            with patch("syfthub.auth.db_dependencies.datetime") as mock_datetime:
+                mock_datetime.now.return_value = later
+                with pytest.raises(HTTPException) as exc_info:
+                    _authenticate_with_api_token("syft_pat_abc", api_token_repo)
+
+        assert exc_info.value.detail == "API token has expired"
+        api_token_repo.get_by_hash.assert_called_once()
+
+    def test_user_change_invalidates_jwt_principal(self):
+        user_repo = MagicMock()
+        user_repo.get_by_id.return_value = _user()
+
+        _get_user_principal(1, user_repo)
+        _get_user_principal(1, user_repo)
+        assert user_repo.get_by_id.call_count == 1
+
+        user_repo.get_by_id.return_value = _user(is_active=False)
+        invalidate_user_principal(1)
+
+        assert _get_user_principal(1, user_repo).is_active is False
+        assert user_repo.get_by_id.call_count == 2
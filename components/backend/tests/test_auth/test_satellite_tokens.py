@@ -9,16 +9,23 @@ from unittest.mock import MagicMock, patch
 
 import jwt
 import pytest
+from sqlalchemy.exc import OperationalError
 
 from syfthub.auth.keys import RSAKeyManager
 from syfthub.auth.satellite_tokens import (
     AudienceValidationResult,
+    SatelliteTokenCache,
     TokenVerificationResult,
     create_guest_satellite_token,
+    create_guest_satellite_tokens,
     create_satellite_token,
+    create_satellite_tokens,
     decode_satellite_token,
     get_allowed_audiences,
+    issue_satellite_token,
+    satellite_token_cache,
     validate_audience,
+    validate_audiences,
     verify_satellite_token_for_service,
 )
 from syfthub.domain.exceptions import (
@@ -26,6 +33,15 @@ from syfthub.domain.exceptions import (
     AudienceNotFoundError,
     KeyNotConfiguredError,
 )
+from syfthub.repositories.user import UserRepository
+
+
+@pytest.fixture(autouse=True)
+def clear_token_cache():
+    """Start every test without previously minted tokens."""
+    satellite_token_cache.clear()
+    yield
+    satellite_token_cache.clear()
 
 
 class TestAudienceValidation:
@@ -993,3 +1009,262 @@ class TestGuestSatelliteTokenCreation:
 
             # Both should have the same audience
             assert guest_payload["aud"] == auth_payload["aud"] == "syftai-space"
+
+
+class TestBatchAudienceValidation:
+    """Tests for validate_audiences()."""
+
+    @staticmethod
+    def _user(username, is_active=True):
+        user = MagicMock()
+        user.username = username
+        user.is_active = is_active
+        return user
+
+    def test_single_query_for_all_audiences(self):
+        """All audiences are resolved with one repository call."""
+        repo = MagicMock()
+        repo.get_by_usernames.return_value = [
+            self._user("alice"),
+            self._user("bob", is_active=False),
+        ]
+
+        results = validate_audiences(["Alice ", "bob", "carol"], repo)
+
+        repo.get_by_usernames.assert_called_once_with(["alice", "bob", "carol"])
+        repo.get_by_username.assert_not_called()
+        assert results["Alice "].valid is True
+        assert results["bob"].error_code == "audience_inactive"
+        assert results["carol"].error_code == "audience_not_found"
+
+    def test_database_error_fails_closed(self):
+        """A lookup failure rejects every audience in the batch."""
+        session = MagicMock()
+        session.execute.side_effect = OperationalError("SELECT", {}, Exception("down"))
+
+        results = validate_audiences(["alice", "bob"], UserRepository(session))
+
+        assert {r.error_code for r in results.values()} == {"validation_error"}
+
+    def test_fallback_without_repo(self):
+        """Without a repository the static allowlist is used per audience."""
+        with patch("syfthub.auth.satellite_tokens.settings") as mock_settings:
+            mock_settings.allowed_audiences = {"alice"}
+            results = validate_audiences(["alice", "bob"])
+
+        assert results["alice"].valid is True
+        assert results["bob"].error_code == "invalid_audience"
+
+
+class TestSatelliteTokenCache:
+    """Tests for reuse of signed satellite tokens."""
+
+    @pytest.fixture
+    def configured_key_manager(self):
+        """Create a configured key manager for testing."""
+        RSAKeyManager._instance = None
+        manager = RSAKeyManager()
+        manager._generate_keypair("cache-test-key")
+        yield manager
+        RSAKeyManager._instance = None
+
+    @pytest.fixture
+    def mock_user(self):
+        user = MagicMock()
+        user.id = 123
+        user.role = "user"
+        return user
+
+    @pytest.fixture
+    def mock_user_repo(self):
+        repo = MagicMock()
+        audience = MagicMock()
+        audience.is_active = True
+        repo.get_by_username.return_value = audience
+        return repo
+
+    def test_token_reused_until_near_expiry(
+        self, mock_user, mock_user_repo, configured_key_manager
+    ):
+        """Repeated mints for the same (sub, aud) sign only once."""
+        with patch("syfthub.auth.satellite_tokens.jwt.encode") as encode:
+            encode.return_value = "signed-token"
+            first = issue_satellite_token(
+                mock_user, "syftai-space", configured_key_manager, mock_user_repo
+            )
+            second = issue_satellite_token(
+                mock_user, "SyftAI-Space", configured_key_manager, mock_user_repo
+            )
+
+        assert encode.call_count == 1
+        assert first.token == second.token == "signed-token"
+        assert second.expires_in <= first.expires_in
+        # Audience validation still runs on every mint
+        assert mock_user_repo.get_by_username.call_count == 2
+
+    def test_cache_keyed_by_subject_and_role(
+        self, mock_user, mock_user_repo, configured_key_manager
+    ):
+        """Different users and roles never share a token."""
+        other = MagicMock()
+        other.id = 456
+        other.role = "user"
+
+        user_token = create_satellite_token(
+            mock_user, "syftai-space", configured_key_manager, mock_user_repo
+        )
+        other_token = create_satellite_token(
+            other, "syftai-space", configured_key_manager, mock_user_repo
+        )
+        mock_user.role = "admin"
+        admin_token = create_satellite_token(
+            mock_user, "syftai-space", configured_key_manager, mock_user_repo
+        )
+        guest_token = create_guest_satellite_token(
+            "syftai-space", configured_key_manager, mock_user_repo
+        )
+
+        assert len({user_token, other_token, admin_token, guest_token}) == 4
+        payload = jwt.decode(admin_token, options={"verify_signature": False})
+        assert payload["role"] == "admin"
+
+    def test_rotated_key_is_not_served_from_cache(
+        self, mock_user, mock_user_repo, configured_key_manager
+    ):
+        """A new signing key ID invalidates previously cached tokens."""
+        before = create_satellite_token(
+            mock_user, "syftai-space", configured_key_manager, mock_user_repo
+        )
+        configured_key_manager._generate_keypair("cache-test-key-2")
+        after = create_satellite_token(
+            mock_user, "syftai-space", configured_key_manager, mock_user_repo
+        )
+
+        assert before != after
+        assert jwt.get_unverified_header(after)["kid"] == "cache-test-key-2"
+
+    def test_expiring_entry_is_not_returned(self):
+        """Entries below the minimum remaining lifetime are dropped."""
+        cache = SatelliteTokenCache(min_remaining_seconds=20)
+        now = int(datetime.now(timezone.utc).timestamp())
+        cache.put(("a",), "fresh", now + 60)
+        cache.put(("b",), "stale", now + 10)
+
+        assert cache.get(("a",)).token == "fresh"
+        assert cache.get(("b",)) is None
+        assert len(cache) == 1
+
+    def test_bounded_entries_evict_least_recently_used(self):
+        """The cache never holds more than max_entries tokens."""
+        cache = SatelliteTokenCache(max_entries=2)
+        exp = int(datetime.now(timezone.utc).timestamp()) + 60
+        cache.put(("a",), "a", exp)
+        cache.put(("b",), "b", exp)
+        cache.get(("a",))
+        cache.put(("c",), "c", exp)
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) is not None
+        assert cache.get(("c",)) is not None
+
+    def test_disabled_cache_always_misses(self):
+        """A disabled cache stores nothing."""
+        cache = SatelliteTokenCache(enabled=False)
+        cache.put(("a",), "a", int(datetime.now(timezone.utc).timestamp()) + 60)
+
+        assert cache.get(("a",)) is None
+        assert len(cache) == 0
+
+
+class TestBatchSatelliteTokenCreation:
+    """Tests for create_satellite_tokens() / create_guest_satellite_tokens()."""
+
+    @pytest.fixture
+    def configured_key_manager(self):
+        """Create a configured key manager for testing."""
+        RSAKeyManager._instance = None
+        manager = RSAKeyManager()
+        manager._generate_keypair("batch-test-key")
+        yield manager
+        RSAKeyManager._instance = None
+
+    @pytest.fixture
+    def mock_user_repo(self):
+        repo = MagicMock()
+        users = []
+        for name, active in (("alice", True), ("bob", True), ("dave", False)):
+            user = MagicMock()
+            user.username = name
+            user.is_active = active
+            users.append(user)
+        repo.get_by_usernames.return_value = users
+        return repo
+
+    def test_batch_mints_valid_and_reports_invalid(
+        self, mock_user_repo, configured_key_manager
+    ):
+        """Valid audiences get tokens; invalid ones are reported, not raised."""
+        user = MagicMock()
+        user.id = 123
+        user.role = "user"
+
+        batch = create_satellite_tokens(
+            user=user,
+            audiences=["alice", "Bob", "dave", "mallory", " "],
+            key_manager=configured_key_manager,
+            user_repo=mock_user_repo,
+        )
+
+        mock_user_repo.get_by_usernames.assert_called_once()
+        assert set(batch.tokens) == {"alice", "Bob"}
+        assert {aud: r.error_code for aud, r in batch.errors.items()} == {
+            "dave": "audience_inactive",
+            "mallory": "audience_not_found",
+            " ": "invalid_audience",
+        }
+        payload = jwt.decode(
+            batch.tokens["Bob"].token, options={"verify_signature": False}
+        )
+        assert payload["aud"] == "bob"
+        assert payload["sub"] == "123"
+
+    def test_guest_batch(self, mock_user_repo, configured_key_manager):
+        """Guest batches mint guest tokens."""
+        batch = create_guest_satellite_tokens(
+            audiences=["alice"],
+            key_manager=configured_key_manager,
+            user_repo=mock_user_repo,
+        )
+
+        payload = jwt.decode(
+            batch.tokens["alice"].token, options={"verify_signature": False}
+        )
+        assert payload["sub"] == "guest"
+        assert payload["role"] == "guest"
+
+    def test_batch_shares_cache_with_single_mint(
+        self, mock_user_repo, configured_key_manager
+    ):
+        """A token minted by the batch path is reused by the single path."""
+        mock_user_repo.get_by_username.return_value = (
+            mock_user_repo.get_by_usernames.return_value[0]
+        )
+        batch = create_guest_satellite_tokens(
+            audiences=["alice"],
+            key_manager=configured_key_manager,
+            user_repo=mock_user_repo,
+        )
+        single = create_guest_satellite_token(
+            "alice", configured_key_manager, mock_user_repo
+        )
+
+        assert single == batch.tokens["alice"].token
+
+    def test_batch_key_not_configured(self, mock_user_repo):
+        """Unconfigured keys fail the whole batch."""
+        RSAKeyManager._instance = None
+        manager = RSAKeyManager()
+
+        with pytest.raises(KeyNotConfiguredError):
+            create_guest_satellite_tokens(["alice"], manager, mock_user_repo)
+        RSAKeyManager._instance = None
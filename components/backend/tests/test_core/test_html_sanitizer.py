@@ -4,6 +4,8 @@ from syfthub.core.html_sanitizer import (
     ALLOWED_ATTRIBUTES,
     ALLOWED_PROTOCOLS,
     ALLOWED_TAGS,
+    readme_digest,
+    render_readme_html,
     sanitize_readme_html,
 )
 
@@ -234,3 +236,25 @@ class TestSanitizeReadmeHtml:
         assert "onclick" not in result
         assert "javascript:" not in result
         assert 'href="https://good.com"' in result
+
+
+class TestRenderReadmeHtml:
+    """Tests for render_readme_html and readme_digest."""
+
+    def test_blank_readme_renders_empty(self):
+        assert render_readme_html("") == ""
+        assert render_readme_html("   \n") == ""
+
+    def test_markdown_is_converted_and_sanitized(self):
+        result = render_readme_html("# Title\n\n<script>evil()</script>")
+        assert "<h1>Title</h1>" in result
+        assert "<script>" not in result
+
+    def test_fenced_code_is_highlighted(self):
+        result = render_readme_html("```python\nx = 1\n```")
+        assert "<pre>" in result or '<div class="codehilite">' in result
+
+    def test_digest_identifies_source(self):
+        assert readme_digest("# A") == readme_digest("# A")
+        assert readme_digest("# A") != readme_digest("# B")
+        assert len(readme_digest("")) == 64
@@ -0,0 +1,249 @@
+"""Tests for the public response cache."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+import redis
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+
+from syfthub.core.response_cache import (
+    CachedResponse,
+    PublicResponseCache,
+    make_cache_key,
+)
+from syfthub.schemas.endpoint import EndpointType
+
+
+class _Renderer:
+    """Counts renders and returns a JSON body tagged with the render number."""
+
+    def __init__(self, status_code: int = 200) -> None:
+        self.calls = 0
+        self.status_code = status_code
+
+    def __call__(self) -> JSONResponse:
+        self.calls += 1
+        return JSONResponse(
+            {"render": self.calls},
+            status_code=self.status_code,
+            headers={"X-Next-Cursor": "abc"},
+        )
+
+
+@pytest.fixture
+def cache() -> PublicResponseCache:
+    return PublicResponseCache(ttl_seconds=60, max_entries=2)
+
+
+class TestMakeCacheKey:
+    def test_ignores_order_and_none(self):
+        assert make_cache_key("r", {"a": 1, "b": None, "c": "x"}) == make_cache_key(
+            "r", {"c": "x", "a": 1}
+        )
+
+    def test_uses_enum_values(self):
+        assert make_cache_key(
+            "r", {"endpoint_type": EndpointType.MODEL}
+        ) == make_cache_key("r", {"endpoint_type": "model"})
+
+    def test_routes_do_not_collide(self):
+        assert make_cache_key("a", {"skip": 0}) != make_cache_key("b", {"skip": 0})
+
+
+class TestPublicResponseCache:
+    def test_repeat_requests_are_served_from_cache(self, cache):
+        render = _Renderer()
+
+        first = cache.get_or_render("route", {"skip": 0}, render)
+        second = cache.get_or_render("route", {"skip": 0}, render)
+
+        assert render.calls == 1
+        assert first.headers["X-Cache"] == "MISS"
+        assert second.headers["X-Cache"] == "HIT"
+        assert second.body == first.body
+        assert second.headers["X-Next-Cursor"] == "abc"
+        assert second.media_type == "application/json"
+        assert cache.stats() == {"route": {"miss": 1, "hit_local": 1}}
+
+    def test_distinct_params_are_cached_separately(self, cache):
+        render = _Renderer()
+
+        cache.get_or_render("route", {"skip": 0}, render)
+        cache.get_or_render("route", {"skip": 10}, render)
+
+        assert render.calls == 2
+
+    def test_invalidate_drops_entries(self, cache):
+        render = _Renderer()
+        cache.get_or_render("route", {}, render)
+
+        cache.invalidate()
+        response = cache.get_or_render("route", {}, render)
+
+        assert render.calls == 2
+        assert response.headers["X-Cache"] == "MISS"
+
+    def test_render_racing_invalidation_is_not_stored(self, cache):
+        """A response rendered across a write may be stale and is discarded."""
+
+        def render() -> JSONResponse:
+            cache.invalidate()
+            return JSONResponse({"stale": True})
+
+        cache.get_or_render("route", {}, render)
+        fresh = _Renderer()
+        cache.get_or_render("route", {}, fresh)
+
+        assert fresh.calls == 1
+
+    def test_entries_expire(self, cache):
+        render = _Renderer()
+        clock = [1000.0]
+
+        with patch(
+            "syfthub.core.response_cache.time.monotonic",
+            side_effect=lambda: clock[0],
+        ):
+            cache.get_or_render("route", {}, render)
+            clock[0] += 59
+            cache.get_or_render("route", {}, render)
+            clock[0] += 1
+            cache.get_or_render("route", {}, render)
+
+        assert render.calls == 2
+
+    def test_least_recently_used_entry_is_evicted(self, cache):
+        render = _Renderer()
+        for skip in (0, 1, 0, 2):
+            cache.get_or_render("route", {"skip": skip}, render)
+
+        cache.get_or_render("route", {"skip": 0}, render)
+        assert render.calls == 3
+        cache.get_or_render("route", {"skip": 1}, render)
+        assert render.calls == 4
+
+    def test_errors_are_not_cached(self, cache):
+        not_found = _Renderer(status_code=404)
+        cache.get_or_render("route", {}, not_found)
+        cache.get_or_render("route", {}, not_found)
+        assert not_found.calls == 2
+
+        def fail() -> JSONResponse:
+            raise HTTPException(status_code=404)
+
+        with pytest.raises(HTTPException):
+            cache.get_or_render("other", {}, fail)
+        assert cache.get_or_render("other", {}, _Renderer()).status_code == 200
+
+    def test_disabled_cache_always_renders(self):
+        cache = PublicResponseCache(ttl_seconds=0, max_entries=10)
+        render = _Renderer()
+
+        cache.get_or_render("route", {}, render)
+        cache.get_or_render("route", {}, render)
+
+        assert render.calls == 2
+
+    def test_concurrent_misses_render_once(self, cache):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        def slow_render() -> JSONResponse:
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return JSONResponse({"ok": True})
+
+        results = []
+
+        def request() -> None:
+            results.append(cache.get_or_render("route", {}, slow_render))
+
+        threads = [threading.Thread(target=request) for _ in range(5)]
+        threads[0].start()
+        assert started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+        assert len(calls) == 1
+        assert len(results) == 5
+        assert sorted(r.headers["X-Cache"] for r in results) == ["HIT"] * 4 + ["MISS"]
+        assert cache._key_locks == {}
+
+
+class TestRedisTier:
+    @pytest.fixture
+    def redis_client(self):
+        client = MagicMock()
+        with patch(
+            "syfthub.core.response_cache.get_sync_redis_client", return_value=client
+        ):
+            yield client
+
+    @pytest.fixture
+    def shared_cache(self) -> PublicResponseCache:
+        return PublicResponseCache(
+            ttl_seconds=60, max_entries=10, redis_enabled=True, redis_ttl_seconds=30
+        )
+
+    def test_miss_is_written_to_redis(self, shared_cache, redis_client):
+        redis_client.mget.return_value = [b"3", None]
+        redis_client.get.return_value = b"3"
+
+        shared_cache.get_or_render("route", {}, _Renderer())
+
+        key, value = redis_client.set.call_args.args
+        assert key == "public-cache:" + make_cache_key("route", {})
+        assert redis_client.set.call_args.kwargs == {"ex": 30}
+        generation, cached = CachedResponse.loads(value)
+        assert generation == 3
+        assert cached.body == b'{"render":1}'
+
+    def test_entry_from_another_worker_is_served(self, shared_cache, redis_client):
+        stored = CachedResponse(
+            body=b'{"shared":true}', media_type="application/json", headers={}
+        )
+        redis_client.mget.return_value = [b"3", stored.dumps(3)]
+        render = _Renderer()
+
+        response = shared_cache.get_or_render("route", {}, render)
+
+        assert render.calls == 0
+        assert response.body == b'{"shared":true}'
+        assert shared_cache.stats() == {"route": {"hit_shared": 1}}
+
+    def test_entry_from_older_generation_is_ignored(self, shared_cache, redis_client):
+        stored = CachedResponse(body=b"{}", media_type="application/json", headers={})
+        redis_client.mget.return_value = [b"4", stored.dumps(3)]
+        redis_client.get.return_value = b"4"
+        render = _Renderer()
+
+        shared_cache.get_or_render("route", {}, render)
+
+        assert render.calls == 1
+
+    def test_invalidate_bumps_shared_generation(self, shared_cache, redis_client):
+        shared_cache.invalidate()
+
+        redis_client.incr.assert_called_once_with("public-cache:generation")
+
+    def test_redis_errors_fall_back_to_local_tier(self, shared_cache, redis_client):
+        redis_client.mget.side_effect = redis.ConnectionError("down")
+        render = _Renderer()
+
+        shared_cache.get_or_render("route", {}, render)
+        response = shared_cache.get_or_render("route", {}, render)
+
+        assert render.calls == 1
+        assert response.headers["X-Cache"] == "HIT"
+        # Backing off: Redis is not retried on every request
+        assert redis_client.mget.call_count == 1
+        redis_client.set.assert_not_called()
@@ -4,12 +4,18 @@ import ipaddress
 import socket
 from unittest.mock import patch
 
+import httpcore
+import httpx
 import pytest
 from fastapi import HTTPException
+from httpcore._backends.mock import AsyncMockBackend
 
 from syfthub.core.ssrf_protection import (
     BLOCKED_IP_NETWORKS,
     CLOUD_METADATA_IPS,
+    DNSResolutionCache,
+    PinnedNetworkBackend,
+    get_dns_cache,
     is_ip_blocked,
     resolve_domain_to_ip,
     validate_domain_for_ssrf,
@@ -197,8 +203,29 @@ class TestValidateDomainForSsrf:
         """Test that domain resolving to public IP is allowed."""
         with patch("syfthub.core.ssrf_protection.resolve_domain_to_ip") as mock_resolve:
             mock_resolve.return_value = "93.184.216.34"
-            # Should not raise
-            validate_domain_for_ssrf("example.com")
+            assert validate_domain_for_ssrf("example.com") == "93.184.216.34"
+
+    def test_direct_ip_returned(self):
+        """Test that a direct public IP is returned as the validated address."""
+        assert validate_domain_for_ssrf("https://8.8.8.8:443") == "8.8.8.8"
+
+    def test_resolution_is_cached(self):
+        """Test that repeated validations reuse the cached resolution."""
+        with patch("syfthub.core.ssrf_protection.resolve_domain_to_ip") as mock_resolve:
+            mock_resolve.return_value = "93.184.216.34"
+            validate_domain_for_ssrf("https://example.com")
+            validate_domain_for_ssrf("example.com:8443")
+        mock_resolve.assert_called_once_with("example.com")
+        assert get_dns_cache().stats()["hits"] == 1
+
+    def test_cached_blocked_ip_still_rejected(self):
+        """Test that a cached resolution is re-checked on every use."""
+        with patch("syfthub.core.ssrf_protection.resolve_domain_to_ip") as mock_resolve:
+            mock_resolve.return_value = "10.0.0.5"
+            for _ in range(2):
+                with pytest.raises(HTTPException) as exc_info:
+                    validate_domain_for_ssrf("rebind.example")
+                assert exc_info.value.status_code == 403
 
     def test_ip_with_port_blocked(self):
         """Test that IP with port is correctly parsed and blocked."""
@@ -222,6 +249,141 @@ class TestValidateDomainForSsrf:
             assert "Invalid IP address resolved" in exc_info.value.detail
 
 
+class TestDNSResolutionCache:
+    """Tests for DNSResolutionCache."""
+
+    def test_entries_expire(self):
+        """Test that a resolution is reused only until its TTL elapses."""
+        cache = DNSResolutionCache(ttl_seconds=60)
+        clock = [1000.0]
+        with (
+            patch(
+                "syfthub.core.ssrf_protection.time.monotonic",
+                side_effect=lambda: clock[0],
+            ),
+            patch(
+                "syfthub.core.ssrf_protection.resolve_domain_to_ip",
+                side_effect=["93.184.216.34", "93.184.216.35"],
+            ),
+        ):
+            assert cache.resolve("example.com") == "93.184.216.34"
+            clock[0] += 59
+            assert cache.resolve("EXAMPLE.com") == "93.184.216.34"
+            clock[0] += 1
+            assert cache.resolve("example.com") == "93.184.216.35"
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 2)
+        assert stats["lookup_ms_max"] >= 0
+
+    def test_failures_are_not_cached(self):
+        """Test that failed lookups are retried and counted as misses."""
+        cache = DNSResolutionCache(ttl_seconds=60)
+        with patch(
+            "syfthub.core.ssrf_protection.resolve_domain_to_ip",
+            side_effect=[HTTPException(status_code=400), "93.184.216.34"],
+        ):
+            with pytest.raises(HTTPException):
+                cache.resolve("example.com")
+            assert cache.resolve("example.com") == "93.184.216.34"
+        assert cache.stats()["misses"] == 2
+
+    def test_zero_ttl_disables_cache(self):
+        """Test that a TTL of 0 resolves on every call."""
+        cache = DNSResolutionCache(ttl_seconds=0)
+        with patch(
+            "syfthub.core.ssrf_protection.resolve_domain_to_ip",
+            return_value="93.184.216.34",
+        ) as mock_resolve:
+            cache.resolve("example.com")
+            cache.resolve("example.com")
+        assert mock_resolve.call_count == 2
+
+    def test_least_recently_used_entry_is_evicted(self):
+        """Test that the cache stays within max_entries."""
+        cache = DNSResolutionCache(ttl_seconds=60, max_entries=1)
+        with patch(
+            "syfthub.core.ssrf_protection.resolve_domain_to_ip",
+            return_value="93.184.216.34",
+        ) as mock_resolve:
+            cache.resolve("a.example")
+            cache.resolve("b.example")
+            cache.resolve("a.example")
+        assert mock_resolve.call_count == 3
+
+
+class RecordingBackend(AsyncMockBackend):
+    """Mock network backend that records the address of every connect."""
+
+    def __init__(self, responses: int) -> None:
+        reply = b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok"
+        super().__init__([reply] * responses)
+        self.connects: list[tuple[str, int]] = []
+
+    async def connect_tcp(
+        self, host, port, timeout=None, local_address=None, socket_options=None
+    ):
+        self.connects.append((host, port))
+        return await super().connect_tcp(
+            host, port, timeout, local_address, socket_options
+        )
+
+
+class TestPinnedNetworkBackend:
+    """Tests for connect-time pinning of validated addresses."""
+
+    @pytest.mark.asyncio
+    async def test_pinned_hosts_dial_validated_ip(self):
+        """Test that pinned hostnames connect to their IP and others resolve."""
+        recorder = RecordingBackend(responses=2)
+        backend = PinnedNetworkBackend(recorder)
+        backend.pin("API.example.com", "93.184.216.34")
+
+        await backend.connect_tcp("api.example.com", 443)
+        await backend.connect_tcp("other.example.com", 443)
+
+        assert recorder.connects == [
+            ("93.184.216.34", 443),
+            ("other.example.com", 443),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_hostnames_sharing_an_ip_get_separate_connections(self):
+        """Test that a connection for one hostname is never reused for another.
+
+        Both owners' domains resolve to the same address; each request must
+        still go over its own connection carrying its own Host header.
+        """
+        recorder = RecordingBackend(responses=3)
+        backend = PinnedNetworkBackend(recorder)
+        backend.pin("owner-a.example", "93.184.216.34")
+        backend.pin("owner-b.example", "93.184.216.34")
+        transport = httpx.AsyncHTTPTransport()
+        transport._pool = httpcore.AsyncConnectionPool(network_backend=backend)
+
+        async with httpx.AsyncClient(transport=transport) as client:
+            await client.get("http://owner-a.example/q")
+            await client.get("http://owner-b.example/q")
+            await client.get("http://owner-a.example/q")
+
+            origins = sorted(
+                c._origin.host.decode() for c in transport._pool.connections
+            )
+
+        assert recorder.connects == [("93.184.216.34", 80), ("93.184.216.34", 80)]
+        assert origins == ["owner-a.example", "owner-b.example"]
+
+    def test_pins_are_bounded(self):
+        """Test that the least recently pinned hostnames are evicted."""
+        backend = PinnedNetworkBackend(max_entries=2)
+        backend.pin("a.example", "93.184.216.34")
+        backend.pin("b.example", "93.184.216.35")
+        backend.pin("c.example", "93.184.216.36")
+
+        assert backend.pinned_ip("a.example") is None
+        assert backend.pinned_ip("c.example") == "93.184.216.36"
+
+
 class TestBlockedNetworksConstant:
     """Tests for BLOCKED_IP_NETWORKS constant."""
 
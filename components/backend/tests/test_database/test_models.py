@@ -1,6 +1,7 @@
 """Tests for database models."""
 
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 from sqlalchemy.exc import IntegrityError
@@ -193,3 +194,43 @@ class TestEndpointModel:
 
         with pytest.raises(IntegrityError):
             test_session.commit()
+
+    def test_endpoint_readme_is_rendered_on_write(
+        self, test_session: Session, sample_user_data: dict, sample_endpoint_data: dict
+    ):
+        """README HTML is stored when the README is set or changed."""
+        user = UserModel(**sample_user_data)
+        test_session.add(user)
+        test_session.commit()
+
+        endpoint = EndpointModel(
+            **{**sample_endpoint_data, "user_id": user.id, "readme": "# Title"}
+        )
+        test_session.add(endpoint)
+        test_session.commit()
+        test_session.refresh(endpoint)
+
+        assert endpoint.readme_html == "<h1>Title</h1>"
+        first_hash = endpoint.readme_html_hash
+        assert first_hash is not None
+
+        endpoint.readme = "<script>alert(1)</script>"
+        assert "<script>" not in endpoint.readme_html
+        assert endpoint.readme_html_hash != first_hash
+
+    def test_unchanged_endpoint_readme_is_not_rerendered(
+        self, test_session: Session, sample_user_data: dict, sample_endpoint_data: dict
+    ):
+        """Re-sending the same README skips the markdown work."""
+        user = UserModel(**sample_user_data)
+        test_session.add(user)
+        test_session.commit()
+        endpoint = EndpointModel(
+            **{**sample_endpoint_data, "user_id": user.id, "readme": "# Same"}
+        )
+
+        with patch("syfthub.models.endpoint.render_readme_html") as render:
+            endpoint.readme = "# Same"
+            render.assert_not_called()
+            endpoint.readme = "# Different"
+            render.assert_called_once_with("# Different")
@@ -2,8 +2,10 @@
 
 from unittest.mock import MagicMock
 
+import pytest
 from sqlalchemy.orm import Session
 
+from syfthub.core.cursor import InvalidCursorError, encode_cursor
 from syfthub.repositories import (
     EndpointRepository,
     UserRepository,
@@ -335,6 +337,35 @@ class TestUserRepository:
         assert refreshed is not None
         assert refreshed.domain == "https://node.example.com"
 
+    def test_create_wallet_if_absent_keeps_existing_wallet(
+        self, test_session: Session, sample_user_data: dict
+    ):
+        """A second wallet creation returns the first wallet untouched."""
+        user_repo = UserRepository(test_session)
+        user = user_repo.create(sample_user_data)
+
+        first = user_repo.create_wallet_if_absent(user.id, "0xfirst", "key-1")
+        second = user_repo.create_wallet_if_absent(user.id, "0xsecond", "key-2")
+
+        assert first == second == "0xfirst"
+        assert user_repo.get_wallet_private_key(user.id) == "key-1"
+        assert user_repo.create_wallet_if_absent(999, "0xthird", "key-3") is None
+
+    def test_update_domain_unchanged(
+        self, test_session: Session, sample_user_data: dict
+    ):
+        """update_domain returns False when the domain is already set."""
+        user_repo = UserRepository(test_session)
+        user = user_repo.create(sample_user_data)
+        user_repo.update_domain(user_id=user.id, domain="https://node.example.com")
+        test_session.commit()
+
+        result = user_repo.update_domain(
+            user_id=user.id,
+            domain="https://node.example.com",
+        )
+        assert result is False
+
     def test_create_with_data_param(self, test_session: Session):
         """create(data={...}) merges into kwargs and creates a user."""
         user_repo = UserRepository(test_session)
@@ -970,6 +1001,138 @@ class TestEndpointRepository:
         assert len(trending) == 1
         assert trending[0].stars_count >= 50
 
+    def test_get_public_endpoints_page_follows_cursor(
+        self, test_session: Session, sample_user_data: dict, sample_endpoint_data: dict
+    ):
+        """Test keyset pages chain through the listing without overlap."""
+        user_repo = UserRepository(test_session)
+        user = user_repo.create(sample_user_data)
+
+        endpoint_repo = EndpointRepository(test_session)
+        for i in range(5):
+            data = sample_endpoint_data.copy()
+            data["user_id"] = user.id
+            data["visibility"] = EndpointVisibility.PUBLIC.value
+            data["slug"] = f"paged-{i}"
+            endpoint_repo.create(data)
+
+        first = endpoint_repo.get_public_endpoints_page(limit=2)
+        assert len(first.items) == 2
+        assert first.next_cursor is not None
+
+        second = endpoint_repo.get_public_endpoints_page(
+            cursor=first.next_cursor, limit=2
+        )
+        third = endpoint_repo.get_public_endpoints_page(
+            cursor=second.next_cursor, limit=2
+        )
+        assert len(third.items) == 1
+        assert third.next_cursor is None
+
+        slugs = [e.slug for page in (first, second, third) for e in page.items]
+        assert slugs == [e.slug for e in endpoint_repo.get_public_endpoints(limit=10)]
+
+    def test_get_public_endpoints_search_ranks_matches(
+        self, test_session: Session, sample_user_data: dict, sample_endpoint_data: dict
+    ):
+        """Test search matches every field and orders by relevance."""
+        user_repo = UserRepository(test_session)
+        user = user_repo.create(sample_user_data)
+
+        endpoint_repo = EndpointRepository(test_session)
+        fixtures = [
+            ("desc-hit", "Other", "Uses vision internally", []),
+            ("tag-hit", "Another", "Unrelated", ["vision"]),
+            ("name-hit", "Vision Transformer", "Unrelated", []),
+            ("exact-hit", "vision", "Unrelated", []),
+            ("miss", "Speech", "Unrelated", []),
+        ]
+        for slug, name, description, tags in fixtures:
+            data = sample_endpoint_data.copy()
+            data.update(
+                user_id=user.id,
+                slug=slug,
+                name=name,
+                description=description,
+                tags=tags,
+            )
+            endpoint_repo.create(data)
+
+        results = endpoint_repo.get_public_endpoints(search="Vision", limit=10)
+        assert [e.slug for e in results] == [
+            "exact-hit",
+            "name-hit",
+            "tag-hit",
+            "desc-hit",
+        ]
+
+        # Owner username matches every endpoint of that owner
+        by_owner = endpoint_repo.get_public_endpoints(search="testus", limit=10)
+        assert len(by_owner) == 5
+
+    def test_get_public_endpoints_search_follows_cursor(
+        self, test_session: Session, sample_user_data: dict, sample_endpoint_data: dict
+    ):
+        """Test ranked search results page by cursor without overlap."""
+        user_repo = UserRepository(test_session)
+        user = user_repo.create(sample_user_data)
+
+        endpoint_repo = EndpointRepository(test_session)
+        for i in range(5):
+            data = sample_endpoint_data.copy()
+            data.update(user_id=user.id, slug=f"search-{i}", name=f"Search {i}")
+            endpoint_repo.create(data)
+
+        expected = [e.slug for e in endpoint_repo.get_public_endpoints(search="search")]
+        slugs: list[str] = []
+        cursor = None
+        while True:
+            page = endpoint_repo.get_public_endpoints_page(
+                cursor=cursor, limit=2, search="search"
+            )
+            slugs.extend(e.slug for e in page.items)
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        assert slugs == expected
+        assert len(slugs) == 5
+
+    def test_get_public_endpoints_search_rejects_cursor_for_other_term(
+        self, test_session: Session, sample_user_data: dict, sample_endpoint_data: dict
+    ):
+        """Test a search cursor only continues the search it came from."""
+        user_repo = UserRepository(test_session)
+        user = user_repo.create(sample_user_data)
+
+        endpoint_repo = EndpointRepository(test_session)
+        for i in range(3):
+            data = sample_endpoint_data.copy()
+            data.update(user_id=user.id, slug=f"search-{i}", name=f"Search {i}")
+            endpoint_repo.create(data)
+
+        page = endpoint_repo.get_public_endpoints_page(limit=1, search="search")
+        assert page.next_cursor is not None
+
+        # Matching is case-insensitive, so the same term in another case is fine
+        endpoint_repo.get_public_endpoints_page(
+            cursor=page.next_cursor, limit=1, search="SEARCH"
+        )
+        with pytest.raises(InvalidCursorError):
+            endpoint_repo.get_public_endpoints_page(
+                cursor=page.next_cursor, limit=1, search="search-1"
+            )
+
+    def test_get_trending_endpoints_page_rejects_foreign_cursor(
+        self, test_session: Session
+    ):
+        """Test a cursor from another listing is rejected."""
+        endpoint_repo = EndpointRepository(test_session)
+        cursor = encode_cursor("updated", ["2026-01-01T00:00:00+00:00", 1])
+
+        with pytest.raises(InvalidCursorError):
+            endpoint_repo.get_trending_endpoints_page(cursor=cursor)
+
     def test_increment_stars(
         self, test_session: Session, sample_user_data: dict, sample_endpoint_data: dict
     ):
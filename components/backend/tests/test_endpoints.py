@@ -313,6 +313,32 @@ def test_list_public_endpoints(client: TestClient, user1_token: str) -> None:
     assert data[0]["name"] == "Public Endpoint"
 
 
+def test_get_public_endpoint_by_path(client: TestClient, user1_token: str) -> None:
+    """Test looking up a public endpoint directly by owner/slug."""
+    headers = {"Authorization": f"Bearer {user1_token}"}
+    for name, visibility in [("Public One", "public"), ("Hidden One", "private")]:
+        client.post(
+            "/api/v1/endpoints",
+            json={"name": name, "type": "model", "visibility": visibility},
+            headers=headers,
+        )
+
+    response = client.get("/api/v1/endpoints/public/user1/public-one")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "Public One"
+    assert data["owner_username"] == "user1"
+
+    # Owner and slug match case-insensitively
+    response = client.get("/api/v1/endpoints/public/User1/Public-One")
+    assert response.status_code == 200
+    assert response.json()["owner_username"] == "user1"
+
+    # Private and unknown endpoints are not found
+    assert client.get("/api/v1/endpoints/public/user1/hidden-one").status_code == 404
+    assert client.get("/api/v1/endpoints/public/user1/nope").status_code == 404
+
+
 def test_get_endpoint_by_id(client: TestClient, user1_token: str) -> None:
     """Test getting a endpoint by ID."""
     headers = {"Authorization": f"Bearer {user1_token}"}
@@ -1074,6 +1100,219 @@ def test_trending_endpoints_pagination(client: TestClient, user1_token: str) ->
     assert len(data) == 2  # Remaining endpoints
 
 
+def _walk_cursor_pages(client: TestClient, path: str, limit: int) -> list[dict]:
+    """Follow X-Next-Cursor headers until the listing is exhausted."""
+    items: list[dict] = []
+    cursor = None
+    while True:
+        params: dict[str, str | int] = {"limit": limit}
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(path, params=params)
+        assert response.status_code == 200
+        items.extend(response.json())
+        cursor = response.headers.get("X-Next-Cursor")
+        if cursor is None:
+            return items
+
+
+def test_public_endpoints_cursor_pagination(
+    client: TestClient, user1_token: str
+) -> None:
+    """Following cursors visits every public endpoint exactly once, in order."""
+    headers = {"Authorization": f"Bearer {user1_token}"}
+    for i in range(7):
+        response = client.post(
+            "/api/v1/endpoints",
+            json={
+                "name": f"Cursor Endpoint {i}",
+                "type": "model",
+                "visibility": "public",
+            },
+            headers=headers,
+        )
+        assert response.status_code == 201
+
+    full = client.get("/api/v1/endpoints/public?limit=100")
+    assert "X-Next-Cursor" not in full.headers
+    expected = [e["slug"] for e in full.json()]
+    assert len(expected) == 7
+
+    walked = _walk_cursor_pages(client, "/api/v1/endpoints/public", limit=3)
+    assert [e["slug"] for e in walked] == expected
+
+
+def test_trending_endpoints_cursor_pagination_with_star_ties(
+    client: TestClient, user1_token: str
+) -> None:
+    """Trending cursors break star-count ties by id without skipping rows."""
+    headers = {"Authorization": f"Bearer {user1_token}"}
+    created_ids = []
+    for i in range(6):
+        response = client.post(
+            "/api/v1/endpoints",
+            json={"name": f"Trending {i}", "type": "model", "visibility": "public"},
+            headers=headers,
+        )
+        assert response.status_code == 201
+        created_ids.append(response.json()["id"])
+
+    from syfthub.database.connection import get_db_session
+    from syfthub.repositories.endpoint import EndpointRepository
+
+    session = next(get_db_session())
+    try:
+        endpoint_repo = EndpointRepository(session)
+        # Two endpoints per star count so page boundaries fall inside ties
+        for idx, endpoint_id in enumerate(created_ids):
+            endpoint_repo.update(endpoint_id, stars_count=idx // 2)
+    finally:
+        session.close()
+
+    walked = _walk_cursor_pages(client, "/api/v1/endpoints/trending", limit=2)
+    stars = [e["stars_count"] for e in walked]
+    assert len(walked) == 6
+    assert len({e["slug"] for e in walked}) == 6
+    assert stars == sorted(stars, reverse=True)
+
+
+def test_grouped_directory_etag_and_not_modified(
+    client: TestClient, user1_token: str
+) -> None:
+    """The grouped directory returns an ETag and honours If-None-Match."""
+    headers = {"Authorization": f"Bearer {user1_token}"}
+    response = client.post(
+        "/api/v1/endpoints",
+        json={"name": "Grouped Endpoint", "type": "model", "visibility": "public"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+
+    response = client.get("/api/v1/endpoints/public/grouped")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+    groups = response.json()["groups"]
+    assert [g["owner_username"] for g in groups] == ["user1"]
+
+    response = client.get(
+        "/api/v1/endpoints/public/grouped", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    # Another page size is a different representation
+    response = client.get(
+        "/api/v1/endpoints/public/grouped?max_per_owner=1",
+        headers={"If-None-Match": etag},
+    )
+    assert response.status_code == 200
+
+
+def test_grouped_directory_refreshes_after_endpoint_changes(
+    client: TestClient, user1_token: str
+) -> None:
+    """Creating and deleting endpoints is reflected in the next read."""
+    headers = {"Authorization": f"Bearer {user1_token}"}
+    response = client.get("/api/v1/endpoints/public/grouped")
+    assert response.json()["groups"] == []
+    etag = response.headers["ETag"]
+
+    response = client.post(
+        "/api/v1/endpoints",
+        json={"name": "Fresh Endpoint", "type": "model", "visibility": "public"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    endpoint_id = response.json()["id"]
+
+    response = client.get(
+        "/api/v1/endpoints/public/grouped", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    groups = response.json()["groups"]
+    assert groups[0]["endpoints"][0]["name"] == "Fresh Endpoint"
+
+    response = client.delete(f"/api/v1/endpoints/{endpoint_id}", headers=headers)
+    assert response.status_code == 204
+
+    response = client.get("/api/v1/endpoints/public/grouped")
+    assert response.json()["groups"] == []
+
+
+def test_anonymous_listings_are_served_from_response_cache(
+    client: TestClient, user1_token: str
+) -> None:
+    """Repeat anonymous reads hit the cache until an endpoint write."""
+    headers = {"Authorization": f"Bearer {user1_token}"}
+    response = client.post(
+        "/api/v1/endpoints",
+        json={"name": "Cached Endpoint", "type": "model", "visibility": "public"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    endpoint_id = response.json()["id"]
+
+    for path in (
+        "/api/v1/endpoints/public",
+        "/api/v1/endpoints/trending",
+        "/api/v1/endpoints/public/owners",
+        "/user1",
+        "/user1/cached-endpoint",
+    ):
+        first = client.get(path, headers={"Accept": "application/json"})
+        second = client.get(path, headers={"Accept": "application/json"})
+        assert first.status_code == 200, path
+        assert first.headers["X-Cache"] == "MISS", path
+        assert second.headers["X-Cache"] == "HIT", path
+        assert second.json() == first.json(), path
+
+    # Signed-in viewers bypass the cache
+    response = client.get("/api/v1/endpoints/public", headers=headers)
+    assert "X-Cache" not in response.headers
+
+    response = client.patch(
+        f"/api/v1/endpoints/{endpoint_id}",
+        json={"description": "Now updated"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+
+    response = client.get("/api/v1/endpoints/public")
+    assert response.headers["X-Cache"] == "MISS"
+    assert response.json()[0]["description"] == "Now updated"
+
+
+def test_anonymous_errors_are_not_cached(client: TestClient, user1_token: str) -> None:
+    """A 404 for a missing endpoint does not outlive its creation."""
+    response = client.get("/user1/late-endpoint")
+    assert response.status_code == 404
+
+    response = client.post(
+        "/api/v1/endpoints",
+        json={"name": "Late Endpoint", "type": "model", "visibility": "public"},
+        headers={"Authorization": f"Bearer {user1_token}"},
+    )
+    assert response.status_code == 201
+
+    response = client.get("/user1/late-endpoint", headers={"Accept": "text/html"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/html")
+    assert response.headers["X-Cache"] == "MISS"
+
+
+def test_endpoint_listing_rejects_invalid_cursor(client: TestClient) -> None:
+    """Malformed cursors, or cursors from another listing, are a 400."""
+    response = client.get("/api/v1/endpoints/public?cursor=not-a-cursor")
+    assert response.status_code == 400
+    assert response.json()["detail"]["code"] == "INVALID_CURSOR"
+
+    from syfthub.core.cursor import encode_cursor
+
+    stars_cursor = encode_cursor("stars", [3, 1])
+    response = client.get(f"/api/v1/endpoints/public?cursor={stars_cursor}")
+    assert response.status_code == 400
+
+
 def test_create_endpoint_with_policies(client: TestClient, user1_token: str) -> None:
     """Test creating a endpoint with policies."""
     headers = {"Authorization": f"Bearer {user1_token}"}
@@ -2219,8 +2458,8 @@ def test_sync_endpoints_max_batch_size(client: TestClient, user1_token: str) ->
     assert response.status_code == 422  # Pydantic validation error
 
 
-def test_sync_endpoints_stars_reset(client: TestClient, user1_token: str) -> None:
-    """Test that stars are reset when endpoints are recreated."""
+def test_sync_endpoints_stars_preserved(client: TestClient, user1_token: str) -> None:
+    """Test that stars survive a sync of an endpoint with the same slug."""
     headers = {"Authorization": f"Bearer {user1_token}"}
 
     # Create an endpoint
@@ -2262,9 +2501,89 @@ def test_sync_endpoints_stars_reset(client: TestClient, user1_token: str) -> Non
     response = client.post("/api/v1/endpoints/sync", json=sync_data, headers=headers)
     assert response.status_code == 200
 
-    # Stars should be reset to 0
+    # The endpoint is matched by slug, so its stars are kept
+    data = response.json()
+    assert data["endpoints"][0]["stars_count"] == 50
+
+
+def test_sync_endpoints_resync_is_noop(client: TestClient, user1_token: str) -> None:
+    """Test that re-syncing identical content writes nothing and keeps IDs."""
+    headers = {"Authorization": f"Bearer {user1_token}"}
+    sync_data = {
+        "endpoints": [
+            {"name": "Stable A", "type": "model", "visibility": "public"},
+            {"name": "Stable B", "type": "data_source", "visibility": "private"},
+        ]
+    }
+
+    first = client.post("/api/v1/endpoints/sync", json=sync_data, headers=headers)
+    assert first.status_code == 200
+    assert first.json()["created"] == 2
+
+    second = client.post("/api/v1/endpoints/sync", json=sync_data, headers=headers)
+    assert second.status_code == 200
+    data = second.json()
+    assert data["synced"] == 2
+    assert data["unchanged"] == 2
+    assert data["updated"] == data["created"] == data["deleted"] == 0
+    assert [ep["id"] for ep in data["endpoints"]] == [
+        ep["id"] for ep in first.json()["endpoints"]
+    ]
+    # Not rewritten (compare without the UTC suffix SQLite drops on reload)
+    assert [ep["updated_at"].rstrip("Z") for ep in data["endpoints"]] == [
+        ep["updated_at"].rstrip("Z") for ep in first.json()["endpoints"]
+    ]
+
+
+def test_sync_endpoints_reports_diff_counts(
+    client: TestClient, user1_token: str
+) -> None:
+    """Test that a mixed sync updates, creates and deletes only what changed."""
+    headers = {"Authorization": f"Bearer {user1_token}"}
+    first = client.post(
+        "/api/v1/endpoints/sync",
+        json={
+            "endpoints": [
+                {"name": "Keep", "type": "model", "visibility": "public"},
+                {"name": "Edit", "type": "model", "visibility": "public"},
+                {"name": "Drop", "type": "model", "visibility": "public"},
+            ]
+        },
+        headers=headers,
+    )
+    ids = {ep["slug"]: ep["id"] for ep in first.json()["endpoints"]}
+
+    response = client.post(
+        "/api/v1/endpoints/sync",
+        json={
+            "endpoints": [
+                {"name": "Keep", "type": "model", "visibility": "public"},
+                {
+                    "name": "Edit",
+                    "type": "model",
+                    "visibility": "public",
+                    "description": "Now with a description",
+                },
+                {"name": "Fresh", "type": "data_source", "visibility": "public"},
+            ]
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+
     data = response.json()
-    assert data["endpoints"][0]["stars_count"] == 0
+    assert (data["unchanged"], data["updated"], data["created"], data["deleted"]) == (
+        1,
+        1,
+        1,
+        1,
+    )
+    by_slug = {ep["slug"]: ep for ep in data["endpoints"]}
+    assert by_slug["keep"]["id"] == ids["keep"]
+    assert by_slug["edit"]["id"] == ids["edit"]
+    assert by_slug["edit"]["description"] == "Now with a description"
+    assert "drop" not in by_slug
+    assert [ep["slug"] for ep in data["endpoints"]] == ["keep", "edit", "fresh"]
 
 
 # ---- Xendit Policy Tests ----
@@ -12,7 +12,11 @@ from fastapi.testclient import TestClient
 
 from syfthub.auth.db_dependencies import get_current_active_user
 from syfthub.auth.keys import RSAKeyManager
-from syfthub.auth.satellite_tokens import AudienceValidationResult
+from syfthub.auth.satellite_tokens import (
+    AudienceValidationResult,
+    satellite_token_cache,
+)
+from syfthub.database.dependencies import get_user_repository
 from syfthub.main import app
 
 
@@ -24,10 +28,12 @@ def client():
 
 @pytest.fixture(autouse=True)
 def reset_key_manager():
-    """Reset key manager before each test."""
+    """Reset key manager and minted-token cache before each test."""
     RSAKeyManager._instance = None
+    satellite_token_cache.clear()
     yield
     RSAKeyManager._instance = None
+    satellite_token_cache.clear()
     # Clear dependency overrides after each test
     app.dependency_overrides.clear()
 
@@ -245,6 +251,104 @@ class TestTokenEndpoint:
             assert payload["aud"] == "syftai-space"
 
 
+class TestTokenBatchEndpoint:
+    """Tests for the /api/v1/token/batch and /api/v1/token/guest/batch endpoints."""
+
+    @pytest.fixture
+    def mock_user_repo(self):
+        """User repository knowing one active and one inactive audience."""
+        active = MagicMock()
+        active.username = "syftai-space"
+        active.is_active = True
+        inactive = MagicMock()
+        inactive.username = "retired"
+        inactive.is_active = False
+        repo = MagicMock()
+        repo.get_by_usernames.return_value = [active, inactive]
+        app.dependency_overrides[get_user_repository] = lambda: repo
+        return repo
+
+    def test_batch_requires_authentication(self, client, configured_key_manager):
+        """The authenticated batch endpoint requires a Hub session token."""
+        with patch("syfthub.api.endpoints.token.key_manager", configured_key_manager):
+            response = client.post(
+                "/api/v1/token/batch", json={"audiences": ["syftai-space"]}
+            )
+            assert response.status_code == 401
+
+    def test_batch_returns_tokens_and_errors(
+        self, authenticated_client, configured_key_manager, mock_user_repo
+    ):
+        """Valid audiences get tokens; the rest are listed under errors."""
+        with patch("syfthub.api.endpoints.token.key_manager", configured_key_manager):
+            response = authenticated_client.post(
+                "/api/v1/token/batch",
+                json={"audiences": ["syftai-space", "retired", "unknown"]},
+            )
+
+        assert response.status_code == 200
+        data = response.json()
+        assert list(data["tokens"]) == ["syftai-space"]
+        assert data["tokens"]["syftai-space"]["expires_in"] > 0
+        assert data["errors"]["retired"]["error"] == "audience_inactive"
+        assert data["errors"]["unknown"]["error"] == "audience_not_found"
+        mock_user_repo.get_by_usernames.assert_called_once()
+
+        payload = jwt.decode(
+            data["tokens"]["syftai-space"]["target_token"],
+            options={"verify_signature": False},
+        )
+        assert payload["sub"] == "123"
+        assert payload["aud"] == "syftai-space"
+
+    def test_guest_batch_is_public(
+        self, client, configured_key_manager, mock_user_repo
+    ):
+        """Guest batch tokens need no authentication."""
+        with patch("syfthub.api.endpoints.token.key_manager", configured_key_manager):
+            response = client.post(
+                "/api/v1/token/guest/batch", json={"audiences": ["syftai-space"]}
+            )
+
+        assert response.status_code == 200
+        token = response.json()["tokens"]["syftai-space"]["target_token"]
+        assert jwt.decode(token, options={"verify_signature": False})["sub"] == "guest"
+
+    def test_batch_rejects_too_many_audiences(
+        self, authenticated_client, configured_key_manager, mock_user_repo
+    ):
+        """Requests above the configured limit are rejected."""
+        with (
+            patch("syfthub.api.endpoints.token.key_manager", configured_key_manager),
+            patch("syfthub.api.endpoints.token.settings") as endpoint_settings,
+        ):
+            endpoint_settings.satellite_token_batch_max_audiences = 2
+            response = authenticated_client.post(
+                "/api/v1/token/batch", json={"audiences": ["a", "b", "c"]}
+            )
+
+        assert response.status_code == 400
+
+    def test_batch_rejects_empty_list(
+        self, authenticated_client, configured_key_manager
+    ):
+        """At least one audience is required."""
+        with patch("syfthub.api.endpoints.token.key_manager", configured_key_manager):
+            response = authenticated_client.post(
+                "/api/v1/token/batch", json={"audiences": []}
+            )
+        assert response.status_code == 422
+
+    def test_batch_not_configured(self, authenticated_client, mock_user_repo):
+        """Without RSA keys the batch endpoint returns 503."""
+        RSAKeyManager._instance = None
+        with patch("syfthub.api.endpoints.token.key_manager", RSAKeyManager()):
+            response = authenticated_client.post(
+                "/api/v1/token/batch", json={"audiences": ["syftai-space"]}
+            )
+        assert response.status_code == 503
+
+
 class TestTokenAudiencesEndpoint:
     """Tests for the /api/v1/token/audiences endpoint."""
 
@@ -0,0 +1,18 @@
+"""Test fixtures for background job tests."""
+
+# Import fixtures from test_database/conftest.py to make them available here
+from tests.test_database.conftest import (
+    sample_endpoint_data,
+    sample_user_data,
+    test_db_url,
+    test_engine,
+    test_session,
+)
+
+__all__ = [
+    "sample_endpoint_data",
+    "sample_user_data",
+    "test_db_url",
+    "test_engine",
+    "test_session",
+]
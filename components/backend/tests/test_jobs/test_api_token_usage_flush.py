@@ -0,0 +1,64 @@
+"""Tests for the API token usage flush background job."""
+
+from datetime import datetime, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from syfthub.auth.api_token_usage import get_api_token_usage_buffer
+from syfthub.jobs.api_token_usage_flush import APITokenUsageFlushJob
+
+T0 = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def job():
+    settings = MagicMock()
+    settings.api_token_last_used_flush_interval_seconds = 30
+    return APITokenUsageFlushJob(settings)
+
+
+class TestRunFlushCycle:
+    def test_writes_buffered_uses_in_one_update(self, job):
+        get_api_token_usage_buffer().record(1, "10.0.0.1", T0)
+        get_api_token_usage_buffer().record(2, None, T0)
+
+        with (
+            patch("syfthub.jobs.api_token_usage_flush.db_manager") as mock_db,
+            patch(
+                "syfthub.jobs.api_token_usage_flush.APITokenRepository"
+            ) as mock_repo_cls,
+        ):
+            mock_repo_cls.return_value.bulk_update_last_used.return_value = True
+            job._run_flush_cycle_sync()
+
+        mock_repo_cls.return_value.bulk_update_last_used.assert_called_once_with(
+            {1: (T0, "10.0.0.1"), 2: (T0, None)}
+        )
+        mock_db.get_session.return_value.close.assert_called_once()
+        assert len(get_api_token_usage_buffer()) == 0
+
+    def test_empty_buffer_skips_database(self, job):
+        with patch("syfthub.jobs.api_token_usage_flush.db_manager") as mock_db:
+            job._run_flush_cycle_sync()
+
+        mock_db.get_session.assert_not_called()
+
+    def test_failed_write_is_retried_next_cycle(self, job):
+        get_api_token_usage_buffer().record(1, "10.0.0.1", T0)
+
+        with patch("syfthub.jobs.api_token_usage_flush.db_manager") as mock_db:
+            mock_db.get_session.side_effect = RuntimeError("db down")
+            job._run_flush_cycle_sync()
+
+        assert get_api_token_usage_buffer().drain() == {1: (T0, "10.0.0.1")}
+
+
+class TestStop:
+    @pytest.mark.asyncio
+    async def test_stop_flushes_remaining_uses(self, job):
+        with patch.object(job, "run_flush_cycle") as mock_flush:
+            await job.stop()
+
+        mock_flush.assert_awaited_once()
+        assert job._running is False
@@ -6,11 +6,14 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from syfthub.jobs import health_monitor as health_monitor_module
 from syfthub.jobs.health_monitor import (
     HEALTH_MONITOR_LOCK_ID,
     EndpointHealthInfo,
     EndpointHealthMonitor,
 )
+from syfthub.models.endpoint import EndpointModel, EndpointUptimeSampleModel
+from syfthub.models.user import UserModel
 
 
 class TestEndpointHealthInfo:
@@ -582,8 +585,8 @@ class TestCheckPerEndpointHealth:
         assert monitor._check_per_endpoint_health(endpoint, now) is False
 
 
-class TestUpdateEndpointHealthStatus:
-    """Tests for _update_endpoint_health_status method (atomic DB update)."""
+class TestApplyHealthResults:
+    """Tests for _apply_health_results (set-based DB update)."""
 
     @pytest.fixture
     def monitor(self):
@@ -594,67 +597,84 @@ class TestUpdateEndpointHealthStatus:
         settings.health_check_failure_threshold = 3
         return EndpointHealthMonitor(settings)
 
-    def test_update_healthy_endpoint(self, monitor):
-        """Test updating endpoint to healthy state."""
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        # RETURNING returns (is_active=True, consecutive_failure_count=0)
-        mock_result.fetchone.return_value = (True, 0)
-        mock_session.execute.return_value = mock_result
-
-        result = monitor._update_endpoint_health_status(mock_session, 1, True)
-
-        assert result == (True, 0)
-        mock_session.execute.assert_called_once()
-        mock_session.commit.assert_called_once()
-
-    def test_update_unhealthy_below_threshold(self, monitor):
-        """Test updating endpoint to unhealthy but below failure threshold."""
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        # Failure count is 1, below threshold of 3, so is_active stays True
-        mock_result.fetchone.return_value = (True, 1)
-        mock_session.execute.return_value = mock_result
-
-        result = monitor._update_endpoint_health_status(mock_session, 1, False)
-
-        assert result == (True, 1)
-        mock_session.commit.assert_called_once()
-
-    def test_update_unhealthy_reaches_threshold(self, monitor):
-        """Test updating endpoint to unhealthy when reaching failure threshold."""
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        # Failure count reaches 3 (threshold), so is_active becomes False
-        mock_result.fetchone.return_value = (False, 3)
-        mock_session.execute.return_value = mock_result
-
-        result = monitor._update_endpoint_health_status(mock_session, 1, False)
-
-        assert result == (False, 3)
-        mock_session.commit.assert_called_once()
-
-    def test_update_endpoint_not_found(self, monitor):
-        """Test status update when endpoint not found."""
-        mock_session = MagicMock()
-        mock_result = MagicMock()
-        mock_result.fetchone.return_value = None
-        mock_session.execute.return_value = mock_result
-
-        result = monitor._update_endpoint_health_status(mock_session, 999, False)
+    @pytest.fixture
+    def endpoints(self, test_session, sample_user_data, sample_endpoint_data):
+        """Create endpoints in (is_active, consecutive_failure_count) states."""
+        user = UserModel(**sample_user_data)
+        test_session.add(user)
+        test_session.commit()
+        states = {
+            "steady": (True, 0),
+            "recovering": (False, 5),
+            "flaky": (True, 1),
+            "failing": (True, 2),
+            "down": (False, 7),
+        }
+        models = {}
+        for slug, (is_active, failures) in states.items():
+            data = dict(sample_endpoint_data)
+            data.update(
+                user_id=user.id,
+                slug=slug,
+                is_active=is_active,
+                consecutive_failure_count=failures,
+            )
+            models[slug] = EndpointModel(**data)
+        test_session.add_all(models.values())
+        test_session.commit()
+        return {slug: model.id for slug, model in models.items()}
+
+    def test_updates_counters_and_status(self, monitor, test_session, endpoints):
+        """Healthy rows reset, unhealthy rows count up and trip at the threshold."""
+        results = {
+            endpoints["steady"]: True,
+            endpoints["recovering"]: True,
+            endpoints["flaky"]: False,
+            endpoints["failing"]: False,
+            endpoints["down"]: False,
+        }
+
+        written = monitor._apply_health_results(test_session, results)
+        test_session.commit()
+
+        assert written == {
+            endpoints["recovering"]: (True, 0),
+            endpoints["flaky"]: (True, 2),
+            endpoints["failing"]: (False, 3),
+            endpoints["down"]: (False, 8),
+        }
+        stored = {
+            m.id: (m.is_active, m.consecutive_failure_count)
+            for m in test_session.query(EndpointModel)
+        }
+        assert stored[endpoints["steady"]] == (True, 0)
+        for endpoint_id, state in written.items():
+            assert stored[endpoint_id] == state
+
+    def test_steady_healthy_rows_are_not_written(
+        self, monitor, test_session, endpoints
+    ):
+        """Already healthy and active endpoints need no write."""
+        written = monitor._apply_health_results(
+            test_session, {endpoints["steady"]: True}
+        )
+        assert written == {}
 
-        assert result is None
-        mock_session.commit.assert_called_once()
+    def test_chunks_large_batches(self, monitor, test_session, endpoints, monkeypatch):
+        """IDs are split across statements without losing any rows."""
+        monkeypatch.setattr(health_monitor_module, "HEALTH_UPDATE_CHUNK_SIZE", 2)
+        results = dict.fromkeys(endpoints.values(), False)
 
-    def test_update_database_error(self, monitor):
-        """Test status update with database error."""
-        mock_session = MagicMock()
-        mock_session.execute.side_effect = Exception("Database error")
+        written = monitor._apply_health_results(test_session, results)
 
-        result = monitor._update_endpoint_health_status(mock_session, 1, False)
+        assert set(written) == set(endpoints.values())
 
-        assert result is None
-        mock_session.rollback.assert_called_once()
+    def test_deleted_endpoints_are_absent(self, monitor, test_session, endpoints):
+        """IDs that no longer exist are simply not returned."""
+        written = monitor._apply_health_results(
+            test_session, {999_999: False, endpoints["flaky"]: False}
+        )
+        assert written == {endpoints["flaky"]: (True, 2)}
 
 
 class TestRunHealthCheckCycle:
@@ -743,20 +763,23 @@ class TestRunHealthCheckCycle:
         with (
             patch("syfthub.jobs.health_monitor.db_manager") as mock_db_manager,
             patch.object(monitor, "_try_acquire_cycle_lock", return_value=True),
+            patch.object(monitor, "_maybe_run_uptime_retention"),
             patch.object(
                 monitor, "_get_endpoints_for_health_check", return_value=endpoints
             ),
             patch.object(monitor, "_check_endpoint_health", return_value=(1, True)),
             patch.object(
                 monitor,
-                "_update_endpoint_health_status",
-                return_value=(True, 0),  # Still active, no failures
+                "_apply_health_results",
+                return_value={},  # Still active, no failures: nothing written
             ),
+            patch("syfthub.repositories.endpoint.EndpointRepository"),
         ):
             mock_db_manager.get_session.return_value = mock_session
 
             await monitor.run_health_check_cycle()
 
+            mock_session.commit.assert_called_once()
             mock_session.close.assert_called_once()
 
     @pytest.mark.asyncio
@@ -779,23 +802,114 @@ class TestRunHealthCheckCycle:
         with (
             patch("syfthub.jobs.health_monitor.db_manager") as mock_db_manager,
             patch.object(monitor, "_try_acquire_cycle_lock", return_value=True),
+            patch.object(monitor, "_maybe_run_uptime_retention"),
             patch.object(
                 monitor, "_get_endpoints_for_health_check", return_value=endpoints
             ),
             patch.object(monitor, "_check_endpoint_health", return_value=(1, False)),
             patch.object(
                 monitor,
-                "_update_endpoint_health_status",
-                return_value=(False, 3),  # Now inactive after 3 failures
+                "_apply_health_results",
+                return_value={1: (False, 3)},  # Now inactive after 3 failures
             ),
+            patch("syfthub.repositories.endpoint.EndpointRepository") as RepoCls,
         ):
             mock_db_manager.get_session.return_value = mock_session
 
             await monitor.run_health_check_cycle()
 
-            monitor._update_endpoint_health_status.assert_called_once_with(
-                mock_session, 1, False
+            monitor._apply_health_results.assert_called_once_with(
+                mock_session, {1: False}
             )
+            RepoCls.return_value.bulk_upsert_uptime_samples.assert_called_once()
+            assert RepoCls.return_value.bulk_upsert_uptime_samples.call_args.kwargs[
+                "results"
+            ] == {1: False}
+            mock_session.commit.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cycle_rolls_back_on_write_failure(self, monitor):
+        """A failed bulk write rolls back the whole cycle."""
+        mock_session = MagicMock()
+        endpoints = [
+            EndpointHealthInfo(
+                id=1,
+                slug="test-endpoint",
+                endpoint_type="model",
+                is_active=True,
+                connect=[{"type": "rest_api", "config": {"url": "/test"}}],
+                owner_domain="https://example.com",
+                owner_id=10,
+                owner_type="user",
+            )
+        ]
+
+        with (
+            patch("syfthub.jobs.health_monitor.db_manager") as mock_db_manager,
+            patch.object(monitor, "_try_acquire_cycle_lock", return_value=True),
+            patch.object(monitor, "_maybe_run_uptime_retention"),
+            patch.object(
+                monitor, "_get_endpoints_for_health_check", return_value=endpoints
+            ),
+            patch.object(
+                monitor, "_apply_health_results", side_effect=Exception("db down")
+            ),
+        ):
+            mock_db_manager.get_session.return_value = mock_session
+
+            await monitor.run_health_check_cycle()
+
+            mock_session.commit.assert_not_called()
+            mock_session.rollback.assert_called_once()
+            mock_session.close.assert_called_once()
+
+    def test_cycle_end_to_end(
+        self, monitor, test_session, sample_user_data, sample_endpoint_data
+    ):
+        """One cycle updates status and records uptime for every endpoint."""
+        user = UserModel(**{**sample_user_data, "domain": "https://example.com"})
+        test_session.add(user)
+        test_session.commit()
+        now = datetime.now(timezone.utc)
+        models = []
+        for i, status in enumerate(["healthy", "unhealthy"]):
+            data = dict(sample_endpoint_data)
+            data.update(
+                user_id=user.id,
+                slug=f"ep-{i}",
+                connect=[{"type": "rest_api", "config": {}}],
+                health_status=status,
+                health_checked_at=now,
+                health_ttl_seconds=300,
+                consecutive_failure_count=2,
+            )
+            models.append(EndpointModel(**data))
+        test_session.add_all(models)
+        test_session.commit()
+        healthy_id, unhealthy_id = (m.id for m in models)
+
+        with (
+            patch("syfthub.jobs.health_monitor.db_manager") as mock_db_manager,
+            # SQLite returns naive datetimes; evaluate the reported status only
+            patch.object(
+                monitor,
+                "_check_per_endpoint_health",
+                side_effect=lambda ep, _now: ep.health_status == "healthy",
+            ),
+        ):
+            mock_db_manager.get_session.return_value = test_session
+            monitor._run_health_check_cycle_sync()
+
+        stored = {
+            m.id: (m.is_active, m.consecutive_failure_count)
+            for m in test_session.query(EndpointModel)
+        }
+        assert stored == {healthy_id: (True, 0), unhealthy_id: (False, 3)}
+        samples = {
+            s.endpoint_id: (s.total_checks, s.healthy_checks)
+            for s in test_session.query(EndpointUptimeSampleModel)
+        }
+        assert samples == {healthy_id: (1, 1), unhealthy_id: (1, 0)}
 
 
 class TestHealthMonitorLifecycle:
@@ -961,42 +1075,6 @@ class TestUptimeSampleEmission:
         now = datetime(2026, 5, 13, 13, 0, 0, tzinfo=timezone.utc)
         assert monitor._current_bucket_start(now) == now
 
-    def test_emit_uptime_sample_calls_repository(self, monitor):
-        mock_session = MagicMock()
-        now = datetime(2026, 5, 13, 12, 5, 0, tzinfo=timezone.utc)
-        with patch("syfthub.repositories.endpoint.EndpointRepository") as RepoCls:
-            repo = MagicMock()
-            RepoCls.return_value = repo
-            monitor._emit_uptime_sample(
-                mock_session,
-                endpoint_id=42,
-                is_healthy=True,
-                now=now,
-            )
-        repo.upsert_uptime_sample.assert_called_once()
-        kwargs = repo.upsert_uptime_sample.call_args.kwargs
-        assert kwargs["endpoint_id"] == 42
-        assert kwargs["is_healthy"] is True
-        # bucket boundary
-        assert kwargs["bucket_start"] == datetime(
-            2026, 5, 13, 12, 0, 0, tzinfo=timezone.utc
-        )
-
-    def test_emit_uptime_sample_swallows_errors(self, monitor):
-        mock_session = MagicMock()
-        now = datetime(2026, 5, 13, 12, 0, 0, tzinfo=timezone.utc)
-        with patch(
-            "syfthub.repositories.endpoint.EndpointRepository",
-            side_effect=RuntimeError("boom"),
-        ):
-            # Must not raise — emission is best-effort.
-            monitor._emit_uptime_sample(
-                mock_session,
-                endpoint_id=1,
-                is_healthy=False,
-                now=now,
-            )
-
     def test_retention_runs_at_most_once_per_day(self, monitor):
         mock_session = MagicMock()
         now = datetime(2026, 5, 13, 1, 0, 0, tzinfo=timezone.utc)
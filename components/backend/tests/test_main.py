@@ -1,19 +1,23 @@
 """Test main FastAPI application."""
 
 from datetime import datetime, timezone
-from unittest.mock import AsyncMock, Mock, patch
+from unittest.mock import Mock, patch
 
 import httpx
 import pytest
 from fastapi.testclient import TestClient
 
+from syfthub.core.html_sanitizer import readme_digest
+from syfthub.core.ssrf_protection import get_pinned_network_backend
 from syfthub.main import (
     PROXY_TIMEOUT_DATA_SOURCE,
     PROXY_TIMEOUT_MODEL,
+    _pin_request_to_ip,
     app,
     build_invocation_url,
     can_access_endpoint,
     get_endpoint_by_owner_and_slug,
+    get_endpoint_readme_html,
     get_owner_endpoints,
     main,
     resolve_owner,
@@ -46,6 +50,21 @@ def test_health_check(client: TestClient) -> None:
     data = response.json()
     assert data["status"] == "healthy"
     assert "version" in data
+    assert set(data["dns_cache"]) == {
+        "hits",
+        "misses",
+        "lookup_ms_total",
+        "lookup_ms_max",
+    }
+    assert isinstance(data["public_response_cache"], dict)
+    assert set(data["error_log_writer"]) == {
+        "queued",
+        "sampled",
+        "dropped",
+        "flushed",
+        "failed",
+        "pending",
+    }
 
 
 def test_docs_endpoint(client: TestClient) -> None:
@@ -351,6 +370,57 @@ class TestUtilityFunctions:
         assert can_access_endpoint(endpoint, test_user) is True
 
 
+class TestGetEndpointReadmeHtml:
+    """Tests for serving pre-rendered README HTML."""
+
+    @staticmethod
+    def _endpoint(**overrides) -> Endpoint:
+        data = {
+            "id": 1,
+            "user_id": 1,
+            "name": "Readme Endpoint",
+            "slug": "readme-endpoint",
+            "description": "",
+            "type": EndpointType.MODEL,
+            "visibility": EndpointVisibility.PUBLIC,
+            "is_active": True,
+            "archived": False,
+            "contributors": [],
+            "version": "1.0.0",
+            "readme": "# Title",
+            "tags": [],
+            "stars_count": 0,
+            "policies": [],
+            "connect": [],
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc),
+        }
+        data.update(overrides)
+        return Endpoint(**data)
+
+    def test_stored_html_is_served_without_rendering(self):
+        endpoint = self._endpoint(
+            readme_html="<h1>Stored</h1>", readme_html_hash=readme_digest("# Title")
+        )
+        with patch("syfthub.main.render_readme_html") as render:
+            assert get_endpoint_readme_html(endpoint) == "<h1>Stored</h1>"
+        render.assert_not_called()
+
+    def test_missing_or_stale_html_is_rendered(self):
+        assert get_endpoint_readme_html(self._endpoint()) == "<h1>Title</h1>"
+        stale = self._endpoint(
+            readme_html="<h1>Old</h1>", readme_html_hash=readme_digest("# Old")
+        )
+        assert get_endpoint_readme_html(stale) == "<h1>Title</h1>"
+
+    def test_blank_readme(self):
+        assert get_endpoint_readme_html(self._endpoint(readme="  ")) == ""
+
+    def test_rendered_html_is_not_serialized(self):
+        endpoint = self._endpoint(readme_html="<h1>Title</h1>")
+        assert "readme_html" not in endpoint.model_dump()
+
+
 class TestBuildInvocationUrl:
     """Tests for build_invocation_url helper function."""
 
@@ -540,6 +610,28 @@ class TestBuildInvocationUrl:
         )
 
 
+class TestPinRequestToIp:
+    """Tests for _pin_request_to_ip function."""
+
+    def test_hostname_pinned_to_validated_ip(self):
+        """Test that new connections to the hostname dial the validated IP."""
+        _pin_request_to_ip("https://pin-a.example/query", "93.184.216.34")
+        _pin_request_to_ip("http://pin-b.example:8080/query", "2606:2800:220:1::1")
+
+        backend = get_pinned_network_backend()
+        assert backend.pinned_ip("pin-a.example") == "93.184.216.34"
+        assert backend.pinned_ip("pin-b.example") == "2606:2800:220:1::1"
+
+    def test_ip_host_and_missing_ip_not_pinned(self):
+        """Test that nothing is pinned when there is nothing to resolve."""
+        _pin_request_to_ip("https://8.8.4.4/q", "8.8.8.8")
+        _pin_request_to_ip("https://unpinned.example/q", None)
+
+        backend = get_pinned_network_backend()
+        assert backend.pinned_ip("8.8.4.4") is None
+        assert backend.pinned_ip("unpinned.example") is None
+
+
 class TestTimeoutConstants:
     """Tests for timeout configuration constants."""
 
@@ -557,10 +649,11 @@ class TestInvokeOwnerEndpoint:
 
     @pytest.fixture(autouse=True)
     def setup_http_client(self):
-        """Set up mock http_client on app state."""
-        mock_client = AsyncMock()
-        app.state.http_client = mock_client
-        self._mock_http_client = mock_client
+        """Route the shared http_client to a mock target endpoint."""
+        self._upstream = Mock(return_value=httpx.Response(200, json={}))
+        app.state.http_client = httpx.AsyncClient(
+            transport=httpx.MockTransport(lambda request: self._upstream(request))
+        )
         yield
         del app.state.http_client
 
@@ -642,7 +735,7 @@ class TestInvokeOwnerEndpoint:
             updated_at=datetime.now(timezone.utc),
         )
 
-    @patch("syfthub.main.validate_domain_for_ssrf")
+    @patch("syfthub.main.validate_domain_for_ssrf", return_value="93.184.216.34")
     @patch("syfthub.main.get_endpoint_by_owner_and_slug")
     @patch("syfthub.main.resolve_owner")
     @patch("syfthub.main.get_optional_current_user")
@@ -662,13 +755,14 @@ class TestInvokeOwnerEndpoint:
         mock_resolve.return_value = mock_user
         mock_get_endpoint.return_value = mock_endpoint_with_connection
 
-        # Setup httpx mock response on shared http_client
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {
-            "summary": {"message": {"content": "Hello from endpoint"}}
-        }
-        self._mock_http_client.post.return_value = mock_response
+        # Setup the target endpoint's response
+        self._upstream.return_value = httpx.Response(
+            200,
+            headers={"Content-Type": "application/json"},
+            stream=httpx.ByteStream(
+                b'{"summary": {"message": {"content": "Hello from endpoint"}}}'
+            ),
+        )
 
         # Make request
         response = client.post(
@@ -683,7 +777,41 @@ class TestInvokeOwnerEndpoint:
         data = response.json()
         assert "summary" in data
 
-    @patch("syfthub.main.validate_domain_for_ssrf")
+    @patch("syfthub.main.validate_domain_for_ssrf", return_value="93.184.216.34")
+    @patch("syfthub.main.get_endpoint_by_owner_and_slug")
+    @patch("syfthub.main.resolve_owner")
+    @patch("syfthub.main.get_optional_current_user")
+    def test_invoke_endpoint_connects_to_validated_ip(
+        self,
+        mock_get_user,
+        mock_resolve,
+        mock_get_endpoint,
+        mock_ssrf_check,
+        client,
+        mock_endpoint_with_connection,
+        mock_user,
+    ):
+        """The proxy connects to the address the SSRF check validated.
+
+        Resolving the domain again would let a rebinding DNS server hand the
+        HTTP client an internal address after the check passed.
+        """
+        mock_get_user.return_value = None
+        mock_resolve.return_value = mock_user
+        mock_get_endpoint.return_value = mock_endpoint_with_connection
+        self._upstream.return_value = httpx.Response(
+            200, stream=httpx.ByteStream(b"{}")
+        )
+
+        response = client.post("/testuser/test-model", json={})
+
+        assert response.status_code == 200
+        sent = self._upstream.call_args.args[0]
+        assert sent.url.host == "syftai-space"
+        assert sent.url.port == 8080
+        assert get_pinned_network_backend().pinned_ip("syftai-space") == "93.184.216.34"
+
+    @patch("syfthub.main.validate_domain_for_ssrf", return_value="93.184.216.34")
     @patch("syfthub.main.get_endpoint_by_owner_and_slug")
     @patch("syfthub.main.resolve_owner")
     @patch("syfthub.main.get_optional_current_user")
@@ -831,7 +959,7 @@ class TestInvokeOwnerEndpoint:
         assert response.status_code == 400
         assert "no domain configured" in response.json()["detail"]
 
-    @patch("syfthub.main.validate_domain_for_ssrf")
+    @patch("syfthub.main.validate_domain_for_ssrf", return_value="93.184.216.34")
     @patch("syfthub.main.get_endpoint_by_owner_and_slug")
     @patch("syfthub.main.resolve_owner")
     @patch("syfthub.main.get_optional_current_user")
@@ -851,7 +979,7 @@ class TestInvokeOwnerEndpoint:
         mock_get_endpoint.return_value = mock_endpoint_with_connection
 
         # Simulate timeout on shared http_client
-        self._mock_http_client.post.side_effect = httpx.TimeoutException("Timeout")
+        self._upstream.side_effect = httpx.TimeoutException("Timeout")
 
         response = client.post(
             "/testuser/test-model",
@@ -861,7 +989,7 @@ class TestInvokeOwnerEndpoint:
         assert response.status_code == 504
         assert "timed out" in response.json()["detail"]
 
-    @patch("syfthub.main.validate_domain_for_ssrf")
+    @patch("syfthub.main.validate_domain_for_ssrf", return_value="93.184.216.34")
     @patch("syfthub.main.get_endpoint_by_owner_and_slug")
     @patch("syfthub.main.resolve_owner")
     @patch("syfthub.main.get_optional_current_user")
@@ -881,9 +1009,7 @@ class TestInvokeOwnerEndpoint:
         mock_get_endpoint.return_value = mock_endpoint_with_connection
 
         # Simulate connection error on shared http_client
-        self._mock_http_client.post.side_effect = httpx.RequestError(
-            "Connection refused"
-        )
+        self._upstream.side_effect = httpx.RequestError("Connection refused")
 
         response = client.post(
             "/testuser/test-model",
@@ -893,7 +1019,7 @@ class TestInvokeOwnerEndpoint:
         assert response.status_code == 502
         assert "Failed to connect" in response.json()["detail"]
 
-    @patch("syfthub.main.validate_domain_for_ssrf")
+    @patch("syfthub.main.validate_domain_for_ssrf", return_value="93.184.216.34")
     @patch("syfthub.main.get_endpoint_by_owner_and_slug")
     @patch("syfthub.main.resolve_owner")
     @patch("syfthub.main.get_optional_current_user")
@@ -913,10 +1039,9 @@ class TestInvokeOwnerEndpoint:
         mock_get_endpoint.return_value = mock_endpoint_with_connection
 
         # Simulate 403 response on shared http_client
-        mock_response = Mock()
-        mock_response.status_code = 403
-        mock_response.json.return_value = {"detail": "User not in visibility list"}
-        self._mock_http_client.post.return_value = mock_response
+        self._upstream.return_value = httpx.Response(
+            403, json={"detail": "User not in visibility list"}
+        )
 
         response = client.post(
             "/testuser/test-model",
@@ -926,7 +1051,7 @@ class TestInvokeOwnerEndpoint:
         assert response.status_code == 403
         assert "denied access" in response.json()["detail"]
 
-    @patch("syfthub.main.validate_domain_for_ssrf")
+    @patch("syfthub.main.validate_domain_for_ssrf", return_value="93.184.216.34")
     @patch("syfthub.main.get_endpoint_by_owner_and_slug")
     @patch("syfthub.main.resolve_owner")
     @patch("syfthub.main.get_optional_current_user")
@@ -946,11 +1071,9 @@ class TestInvokeOwnerEndpoint:
         mock_get_endpoint.return_value = mock_endpoint_with_connection
 
         # Simulate 500 response on shared http_client
-        mock_response = Mock()
-        mock_response.status_code = 500
-        mock_response.json.return_value = {"detail": "Internal server error"}
-        mock_response.text = "Internal server error"
-        self._mock_http_client.post.return_value = mock_response
+        self._upstream.return_value = httpx.Response(
+            500, json={"detail": "Internal server error"}
+        )
 
         response = client.post(
             "/testuser/test-model",
@@ -960,11 +1083,11 @@ class TestInvokeOwnerEndpoint:
         assert response.status_code == 500
         assert "Target endpoint returned an error" in response.json()["detail"]
 
-    @patch("syfthub.main.validate_domain_for_ssrf")
+    @patch("syfthub.main.validate_domain_for_ssrf", return_value="93.184.216.34")
     @patch("syfthub.main.get_endpoint_by_owner_and_slug")
     @patch("syfthub.main.resolve_owner")
     @patch("syfthub.main.get_optional_current_user")
-    def test_invoke_endpoint_invalid_json_body(
+    def test_invoke_endpoint_forwards_body_unparsed(
         self,
         mock_get_user,
         mock_resolve,
@@ -974,19 +1097,62 @@ class TestInvokeOwnerEndpoint:
         mock_user,
         mock_endpoint_with_connection,
     ):
-        """Test endpoint invocation with invalid JSON body."""
+        """The body is streamed through as-is; the target validates it."""
         mock_get_user.return_value = None
         mock_resolve.return_value = mock_user
         mock_get_endpoint.return_value = mock_endpoint_with_connection
+        self._upstream.return_value = httpx.Response(
+            400, json={"detail": "Invalid JSON"}
+        )
 
         response = client.post(
             "/testuser/test-model",
             content="not valid json",
-            headers={"Content-Type": "application/json"},
+            headers={"Content-Type": "application/json", "X-Tenant-Name": "acme"},
         )
 
         assert response.status_code == 400
-        assert "Invalid JSON" in response.json()["detail"]
+        assert "Target endpoint returned an error" in response.json()["detail"]
+        forwarded = self._upstream.call_args.args[0]
+        assert forwarded.content == b"not valid json"
+        assert forwarded.headers["content-type"] == "application/json"
+        assert forwarded.headers["content-length"] == "14"
+        assert forwarded.headers["x-tenant-name"] == "acme"
+        assert forwarded.url.path == "/api/v1/endpoints/test-model/query"
+
+    @patch("syfthub.main.validate_domain_for_ssrf", return_value="93.184.216.34")
+    @patch("syfthub.main.get_endpoint_by_owner_and_slug")
+    @patch("syfthub.main.resolve_owner")
+    @patch("syfthub.main.get_optional_current_user")
+    def test_invoke_endpoint_relays_response_bytes(
+        self,
+        mock_get_user,
+        mock_resolve,
+        mock_get_endpoint,
+        mock_ssrf_check,
+        client,
+        mock_user,
+        mock_endpoint_with_connection,
+    ):
+        """Successful responses keep the target's bytes, status and headers."""
+        mock_get_user.return_value = None
+        mock_resolve.return_value = mock_user
+        mock_get_endpoint.return_value = mock_endpoint_with_connection
+        body = b'data: {"token": "Hel"}\n\ndata: {"token": "lo"}\n\n'
+        # A streamed (not pre-read) body, as a real connection would deliver
+        self._upstream.return_value = httpx.Response(
+            201,
+            stream=httpx.ByteStream(body),
+            headers={"Content-Type": "text/event-stream", "X-Internal": "secret"},
+        )
+
+        response = client.post("/testuser/test-model", json={"stream": True})
+
+        assert response.status_code == 201
+        assert response.content == body
+        assert response.headers["content-type"] == "text/event-stream"
+        assert "x-internal" not in response.headers
+        assert int(response.headers["X-Proxy-Latency-Ms"]) >= 0
 
 
 class TestMainEntryPoint:
@@ -86,6 +86,66 @@ class TestErrorLogRepositoryCreate:
         session.rollback.assert_called_once()
 
 
+class TestErrorLogRepositoryCreateMany:
+    """Tests for ErrorLogRepository.create_many()."""
+
+    def test_inserts_all_entries_in_one_statement(self):
+        """All entries go into one INSERT with sanitized JSON fields."""
+        repo, session = _make_repo()
+
+        count = repo.create_many(
+            [
+                {
+                    "correlation_id": "corr-1",
+                    "service": "backend",
+                    "level": "ERROR",
+                    "event": "request.failed",
+                    "context": {"token": "secret"},
+                },
+                {
+                    "correlation_id": "corr-2",
+                    "service": "backend",
+                    "level": "ERROR",
+                    "event": "request.failed",
+                },
+            ]
+        )
+
+        assert count == 2
+        session.execute.assert_called_once()
+        rows = session.execute.call_args.args[1]
+        assert rows[0]["context"] != {"token": "secret"}
+        assert rows[1]["context"] is None
+        assert rows[0].keys() == rows[1].keys()
+        session.commit.assert_called_once()
+
+    def test_empty_batch_is_a_no_op(self):
+        """No statement is executed for an empty batch."""
+        repo, session = _make_repo()
+
+        assert repo.create_many([]) == 0
+        session.execute.assert_not_called()
+
+    def test_sqlalchemy_error_returns_zero(self):
+        """SQLAlchemyError during the insert → rollback, returns 0."""
+        repo, session = _make_repo()
+        session.execute.side_effect = SQLAlchemyError("DB gone")
+
+        count = repo.create_many(
+            [
+                {
+                    "correlation_id": "c",
+                    "service": "backend",
+                    "level": "ERROR",
+                    "event": "e",
+                }
+            ]
+        )
+
+        assert count == 0
+        session.rollback.assert_called_once()
+
+
 class TestErrorLogRepositoryGetByCorrelationId:
     """Tests for ErrorLogRepository.get_by_correlation_id()."""
 
@@ -0,0 +1,170 @@
+"""Tests for the background error log writer."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+from sqlalchemy.orm import sessionmaker
+
+from syfthub.models import Base
+from syfthub.observability.constants import REDACTED_VALUE
+from syfthub.observability.error_log_writer import ErrorLogWriter
+from syfthub.observability.handlers import register_exception_handlers
+from syfthub.observability.models import ErrorLogModel
+
+
+def _entry(n: int) -> dict:
+    return {
+        "correlation_id": f"corr-{n}",
+        "service": "backend",
+        "level": "ERROR",
+        "event": "error.unhandled",
+        "message": f"boom {n}",
+        "context": {"password": "hunter2"},
+    }
+
+
+@pytest.fixture
+def session_factory(test_engine):
+    Base.metadata.create_all(bind=test_engine)
+    yield sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+    Base.metadata.drop_all(bind=test_engine)
+
+
+def _stored(session_factory) -> list[ErrorLogModel]:
+    with session_factory() as session:
+        return list(session.execute(select(ErrorLogModel)).scalars().all())
+
+
+def _wait_for(condition, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+class TestErrorLogWriter:
+    """Tests for ErrorLogWriter."""
+
+    def test_stop_writes_queued_entries(self, session_factory):
+        """Entries still queued at shutdown are written, sanitized."""
+        writer = ErrorLogWriter(
+            max_queue_size=100,
+            batch_size=2,
+            flush_interval_seconds=60,
+            session_factory=session_factory,
+        )
+        for n in range(5):
+            assert writer.enqueue(**_entry(n))
+
+        writer.stop()
+
+        logs = _stored(session_factory)
+        assert sorted(log.correlation_id for log in logs) == [
+            f"corr-{n}" for n in range(5)
+        ]
+        assert logs[0].context == {"password": REDACTED_VALUE}
+        assert logs[0].timestamp is not None
+        assert writer.stats() == {
+            "queued": 5,
+            "sampled": 0,
+            "dropped": 0,
+            "flushed": 5,
+            "failed": 0,
+            "pending": 0,
+        }
+
+    def test_full_batch_is_flushed_in_background(self, session_factory):
+        """A full batch is written without waiting for the interval."""
+        writer = ErrorLogWriter(
+            max_queue_size=100,
+            batch_size=3,
+            flush_interval_seconds=60,
+            session_factory=session_factory,
+        )
+        writer.start()
+        try:
+            for n in range(3):
+                writer.enqueue(**_entry(n))
+            _wait_for(lambda: writer.stats()["flushed"] == 3)
+        finally:
+            writer.stop()
+
+        assert len(_stored(session_factory)) == 3
+
+    def test_partial_batch_is_flushed_after_interval(self, session_factory):
+        """A partial batch is written once the flush interval passes."""
+        writer = ErrorLogWriter(
+            max_queue_size=100,
+            batch_size=50,
+            flush_interval_seconds=0.05,
+            session_factory=session_factory,
+        )
+        writer.start()
+        try:
+            writer.enqueue(**_entry(1))
+            _wait_for(lambda: writer.stats()["flushed"] == 1)
+        finally:
+            writer.stop()
+
+    def test_overload_samples_then_drops(self):
+        """Past half capacity entries are sampled; a full queue drops them."""
+        writer = ErrorLogWriter(
+            max_queue_size=4,
+            batch_size=10,
+            flush_interval_seconds=60,
+            overload_sample_rate=2,
+            session_factory=MagicMock(),
+        )
+
+        results = [writer.enqueue(**_entry(n)) for n in range(8)]
+
+        assert results == [True, True, True, False, True, False, False, False]
+        stats = writer.stats()
+        assert (stats["queued"], stats["sampled"], stats["dropped"]) == (4, 3, 1)
+        assert stats["pending"] == 4
+
+    def test_failed_insert_is_counted(self):
+        """Entries lost to a failing database are counted, not raised."""
+        writer = ErrorLogWriter(
+            max_queue_size=10,
+            batch_size=10,
+            flush_interval_seconds=60,
+            session_factory=MagicMock(side_effect=RuntimeError("db down")),
+        )
+        writer.enqueue(**_entry(1))
+        writer.enqueue(**_entry(2))
+
+        writer.stop()
+
+        assert writer.stats()["failed"] == 2
+        assert writer.stats()["flushed"] == 0
+
+
+class TestHandlersQueueErrors:
+    """The exception handlers queue error logs instead of writing them."""
+
+    def test_unhandled_exception_is_queued(self):
+        app = FastAPI()
+        register_exception_handlers(app)
+
+        @app.get("/boom")
+        def boom() -> None:
+            raise RuntimeError("kaboom")
+
+        writer = MagicMock()
+        with patch(
+            "syfthub.observability.handlers.get_error_log_writer",
+            return_value=writer,
+        ):
+            response = TestClient(app, raise_server_exceptions=False).get("/boom")
+
+        assert response.status_code == 500
+        entry = writer.enqueue.call_args.kwargs
+        assert entry["error_type"] == "RuntimeError"
+        assert entry["message"] == "kaboom"
+        assert entry["endpoint"] == "/boom"
+        assert entry["method"] == "GET"
@@ -370,6 +370,69 @@ class TestAPITokenRepositoryUpdateLastUsed:
         assert result is False
 
 
+class TestAPITokenRepositoryBulkUpdateLastUsed:
+    """Tests for bulk_update_last_used method."""
+
+    def _create(self, repo: APITokenRepository, user_id: int, name: str):
+        _, token_hash, token_prefix = generate_api_token()
+        return repo.create_token(
+            user_id=user_id,
+            name=name,
+            token_prefix=token_prefix,
+            token_hash=token_hash,
+            scopes=["full"],
+        )
+
+    def test_updates_every_token(
+        self, api_token_repo: APITokenRepository, test_session: Session, test_user
+    ):
+        """Test that all buffered uses are written."""
+        first = self._create(api_token_repo, test_user.id, "first")
+        second = self._create(api_token_repo, test_user.id, "second")
+        used_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        assert api_token_repo.bulk_update_last_used(
+            {first.id: (used_at, "10.1.1.1"), second.id: (used_at, None)}
+        )
+
+        test_session.expire_all()
+        assert first.last_used_at.replace(tzinfo=timezone.utc) == used_at
+        assert first.last_used_ip == "10.1.1.1"
+        assert second.last_used_at is not None
+        assert second.last_used_ip is None
+
+    def test_never_moves_last_used_back(
+        self, api_token_repo: APITokenRepository, test_session: Session, test_user
+    ):
+        """Test that an older use does not overwrite a newer stored one."""
+        token = self._create(api_token_repo, test_user.id, "token")
+        newer = datetime(2026, 1, 2, tzinfo=timezone.utc)
+        api_token_repo.bulk_update_last_used({token.id: (newer, "10.0.0.2")})
+
+        api_token_repo.bulk_update_last_used(
+            {token.id: (newer - timedelta(days=1), "10.0.0.1")}
+        )
+
+        test_session.expire_all()
+        assert token.last_used_at.replace(tzinfo=timezone.utc) == newer
+        assert token.last_used_ip == "10.0.0.2"
+
+    def test_missing_ip_keeps_stored_ip(
+        self, api_token_repo: APITokenRepository, test_session: Session, test_user
+    ):
+        """Test that a use without an IP keeps the last known IP."""
+        token = self._create(api_token_repo, test_user.id, "token")
+        used_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        api_token_repo.bulk_update_last_used({token.id: (used_at, "10.0.0.1")})
+
+        api_token_repo.bulk_update_last_used(
+            {token.id: (used_at + timedelta(hours=1), None)}
+        )
+
+        test_session.expire_all()
+        assert token.last_used_ip == "10.0.0.1"
+
+
 class TestAPITokenRepositoryUpdateName:
     """Tests for update_name method."""
 
@@ -1,5 +1,6 @@
 """Additional tests for APITokenRepository exception paths."""
 
+from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
 import pytest
@@ -53,6 +54,12 @@ class TestAPITokenRepositoryExceptionPaths:
         result = repo.update_last_used(999)
         assert result is False
 
+    def test_bulk_update_last_used_returns_false_on_exception(self, repo):
+        repo.session.execute.side_effect = Exception("DB error")
+        result = repo.bulk_update_last_used({1: (datetime.now(timezone.utc), None)})
+        assert result is False
+        repo.session.rollback.assert_called_once()
+
     def test_revoke_returns_false_on_exception(self, repo):
         repo.session.execute.side_effect = Exception("DB error")
         result = repo.revoke(1, 1)
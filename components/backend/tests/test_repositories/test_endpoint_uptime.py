@@ -1,7 +1,7 @@
 """Tests for the endpoint uptime/telemetry repository methods.
 
 Exercises the SQLite fallback paths (no ``ON CONFLICT``) of
-``upsert_uptime_sample``, plus ``get_uptime_samples``,
+``upsert_uptime_sample``, the bulk ``bulk_upsert_uptime_samples``, plus ``get_uptime_samples``,
 ``delete_uptime_samples_older_than`` and ``get_by_owner_and_slug_any_state``.
 """
 
@@ -86,6 +86,51 @@ class TestUpsertUptimeSample:
         assert s.healthy_checks == 0
 
 
+class TestBulkUpsertUptimeSamples:
+    @pytest.fixture
+    def endpoints(self, test_session, user, sample_endpoint_data):
+        models = []
+        for i in range(3):
+            data = dict(sample_endpoint_data)
+            data.update(user_id=user.id, slug=f"bulk-{i}", name=f"Bulk {i}")
+            models.append(EndpointModel(**data))
+        test_session.add_all(models)
+        test_session.commit()
+        return models
+
+    def test_inserts_and_accumulates(self, test_session, endpoints):
+        repo = EndpointRepository(test_session)
+        bucket = datetime.now(timezone.utc).replace(
+            minute=0, second=0, microsecond=0
+        ) - timedelta(days=1)
+        a, b, c = (ep.id for ep in endpoints)
+
+        repo.bulk_upsert_uptime_samples(bucket, {a: True, b: False, c: True})
+        repo.bulk_upsert_uptime_samples(bucket, {a: True, b: True, c: False})
+        test_session.commit()
+
+        totals = {
+            ep_id: (s.total_checks, s.healthy_checks)
+            for ep_id in (a, b, c)
+            for s in repo.get_uptime_samples(ep_id, 24 * 30)
+        }
+        assert totals == {a: (2, 2), b: (2, 1), c: (2, 1)}
+
+    def test_skips_deleted_endpoints(self, test_session, endpoints):
+        repo = EndpointRepository(test_session)
+        bucket = datetime.now(timezone.utc).replace(
+            minute=0, second=0, microsecond=0
+        ) - timedelta(days=1)
+
+        repo.bulk_upsert_uptime_samples(
+            bucket, {endpoints[0].id: True, 999_999: True}, chunk_size=1
+        )
+        test_session.commit()
+
+        assert len(repo.get_uptime_samples(endpoints[0].id, 24 * 30)) == 1
+        assert repo.get_uptime_samples(999_999, 24 * 30) == []
+
+
 class TestUptimeRetention:
     def test_purges_old_samples_only(self, test_session, endpoint):
         repo = EndpointRepository(test_session)
@@ -1,8 +1,10 @@
 """Tests for UserRepository admin-dashboard methods."""
 
 from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
 
 import pytest
+from sqlalchemy.exc import OperationalError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from syfthub.models.user import UserModel
@@ -46,6 +48,31 @@ class TestUpdateLastLogin:
         assert repo.update_last_login(999999) is False
 
 
+class TestGetByUsernames:
+    """Tests for get_by_usernames."""
+
+    def test_returns_matching_users_case_insensitive(
+        self, test_session: Session
+    ) -> None:
+        test_session.add_all([_make_user("alice"), _make_user("bob")])
+        test_session.commit()
+        repo = UserRepository(test_session)
+
+        users = repo.get_by_usernames(["ALICE", "bob", "carol"])
+
+        assert sorted(u.username for u in users) == ["alice", "bob"]
+
+    def test_empty_input_returns_empty(self, test_session: Session) -> None:
+        assert UserRepository(test_session).get_by_usernames([]) == []
+
+    def test_database_errors_propagate(self) -> None:
+        session = MagicMock()
+        session.execute.side_effect = OperationalError("SELECT", {}, Exception("down"))
+
+        with pytest.raises(SQLAlchemyError):
+            UserRepository(session).get_by_usernames(["alice"])
+
+
 class TestListUsersAdmin:
     """Tests for list_users_admin filtering/sorting/pagination."""
 
@@ -0,0 +1,191 @@
+"""Tests for the grouped Global Directory snapshot."""
+
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from tests.test_utils import get_test_user_model_data
+
+from syfthub.repositories import EndpointRepository, UserRepository
+from syfthub.services.directory_snapshot import DirectorySnapshot
+
+
+def _create_user(session: Session, username: str) -> int:
+    user = UserRepository(session).create(
+        get_test_user_model_data(
+            {
+                "username": username,
+                "email": f"{username}@example.com",
+                "full_name": username.title(),
+                "role": "user",
+                "password_hash": "hashed_password_123",
+                "is_active": True,
+            }
+        )
+    )
+    return user.id
+
+
+def _create_endpoint(session: Session, user_id: int, slug: str, **overrides) -> int:
+    data = {
+        "user_id": user_id,
+        "name": slug.title(),
+        "slug": slug,
+        "description": "",
+        "type": "model",
+        "visibility": "public",
+        "is_active": True,
+        "contributors": [user_id],
+        "version": "0.1.0",
+        "readme": "",
+        "stars_count": 0,
+        "policies": [],
+    }
+    data.update(overrides)
+    return EndpointRepository(session).create(data).id
+
+
+@pytest.fixture
+def repo(test_session: Session) -> EndpointRepository:
+    return EndpointRepository(test_session)
+
+
+@pytest.fixture
+def owners(test_session: Session) -> dict[str, int]:
+    alice = _create_user(test_session, "alice")
+    bob = _create_user(test_session, "bob")
+    for i in range(3):
+        _create_endpoint(test_session, alice, f"alice-{i}")
+    _create_endpoint(test_session, bob, "bob-0")
+    return {"alice": alice, "bob": bob}
+
+
+class TestDirectorySnapshot:
+    """Tests for DirectorySnapshot reads and refreshes."""
+
+    def test_serves_repeat_reads_from_memory(self, repo, owners):
+        """Only the first read queries the database."""
+        snapshot = DirectorySnapshot(ttl_seconds=60)
+
+        with patch.object(
+            repo, "get_public_directory_rows", wraps=repo.get_public_directory_rows
+        ) as query:
+            first = snapshot.get(repo)
+            second = snapshot.get(repo)
+
+        assert query.call_count == 1
+        assert first is second
+        response = first.render(max_per_owner=2)
+        assert [g.owner_username for g in response.groups] == ["alice", "bob"]
+        assert response.groups[0].total_count == 3
+        assert len(response.groups[0].endpoints) == 2
+        assert response.groups[0].has_more is True
+
+    def test_invalidated_owner_is_requeried_alone(self, test_session, repo, owners):
+        """An owner refresh re-queries just that owner and re-sorts groups."""
+        snapshot = DirectorySnapshot(ttl_seconds=60)
+        before = snapshot.get(repo)
+
+        for i in range(3):
+            _create_endpoint(test_session, owners["bob"], f"bob-new-{i}")
+        snapshot.invalidate_owners([owners["bob"]])
+
+        with patch.object(
+            repo, "get_public_directory_rows", wraps=repo.get_public_directory_rows
+        ) as query:
+            after = snapshot.get(repo)
+
+        query.assert_called_once()
+        assert query.call_args.kwargs["user_ids"] == [owners["bob"]]
+        response = after.render(max_per_owner=15)
+        assert [g.owner_username for g in response.groups] == ["bob", "alice"]
+        assert response.groups[0].total_count == 4
+        assert after.etag(15) != before.etag(15)
+
+    def test_owner_without_public_endpoints_drops_out(self, test_session, repo, owners):
+        """Refreshing an owner with nothing public left removes their group."""
+        snapshot = DirectorySnapshot(ttl_seconds=60)
+        snapshot.get(repo)
+
+        endpoint = repo.get_by_user_and_slug(owners["bob"], "bob-0")
+        repo.update(endpoint.id, visibility="private")
+        snapshot.invalidate_owners([owners["bob"]])
+
+        groups = snapshot.get(repo).render(max_per_owner=15).groups
+        assert [g.owner_username for g in groups] == ["alice"]
+
+    def test_expired_snapshot_is_rebuilt(self, repo, owners):
+        """Past the TTL the whole directory is queried again."""
+        snapshot = DirectorySnapshot(ttl_seconds=60)
+        clock = [1000.0]
+
+        with (
+            patch(
+                "syfthub.services.directory_snapshot.time.monotonic",
+                side_effect=lambda: clock[0],
+            ),
+            patch.object(
+                repo, "get_public_directory_rows", wraps=repo.get_public_directory_rows
+            ) as query,
+        ):
+            snapshot.get(repo)
+            clock[0] += 59
+            snapshot.get(repo)
+            clock[0] += 1
+            snapshot.get(repo)
+
+        assert query.call_count == 2
+        assert query.call_args.kwargs["user_ids"] is None
+
+    def test_failed_query_is_not_cached(self, repo, owners):
+        """A database error serves an empty directory and retries next read."""
+        snapshot = DirectorySnapshot(ttl_seconds=60)
+
+        with patch.object(
+            repo, "get_public_directory_rows", side_effect=SQLAlchemyError("down")
+        ):
+            assert snapshot.get(repo).groups == ()
+
+        assert len(snapshot.get(repo).groups) == 2
+
+    def test_etag_is_stable_for_unchanged_content(self, repo, owners):
+        """Rebuilding identical content yields the same ETag."""
+        first = DirectorySnapshot(ttl_seconds=60).get(repo)
+        second = DirectorySnapshot(ttl_seconds=60).get(repo)
+
+        assert first.etag(15) == second.etag(15)
+        assert first.etag(15) != first.etag(5)
+
+
+class TestDirectorySnapshotPolicies:
+    """Tests for per-viewer policy rendering from the shared snapshot."""
+
+    def test_targeted_policies_render_per_viewer(self, test_session, repo):
+        """Viewers named by a policy see it; everyone else sees the wildcard."""
+        owner = _create_user(test_session, "carol")
+        _create_endpoint(
+            test_session,
+            owner,
+            "carol-api",
+            policies=[
+                {"type": "public", "config": {"applied_to": ["*"]}},
+                {"type": "premium", "config": {"applied_to": ["vip@example.com"]}},
+            ],
+        )
+        state = DirectorySnapshot(ttl_seconds=60).get(repo)
+
+        def policy_types(viewer):
+            endpoint = state.render(15, viewer).groups[0].endpoints[0]
+            return [p.type for p in endpoint.policies]
+
+        assert policy_types(None) == ["public"]
+        assert policy_types("someone@example.com") == ["public"]
+        assert policy_types("VIP@example.com") == ["premium"]
+        assert state.etag(15, "vip@example.com") != state.etag(15)
+
+    def test_untargeted_directory_shares_one_etag(self, repo, owners):
+        """Without targeted policies every viewer gets the same ETag."""
+        state = DirectorySnapshot(ttl_seconds=60).get(repo)
+
+        assert state.etag(15, "someone@example.com") == state.etag(15)
@@ -1278,6 +1278,77 @@ class TestReportEndpointHealth:
 
         endpoint_service.session.rollback.assert_called_once()
 
+    @pytest.mark.parametrize("domain_changed", [True, False])
+    def test_report_health_invalidates_principal_only_on_domain_change(
+        self, endpoint_service, sample_user, domain_changed
+    ):
+        """Heartbeats that keep the domain leave the auth cache alone."""
+        with (
+            patch.object(
+                endpoint_service.endpoint_repository,
+                "get_endpoints_by_slugs_for_health",
+                return_value=[],
+            ),
+            patch.object(
+                endpoint_service.user_repository,
+                "update_domain",
+                return_value=domain_changed,
+            ),
+            patch(
+                "syfthub.services.endpoint_service.invalidate_user_principal"
+            ) as invalidate,
+        ):
+            endpoint_service.report_endpoint_health(
+                endpoints_health=[],
+                url="https://example.com",
+                current_user=sample_user,
+            )
+
+        assert invalidate.called is domain_changed
+
+    @pytest.mark.parametrize(
+        ("stored_status", "refreshed"),
+        [("healthy", False), ("unhealthy", True), (None, True)],
+    )
+    def test_report_health_refreshes_listings_on_status_change(
+        self, endpoint_service, sample_user, stored_status, refreshed
+    ):
+        """Public listings are refreshed when a reported status changes."""
+        items = [
+            EndpointHealthItem(
+                slug="my-endpoint",
+                status=EndpointHealthStatus.HEALTHY,
+                checked_at=datetime.now(timezone.utc),
+            )
+        ]
+        stored = MagicMock(slug="my-endpoint", id=1, health_status=stored_status)
+
+        with (
+            patch.object(
+                endpoint_service.endpoint_repository,
+                "get_endpoints_by_slugs_for_health",
+                return_value=[stored],
+            ),
+            patch.object(
+                endpoint_service.endpoint_repository,
+                "bulk_update_health_status",
+                return_value=1,
+            ),
+            patch.object(
+                endpoint_service.user_repository, "update_domain", return_value=False
+            ),
+            patch(
+                "syfthub.services.endpoint_service._public_listings_changed"
+            ) as listings_changed,
+        ):
+            endpoint_service.report_endpoint_health(
+                endpoints_health=items,
+                url="https://example.com",
+                current_user=sample_user,
+            )
+
+        assert listings_changed.called is refreshed
+
 
 class TestGetEndpointUptime:
     """Tests for EndpointService.get_endpoint_uptime method."""
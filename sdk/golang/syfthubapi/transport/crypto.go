@@ -6,11 +6,15 @@ import (
 	"crypto/ecdh"
 	"crypto/rand"
 	"encoding/base64"
+	"encoding/binary"
 	"errors"
 	"fmt"
 	"io"
 	"os"
 	"path/filepath"
+	"sync"
+	"sync/atomic"
+	"time"
 
 	"golang.org/x/crypto/hkdf"
 
@@ -27,6 +31,16 @@ var (
 
 const nonceSize = 12 // 96-bit nonce for AES-256-GCM
 
+const (
+	algorithmID = "X25519-ECDH-AES-256-GCM"
+
+	// sessionAlgorithmID marks a request sent with an aggregator tunnel session
+	// (one ephemeral keypair reused across requests). Responses tagged with it
+	// are encrypted under the session response key — must match the Python
+	// aggregator's SESSION_ALGORITHM_ID.
+	sessionAlgorithmID = "X25519-ECDH-AES-256-GCM-SESSION"
+)
+
 // GenerateX25519Keypair generates a fresh X25519 keypair.
 // Returns the private key and the raw (32-byte) public key bytes.
 func GenerateX25519Keypair() (*ecdh.PrivateKey, error) {
@@ -258,7 +272,7 @@ func EncryptTunnelResponse(
 	}
 
 	encInfo := &syfthubapi.EncryptionInfo{
-		Algorithm:          "X25519-ECDH-AES-256-GCM",
+		Algorithm:          algorithmID,
 		EphemeralPublicKey: b64urlEncode(respPubBytes),
 		Nonce:              b64urlEncode(nonce),
 	}
@@ -340,9 +354,212 @@ func (e *SessionEncryptor) Encrypt(payloadJSON []byte, correlationID string) (*s
 	ciphertext := e.gcm.Seal(nil, nonce, payloadJSON, aad)
 
 	encInfo := &syfthubapi.EncryptionInfo{
-		Algorithm:          "X25519-ECDH-AES-256-GCM",
+		Algorithm:          algorithmID,
 		EphemeralPublicKey: e.ephPubKeyB64,
 		Nonce:              b64urlEncode(nonce),
 	}
 	return encInfo, b64urlEncode(ciphertext), nil
 }
+
+// newGCM builds an AES-256-GCM AEAD for a derived key.
+func newGCM(aesKey []byte) (cipher.AEAD, error) {
+	block, err := aes.NewCipher(aesKey)
+	if err != nil {
+		return nil, fmt.Errorf("AES cipher creation failed: %w", err)
+	}
+	gcm, err := cipher.NewGCM(block)
+	if err != nil {
+		return nil, fmt.Errorf("GCM creation failed: %w", err)
+	}
+	return gcm, nil
+}
+
+// tunnelSession holds the keys derived for one aggregator session key.
+//
+// Response nonces are a random 4-byte prefix chosen when the entry is created
+// followed by an 8-byte counter, so they never repeat under this entry's key.
+// The prefix keeps nonces distinct if the entry is evicted and re-derived (or
+// the space restarts) while the aggregator keeps using the same session.
+type tunnelSession struct {
+	requestGCM  cipher.AEAD
+	responseGCM cipher.AEAD
+	noncePrefix [4]byte
+	counter     atomic.Uint64
+	expiresAt   time.Time
+}
+
+func (s *tunnelSession) nextNonce() []byte {
+	nonce := make([]byte, nonceSize)
+	copy(nonce, s.noncePrefix[:])
+	binary.BigEndian.PutUint64(nonce[4:], s.counter.Add(1))
+	return nonce
+}
+
+// TunnelSessionCache caches the request/response keys for aggregator tunnel
+// sessions, keyed by the session's ephemeral public key.
+//
+// In session mode the aggregator reuses one ephemeral keypair per space for a
+// bounded lifetime. The request key is derived exactly as in the per-request
+// protocol, so a space without this cache still decrypts session requests.
+// With it, the space runs ECDH + HKDF once per session instead of once per
+// request, and skips the per-response keypair generation and ECDH.
+type TunnelSessionCache struct {
+	privateKey *ecdh.PrivateKey
+	ttl        time.Duration
+	maxEntries int
+	now        func() time.Time // time source, replaced in tests
+
+	mu      sync.Mutex
+	entries map[string]*tunnelSession
+}
+
+// Default limits for NewTunnelSessionCache. The TTL is longer than the
+// aggregator's default session lifetime so a live session is derived once.
+const (
+	defaultSessionCacheTTL        = 10 * time.Minute
+	defaultSessionCacheMaxEntries = 1024
+)
+
+// NewTunnelSessionCache creates a session key cache for the space's long-term key.
+// Zero ttl or maxEntries select the defaults.
+func NewTunnelSessionCache(privateKey *ecdh.PrivateKey, ttl time.Duration, maxEntries int) *TunnelSessionCache {
+	if ttl <= 0 {
+		ttl = defaultSessionCacheTTL
+	}
+	if maxEntries <= 0 {
+		maxEntries = defaultSessionCacheMaxEntries
+	}
+	return &TunnelSessionCache{
+		privateKey: privateKey,
+		ttl:        ttl,
+		maxEntries: maxEntries,
+		now:        time.Now,
+		entries:    make(map[string]*tunnelSession),
+	}
+}
+
+// session returns the cached keys for an aggregator session key, deriving them
+// on first use (or after expiry).
+func (c *TunnelSessionCache) session(ephemeralPubKeyB64 string) (*tunnelSession, error) {
+	now := c.now()
+
+	c.mu.Lock()
+	s, ok := c.entries[ephemeralPubKeyB64]
+	c.mu.Unlock()
+	if ok && now.Before(s.expiresAt) {
+		return s, nil
+	}
+
+	ephemeralPubBytes, err := b64urlDecode(ephemeralPubKeyB64)
+	if err != nil {
+		return nil, fmt.Errorf("invalid ephemeral_public_key: %w", err)
+	}
+	requestKey, err := deriveKey(c.privateKey, ephemeralPubBytes, hkdfRequestInfo)
+	if err != nil {
+		return nil, err
+	}
+	responseKey, err := deriveKey(c.privateKey, ephemeralPubBytes, hkdfResponseInfo)
+	if err != nil {
+		return nil, err
+	}
+
+	s = &tunnelSession{expiresAt: now.Add(c.ttl)}
+	if s.requestGCM, err = newGCM(requestKey); err != nil {
+		return nil, err
+	}
+	if s.responseGCM, err = newGCM(responseKey); err != nil {
+		return nil, err
+	}
+	if _, err := io.ReadFull(rand.Reader, s.noncePrefix[:]); err != nil {
+		return nil, fmt.Errorf("nonce prefix generation failed: %w", err)
+	}
+
+	c.mu.Lock()
+	defer c.mu.Unlock()
+	// Another goroutine may have derived the same session concurrently; keep
+	// the first so every response shares one nonce sequence.
+	if existing, ok := c.entries[ephemeralPubKeyB64]; ok && now.Before(existing.expiresAt) {
+		return existing, nil
+	}
+	if len(c.entries) >= c.maxEntries {
+		c.evictLocked(now)
+	}
+	c.entries[ephemeralPubKeyB64] = s
+	return s, nil
+}
+
+// evictLocked drops expired entries, or an arbitrary one if none has expired.
+// c.mu must be held.
+func (c *TunnelSessionCache) evictLocked(now time.Time) {
+	for key, s := range c.entries {
+		if !now.Before(s.expiresAt) {
+			delete(c.entries, key)
+		}
+	}
+	if len(c.entries) < c.maxEntries {
+		return
+	}
+	for key := range c.entries {
+		delete(c.entries, key)
+		return
+	}
+}
+
+// DecryptRequest decrypts a session-mode tunnel request payload.
+func (c *TunnelSessionCache) DecryptRequest(
+	encryptedPayloadB64 string,
+	encInfo *syfthubapi.EncryptionInfo,
+	correlationID string,
+) ([]byte, error) {
+	if encInfo == nil {
+		return nil, fmt.Errorf("encryption_info is nil")
+	}
+
+	s, err := c.session(encInfo.EphemeralPublicKey)
+	if err != nil {
+		return nil, err
+	}
+
+	nonce, err := b64urlDecode(encInfo.Nonce)
+	if err != nil {
+		return nil, fmt.Errorf("invalid nonce: %w", err)
+	}
+	if len(nonce) != nonceSize {
+		return nil, fmt.Errorf("nonce must be %d bytes, got %d", nonceSize, len(nonce))
+	}
+
+	ciphertext, err := b64urlDecode(encryptedPayloadB64)
+	if err != nil {
+		return nil, fmt.Errorf("invalid encrypted_payload: %w", err)
+	}
+
+	plaintext, err := s.requestGCM.Open(nil, nonce, ciphertext, []byte(correlationID))
+	if err != nil {
+		return nil, fmt.Errorf("GCM decryption failed (wrong key, nonce, or tampered data): %w", err)
+	}
+	return plaintext, nil
+}
+
+// EncryptResponse encrypts a response to a session-mode request under the
+// session response key. The returned EncryptionInfo echoes the aggregator's
+// session public key and is tagged with the session algorithm.
+func (c *TunnelSessionCache) EncryptResponse(
+	payloadJSON []byte,
+	requestEphemeralPubKeyB64 string,
+	correlationID string,
+) (*syfthubapi.EncryptionInfo, string, error) {
+	s, err := c.session(requestEphemeralPubKeyB64)
+	if err != nil {
+		return nil, "", err
+	}
+
+	nonce := s.nextNonce()
+	ciphertext := s.responseGCM.Seal(nil, nonce, payloadJSON, []byte(correlationID))
+
+	encInfo := &syfthubapi.EncryptionInfo{
+		Algorithm:          sessionAlgorithmID,
+		EphemeralPublicKey: requestEphemeralPubKeyB64,
+		Nonce:              b64urlEncode(nonce),
+	}
+	return encInfo, b64urlEncode(ciphertext), nil
+}
@@ -2,9 +2,12 @@ package transport
 
 import (
 	"crypto/ecdh"
+	"encoding/binary"
 	"encoding/json"
+	"fmt"
 	"strings"
 	"testing"
+	"time"
 
 	syfthubapi "github.com/openmined/syfthub/sdk/golang/syfthubapi"
 )
@@ -408,3 +411,240 @@ func TestFullPipelineRoundtrip(t *testing.T) {
 		t.Fatalf("response decrypt mismatch: got %q, want %q", recovered, responsePayload)
 	}
 }
+
+// ---------------------------------------------------------------------------
+// Session mode
+// ---------------------------------------------------------------------------
+
+// aggregatorSessionForTest simulates the Python aggregator's TunnelSession: one
+// ephemeral keypair reused across requests, with counter nonces.
+type aggregatorSessionForTest struct {
+	ephemeral   *ecdh.PrivateKey
+	requestKey  []byte
+	responseKey []byte
+	counter     uint64
+}
+
+func newAggregatorSessionForTest(tb testing.TB, spacePublicKeyBytes []byte) *aggregatorSessionForTest {
+	tb.Helper()
+	ephemeral, err := GenerateX25519Keypair()
+	if err != nil {
+		tb.Fatalf("GenerateX25519Keypair: %v", err)
+	}
+	requestKey, err := deriveKey(ephemeral, spacePublicKeyBytes, hkdfRequestInfo)
+	if err != nil {
+		tb.Fatalf("deriveKey(request): %v", err)
+	}
+	responseKey, err := deriveKey(ephemeral, spacePublicKeyBytes, hkdfResponseInfo)
+	if err != nil {
+		tb.Fatalf("deriveKey(response): %v", err)
+	}
+	return &aggregatorSessionForTest{ephemeral: ephemeral, requestKey: requestKey, responseKey: responseKey}
+}
+
+func (s *aggregatorSessionForTest) encrypt(tb testing.TB, payloadJSON, correlationID string) (*syfthubapi.EncryptionInfo, string) {
+	tb.Helper()
+	s.counter++
+	nonce := make([]byte, nonceSize)
+	binary.BigEndian.PutUint64(nonce[4:], s.counter)
+
+	gcm, err := newGCM(s.requestKey)
+	if err != nil {
+		tb.Fatalf("newGCM: %v", err)
+	}
+	ciphertext := gcm.Seal(nil, nonce, []byte(payloadJSON), []byte(correlationID))
+	return &syfthubapi.EncryptionInfo{
+		Algorithm:          sessionAlgorithmID,
+		EphemeralPublicKey: b64urlEncode(s.ephemeral.PublicKey().Bytes()),
+		Nonce:              b64urlEncode(nonce),
+	}, b64urlEncode(ciphertext)
+}
+
+func (s *aggregatorSessionForTest) decrypt(tb testing.TB, encPayloadB64 string, encInfo *syfthubapi.EncryptionInfo, correlationID string) string {
+	tb.Helper()
+	nonce, _ := b64urlDecode(encInfo.Nonce)
+	ciphertext, _ := b64urlDecode(encPayloadB64)
+	plaintext, err := decryptPayload(ciphertext, s.responseKey, nonce, []byte(correlationID))
+	if err != nil {
+		tb.Fatalf("decryptPayload: %v", err)
+	}
+	return string(plaintext)
+}
+
+func TestSessionCacheRoundtrip(t *testing.T) {
+	spacePriv, _ := GenerateX25519Keypair()
+	cache := NewTunnelSessionCache(spacePriv, 0, 0)
+	agg := newAggregatorSessionForTest(t, spacePriv.PublicKey().Bytes())
+
+	for i := 0; i < 3; i++ {
+		correlationID := fmt.Sprintf("session-%d", i)
+		encInfo, encPayloadB64 := agg.encrypt(t, `{"messages":"hi"}`, correlationID)
+
+		plaintext, err := cache.DecryptRequest(encPayloadB64, encInfo, correlationID)
+		if err != nil {
+			t.Fatalf("DecryptRequest: %v", err)
+		}
+		if string(plaintext) != `{"messages":"hi"}` {
+			t.Fatalf("request mismatch: %q", plaintext)
+		}
+
+		respInfo, respPayloadB64, err := cache.EncryptResponse([]byte(`{"ok":true}`), encInfo.EphemeralPublicKey, correlationID)
+		if err != nil {
+			t.Fatalf("EncryptResponse: %v", err)
+		}
+		if respInfo.Algorithm != sessionAlgorithmID {
+			t.Errorf("algorithm = %q, want %q", respInfo.Algorithm, sessionAlgorithmID)
+		}
+		if got := agg.decrypt(t, respPayloadB64, respInfo, correlationID); got != `{"ok":true}` {
+			t.Fatalf("response mismatch: %q", got)
+		}
+	}
+
+	if len(cache.entries) != 1 {
+		t.Errorf("cache entries = %d, want 1 (one derivation per session)", len(cache.entries))
+	}
+}
+
+// Session requests use the same request key derivation as per-request mode,
+// so spaces without a session cache still decrypt them.
+func TestSessionRequestDecryptableWithoutCache(t *testing.T) {
+	spacePriv, _ := GenerateX25519Keypair()
+	agg := newAggregatorSessionForTest(t, spacePriv.PublicKey().Bytes())
+	encInfo, encPayloadB64 := agg.encrypt(t, `{}`, "compat")
+
+	plaintext, err := DecryptTunnelRequest(encPayloadB64, encInfo, spacePriv, "compat")
+	if err != nil {
+		t.Fatalf("DecryptTunnelRequest: %v", err)
+	}
+	if string(plaintext) != `{}` {
+		t.Fatalf("mismatch: %q", plaintext)
+	}
+}
+
+func TestSessionResponseNoncesUnique(t *testing.T) {
+	spacePriv, _ := GenerateX25519Keypair()
+	cache := NewTunnelSessionCache(spacePriv, 0, 0)
+	agg := newAggregatorSessionForTest(t, spacePriv.PublicKey().Bytes())
+	ephPubB64 := b64urlEncode(agg.ephemeral.PublicKey().Bytes())
+
+	seen := make(map[string]bool)
+	for i := 0; i < 1000; i++ {
+		encInfo, _, err := cache.EncryptResponse([]byte(`{}`), ephPubB64, "same-id")
+		if err != nil {
+			t.Fatalf("EncryptResponse: %v", err)
+		}
+		if seen[encInfo.Nonce] {
+			t.Fatalf("nonce reused after %d responses", i)
+		}
+		seen[encInfo.Nonce] = true
+	}
+}
+
+func TestSessionCacheBoundedEntries(t *testing.T) {
+	spacePriv, _ := GenerateX25519Keypair()
+	cache := NewTunnelSessionCache(spacePriv, 0, 2)
+
+	for i := 0; i < 5; i++ {
+		agg := newAggregatorSessionForTest(t, spacePriv.PublicKey().Bytes())
+		encInfo, encPayloadB64 := agg.encrypt(t, `{}`, "bounded")
+		if _, err := cache.DecryptRequest(encPayloadB64, encInfo, "bounded"); err != nil {
+			t.Fatalf("DecryptRequest: %v", err)
+		}
+	}
+	if len(cache.entries) > 2 {
+		t.Errorf("cache entries = %d, want <= 2", len(cache.entries))
+	}
+}
+
+func TestSessionCacheHitExpiryAndEviction(t *testing.T) {
+	spacePriv, _ := GenerateX25519Keypair()
+	cache := NewTunnelSessionCache(spacePriv, time.Minute, 2)
+	now := time.Unix(1_700_000_000, 0)
+	cache.now = func() time.Time { return now }
+
+	sessionKey := func() string {
+		agg := newAggregatorSessionForTest(t, spacePriv.PublicKey().Bytes())
+		return b64urlEncode(agg.ephemeral.PublicKey().Bytes())
+	}
+	first, second, third := sessionKey(), sessionKey(), sessionKey()
+
+	s1, err := cache.session(first)
+	if err != nil {
+		t.Fatalf("session: %v", err)
+	}
+	if again, _ := cache.session(first); again != s1 {
+		t.Error("live session was derived again instead of served from the cache")
+	}
+
+	now = now.Add(time.Minute)
+	if expired, _ := cache.session(first); expired == s1 {
+		t.Error("expired session was served from the cache")
+	}
+
+	// The cache is full with first and second; third evicts the expired one
+	// before any live entry.
+	now = now.Add(30 * time.Second)
+	s2, _ := cache.session(second)
+	now = now.Add(31 * time.Second)
+	if _, err := cache.session(third); err != nil {
+		t.Fatalf("session: %v", err)
+	}
+	if len(cache.entries) != 2 {
+		t.Fatalf("cache entries = %d, want 2", len(cache.entries))
+	}
+	if _, ok := cache.entries[first]; ok {
+		t.Error("expired entry survived eviction")
+	}
+	if got, _ := cache.session(second); got != s2 {
+		t.Error("live entry was evicted while an expired one was present")
+	}
+}
+
+// ---------------------------------------------------------------------------
+// Benchmarks: space-side cost of one request/response exchange.
+// Run with `go test -bench Tunnel -cpu 1 ./transport` for requests/sec per core.
+// ---------------------------------------------------------------------------
+
+func BenchmarkTunnelPerRequestKeys(b *testing.B) {
+	spacePriv, _ := GenerateX25519Keypair()
+	payload := []byte(`{"messages":"what is syfthub?","limit":5}`)
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		// Aggregator side: fresh ephemeral keypair + ECDH per request
+		ephemeral, _ := GenerateX25519Keypair()
+		reqKey, _ := deriveKey(ephemeral, spacePriv.PublicKey().Bytes(), hkdfRequestInfo)
+		nonce, ciphertext, _ := encryptPayload(payload, reqKey, []byte("bench"))
+		encInfo := &syfthubapi.EncryptionInfo{
+			Algorithm:          algorithmID,
+			EphemeralPublicKey: b64urlEncode(ephemeral.PublicKey().Bytes()),
+			Nonce:              b64urlEncode(nonce),
+		}
+
+		// Space side
+		if _, err := DecryptTunnelRequest(b64urlEncode(ciphertext), encInfo, spacePriv, "bench"); err != nil {
+			b.Fatal(err)
+		}
+		if _, _, err := EncryptTunnelResponse(payload, encInfo.EphemeralPublicKey, "bench"); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkTunnelSessionKeys(b *testing.B) {
+	spacePriv, _ := GenerateX25519Keypair()
+	cache := NewTunnelSessionCache(spacePriv, 0, 0)
+	agg := newAggregatorSessionForTest(b, spacePriv.PublicKey().Bytes())
+	payload := `{"messages":"what is syfthub?","limit":5}`
+
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		encInfo, encPayloadB64 := agg.encrypt(b, payload, "bench")
+		if _, err := cache.DecryptRequest(encPayloadB64, encInfo, "bench"); err != nil {
+			b.Fatal(err)
+		}
+		if _, _, err := cache.EncryptResponse([]byte(payload), encInfo.EphemeralPublicKey, "bench"); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
@@ -267,6 +267,10 @@ type NATSTransport struct {
 	// tunnel requests. Generated at construction time; never rotated at runtime.
 	privateKey *ecdh.PrivateKey
 
+	// sessions caches derived keys for aggregators that reuse one ephemeral
+	// key per space (session mode), so each session costs a single ECDH.
+	sessions *TunnelSessionCache
+
 	mu      sync.Mutex
 	running bool
 	stopCh  chan struct{}
@@ -311,6 +315,7 @@ func NewNATSTransport(cfg *Config) (*NATSTransport, error) {
 		config:     cfg,
 		logger:     logger,
 		privateKey: privateKey,
+		sessions:   NewTunnelSessionCache(privateKey, 0, 0),
 		stopCh:     make(chan struct{}),
 	}, nil
 }
@@ -544,12 +549,22 @@ func (t *NATSTransport) handleMessage(msg *nats.Msg) {
 		return
 	}
 
-	plaintext, err := DecryptTunnelRequest(
-		req.EncryptedPayload,
-		req.EncryptionInfo,
-		t.privateKey,
-		req.CorrelationID,
-	)
+	var plaintext []byte
+	var err error
+	if req.EncryptionInfo.Algorithm == sessionAlgorithmID {
+		plaintext, err = t.sessions.DecryptRequest(
+			req.EncryptedPayload,
+			req.EncryptionInfo,
+			req.CorrelationID,
+		)
+	} else {
+		plaintext, err = DecryptTunnelRequest(
+			req.EncryptedPayload,
+			req.EncryptionInfo,
+			t.privateKey,
+			req.CorrelationID,
+		)
+	}
 	if err != nil {
 		t.logger.Error("failed to decrypt request payload",
 			"correlation_id", req.CorrelationID,
@@ -613,7 +628,13 @@ func (t *NATSTransport) sendResponse(msg *nats.Msg, req *syfthubapi.TunnelReques
 			payloadToEncrypt = []byte("null")
 		}
 
-		encInfo, encPayloadB64, err := EncryptTunnelResponse(
+		encrypt := EncryptTunnelResponse
+		if req.EncryptionInfo.Algorithm == sessionAlgorithmID {
+			// Answer in session mode: the aggregator offered it and decrypts
+			// with its cached session response key.
+			encrypt = t.sessions.EncryptResponse
+		}
+		encInfo, encPayloadB64, err := encrypt(
 			payloadToEncrypt,
 			req.EncryptionInfo.EphemeralPublicKey,
 			resp.CorrelationID,
@@ -28,7 +28,7 @@ Example usage:
             print(event.content, end="")
 """
 
-from syfthub_sdk._pagination import PageIterator
+from syfthub_sdk._pagination import CursorPageIterator, PageIterator
 from syfthub_sdk.agent import (
     AgentConfig,
     AgentHistoryMessage,
@@ -215,4 +215,5 @@ __all__ = [
     "EndpointResolutionError",
     # Utilities
     "PageIterator",
+    "CursorPageIterator",
 ]
@@ -0,0 +1,82 @@
+"""Client-side caching utilities for SyftHub SDK."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Small thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Example usage:
+        cache: TTLCache[str, EndpointPublic] = TTLCache(ttl=60)
+        cache.set("alice/cool-api", endpoint)
+        cache.get("alice/cool-api")  # -> endpoint, until 60s have passed
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        *,
+        max_entries: int = 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid. 0 or less disables caching.
+            max_entries: Maximum entries kept; least recently used are evicted first
+            clock: Monotonic time source (injectable for tests)
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        """Whether entries are cached at all."""
+        return self.ttl > 0 and self.max_entries > 0
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value for ``key``, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V) -> None:
+        """Cache ``value`` under ``key`` for ``ttl`` seconds."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: K | None = None) -> None:
+        """Drop one entry, or every entry when ``key`` is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -20,6 +20,9 @@ from syfthub_sdk.exceptions import (
 )
 from syfthub_sdk.models import AuthTokens
 
+# Response header carrying the opaque cursor for the next page of a listing
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
 
 class HTTPClient:
     """HTTP client with automatic token management.
@@ -248,6 +251,50 @@ class HTTPClient:
         Returns:
             Parsed JSON response
 
+        Raises:
+            SyftHubError: On API errors
+        """
+        response = self._send(
+            method,
+            path,
+            json=json,
+            params=params,
+            data=data,
+            include_auth=include_auth,
+            retry_on_401=retry_on_401,
+        )
+
+        # Return parsed JSON (or empty dict for 204 No Content)
+        if response.status_code == 204:
+            return {}
+
+        return response.json()  # type: ignore[no-any-return]
+
+    def _send(
+        self,
+        method: str,
+        path: str,
+        *,
+        json: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        include_auth: bool = True,
+        retry_on_401: bool = True,
+    ) -> httpx.Response:
+        """Send an HTTP request and return the successful raw response.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, PATCH, DELETE)
+            path: URL path (will be joined with base_url)
+            json: JSON body data
+            params: Query parameters
+            data: Form data (for login endpoint)
+            include_auth: Whether to include Authorization header
+            retry_on_401: Whether to retry with token refresh on 401
+
+        Returns:
+            The httpx response (status < 400)
+
         Raises:
             SyftHubError: On API errors
         """
@@ -297,7 +344,7 @@ class HTTPClient:
             and self._attempt_refresh()
         ):
             # Retry with new token
-            return self.request(
+            return self._send(
                 method=method,
                 path=path,
                 json=json,
@@ -311,11 +358,7 @@ class HTTPClient:
         if response.status_code >= 400:
             self._handle_error(response)
 
-        # Return parsed JSON (or empty dict for 204 No Content)
-        if response.status_code == 204:
-            return {}
-
-        return response.json()  # type: ignore[no-any-return]
+        return response
 
     def get(
         self,
@@ -327,6 +370,25 @@ class HTTPClient:
         """Make a GET request."""
         return self.request("GET", path, params=params, include_auth=include_auth)
 
+    def get_page(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        include_auth: bool = True,
+    ) -> tuple[list[Any], str | None]:
+        """GET a list endpoint and return its items with the next-page cursor.
+
+        The cursor comes from the ``X-Next-Cursor`` response header and is
+        None on the last page (or from servers without cursor pagination).
+        """
+        response = self._send("GET", path, params=params, include_auth=include_auth)
+        items = response.json()
+        return (
+            items if isinstance(items, list) else [],
+            response.headers.get(NEXT_CURSOR_HEADER),
+        )
+
     def post(
         self,
         path: str,
@@ -12,6 +12,11 @@ T = TypeVar("T", bound=BaseModel)
 # Type alias for fetch functions
 FetchFn = Callable[[int, int], list[dict[str, object]]]
 
+# Cursor fetch functions take (skip, limit, cursor) and return (items, next_cursor)
+CursorFetchFn = Callable[
+    [int, int, str | None], tuple[list[dict[str, object]], str | None]
+]
+
 
 class PageIterator(Generic[T]):
     """Lazy pagination iterator that fetches pages on demand.
@@ -131,3 +136,72 @@ class PageIterator(Generic[T]):
             if len(result) >= n:
                 break
         return result
+
+
+class CursorPageIterator(PageIterator[T]):
+    """Page iterator that follows server-issued cursors.
+
+    Each page carries an opaque cursor for the next one, so the server seeks
+    straight to it instead of skipping rows; deep pages cost the same as the
+    first. Against servers that don't issue cursors it falls back to
+    ``skip``/``limit`` paging, so the same iterator works with older hubs.
+
+    Example usage:
+        for endpoint in client.hub.browse():
+            print(endpoint.name)
+    """
+
+    def __init__(
+        self,
+        fetch_fn: CursorFetchFn,
+        model_class: type[T],
+        page_size: int = 20,
+    ) -> None:
+        """Initialize the cursor page iterator.
+
+        Args:
+            fetch_fn: Function that takes (skip, limit, cursor) and returns
+                (list of dicts, next cursor or None)
+            model_class: Pydantic model class to parse items into
+            page_size: Number of items per page (default 20)
+        """
+        # _fetch_page and first_page are overridden, so the base class's
+        # (skip, limit) fetch function is never needed.
+        self._cursor_fetch_fn = fetch_fn
+        self._model_class = model_class
+        self._page_size = page_size
+        self._reset()
+
+    def _reset(self) -> None:
+        """Reset iterator state for fresh iteration."""
+        super()._reset()
+        self._cursor: str | None = None
+        self._seen_cursor = False
+
+    def _fetch_page(self, page: int) -> list[T]:
+        """Fetch a page, seeking by cursor once the server has issued one."""
+        if self._seen_cursor:
+            skip, cursor = 0, self._cursor
+        else:
+            skip, cursor = page * self._page_size, None
+        raw_items, next_cursor = self._cursor_fetch_fn(skip, self._page_size, cursor)
+
+        items = [self._model_class.model_validate(item) for item in raw_items]
+
+        if next_cursor:
+            self._cursor = next_cursor
+            self._seen_cursor = True
+        elif self._seen_cursor or len(items) < self._page_size:
+            # A cursor-aware server omits the cursor only on the last page
+            self._exhausted = True
+
+        return items
+
+    def first_page(self) -> list[T]:
+        """Get just the first page of results.
+
+        Returns:
+            List of items from the first page
+        """
+        raw_items, _ = self._cursor_fetch_fn(0, self._page_size, None)
+        return [self._model_class.model_validate(item) for item in raw_items]
@@ -6,6 +6,7 @@ import concurrent.futures
 from collections.abc import Callable
 from typing import TYPE_CHECKING
 
+from syfthub_sdk.exceptions import NotFoundError, SyftHubError
 from syfthub_sdk.models import (
     AuthConfig,
     AuthTokens,
@@ -18,6 +19,10 @@ from syfthub_sdk.models import (
 if TYPE_CHECKING:
     from syfthub_sdk._http import HTTPClient
 
+# Audiences the hub accepts per batch token request
+# (its satellite_token_batch_max_audiences setting)
+SATELLITE_TOKEN_BATCH_MAX_AUDIENCES = 100
+
 
 class AuthResource:
     """Handle authentication operations.
@@ -447,11 +452,61 @@ class AuthResource:
 
         return token_map
 
+    def _batch_fetch_tokens(
+        self,
+        path: str,
+        audiences: list[str],
+        *,
+        include_auth: bool,
+        fetch_one: Callable[[str], SatelliteTokenResponse],
+    ) -> dict[str, str]:
+        """Fetch tokens for multiple audiences with batch requests.
+
+        Audiences are sent in chunks of ``SATELLITE_TOKEN_BATCH_MAX_AUDIENCES``,
+        the hub's per-request limit. Like the per-audience path, failures are
+        skipped rather than raised — the aggregator handles missing tokens. A
+        chunk whose batch request fails is fetched one audience at a time, as
+        is everything on hubs without the batch endpoint (404/405).
+        """
+        unique_audiences = sorted(set(audiences))
+        token_map: dict[str, str] = {}
+
+        for start in range(
+            0, len(unique_audiences), SATELLITE_TOKEN_BATCH_MAX_AUDIENCES
+        ):
+            chunk = unique_audiences[
+                start : start + SATELLITE_TOKEN_BATCH_MAX_AUDIENCES
+            ]
+            try:
+                response = self._http.post(
+                    path,
+                    json={"audiences": chunk},
+                    include_auth=include_auth,
+                )
+            except SyftHubError as e:
+                if isinstance(e, NotFoundError) or e.status_code == 405:
+                    rest = unique_audiences[start:]
+                    token_map.update(self._parallel_fetch_tokens(rest, fetch_one))
+                    break
+                token_map.update(self._parallel_fetch_tokens(chunk, fetch_one))
+                continue
+
+            data = response if isinstance(response, dict) else {}
+            token_map.update(
+                {
+                    aud: SatelliteTokenResponse.model_validate(entry).target_token
+                    for aud, entry in data.get("tokens", {}).items()
+                }
+            )
+
+        return token_map
+
     def get_satellite_tokens(self, audiences: list[str]) -> dict[str, str]:
-        """Get satellite tokens for multiple audiences in parallel.
+        """Get satellite tokens for multiple audiences in one request.
 
         This is useful when making requests to endpoints owned by different users.
-        Tokens are cached and reused where possible.
+        All audiences are minted by a single call to the hub's batch endpoint;
+        audiences that are unknown or inactive are left out of the result.
 
         Args:
             audiences: List of audience identifiers (usernames)
@@ -467,7 +522,12 @@ class AuthResource:
             tokens = client.auth.get_satellite_tokens(["alice", "bob"])
             print(f"Got {len(tokens)} tokens")
         """
-        return self._parallel_fetch_tokens(audiences, self.get_satellite_token)
+        return self._batch_fetch_tokens(
+            "/api/v1/token/batch",
+            audiences,
+            include_auth=True,
+            fetch_one=self.get_satellite_token,
+        )
 
     def get_guest_satellite_token(self, audience: str) -> SatelliteTokenResponse:
         """Get a guest satellite token for a specific audience without authentication.
@@ -487,7 +547,7 @@ class AuthResource:
         return SatelliteTokenResponse.model_validate(data)
 
     def get_guest_satellite_tokens(self, audiences: list[str]) -> dict[str, str]:
-        """Get guest satellite tokens for multiple audiences in parallel.
+        """Get guest satellite tokens for multiple audiences in one request.
 
         No authentication is required to call this method.
 
@@ -497,7 +557,12 @@ class AuthResource:
         Returns:
             Dict mapping audience to satellite token
         """
-        return self._parallel_fetch_tokens(audiences, self.get_guest_satellite_token)
+        return self._batch_fetch_tokens(
+            "/api/v1/token/guest/batch",
+            audiences,
+            include_auth=False,
+            fetch_one=self.get_guest_satellite_token,
+        )
 
     def get_peer_token(self, target_usernames: list[str]) -> PeerTokenResponse:
         """Get a peer token for NATS communication with tunneling spaces.
@@ -382,12 +382,17 @@ class ChatResource:
             # Find first enabled connection with URL
             for conn in endpoint.connect:
                 if conn.enabled and conn.config.get("url"):
+                    # Owner opt-in to aggregator retrieval caching
+                    cache_ttl = conn.config.get("retrieval_cache_ttl")
+                    if not isinstance(cache_ttl, int) or isinstance(cache_ttl, bool):
+                        cache_ttl = None
                     return EndpointRef(
                         url=str(conn.config["url"]),
                         slug=endpoint.slug,
                         name=endpoint.name,
                         tenant_name=conn.config.get("tenant_name"),
                         owner_username=endpoint.owner_username,  # Capture owner for satellite token
+                        cache_ttl_seconds=cache_ttl,
                     )
 
             raise EndpointResolutionError(
@@ -544,6 +549,7 @@ class ChatResource:
                     "name": ds.name,
                     "tenant_name": ds.tenant_name,
                     "owner_username": ds.owner_username,
+                    "cache_ttl_seconds": ds.cache_ttl_seconds,
                 }
                 for ds in data_source_refs
             ],
@@ -96,6 +96,7 @@ class SyftHubClient:
         timeout: float = 30.0,
         aggregator_url: str | None = None,
         api_token: str | None = None,
+        endpoint_cache_ttl: float = 60.0,
     ) -> None:
         """Initialize the SyftHub client.
 
@@ -107,6 +108,9 @@ class SyftHubClient:
             api_token: API token for authentication (or from SYFTHUB_API_TOKEN env var).
                 If provided, the client will be authenticated immediately without
                 needing to call login().
+            endpoint_cache_ttl: Seconds to cache endpoints resolved by path via
+                ``hub.get()`` (default 60, 0 disables). Repeated chats against the
+                same sources then skip resolution entirely.
 
         Raises:
             ConfigurationError: If base_url is not provided and
@@ -142,7 +146,7 @@ class SyftHubClient:
         self._auth = AuthResource(self._http)
         self._users = UsersResource(self._http)
         self._my_endpoints = MyEndpointsResource(self._http)
-        self._hub = HubResource(self._http)
+        self._hub = HubResource(self._http, cache_ttl=endpoint_cache_ttl)
 
         # Lazy-initialized resources
         self._chat: ChatResource | None = None
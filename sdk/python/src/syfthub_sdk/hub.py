@@ -7,14 +7,23 @@ For managing your own endpoints, see the `my_endpoints` module.
 from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
+from urllib.parse import quote
 
-from syfthub_sdk._pagination import PageIterator
+from syfthub_sdk._cache import TTLCache
+from syfthub_sdk._pagination import CursorPageIterator, PageIterator
 from syfthub_sdk.models import EndpointPublic, EndpointSearchResult, EndpointType
 
 if TYPE_CHECKING:
     from syfthub_sdk._http import HTTPClient
 
 
+def _page_params(skip: int, limit: int, cursor: str | None) -> dict[str, Any]:
+    """Query parameters for one page of a cursor-paginated listing."""
+    if cursor:
+        return {"limit": limit, "cursor": cursor}
+    return {"skip": skip, "limit": limit}
+
+
 class HubResource:
     """Browse and discover public endpoints from the hub.
 
@@ -47,17 +56,25 @@ class HubResource:
         client.hub.unstar("alice/cool-api")
     """
 
-    def __init__(self, http: HTTPClient) -> None:
+    def __init__(self, http: HTTPClient, *, cache_ttl: float = 60.0) -> None:
         """Initialize hub resource.
 
         Args:
             http: HTTP client instance
+            cache_ttl: Seconds to cache endpoints returned by ``get()``
+                (0 disables the cache)
         """
         self._http = http
+        self._endpoint_cache: TTLCache[tuple[str, str], EndpointPublic] = TTLCache(
+            cache_ttl
+        )
 
     def browse(self, *, page_size: int = 20) -> PageIterator[EndpointPublic]:
         """Browse all public endpoints.
 
+        Pages are followed by server-issued cursors, so iterating deep into
+        the listing costs the same per page as the first.
+
         Args:
             page_size: Number of items per page (default 20)
 
@@ -65,15 +82,16 @@ class HubResource:
             PageIterator that lazily fetches endpoints
         """
 
-        def fetch_fn(skip: int, limit: int) -> list[dict[str, Any]]:
-            response = self._http.get(
+        def fetch_fn(
+            skip: int, limit: int, cursor: str | None
+        ) -> tuple[list[dict[str, Any]], str | None]:
+            return self._http.get_page(
                 "/api/v1/endpoints/public",
-                params={"skip": skip, "limit": limit},
+                params=_page_params(skip, limit, cursor),
                 include_auth=False,
             )
-            return response if isinstance(response, list) else []
 
-        return PageIterator(fetch_fn, EndpointPublic, page_size=page_size)
+        return CursorPageIterator(fetch_fn, EndpointPublic, page_size=page_size)
 
     def trending(
         self,
@@ -91,18 +109,19 @@ class HubResource:
             PageIterator that lazily fetches endpoints
         """
 
-        def fetch_fn(skip: int, limit: int) -> list[dict[str, Any]]:
-            params: dict[str, Any] = {"skip": skip, "limit": limit}
+        def fetch_fn(
+            skip: int, limit: int, cursor: str | None
+        ) -> tuple[list[dict[str, Any]], str | None]:
+            params = _page_params(skip, limit, cursor)
             if min_stars is not None:
                 params["min_stars"] = min_stars
-            response = self._http.get(
+            return self._http.get_page(
                 "/api/v1/endpoints/trending",
                 params=params,
                 include_auth=False,
             )
-            return response if isinstance(response, list) else []
 
-        return PageIterator(fetch_fn, EndpointPublic, page_size=page_size)
+        return CursorPageIterator(fetch_fn, EndpointPublic, page_size=page_size)
 
     def search(
         self,
@@ -178,8 +197,10 @@ class HubResource:
     def get(self, path: str) -> EndpointPublic:
         """Get an endpoint by its path (owner/slug format).
 
-        This method searches the public endpoints API to find the endpoint,
-        which works reliably across all deployment configurations.
+        Looks the endpoint up directly by owner and slug. Found endpoints are
+        cached client-side for ``endpoint_cache_ttl`` seconds (see
+        ``SyftHubClient``), so repeated chats against the same sources skip
+        the request entirely; use ``clear_cache()`` to force a refresh.
 
         Args:
             path: Endpoint path in "owner/slug" format (e.g., "alice/cool-api")
@@ -194,19 +215,38 @@ class HubResource:
         from syfthub_sdk.exceptions import NotFoundError
 
         owner, slug = self._parse_path(path)
+        key = (owner.lower(), slug.lower())
+        cached = self._endpoint_cache.get(key)
+        if cached is not None:
+            return cached
+
+        try:
+            response = self._http.get(
+                f"/api/v1/endpoints/public/{quote(owner, safe='')}/{quote(slug, safe='')}",
+                include_auth=False,
+            )
+        except NotFoundError:
+            raise NotFoundError(
+                message=f"Endpoint not found: '{path}'",
+                detail=f"No public endpoint found with owner '{owner}' and slug '{slug}'",
+            ) from None
 
-        # Search public endpoints to find the matching one
-        # This approach works because /api/v1/endpoints/public is reliably
-        # served by the backend API, unlike /{owner}/{slug} which may be
-        # intercepted by frontend routing in some deployments.
-        for endpoint in self.browse(page_size=100):
-            if endpoint.owner_username == owner and endpoint.slug == slug:
-                return endpoint
+        endpoint = EndpointPublic.model_validate(response)
+        self._endpoint_cache.set(key, endpoint)
+        return endpoint
 
-        raise NotFoundError(
-            message=f"Endpoint not found: '{path}'",
-            detail=f"No public endpoint found with owner '{owner}' and slug '{slug}'",
-        )
+    def clear_cache(self, path: str | None = None) -> None:
+        """Drop cached endpoint lookups made by ``get()``.
+
+        Args:
+            path: Endpoint path in "owner/slug" format to forget. Clears the
+                whole cache when omitted.
+        """
+        if path is None:
+            self._endpoint_cache.invalidate()
+            return
+        owner, slug = self._parse_path(path)
+        self._endpoint_cache.invalidate((owner.lower(), slug.lower()))
 
     def star(self, path: str) -> None:
         """Star an endpoint.
@@ -276,8 +316,6 @@ class HubResource:
         Raises:
             NotFoundError: If the collective (or shared endpoint) does not exist.
         """
-        from urllib.parse import quote
-
         base = f"/api/v1/collectives/by-slug/{quote(slug, safe='')}"
         path = (
             f"{base}/shared-endpoints/{quote(shared_slug, safe='')}/endpoint-paths"
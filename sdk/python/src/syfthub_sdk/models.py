@@ -404,6 +404,11 @@ class EndpointRef(BaseModel):
         default=None,
         description="Owner's username - used as the audience for satellite token authentication",
     )
+    cache_ttl_seconds: int | None = Field(
+        default=None,
+        description="Seconds the aggregator may cache retrieval results from this data source "
+        "(the owner's 'retrieval_cache_ttl' connection setting)",
+    )
 
     model_config = {"frozen": True}
 
@@ -830,14 +835,23 @@ class NatsCredentials(BaseModel):
 class SyncEndpointsResponse(BaseModel):
     """Response from the sync endpoints operation.
 
-    Contains details about the sync operation including how many endpoints
-    were deleted, how many were created, and the full list of created endpoints.
+    Contains how many endpoints were created, updated, left unchanged and
+    deleted, and the full list of synced endpoints.
     """
 
-    synced: int = Field(..., ge=0, description="Number of endpoints created")
+    synced: int = Field(
+        ..., ge=0, description="Number of endpoints the user owns after the sync"
+    )
+    created: int = Field(default=0, ge=0, description="Number of endpoints created")
+    updated: int = Field(
+        default=0, ge=0, description="Number of endpoints whose content changed"
+    )
+    unchanged: int = Field(
+        default=0, ge=0, description="Number of endpoints left untouched"
+    )
     deleted: int = Field(..., ge=0, description="Number of endpoints deleted")
     endpoints: list[Endpoint] = Field(
-        ..., description="List of created endpoints with full details"
+        ..., description="List of synced endpoints with full details"
     )
 
     model_config = {"frozen": True}
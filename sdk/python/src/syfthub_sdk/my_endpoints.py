@@ -322,14 +322,14 @@ class MyEndpointsResource:
     ) -> SyncEndpointsResponse:
         """Synchronize user's endpoints with provided list.
 
-        This is a DESTRUCTIVE operation that:
-        1. Deletes ALL existing endpoints owned by the current user
-        2. Creates ALL endpoints from the provided list
-        3. Is ATOMIC: either all endpoints sync successfully, or none do
+        After the sync the user owns exactly the provided endpoints:
+        1. Existing endpoints are matched by slug and compared by content
+        2. Unchanged endpoints are left untouched, changed ones are updated
+        3. New slugs are created; endpoints missing from the list are deleted
+        4. Is ATOMIC: either all endpoints sync successfully, or none do
 
         Important Notes:
-        - Stars on existing endpoints will be lost (reset to 0)
-        - Endpoint IDs will change (new IDs assigned)
+        - Matched endpoints keep their ID and stars
         - Maximum 300 endpoints per sync request
 
         Args:
@@ -338,7 +338,7 @@ class MyEndpointsResource:
                       Pass an empty list or None to delete ALL user endpoints.
 
         Returns:
-            SyncEndpointsResponse with synced count, deleted count, and created endpoints
+            SyncEndpointsResponse with per-outcome counts and the synced endpoints
 
         Raises:
             AuthenticationError: If not authenticated
@@ -350,7 +350,8 @@ class MyEndpointsResource:
                 {"name": "Model A", "type": "model", "visibility": "public"},
                 {"name": "Data Source B", "type": "data_source", "visibility": "private"},
             ])
-            print(f"Deleted {result.deleted}, created {result.synced} endpoints")
+            print(f"Created {result.created}, updated {result.updated}, "
+                  f"deleted {result.deleted} endpoints")
 
             # Clear all endpoints
             result = client.my_endpoints.sync([])
@@ -0,0 +1,158 @@
+"""Unit tests for AuthResource satellite token helpers."""
+
+from __future__ import annotations
+
+import json
+
+import httpx
+import pytest
+import respx
+
+from syfthub_sdk import SyftHubClient
+from syfthub_sdk.auth import SATELLITE_TOKEN_BATCH_MAX_AUDIENCES
+from syfthub_sdk.models import AuthTokens
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def client(base_url: str) -> SyftHubClient:
+    """Return an authenticated client."""
+    client = SyftHubClient(base_url=base_url)
+    client._http.set_tokens(
+        AuthTokens(access_token="fake-access-token", refresh_token="fake-refresh")
+    )
+    return client
+
+
+# =============================================================================
+# Satellite Token Tests
+# =============================================================================
+
+
+class TestGetSatelliteTokens:
+    """Tests for AuthResource.get_satellite_tokens()."""
+
+    @respx.mock
+    def test_uses_single_batch_request(
+        self, base_url: str, client: SyftHubClient
+    ) -> None:
+        """All audiences are minted by one call; rejected ones are left out."""
+        route = respx.post(f"{base_url}/api/v1/token/batch").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "tokens": {
+                        "alice": {"target_token": "tok-alice", "expires_in": 60},
+                        "bob": {"target_token": "tok-bob", "expires_in": 42},
+                    },
+                    "errors": {
+                        "carol": {
+                            "error": "audience_not_found",
+                            "message": "Audience 'carol' is not a registered user.",
+                        }
+                    },
+                },
+            )
+        )
+
+        tokens = client.auth.get_satellite_tokens(["bob", "alice", "carol", "alice"])
+
+        assert tokens == {"alice": "tok-alice", "bob": "tok-bob"}
+        assert route.call_count == 1
+        sent = json.loads(route.calls.last.request.content)
+        assert sent == {"audiences": ["alice", "bob", "carol"]}
+
+    @respx.mock
+    def test_falls_back_to_per_audience_requests(
+        self, base_url: str, client: SyftHubClient
+    ) -> None:
+        """Hubs without the batch endpoint are queried one audience at a time."""
+        respx.post(f"{base_url}/api/v1/token/batch").mock(
+            return_value=httpx.Response(404, json={"detail": "Not Found"})
+        )
+        single = respx.get(f"{base_url}/api/v1/token").mock(
+            return_value=httpx.Response(
+                200, json={"target_token": "tok", "expires_in": 60}
+            )
+        )
+
+        tokens = client.auth.get_satellite_tokens(["alice", "bob"])
+
+        assert tokens == {"alice": "tok", "bob": "tok"}
+        assert single.call_count == 2
+
+    @respx.mock
+    def test_large_requests_are_chunked(
+        self, base_url: str, client: SyftHubClient
+    ) -> None:
+        """Audiences beyond the hub's per-request limit go in further batches."""
+        audiences = [
+            f"user{i:03d}" for i in range(SATELLITE_TOKEN_BATCH_MAX_AUDIENCES + 1)
+        ]
+
+        def mint(request: httpx.Request) -> httpx.Response:
+            requested = json.loads(request.content)["audiences"]
+            assert len(requested) <= SATELLITE_TOKEN_BATCH_MAX_AUDIENCES
+            return httpx.Response(
+                200,
+                json={
+                    "tokens": {
+                        aud: {"target_token": f"tok-{aud}", "expires_in": 60}
+                        for aud in requested
+                    },
+                    "errors": {},
+                },
+            )
+
+        route = respx.post(f"{base_url}/api/v1/token/batch").mock(side_effect=mint)
+
+        tokens = client.auth.get_satellite_tokens(audiences)
+
+        assert route.call_count == 2
+        assert tokens == {aud: f"tok-{aud}" for aud in audiences}
+
+    @respx.mock
+    def test_failed_batch_falls_back_to_per_audience_requests(
+        self, base_url: str, client: SyftHubClient
+    ) -> None:
+        """A rejected batch does not lose the tokens it would have minted."""
+        respx.post(f"{base_url}/api/v1/token/batch").mock(
+            return_value=httpx.Response(400, json={"detail": "Too many audiences"})
+        )
+        single = respx.get(f"{base_url}/api/v1/token").mock(
+            return_value=httpx.Response(
+                200, json={"target_token": "tok", "expires_in": 60}
+            )
+        )
+
+        tokens = client.auth.get_satellite_tokens(["alice", "bob"])
+
+        assert tokens == {"alice": "tok", "bob": "tok"}
+        assert single.call_count == 2
+
+    @respx.mock
+    def test_guest_batch_is_unauthenticated(self, base_url: str) -> None:
+        """Guest tokens come from the public batch endpoint."""
+        route = respx.post(f"{base_url}/api/v1/token/guest/batch").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "tokens": {"alice": {"target_token": "guest", "expires_in": 60}},
+                    "errors": {},
+                },
+            )
+        )
+
+        tokens = SyftHubClient(base_url=base_url).auth.get_guest_satellite_tokens(
+            ["alice"]
+        )
+
+        assert tokens == {"alice": "guest"}
+        assert "authorization" not in route.calls.last.request.headers
+
+    def test_empty_audiences_make_no_request(self, client: SyftHubClient) -> None:
+        """No audiences means no network call."""
+        assert client.auth.get_satellite_tokens([]) == {}
@@ -181,15 +181,21 @@ class TestChatComplete:
     ) -> None:
         """Test chat completion with string endpoint references."""
         # Mock satellite token endpoint (for owner "alice")
-        respx.get(f"{base_url}/api/v1/token").mock(
-            return_value=httpx.Response(200, json=mock_satellite_token_response)
+        respx.post(f"{base_url}/api/v1/token/batch").mock(
+            return_value=httpx.Response(
+                200,
+                json={"tokens": {"alice": mock_satellite_token_response}, "errors": {}},
+            )
         )
 
-        # Mock hub browse endpoint (hub.get uses browse to find endpoints)
+        # Mock hub path lookups (hub.get fetches each endpoint by owner/slug)
         model_response = {**mock_endpoint_public}
         ds_response = {**mock_endpoint_public, "slug": "docs", "type": "data_source"}
-        respx.get(f"{base_url}/api/v1/endpoints/public").mock(
-            return_value=httpx.Response(200, json=[model_response, ds_response])
+        respx.get(f"{base_url}/api/v1/endpoints/public/alice/test-model").mock(
+            return_value=httpx.Response(200, json=model_response)
+        )
+        respx.get(f"{base_url}/api/v1/endpoints/public/alice/docs").mock(
+            return_value=httpx.Response(200, json=ds_response)
         )
 
         # Mock aggregator chat endpoint
@@ -240,8 +246,11 @@ class TestChatComplete:
         are fetched. Without owner_username, no tokens are fetched.
         """
         # Mock satellite token endpoint (for owner "alice")
-        respx.get(f"{base_url}/api/v1/token").mock(
-            return_value=httpx.Response(200, json=mock_satellite_token_response)
+        respx.post(f"{base_url}/api/v1/token/batch").mock(
+            return_value=httpx.Response(
+                200,
+                json={"tokens": {"alice": mock_satellite_token_response}, "errors": {}},
+            )
         )
 
         respx.post(f"{aggregator_url}/chat").mock(
@@ -501,9 +510,9 @@ class TestEndpointResolution:
         mock_endpoint_public: dict[str, Any],
     ) -> None:
         """Test resolving string path to EndpointRef with owner_username."""
-        # Mock hub browse endpoint (hub.get uses browse to find endpoints)
-        respx.get(f"{base_url}/api/v1/endpoints/public").mock(
-            return_value=httpx.Response(200, json=[mock_endpoint_public])
+        # Mock hub path lookup (hub.get fetches the endpoint by owner/slug)
+        respx.get(f"{base_url}/api/v1/endpoints/public/alice/test-model").mock(
+            return_value=httpx.Response(200, json=mock_endpoint_public)
         )
 
         client = SyftHubClient(base_url=base_url)
@@ -0,0 +1,195 @@
+"""Unit tests for HubResource endpoint lookup, caching and pagination."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from syfthub_sdk import SyftHubClient
+from syfthub_sdk._cache import TTLCache
+from syfthub_sdk.exceptions import NotFoundError
+
+# =============================================================================
+# Test Fixtures
+# =============================================================================
+
+
+@pytest.fixture
+def mock_endpoint_public() -> dict[str, Any]:
+    """Return mock public endpoint response."""
+    now = datetime.now(timezone.utc).isoformat()
+    return {
+        "name": "Cool API",
+        "slug": "cool-api",
+        "type": "model",
+        "owner_username": "alice",
+        "description": "A test model",
+        "version": "1.0.0",
+        "stars_count": 3,
+        "created_at": now,
+        "updated_at": now,
+        "connect": [
+            {
+                "type": "syftai",
+                "enabled": True,
+                "description": "SyftAI Space connection",
+                "config": {"url": "http://syftai:8080"},
+            }
+        ],
+    }
+
+
+# =============================================================================
+# Lookup Tests
+# =============================================================================
+
+
+class TestHubGet:
+    """Tests for HubResource.get()."""
+
+    @respx.mock
+    def test_fetches_endpoint_by_path(
+        self, base_url: str, mock_endpoint_public: dict[str, Any]
+    ) -> None:
+        """A lookup is a single request to the path route, not a browse."""
+        route = respx.get(f"{base_url}/api/v1/endpoints/public/alice/cool-api").mock(
+            return_value=httpx.Response(200, json=mock_endpoint_public)
+        )
+        browse = respx.get(f"{base_url}/api/v1/endpoints/public")
+
+        endpoint = SyftHubClient(base_url=base_url).hub.get("alice/cool-api")
+
+        assert endpoint.owner_username == "alice"
+        assert endpoint.slug == "cool-api"
+        assert route.call_count == 1
+        assert browse.call_count == 0
+
+    @respx.mock
+    def test_not_found(self, base_url: str) -> None:
+        """A 404 surfaces as NotFoundError naming the path."""
+        respx.get(f"{base_url}/api/v1/endpoints/public/alice/missing").mock(
+            return_value=httpx.Response(404, json={"detail": "Endpoint not found"})
+        )
+
+        with pytest.raises(NotFoundError, match="alice/missing"):
+            SyftHubClient(base_url=base_url).hub.get("alice/missing")
+
+    @respx.mock
+    def test_repeated_lookups_are_cached(
+        self, base_url: str, mock_endpoint_public: dict[str, Any]
+    ) -> None:
+        """Repeated lookups within the TTL reuse the first response."""
+        route = respx.get(f"{base_url}/api/v1/endpoints/public/alice/cool-api").mock(
+            return_value=httpx.Response(200, json=mock_endpoint_public)
+        )
+        client = SyftHubClient(base_url=base_url)
+
+        first = client.hub.get("alice/cool-api")
+        second = client.hub.get("/Alice/cool-api/")
+        client.chat._resolve_endpoint_ref("alice/cool-api")
+
+        assert second == first
+        assert route.call_count == 1
+
+        client.hub.clear_cache("alice/cool-api")
+        client.hub.get("alice/cool-api")
+        assert route.call_count == 2
+
+    @respx.mock
+    def test_cache_can_be_disabled(
+        self, base_url: str, mock_endpoint_public: dict[str, Any]
+    ) -> None:
+        """endpoint_cache_ttl=0 fetches on every lookup."""
+        route = respx.get(f"{base_url}/api/v1/endpoints/public/alice/cool-api").mock(
+            return_value=httpx.Response(200, json=mock_endpoint_public)
+        )
+        client = SyftHubClient(base_url=base_url, endpoint_cache_ttl=0)
+
+        client.hub.get("alice/cool-api")
+        client.hub.get("alice/cool-api")
+
+        assert route.call_count == 2
+
+
+class TestHubBrowse:
+    """Tests for cursor pagination in HubResource.browse() and trending()."""
+
+    @respx.mock
+    def test_follows_next_cursor(
+        self, base_url: str, mock_endpoint_public: dict[str, Any]
+    ) -> None:
+        """Later pages are requested by cursor rather than by skip."""
+        pages = {
+            None: ([{**mock_endpoint_public, "slug": "a"}], "c1"),
+            "c1": ([{**mock_endpoint_public, "slug": "b"}], "c2"),
+            "c2": ([{**mock_endpoint_public, "slug": "c"}], None),
+        }
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            cursor = request.url.params.get("cursor")
+            if cursor is not None:
+                assert "skip" not in request.url.params
+            items, next_cursor = pages[cursor]
+            headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+            return httpx.Response(200, json=items, headers=headers)
+
+        route = respx.get(f"{base_url}/api/v1/endpoints/public").mock(
+            side_effect=handler
+        )
+
+        client = SyftHubClient(base_url=base_url)
+        slugs = [e.slug for e in client.hub.browse(page_size=1)]
+
+        assert slugs == ["a", "b", "c"]
+        assert route.call_count == 3
+
+    @respx.mock
+    def test_falls_back_to_offset_without_cursors(
+        self, base_url: str, mock_endpoint_public: dict[str, Any]
+    ) -> None:
+        """Servers that never send a cursor are paged by skip/limit."""
+        endpoints = [{**mock_endpoint_public, "slug": f"e{i}"} for i in range(3)]
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            skip = int(request.url.params["skip"])
+            limit = int(request.url.params["limit"])
+            return httpx.Response(200, json=endpoints[skip : skip + limit])
+
+        respx.get(f"{base_url}/api/v1/endpoints/trending").mock(side_effect=handler)
+
+        client = SyftHubClient(base_url=base_url)
+        slugs = [e.slug for e in client.hub.trending(page_size=2)]
+
+        assert slugs == ["e0", "e1", "e2"]
+
+
+class TestTTLCache:
+    """Tests for the TTLCache helper."""
+
+    def test_entries_expire(self) -> None:
+        """Entries are dropped once their TTL has passed."""
+        now = [0.0]
+        cache: TTLCache[str, int] = TTLCache(10, clock=lambda: now[0])
+        cache.set("a", 1)
+
+        now[0] = 9.9
+        assert cache.get("a") == 1
+        now[0] = 10.0
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self) -> None:
+        """The oldest untouched entry is evicted at capacity."""
+        cache: TTLCache[str, int] = TTLCache(60, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
@@ -90,8 +90,14 @@ class TestSearchQuery:
         mock_search_response: dict[str, Any],
         mock_satellite_token_response: dict[str, Any],
     ) -> None:
-        respx.get(f"{base_url}/api/v1/token").mock(
-            return_value=httpx.Response(200, json=mock_satellite_token_response)
+        respx.post(f"{base_url}/api/v1/token/batch").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "tokens": {"epfl-news": mock_satellite_token_response},
+                    "errors": {},
+                },
+            )
         )
         respx.post(f"{aggregator_url}/chat").mock(
             return_value=httpx.Response(200, json=mock_search_response)
@@ -135,8 +141,14 @@ class TestSearchQuery:
     ) -> None:
         """The aggregator request must flag retrieval_only and forward the
         user token (so metered sources can be paid server-side)."""
-        respx.get(f"{base_url}/api/v1/token").mock(
-            return_value=httpx.Response(200, json=mock_satellite_token_response)
+        respx.post(f"{base_url}/api/v1/token/batch").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "tokens": {"epfl-news": mock_satellite_token_response},
+                    "errors": {},
+                },
+            )
         )
         route = respx.post(f"{aggregator_url}/chat").mock(
             return_value=httpx.Response(200, json=mock_search_response)
@@ -164,8 +176,16 @@ class TestSearchQuery:
         aggregator_url: str,
         mock_search_response: dict[str, Any],
     ) -> None:
-        respx.get(f"{base_url}/api/v1/token/guest").mock(
-            return_value=httpx.Response(200, json={"target_token": "guest-tok"})
+        respx.post(f"{base_url}/api/v1/token/guest/batch").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "tokens": {
+                        "epfl-news": {"target_token": "guest-tok", "expires_in": 60}
+                    },
+                    "errors": {},
+                },
+            )
         )
         route = respx.post(f"{aggregator_url}/chat").mock(
             return_value=httpx.Response(200, json=mock_search_response)
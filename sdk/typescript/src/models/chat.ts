@@ -29,6 +29,8 @@ export interface EndpointRef {
   tenantName?: string;
   /** Owner's username - used as the audience for satellite token authentication */
   ownerUsername?: string;
+  /** Seconds the aggregator may cache retrieval results (owner's `retrieval_cache_ttl` setting) */
+  cacheTtlSeconds?: number;
 }
 
 /**
@@ -171,10 +171,16 @@ export function getEndpointPublicPath(endpoint: EndpointPublic): string {
  * were deleted, how many were created, and the full list of created endpoints.
  */
 export interface SyncEndpointsResponse {
-  /** Number of endpoints created */
+  /** Number of endpoints the user owns after the sync */
   readonly synced: number;
+  /** Number of endpoints created */
+  readonly created: number;
+  /** Number of endpoints whose content changed */
+  readonly updated: number;
+  /** Number of endpoints left untouched */
+  readonly unchanged: number;
   /** Number of endpoints deleted */
   readonly deleted: number;
-  /** List of created endpoints with full details */
+  /** List of synced endpoints with full details */
   readonly endpoints: readonly Endpoint[];
 }
@@ -144,6 +144,9 @@ export class ChatResource {
             name: endpoint.name,
             tenantName: conn.config['tenant_name'] as string | undefined,
             ownerUsername: endpoint.ownerUsername, // Capture owner for satellite token
+            cacheTtlSeconds: Number.isInteger(conn.config['retrieval_cache_ttl'])
+              ? (conn.config['retrieval_cache_ttl'] as number)
+              : undefined,
           };
         }
       }
@@ -465,6 +468,7 @@ export class ChatResource {
         name: ds.name ?? '',
         tenant_name: ds.tenantName ?? null,
         owner_username: ds.ownerUsername ?? null,
+        cache_ttl_seconds: ds.cacheTtlSeconds ?? null,
       })),
       endpoint_tokens: endpointTokens,
       top_k: options.topK ?? 5,
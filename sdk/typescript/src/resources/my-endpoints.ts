@@ -165,19 +165,19 @@ export class MyEndpointsResource {
   /**
    * Synchronize user's endpoints with provided list.
    *
-   * This is a DESTRUCTIVE operation that:
-   * 1. Deletes ALL existing endpoints owned by the current user
-   * 2. Creates ALL endpoints from the provided list
-   * 3. Is ATOMIC: either all endpoints sync successfully, or none do
+   * After the sync the user owns exactly the provided endpoints:
+   * 1. Existing endpoints are matched by slug and compared by content
+   * 2. Unchanged endpoints are left untouched, changed ones are updated
+   * 3. New slugs are created; endpoints missing from the list are deleted
+   * 4. Is ATOMIC: either all endpoints sync successfully, or none do
    *
    * Important Notes:
-   * - Stars on existing endpoints will be lost (reset to 0)
-   * - Endpoint IDs will change (new IDs assigned)
+   * - Matched endpoints keep their ID and stars
    * - Maximum 300 endpoints per sync request
    *
    * @param endpoints - List of endpoint specifications to sync.
    *                    Pass an empty array to delete ALL user endpoints.
-   * @returns SyncEndpointsResponse with synced count, deleted count, and created endpoints
+   * @returns SyncEndpointsResponse with per-outcome counts and the synced endpoints
    * @throws {AuthenticationError} If not authenticated
    * @throws {ValidationError} If any endpoint fails validation (entire batch rejected)
    *
@@ -187,7 +187,7 @@ export class MyEndpointsResource {
    *   { name: 'Model A', type: 'model', visibility: 'public' },
    *   { name: 'Data Source B', type: 'data_source', visibility: 'private' },
    * ]);
-   * console.log(`Deleted ${result.deleted}, created ${result.synced} endpoints`);
+   * console.log(`Created ${result.created}, updated ${result.updated}, deleted ${result.deleted}`);
    *
    * @example
    * // Clear all endpoints